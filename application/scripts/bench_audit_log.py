@@ -0,0 +1,113 @@
+"""
+Audit Log Query Benchmarks
+
+Writes a synthetic audit log (daily JSONL files without sidecar indexes,
+as older logs are) and compares the linear scan of every line (the
+previous behaviour) against indexed queries: the first query builds the
+sidecar indexes, later ones use the cached indexes.
+
+Usage:
+    python scripts/bench_audit_log.py [--events 100000] [--days 30] [--iterations 20]
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.orchestration.audit_logger import AuditEvent, AuditLogger
+
+ACTORS = ["human:ceo", "orchestration_agent", "sa_agent", "ae_agent", "cs_agent"]
+
+
+def write_log(audit_path: Path, events: int, days: int, seed: int = 7):
+    """Daily JSONL logs with events spread evenly over the days."""
+    rng = random.Random(seed)
+    event_types = list(AuditLogger.EVENT_TYPES)
+    per_day = events // days
+    for day in range(days):
+        date = f"2026-01-{day + 1:02d}" if day < 31 else f"2026-02-{day - 30:02d}"
+        with open(audit_path / f"{date}.jsonl", 'w') as f:
+            for i in range(per_day):
+                event = AuditEvent(
+                    timestamp=f"{date}T{i * 86400 // per_day // 3600:02d}:00:00Z",
+                    event_type=rng.choice(event_types),
+                    actor=rng.choice(ACTORS),
+                    entity=f"PROC_{rng.randrange(events // 20):05d}",
+                    entity_type="process",
+                    details={"note": "x" * rng.randrange(50, 400)},
+                    conflicts_detected=[],
+                    resolution=None,
+                )
+                f.write(json.dumps(asdict(event)) + "\n")
+
+
+def linear_query(audit_path: Path, limit: int, **filters):
+    """The previous query_events: parse every line of every file in range."""
+    results = []
+    for log_file in sorted(audit_path.glob("*.jsonl"), reverse=True):
+        with open(log_file, 'r') as f:
+            for line in f:
+                event = json.loads(line)
+                if all(event.get(k) == v for k, v in filters.items()):
+                    results.append(event)
+                    if len(results) >= limit:
+                        return results
+    return results
+
+
+def timed(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = func()
+    return (time.perf_counter() - start) / iterations * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    audit_path = Path(tempfile.mkdtemp(prefix="bench_audit_"))
+    try:
+        write_log(audit_path, args.events, args.days)
+        size_mb = sum(p.stat().st_size for p in audit_path.glob("*.jsonl")) / 1e6
+        print(f"{args.events} events over {args.days} days ({size_mb:.1f} MB)\n")
+
+        logger = AuditLogger(audit_path)
+        cold_ms, _ = timed(lambda: logger.get_entity_history("PROC_00042"), 1)
+        print(f"first indexed query (builds sidecars): {cold_ms:.1f} ms\n")
+
+        entity = "PROC_00042"
+        cases = [
+            ("entity history", dict(entity=entity), 1000,
+             lambda: logger.get_entity_history(entity)),
+            ("event type, limit 10", dict(event_type="conflict_detected"), 10,
+             lambda: logger.query_events(event_type="conflict_detected", limit=10)),
+            ("actor + type, limit 100", dict(actor="sa_agent", event_type="process_created"), 100,
+             lambda: logger.query_events(actor="sa_agent", event_type="process_created", limit=100)),
+        ]
+        print(f"{'query':<26}{'matches':>8}{'scan ms':>10}{'indexed ms':>12}{'speedup':>10}")
+        for name, filters, limit, indexed in cases:
+            scan_ms, scanned = timed(lambda: linear_query(audit_path, limit, **filters), max(1, args.iterations // 10))
+            indexed_ms, found = timed(indexed, args.iterations)
+            if len(scanned) < limit:
+                # All matches found; the scan returns them oldest-first within each day
+                assert sorted(map(json.dumps, scanned)) == sorted(map(json.dumps, found))
+            print(f"{name:<26}{len(found):>8}{scan_ms:>10.2f}{indexed_ms:>12.3f}{scan_ms / indexed_ms:>9.0f}x")
+    finally:
+        shutil.rmtree(audit_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Audit Chain Verification Benchmarks
+
+Writes a year of hash-chained daily audit logs and times verification:
+every event in one process (the previous verify_integrity cost, per day),
+every event across worker processes, and incremental re-verification
+resuming from the checkpoints the first verification leaves behind.
+
+Usage:
+    python scripts/bench_audit_verify.py [--days 365] [--events-per-day 300] [--workers N]
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.orchestration.audit_logger import AuditEvent, AuditLogger, GENESIS_HASH, event_hash
+
+ACTORS = ["human:ceo", "orchestration_agent", "sa_agent", "ae_agent", "cs_agent"]
+
+
+def write_chain(audit_path: Path, days: int, per_day: int, seed: int = 7):
+    """Daily logs chained as AuditLogger.log_event writes them."""
+    rng = random.Random(seed)
+    event_types = list(AuditLogger.EVENT_TYPES)
+    head = GENESIS_HASH
+    first = date(2025, 1, 1)
+    for day in range(days):
+        today = (first + timedelta(days=day)).isoformat()
+        with open(audit_path / f"{today}.jsonl", 'w') as f:
+            for i in range(per_day):
+                event = AuditEvent(
+                    timestamp=f"{today}T{i * 86400 // per_day // 3600:02d}:00:00Z",
+                    event_type=rng.choice(event_types),
+                    actor=rng.choice(ACTORS),
+                    entity=f"PROC_{rng.randrange(5000):05d}",
+                    entity_type="process",
+                    details={"note": "x" * rng.randrange(50, 400)},
+                    conflicts_detected=[],
+                    resolution=None,
+                    prev_hash=head,
+                )
+                record = vars(event)
+                event.hash = head = event_hash(record)
+                f.write(json.dumps(record) + "\n")
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--events-per-day", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    audit_path = Path(tempfile.mkdtemp(prefix="bench_audit_verify_"))
+    try:
+        write_chain(audit_path, args.days, args.events_per_day)
+        size_mb = sum(p.stat().st_size for p in audit_path.glob("*.jsonl")) / 1e6
+        print(f"{args.days} days, {args.days * args.events_per_day} events ({size_mb:.1f} MB)\n")
+        logger = AuditLogger(audit_path, checkpoint_key=b"bench-key")
+
+        runs = [
+            ("full, one process", lambda: logger.verify_range(full=True, max_workers=1)),
+            ("full, parallel", lambda: logger.verify_range(full=True, max_workers=args.workers)),
+            ("incremental (checkpointed)", lambda: logger.verify_range(max_workers=args.workers)),
+            ("incremental, one process", lambda: logger.verify_range(max_workers=1)),
+        ]
+        print(f"{'verification':<30}{'seconds':>10}{'events checked':>16}{'valid':>8}")
+        for name, run in runs:
+            elapsed, result = timed(run)
+            print(f"{name:<30}{elapsed:>10.3f}{result['checked_events']:>16}{str(result['valid']):>8}")
+            assert result["valid"], result["errors"][:5]
+
+        # Tampering is still caught: drop one event from the middle of the year
+        middle = sorted(audit_path.glob("*.jsonl"))[args.days // 2]
+        lines = middle.read_bytes().splitlines(keepends=True)
+        middle.write_bytes(b"".join(lines[:10] + lines[11:]))
+        elapsed, result = timed(lambda: logger.verify_range(max_workers=args.workers))
+        print(f"{'after removing an event':<30}{elapsed:>10.3f}{result['checked_events']:>16}{str(result['valid']):>8}")
+        assert not result["valid"]
+    finally:
+        shutil.rmtree(audit_path)
+
+
+if __name__ == "__main__":
+    main()
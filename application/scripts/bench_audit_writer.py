@@ -0,0 +1,123 @@
+"""
+Audit Writer Throughput Benchmarks
+
+Appends the same events through AuditLogger.log_event and
+GovernanceOrchestrator-style per-execution logs, comparing the previous
+open/append/close per event against the shared AuditWriter under each
+durability policy.
+
+Usage:
+    python scripts/bench_audit_writer.py [--events 20000] [--executions 20] [--fsync]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.orchestration.audit_logger import AuditEvent, AuditLogger, INDEXED_FIELDS
+from core.orchestration.audit_writer import AuditWriter
+
+
+def per_event_open_logger(audit_path: Path, events: int, fsync: bool):
+    """The previous log_event: open the day's log and its sidecar for every event."""
+    log_file = audit_path / "2026-01-01.jsonl"
+    for i in range(events):
+        record = asdict(AuditEvent(
+            timestamp="2026-01-01T00:00:00Z", event_type="process_updated", actor="sa_agent",
+            entity=f"PROC_{i % 100:03d}", entity_type="process", details={"step": i},
+            conflicts_detected=[], resolution=None,
+        ))
+        line = (json.dumps(record) + "\n").encode()
+        with open(log_file, 'ab') as f:
+            offset = f.tell()
+            f.write(line)
+            sync(f, fsync)
+        row = [offset, len(line)] + [record.get(name) for name in INDEXED_FIELDS]
+        with open(log_file.with_suffix(".idx"), 'ab') as f:
+            f.write(json.dumps(row).encode() + b"\n")
+            sync(f, fsync)
+
+
+def sync(f, fsync: bool):
+    if fsync:
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def writer_logger(audit_path: Path, events: int, fsync: bool, writer: AuditWriter):
+    logger = AuditLogger(audit_path, writer=writer)
+    for i in range(events):
+        logger.log_event("process_updated", "sa_agent", entity=f"PROC_{i % 100:03d}",
+                         entity_type="process", details={"step": i})
+    writer.close()
+
+
+def per_event_open_steps(output_dir: Path, events: int, fsync: bool, executions: int):
+    """The previous GovernanceOrchestrator._log_event."""
+    for i in range(events):
+        log_file = output_dir / f"WF_{i % executions:03d}_audit.jsonl"
+        with open(log_file, 'a') as f:
+            f.write(json.dumps({"timestamp": "2026-01-01T00:00:00", "event_type": "step_completed", "step": i}) + '\n')
+            sync(f, fsync)
+
+
+def writer_steps(output_dir: Path, events: int, fsync: bool, executions: int, writer: AuditWriter):
+    for i in range(events):
+        log_file = output_dir / f"WF_{i % executions:03d}_audit.jsonl"
+        event = {"timestamp": "2026-01-01T00:00:00", "event_type": "step_completed", "step": i}
+        writer.append(log_file, (json.dumps(event) + '\n').encode())
+    writer.close()
+
+
+def run(func, *args) -> float:
+    directory = Path(tempfile.mkdtemp(prefix="bench_audit_writer_"))
+    try:
+        start = time.perf_counter()
+        func(directory, *args)
+        elapsed = time.perf_counter() - start
+        lines = sum(len(p.read_bytes().splitlines()) for p in directory.glob("*.jsonl"))
+        assert lines == args[0], f"{lines} lines written, expected {args[0]}"
+        return elapsed
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--executions", type=int, default=20, help="Per-execution logs written round-robin")
+    parser.add_argument("--fsync", action="store_true", help="fsync every event (open per event) or batch (AuditWriter)")
+    args = parser.parse_args()
+
+    policies = [
+        ("AuditWriter per_event", dict(policy="per_event", fsync=args.fsync)),
+        ("AuditWriter interval 5ms", dict(policy="interval", interval_ms=5, fsync=args.fsync)),
+        ("AuditWriter interval 50ms", dict(policy="interval", interval_ms=50, fsync=args.fsync)),
+    ]
+    suites = [
+        ("AuditLogger.log_event", per_event_open_logger, writer_logger, ()),
+        ("workflow step events", per_event_open_steps, writer_steps, (args.executions,)),
+    ]
+    print(f"{args.events} events{' with fsync' if args.fsync else ''}\n")
+    for title, baseline, buffered, extra in suites:
+        base = run(baseline, args.events, args.fsync, *extra)
+        print(f"{title}")
+        print(f"  {'writer':<28}{'events/s':>12}{'speedup':>10}")
+        print(f"  {'open per event':<28}{args.events / base:>12,.0f}{1:>9.1f}x")
+        for name, options in policies:
+            elapsed = run(lambda d, *a: buffered(d, *a, AuditWriter(**options)), args.events, args.fsync, *extra)
+            print(f"  {name:<28}{args.events / elapsed:>12,.0f}{base / elapsed:>9.1f}x")
+        print()
+
+
+if __name__ == "__main__":
+    main()
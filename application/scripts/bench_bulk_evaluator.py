@@ -0,0 +1,103 @@
+"""
+Bulk Evaluator Benchmark
+
+Evaluates each PB_201 rule for a synthetic portfolio of nodes two ways:
+one DLLEvaluator.evaluate call per node, and one columnar BulkEvaluator
+pass over all nodes. Node contexts are perturbed copies of the realistic
+test fixture.
+
+Usage:
+    python scripts/bench_bulk_evaluator.py [--nodes 2000]
+"""
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = APPLICATION_ROOT.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.playbook_engine import DLLEvaluator, ThresholdManager
+from core.playbook_engine.bulk_evaluator import BulkEvaluator, ContextFrame
+
+# Threshold section for PB_201 in playbook_thresholds.yaml
+THRESHOLD_SECTION = "PB_201_swot"
+
+
+def build_portfolio(base, count, seed=42):
+    rng = random.Random(seed)
+    contexts = {}
+    for i in range(count):
+        context = copy.deepcopy(base)
+        context["account_overview"]["arr"] = rng.randint(50_000, 2_000_000)
+        for risk in context.get("risks", []):
+            risk["severity"] = rng.choice(["HIGH", "MEDIUM", "LOW"])
+        for quadrant in context.get("swot", {}).values():
+            if not isinstance(quadrant, dict):
+                continue
+            if "count" in quadrant:
+                quadrant["count"] = rng.randint(0, 12)
+            for item in quadrant.get("items", []):
+                item["impact"] = rng.choice(["high", "medium", "low"])
+        contexts[f"node_{i:04d}"] = context
+    return contexts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(APPLICATION_ROOT / "tests" / "fixtures" / "context_realistic.json") as f:
+        base = json.load(f)
+    playbook_path = next((PROJECT_ROOT / "domain" / "playbooks").rglob("PB_201_*.yaml"))
+    with open(playbook_path) as f:
+        playbook = yaml.safe_load(f)
+
+    thresholds = ThresholdManager(PROJECT_ROOT / "domain" / "config" / "playbook_thresholds.yaml")
+    contexts = build_portfolio(base, args.nodes)
+    evaluator = DLLEvaluator()
+    rules = playbook.get("decision_logic", {}).get("rules", [])
+    conditions = {
+        rule.get("id"): thresholds.substitute_condition(rule.get("condition", ""), THRESHOLD_SECTION)
+        for rule in rules
+    }
+
+    start = time.perf_counter()
+    scalar = {}
+    for rule_id, condition in conditions.items():
+        firing = []
+        for node_id, context in contexts.items():
+            try:
+                if evaluator.evaluate(condition, context):
+                    firing.append(node_id)
+            except Exception:
+                pass
+        scalar[rule_id] = firing
+    scalar_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = BulkEvaluator(evaluator, thresholds).evaluate_playbook(playbook, ContextFrame(contexts), THRESHOLD_SECTION)
+    bulk_s = time.perf_counter() - start
+
+    for rule_id, firing in scalar.items():
+        assert results[rule_id].firing == firing, rule_id
+
+    print(f"{len(conditions)} rules x {args.nodes} nodes\n")
+    print(f"{'mode':<10}{'total s':>10}{'speedup':>10}")
+    print(f"{'scalar':<10}{scalar_s:>10.3f}{1.0:>9.1f}x")
+    print(f"{'bulk':<10}{bulk_s:>10.3f}{scalar_s / bulk_s:>9.1f}x")
+    print()
+    for rule_id, result in results.items():
+        print(f"  {rule_id:<40} fires for {len(result.firing):>5} nodes, {len(result.errors)} errors")
+
+
+if __name__ == "__main__":
+    main()
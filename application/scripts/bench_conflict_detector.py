@@ -0,0 +1,118 @@
+"""
+Conflict Detector Benchmarks
+
+Runs full_analysis over synthetic process catalogs of growing size and
+compares the all-pairs comparison (the previous behaviour) against the
+blocking index (MinHash/LSH bands for redundancy). About one process in
+ten is a near-copy of an earlier one. Findings must be identical; the
+all-pairs run is skipped above --max-pairwise processes. The second table
+times analyze() of one new process with a trigger graph rebuilt per call
+(the previous behaviour) and with a persistent DependencyGraph.
+
+Usage:
+    python scripts/bench_conflict_detector.py [--sizes 100 1000 10000] [--max-pairwise 1000] [--seed 7]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.orchestration.conflict_detector import ConflictDetector, ConflictReport
+from core.orchestration.dependency_graph import DependencyGraph
+
+AGENTS = [f"agent_{i:02d}" for i in range(40)]
+VALUES = ["approved", "rejected", "active", "closed", True, False, None]
+WORDS = ("review account renewal risk pricing proposal escalate sponsor forecast "
+         "pipeline onboarding contract audit security roadmap budget").split()
+
+
+def make_processes(count: int, seed: int = 7) -> list:
+    """Synthetic catalog; events, artifacts and slots grow with the catalog."""
+    rng = random.Random(seed)
+    events = ConflictDetector.KNOWN_EVENTS + [f"event_{i}" for i in range(max(1, count // 10))]
+    artifacts = [f"artifact_{i}" for i in range(max(1, count // 3))]
+    slots = [f"slot_{i}" for i in range(max(1, count // 4))]
+    processes = []
+    for i in range(count):
+        if processes and rng.random() < 0.1:
+            # Near-copy: same process with one description word changed
+            copy = dict(rng.choice(processes), process_id=f"PROC_{i:05d}")
+            words = copy["description"].split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            copy["description"] = " ".join(words)
+            processes.append(copy)
+            continue
+        steps = [
+            {"action": rng.choice(["update_record", "notify", "review"]), "name": " ".join(rng.sample(WORDS, 3)),
+             "outputs": [{"artifact": rng.choice(artifacts), "value": rng.choice(VALUES)}]}
+            for _ in range(rng.randint(0, 2))
+        ]
+        if rng.random() < 0.3:
+            steps.append({"action": "schedule_meeting", "params": {"slot": rng.choice(slots)}})
+        processes.append({
+            "process_id": f"PROC_{i:05d}",
+            "description": " ".join(rng.choice(WORDS) for _ in range(12)),
+            "trigger": {"event": rng.choice(events),
+                        "conditions": [{"field": rng.choice(["arr", "health", "stage"])}] if rng.random() < 0.5 else []},
+            "ownership": {"primary_owner": {"agent": rng.choice(AGENTS)}},
+            "outputs": {"primary": {"artifact": rng.choice(artifacts), "value": rng.choice(VALUES)}},
+            "steps": steps,
+        })
+        if rng.random() < 0.3:
+            # Mostly forward triggers, with a rare back edge closing a cycle
+            target = rng.randrange(i + 1, count + 1) if rng.random() > 0.002 else rng.randrange(0, i + 1)
+            processes[-1]["outputs"]["triggers"] = [f"PROC_{target:05d}"]
+    return processes
+
+
+def timed(detector, processes):
+    start = time.perf_counter()
+    report = detector.full_analysis(processes)
+    return time.perf_counter() - start, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--max-pairwise", type=int, default=1000, help="Largest catalog compared all-pairs")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'processes':>10}{'conflicts':>11}{'all-pairs s':>13}{'indexed s':>11}{'speedup':>10}")
+    for size in args.sizes:
+        processes = make_processes(size, args.seed)
+        indexed_s, indexed = timed(ConflictDetector(), processes)
+        if size <= args.max_pairwise:
+            pairwise_s, pairwise = timed(ConflictDetector(use_index=False), processes)
+            assert pairwise.to_list() == indexed.to_list(), "findings differ"
+            columns = f"{pairwise_s:>13.3f}{indexed_s:>11.3f}{pairwise_s / indexed_s:>9.1f}x"
+        else:
+            columns = f"{'skipped':>13}{indexed_s:>11.3f}{'':>10}"
+        print(f"{size:>10}{len(indexed.conflicts):>11}{columns}")
+
+    print(f"\n{'processes':>10}{'rebuilt ms':>12}{'persistent ms':>15}{'speedup':>10}   cycle check in analyze()")
+    for size in args.sizes:
+        processes = make_processes(size, args.seed)
+        # Update of an existing process that now triggers an earlier one
+        new = dict(processes[size // 2], outputs={"triggers": [processes[size // 4]["process_id"]]})
+        graph = DependencyGraph.from_processes(processes)
+        rebuilt_ms = cycle_check_ms(new, processes, None)
+        persistent_ms = cycle_check_ms(new, processes, graph)
+        print(f"{size:>10}{rebuilt_ms:>12.2f}{persistent_ms:>15.3f}{rebuilt_ms / persistent_ms:>9.0f}x")
+
+
+def cycle_check_ms(new, processes, graph, repeat=3):
+    detector = ConflictDetector()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        detector._check_new_cycle(new, processes, ConflictReport(), graph)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+if __name__ == "__main__":
+    main()
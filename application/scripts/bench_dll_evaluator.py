@@ -0,0 +1,77 @@
+"""
+DLL Evaluator Microbenchmarks
+
+Compares per-evaluation parsing (the pre-compilation behaviour, reproduced by
+clearing the compile cache before every call) against the cached compile path
+and against evaluating an already compiled condition.
+
+Usage:
+    python scripts/bench_dll_evaluator.py [--iterations 2000]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.playbook_engine.dll_evaluator import DLLEvaluator
+
+CONDITIONS = [
+    "$.risks[?(@.severity=='HIGH')].length > 0",
+    "$.account_overview.arr >= 500000",
+    "$.swot.strengths EXISTS",
+    "$.swot.threats.items[?(@.category=='competitive')].length > 0 AND $.swot.weaknesses.items[?(@.category=='technical')].length > 0",
+    "$.swot.strengths.count > 10 OR $.swot.weaknesses.count > 0",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(APPLICATION_ROOT / "tests" / "fixtures" / "context_realistic.json") as f:
+        context = json.load(f)
+
+    evaluator = DLLEvaluator()
+
+    def uncached():
+        for condition in CONDITIONS:
+            DLLEvaluator.clear_cache()
+            evaluator.evaluate(condition, context)
+
+    def cached():
+        for condition in CONDITIONS:
+            evaluator.evaluate(condition, context)
+
+    compiled = [evaluator.compile(c) for c in CONDITIONS]
+
+    def precompiled():
+        for condition in compiled:
+            condition.evaluate(context)
+
+    evaluations = args.iterations * len(CONDITIONS)
+    print(f"{len(CONDITIONS)} conditions x {args.iterations} iterations = {evaluations} evaluations\n")
+    print(f"{'mode':<14}{'total s':>10}{'us/eval':>10}{'speedup':>10}")
+
+    baseline = None
+    # Parsing per call is slow; time it over fewer iterations and scale
+    for name, func, iterations in [
+        ("parse-per-call", uncached, max(1, args.iterations // 20)),
+        ("compile-cache", cached, args.iterations),
+        ("precompiled", precompiled, args.iterations),
+    ]:
+        elapsed = timeit.timeit(func, number=iterations) * (args.iterations / iterations)
+        per_eval = elapsed / evaluations * 1e6
+        baseline = baseline or per_eval
+        print(f"{name:<14}{elapsed:>10.3f}{per_eval:>10.1f}{baseline / per_eval:>9.1f}x")
+
+    print(f"\ncompile cache: {DLLEvaluator.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
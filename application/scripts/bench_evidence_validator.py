@@ -0,0 +1,111 @@
+"""
+Evidence Validator Benchmarks
+
+Validates generated outputs with thousands of claims and compares the
+generic walk (message-building checks on every item, the previous
+behaviour) against the compiled checks in full-report, fail-fast and
+batch modes.
+
+Usage:
+    python scripts/bench_evidence_validator.py [--claims 5000] [--outputs 20] [--iterations 20]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.playbook_engine.evidence_validator import EvidenceValidator
+
+FIELDS = ["strengths", "weaknesses", "opportunities", "threats", "risks", "decisions"]
+
+
+def make_output(claims: int, invalid_every: int = 0) -> dict:
+    """One output with claims spread over the evidence-required fields."""
+    output = {field: [] for field in FIELDS}
+    for i in range(claims):
+        evidence = [
+            {
+                "source_artifact": f"ACME_CORP/meetings/2026-01-{i % 28 + 1:02d}.md",
+                "date": f"2026-01-{i % 28 + 1:02d}",
+                "excerpt": f"Observation {i}",
+                "confidence": ("HIGH", "MEDIUM", "LOW")[i % 3],
+            }
+            for _ in range(1 + i % 3)
+        ]
+        if invalid_every and i % invalid_every == invalid_every - 1:
+            evidence[0]["confidence"] = "CERTAIN"
+        output[FIELDS[i % len(FIELDS)]].append({"description": f"Claim {i}", "evidence": evidence})
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--claims", type=int, default=5000, help="Claims per output")
+    parser.add_argument("--outputs", type=int, default=20, help="Outputs per run (batch mode)")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    validator = EvidenceValidator()
+    valid = make_output(args.claims)
+    invalid = make_output(args.claims, invalid_every=100)
+    run = [make_output(args.claims // args.outputs) for _ in range(args.outputs)]
+
+    def generic(output):
+        errors = []
+        for field in validator.fields:
+            if output.get(field):
+                # Bypass the compiled predicates: every item takes the checked path
+                errors.extend(_generic_field(validator, field, output[field]))
+        return errors
+
+    cases = [
+        ("valid output", valid, [
+            ("generic walk", lambda: generic(valid)),
+            ("compiled full", lambda: validator.validate(valid)),
+            ("compiled fail-fast", lambda: validator.first_error(valid)),
+        ]),
+        ("1% invalid claims", invalid, [
+            ("generic walk", lambda: generic(invalid)),
+            ("compiled full", lambda: validator.validate(invalid)),
+            ("compiled fail-fast", lambda: validator.first_error(invalid)),
+        ]),
+        (f"run of {args.outputs} outputs", None, [
+            ("generic walk", lambda: [generic(o) for o in run]),
+            ("compiled batch", lambda: validator.validate_many(run)),
+            ("batch fail-fast", lambda: validator.validate_many(run, fail_fast=True)),
+        ]),
+    ]
+
+    print(f"{args.claims} claims per case, {args.iterations} iterations\n")
+    for title, output, modes in cases:
+        if output is not None:
+            assert generic(output) == validator.validate(output)
+        print(title)
+        print(f"  {'mode':<20}{'ms/call':>10}{'speedup':>10}")
+        baseline = None
+        for name, func in modes:
+            per_call = timeit.timeit(func, number=args.iterations) / args.iterations * 1000
+            baseline = baseline or per_call
+            print(f"  {name:<20}{per_call:>10.2f}{baseline / per_call:>9.1f}x")
+        print()
+
+
+def _generic_field(validator, field_name, items):
+    errors = []
+    if not isinstance(items, list):
+        return validator._validate_field(field_name, items)
+    for idx, item in enumerate(items):
+        if not isinstance(item, dict) or not isinstance(item.get("evidence"), list) or not item["evidence"]:
+            errors.extend(validator._validate_field(field_name, [item]))
+            continue
+        for ev_idx, evidence in enumerate(item["evidence"]):
+            errors.extend(validator._validate_evidence_object(evidence, f"{field_name}[{idx}].evidence[{ev_idx}]"))
+    return errors
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Export Runs from the Compact Run Store
+
+Materializes runs stored in a SQLite run store as the data/runs/{run_id}/
+directory layout (metadata.yaml, trace.json, report.md, outputs/).
+
+Usage:
+    python scripts/export_runs.py DEST_DIR [--db data/runs.db] [--playbook PB_201]
+        [--client ACME_CORP] [--status failed] [--since 2026-01-01] [--until 2026-02-01]
+    python scripts/export_runs.py --list [filters...]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.config.paths import RUNS_DB
+from core.playbook_engine import SQLiteRunStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("dest", type=Path, nargs="?")
+    parser.add_argument("--db", type=Path, default=RUNS_DB)
+    parser.add_argument("--playbook", dest="playbook_id")
+    parser.add_argument("--client", dest="client_id")
+    parser.add_argument("--status")
+    parser.add_argument("--since")
+    parser.add_argument("--until")
+    parser.add_argument("--list", action="store_true", help="List matching runs instead of exporting")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        parser.error(f"Run store not found: {args.db}")
+    if not args.list and args.dest is None:
+        parser.error("DEST_DIR is required unless --list is given")
+
+    store = SQLiteRunStore(args.db)
+    filters = {
+        key: getattr(args, key)
+        for key in ("playbook_id", "client_id", "status", "since", "until")
+        if getattr(args, key) is not None
+    }
+
+    if args.list:
+        for run in store.query(**filters):
+            print(f"{run['started_at']}  {run['status']:<10}{run['playbook_id']:<12}{run['run_id']}")
+        return
+
+    written = store.export(args.dest, **filters)
+    print(f"Exported {len(written)} runs to {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Profile Recent Playbook Runs
+
+Aggregates the perf_counter_ns profiles in the traces of recent runs and
+ranks the slowest rules and playbooks by p95.
+
+Usage:
+    python scripts/profile_runs.py [--runs-dir data/runs | --db data/runs.db] [--last 200] [--top 10]
+        [--playbook PB_201] [--json]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.config.paths import RUNS_OUTPUT
+from core.playbook_engine import SQLiteRunStore
+from core.playbook_engine.run_profile import load_traces, profile_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs-dir", type=Path, default=RUNS_OUTPUT)
+    parser.add_argument("--db", type=Path, help="Read runs from a SQLite run store instead of runs-dir")
+    parser.add_argument("--last", type=int, default=200, help="Number of most recent runs")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--playbook", dest="playbook_id")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if args.db is not None and not args.db.exists():
+        parser.error(f"Run store not found: {args.db}")
+    if args.db is None and not args.runs_dir.is_dir():
+        parser.error(f"Runs directory not found: {args.runs_dir}")
+
+    traces = load_traces(SQLiteRunStore(args.db) if args.db else args.runs_dir, limit=args.last)
+    if args.playbook_id:
+        traces = [t for t in traces if t.get("profile", {}).get("playbook_id") == args.playbook_id]
+    report = profile_report(traces, top=args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{report['runs']} profiled runs of the last {args.last}\n")
+    print(f"{'playbook':<14}{'runs':>6}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}  slowest stage")
+    for row in report["playbooks"]:
+        print(f"{row['playbook_id']:<14}{row['count']:>6}{row['mean_ms']:>10.3f}{row['p95_ms']:>10.3f}"
+              f"{row['max_ms']:>10.3f}  {row['slowest_stage']}")
+    print(f"\n{'playbook':<14}{'rule':<40}{'evals':>6}{'mean ms':>10}{'p95 ms':>10}{'jsonpath':>10}")
+    for row in report["rules"]:
+        print(f"{row['playbook_id']:<14}{row['rule_id']:<40}{row['count']:>6}{row['mean_ms']:>10.3f}"
+              f"{row['p95_ms']:>10.3f}{row['resolution_share']:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Query the Run Catalog
+
+Lists and aggregates past playbook runs from the run catalog index
+without opening run directories.
+
+Usage:
+    python scripts/query_runs.py list [--playbook PB_201] [--client ACME_CORP] [--status failed]
+        [--fired-rule RULE] [--since 2026-01-01] [--until ...] [--limit 20] [--offset 0]
+    python scripts/query_runs.py rules [--playbook PB_201]
+    python scripts/query_runs.py durations [--playbook PB_201]
+    python scripts/query_runs.py backfill [--runs-dir data/runs | --runs-db data/runs.db]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.config.paths import RUN_CATALOG, RUNS_OUTPUT
+from core.playbook_engine import RunCatalog, SQLiteRunStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("command", choices=["list", "rules", "durations", "backfill"])
+    parser.add_argument("--catalog", type=Path, default=RUN_CATALOG)
+    parser.add_argument("--playbook", dest="playbook_id")
+    parser.add_argument("--client", dest="client_id")
+    parser.add_argument("--status")
+    parser.add_argument("--fired-rule", dest="fired_rule_id")
+    parser.add_argument("--since")
+    parser.add_argument("--until")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--offset", type=int, default=0)
+    parser.add_argument("--runs-dir", type=Path, default=RUNS_OUTPUT)
+    parser.add_argument("--runs-db", type=Path, help="Backfill from a SQLite run store instead of runs-dir")
+    args = parser.parse_args()
+
+    catalog = RunCatalog(args.catalog)
+    scope = {
+        key: getattr(args, key)
+        for key in ("playbook_id", "client_id", "since", "until")
+        if getattr(args, key) is not None
+    }
+
+    if args.command == "backfill":
+        source = SQLiteRunStore(args.runs_db) if args.runs_db else args.runs_dir
+        print(f"Indexed {catalog.backfill(source)} runs into {args.catalog}")
+
+    elif args.command == "list":
+        page = catalog.query(
+            status=args.status, fired_rule_id=args.fired_rule_id,
+            limit=args.limit, offset=args.offset, **scope
+        )
+        shown = f"{page['offset'] + 1}-{page['offset'] + len(page['items'])}" if page["items"] else "0"
+        print(f"runs {shown} of {page['total']}\n")
+        for run in page["items"]:
+            print(f"{run['started_at']}  {run['status']:<10}{run['duration_seconds']:>7.2f}s  "
+                  f"{run['outputs_count']:>3} outputs  {run['run_id']}")
+            if run["fired_rule_ids"]:
+                print(f"    fired: {', '.join(run['fired_rule_ids'])}")
+
+    elif args.command == "rules":
+        print(f"{'playbook':<12}{'rule':<44}{'runs':>6}{'fired':>7}{'errors':>8}{'rate':>8}")
+        for row in catalog.rule_fire_rates(**scope):
+            print(f"{row['playbook_id']:<12}{row['rule_id']:<44}{row['runs']:>6}"
+                  f"{row['fired']:>7}{row['errors']:>8}{row['fire_rate']:>8.1%}")
+
+    else:
+        print(f"{'playbook':<12}{'runs':>6}{'mean s':>9}{'p50 s':>9}{'p95 s':>9}{'max s':>9}")
+        for row in catalog.duration_percentiles(status=args.status or "completed", **scope):
+            print(f"{row['playbook_id']:<12}{row['runs']:>6}{row['mean']:>9.3f}"
+                  f"{row['p50']:>9.3f}{row['p95']:>9.3f}{row['max']:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Batch Playbook Runner
+
+Runs one or more playbooks for every node of the given realms (or the
+whole vault) on a process pool and prints throughput and per-stage
+timings.
+
+Usage:
+    python scripts/run_batch_playbooks.py PB_201 [--realm ACME_CORP] [--repeat 10] [--workers 4]
+        [--db data/runs.db] [--catalog data/run_catalog.db] [--rule-cache data/rule_cache.db] [--lazy]
+        [--profile-memory] [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+APPLICATION_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = APPLICATION_ROOT.parent
+sys.path.insert(0, str(APPLICATION_ROOT / "src"))
+
+from core.config.paths import RUNS_OUTPUT, VAULT_ROOT
+from core.playbook_engine import BatchExecutor, BatchJob, RuleResultCache, RunCatalog, SQLiteRunStore
+from core.playbook_engine.lazy_context import LazyNodeContext
+from core.playbook_engine.node_context import INFOHUB_DIR, load_node_context
+
+
+def discover_nodes(vault_root, realms):
+    """(realm_id, node_id) for every node directory with an InfoHub (skips _templates etc.)."""
+    for realm_dir in sorted(p for p in vault_root.iterdir() if p.is_dir() and not p.name.startswith("_")):
+        if realms and realm_dir.name not in realms:
+            continue
+        for node_dir in sorted(p for p in realm_dir.iterdir() if p.is_dir() and not p.name.startswith("_")):
+            if (node_dir / INFOHUB_DIR).is_dir():
+                yield realm_dir.name, node_dir.name
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("playbooks", nargs="+")
+    parser.add_argument("--realm", action="append", default=[])
+    parser.add_argument("--vault", type=Path, default=VAULT_ROOT)
+    parser.add_argument("--runs-dir", type=Path, default=RUNS_OUTPUT)
+    parser.add_argument("--db", type=Path, help="Store runs in this SQLite run store instead of runs-dir")
+    parser.add_argument("--catalog", type=Path, help="Index run metadata in this run catalog")
+    parser.add_argument("--rule-cache", type=Path, help="Reuse results of rules with unchanged inputs")
+    parser.add_argument("--lazy", action="store_true", help="Parse only the vault documents rules read")
+    parser.add_argument("--dry-run", action="store_true", help="Evaluate without persisting runs")
+    parser.add_argument("--profile-memory", action="store_true", help="Record memory deltas per stage in traces")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-per-node", type=int, default=1)
+    args = parser.parse_args()
+
+    nodes = list(discover_nodes(args.vault, args.realm))
+    jobs = [
+        BatchJob(playbook_id, realm_id, node_id)
+        for _ in range(args.repeat)
+        for realm_id, node_id in nodes
+        for playbook_id in args.playbooks
+    ]
+    batch = BatchExecutor(
+        PROJECT_ROOT / "domain" / "playbooks",
+        PROJECT_ROOT / "domain" / "config" / "playbook_thresholds.yaml",
+        args.runs_dir,
+        vault_root=args.vault,
+        max_workers=args.workers,
+        max_per_node=args.max_per_node,
+        context_loader=LazyNodeContext if args.lazy else load_node_context,
+        profile_memory=args.profile_memory,
+        dry_run=args.dry_run,
+        run_store=SQLiteRunStore(args.db) if args.db else None,
+        run_catalog=RunCatalog(args.catalog) if args.catalog else None,
+        rule_cache=RuleResultCache(args.rule_cache) if args.rule_cache else None,
+    )
+    report = batch.run(jobs)
+
+    print(f"{len(jobs)} runs over {len(nodes)} nodes with {batch.max_workers} workers")
+    print(f"completed {report.completed}, failed {report.failed}, "
+          f"{report.wall_seconds:.2f}s wall, {report.throughput:.1f} runs/sec\n")
+    print(f"{'stage':<28}{'count':>7}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for stage, stats in report.stage_stats().items():
+        print(f"{stage:<28}{stats['count']:>7}{stats['mean'] * 1000:>10.2f}"
+              f"{stats['p50'] * 1000:>10.2f}{stats['p95'] * 1000:>10.2f}")
+    for result in report.results:
+        if result.error:
+            print(f"  {result.job.node_key} {result.job.playbook_id}: {result.error}")
+
+
+if __name__ == "__main__":
+    main()
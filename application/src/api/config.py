@@ -23,6 +23,7 @@ class Settings(BaseSettings):
     domain_path: Path = project_root / "domain"
     config_path: Path = project_root / "domain" / "config"
     user_profiles_path: Path = config_path / "user_profiles"
+    run_catalog_path: Path = project_root / "data" / "run_catalog.db"
 
     # Authentication
     secret_key: str = "dev-secret-key-change-in-production"
@@ -70,10 +70,46 @@ class KnowledgeProposal(KnowledgeItem):
     reviewer_notes: str = ""
 
 
+class KnowledgeProposalCreate(KnowledgeItemCreate):
+    confidence: Literal["proposed", "reviewed", "validated"] = "proposed"
+    proposed_by: str = ""
+    proposed_from: ProposalSource = Field(default_factory=ProposalSource)
+
+
+class SimilarKnowledge(BaseModel):
+    id: str
+    title: str
+    score: float
+    kind: Literal["item", "proposal"] = "item"
+
+
+class ProposalCreateResult(BaseModel):
+    status: Literal["created", "duplicate"]
+    proposal: Optional[KnowledgeProposal] = None
+    near_duplicates: list[SimilarKnowledge] = []
+
+
 class ProposalAction(BaseModel):
     reviewer_notes: str = ""
 
 
+class ProposalDecision(BaseModel):
+    proposal_id: str
+    action: Literal["approve", "reject"]
+    reviewer_notes: str = ""
+
+
+class ProposalReviewBatch(BaseModel):
+    decisions: list[ProposalDecision]
+
+
+class ProposalReviewResult(BaseModel):
+    status: Literal["applied", "rejected_batch"]
+    approved: list[KnowledgeItem] = []
+    rejected: list[str] = []
+    errors: list[str] = []
+
+
 class KnowledgeStats(BaseModel):
     total_items: int = 0
     by_category: dict[str, int] = {}
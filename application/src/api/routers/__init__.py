@@ -1,4 +1,4 @@
 """API Routers"""
-from . import nodes, health, risks, actions, decisions, profile, widgets, blueprints, vault, intelligence, data_sources
+from . import nodes, health, risks, actions, decisions, profile, widgets, blueprints, vault, intelligence, data_sources, runs
 
-__all__ = ["nodes", "health", "risks", "actions", "decisions", "profile", "widgets", "blueprints", "vault", "intelligence", "data_sources"]
+__all__ = ["nodes", "health", "risks", "actions", "decisions", "profile", "widgets", "blueprints", "vault", "intelligence", "data_sources", "runs"]
@@ -10,8 +10,13 @@ from ..models.knowledge_schemas import (
     KnowledgeItemCreate,
     KnowledgeItemUpdate,
     KnowledgeProposal,
+    KnowledgeProposalCreate,
     KnowledgeStats,
     ProposalAction,
+    ProposalCreateResult,
+    ProposalReviewBatch,
+    ProposalReviewResult,
+    SimilarKnowledge,
 )
 from ..services.knowledge_service import KnowledgeService, get_knowledge_service
 
@@ -78,10 +83,40 @@ async def get_relevant(
 
 @router.get("/knowledge/proposals", response_model=list[KnowledgeProposal])
 async def list_proposals(
+    status: Optional[str] = None,
     svc: KnowledgeService = Depends(get_knowledge_service),
 ):
-    """List pending knowledge proposals from agents"""
-    return svc.list_proposals()
+    """List knowledge proposals from agents, optionally filtered by status"""
+    return svc.list_proposals(status=status)
+
+
+@router.post("/knowledge/proposals", response_model=ProposalCreateResult, status_code=201)
+async def create_proposal(
+    body: KnowledgeProposalCreate,
+    allow_duplicates: bool = False,
+    svc: KnowledgeService = Depends(get_knowledge_service),
+):
+    """Queue a knowledge proposal, refusing near-duplicates unless allowed"""
+    result = svc.create_proposal(body, allow_duplicates=allow_duplicates)
+    if result.status == "duplicate":
+        raise HTTPException(
+            status_code=409,
+            detail=[d.model_dump() for d in result.near_duplicates],
+        )
+    return result
+
+
+@router.get("/knowledge/{item_id}/similar", response_model=list[SimilarKnowledge])
+async def get_similar_items(
+    item_id: str,
+    top_k: int = 5,
+    svc: KnowledgeService = Depends(get_knowledge_service),
+):
+    """Get knowledge items most similar to an item (TF-IDF cosine)"""
+    similar = svc.get_similar_items(item_id, top_k=top_k)
+    if similar is None:
+        raise HTTPException(status_code=404, detail="Knowledge item not found")
+    return similar
 
 
 @router.get("/knowledge/{item_id}", response_model=KnowledgeItem)
@@ -129,6 +164,18 @@ async def delete_knowledge_item(
     return {"status": "deleted"}
 
 
+@router.post("/knowledge/proposals/review", response_model=ProposalReviewResult)
+async def review_proposals(
+    body: ProposalReviewBatch,
+    svc: KnowledgeService = Depends(get_knowledge_service),
+):
+    """Approve and/or reject many proposals in one atomic batch"""
+    result = svc.review_proposals(body.decisions)
+    if result.status != "applied":
+        raise HTTPException(status_code=422, detail=result.errors)
+    return result
+
+
 @router.post("/knowledge/proposals/{proposal_id}/approve", response_model=KnowledgeItem)
 async def approve_proposal(
     proposal_id: str,
@@ -0,0 +1,75 @@
+"""Run History API Router"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from ..services.run_history_service import RunHistoryService, get_run_history_service
+
+router = APIRouter()
+
+
+@router.get("/runs")
+async def list_runs(
+    playbook_id: Optional[str] = None,
+    client_id: Optional[str] = None,
+    status: Optional[str] = None,
+    fired_rule_id: Optional[str] = Query(None, description="Only runs in which this rule fired"),
+    run_id: Optional[str] = Query(None, description="Run ID prefix"),
+    since: Optional[str] = Query(None, description="ISO date/time, inclusive"),
+    until: Optional[str] = Query(None, description="ISO date/time, exclusive"),
+    min_duration: Optional[float] = None,
+    max_duration: Optional[float] = None,
+    min_outputs: Optional[int] = None,
+    max_outputs: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    svc: RunHistoryService = Depends(get_run_history_service),
+):
+    """List past playbook runs, newest first, with pagination"""
+    return svc.list_runs(
+        playbook_id=playbook_id, client_id=client_id, status=status,
+        fired_rule_id=fired_rule_id, run_id=run_id, since=since, until=until,
+        min_duration=min_duration, max_duration=max_duration,
+        min_outputs=min_outputs, max_outputs=max_outputs,
+        limit=limit, offset=offset,
+    )
+
+
+@router.get("/runs/stats/rules")
+async def rule_fire_rates(
+    playbook_id: Optional[str] = None,
+    client_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    svc: RunHistoryService = Depends(get_run_history_service),
+):
+    """Fire rate per rule over completed runs"""
+    return svc.rule_fire_rates(playbook_id=playbook_id, client_id=client_id, since=since, until=until)
+
+
+@router.get("/runs/stats/durations")
+async def duration_percentiles(
+    playbook_id: Optional[str] = None,
+    client_id: Optional[str] = None,
+    status: Optional[str] = "completed",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    svc: RunHistoryService = Depends(get_run_history_service),
+):
+    """p50/p95 run duration per playbook"""
+    return svc.duration_percentiles(
+        playbook_id=playbook_id, client_id=client_id, status=status, since=since, until=until
+    )
+
+
+@router.get("/runs/{run_id}")
+async def get_run(
+    run_id: str,
+    svc: RunHistoryService = Depends(get_run_history_service),
+):
+    """Catalog entry for one run, including per-rule outcomes"""
+    run = svc.get_run(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return run
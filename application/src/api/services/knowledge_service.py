@@ -1,5 +1,6 @@
 """Knowledge Vault Service for reading, writing, and querying knowledge items"""
 
+import os
 import re
 import shutil
 from collections import Counter
@@ -16,10 +17,23 @@ from ..models.knowledge_schemas import (
     KnowledgeItemCreate,
     KnowledgeItemUpdate,
     KnowledgeProposal,
+    KnowledgeProposalCreate,
     KnowledgeSource,
     KnowledgeStats,
+    ProposalCreateResult,
+    ProposalDecision,
+    ProposalReviewResult,
     ProposalSource,
+    SimilarKnowledge,
 )
+from .knowledge_similarity import KnowledgeSimilarityIndex
+from .proposal_store import ProposalStore
+
+try:
+    from ...core.tools.markdown_tools import parse_markdown_with_frontmatter
+except ImportError:
+    # application/src on sys.path: core is a sibling top-level package
+    from core.tools.markdown_tools import parse_markdown_with_frontmatter
 
 # Separator between YAML frontmatter and markdown content
 _FRONTMATTER_SEP = re.compile(r"^---\s*$", re.MULTILINE)
@@ -35,6 +49,9 @@ _CATEGORY_DIRS = {
 # Confidence ordering for sorting (higher = better)
 _CONFIDENCE_RANK = {"validated": 3, "reviewed": 2, "proposed": 1}
 
+# Cosine similarity at which a new proposal is flagged as a near-duplicate
+NEAR_DUPLICATE_THRESHOLD = 0.85
+
 
 def _parse_knowledge_file(path: Path) -> Optional[dict[str, Any]]:
     """Parse a knowledge YAML file with frontmatter + markdown content."""
@@ -66,8 +83,51 @@ def _parse_knowledge_file(path: Path) -> Optional[dict[str, Any]]:
         return None
 
 
-def _to_knowledge_item(data: dict[str, Any], file_path: Path) -> KnowledgeItem:
-    """Convert parsed YAML data to KnowledgeItem."""
+class _KnowledgeHeader(dict):
+    """Frontmatter dict whose markdown body is read on first access to "content"."""
+
+    def __init__(self, data: dict[str, Any], document: dict[str, Any]):
+        super().__init__(data)
+        self._document = document
+
+    def __missing__(self, key: str) -> Any:
+        if key != "content":
+            raise KeyError(key)
+        self["content"] = self._document["content"].strip()
+        return self["content"]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "content":
+            return self["content"]
+        return super().get(key, default)
+
+
+def _read_knowledge_header(path: Path) -> Optional[dict[str, Any]]:
+    """Parse only the YAML frontmatter of a knowledge file, stopping at the closing `---`.
+
+    Files without frontmatter (plain YAML) fall back to a full parse.
+    """
+    try:
+        document = parse_markdown_with_frontmatter(path, lazy_content=True)
+    except Exception:
+        return None
+    data = dict(document["frontmatter"])
+    if not data:
+        return _parse_knowledge_file(path)
+    data.pop("content", None)
+    return _KnowledgeHeader(data, document)
+
+
+def _similarity_text(data: dict[str, Any]) -> str:
+    """Text used for TF-IDF similarity: title, tags and body."""
+    tags = data.get("tags") or []
+    return f"{data.get('title', '')}\n{' '.join(str(t) for t in tags)}\n{data.get('content', '')}"
+
+
+def _to_knowledge_item(
+    data: dict[str, Any], file_path: Path, include_content: bool = True
+) -> KnowledgeItem:
+    """Convert parsed YAML data to KnowledgeItem (optionally without loading the body)."""
     source_data = data.get("source", {})
     if isinstance(source_data, dict):
         source = KnowledgeSource(
@@ -90,7 +150,7 @@ def _to_knowledge_item(data: dict[str, Any], file_path: Path) -> KnowledgeItem:
         tags=data.get("tags", []),
         confidence=data.get("confidence", "proposed"),
         source=source,
-        content=data.get("content", ""),
+        content=data.get("content", "") if include_content else "",
         created=str(data.get("created", "")),
         updated=str(data.get("updated", "")),
     )
@@ -156,16 +216,32 @@ def _write_knowledge_yaml(path: Path, item_data: dict[str, Any]) -> None:
     path.write_text("\n".join(lines), encoding="utf-8")
 
 
+def _write_staged(path: Path, item_data: dict[str, Any]) -> Path:
+    """Write a knowledge file next to its target, to be renamed into place."""
+    staged = path.with_name(f".{path.name}.staged")
+    _write_knowledge_yaml(staged, dict(item_data))
+    return staged
+
+
 class KnowledgeService:
     """Service for managing Knowledge Vault items"""
 
-    def __init__(self):
-        settings = get_settings()
-        self.base_path = settings.vault_path / "knowledge"
+    def __init__(self, base_path: Optional[Path] = None):
+        self.base_path = base_path or get_settings().vault_path / "knowledge"
         self.proposals_path = self.base_path / ".proposals"
+        self.proposal_store = ProposalStore(
+            self.proposals_path,
+            parse_file=_read_knowledge_header,
+            seed_ids=lambda: [data["id"] for data, _ in self._scan_items()],
+        )
+        self._similarity: Optional[KnowledgeSimilarityIndex] = None
+        self._similarity_meta: dict[str, tuple[str, str]] = {}
 
     def _scan_items(self) -> list[tuple[dict[str, Any], Path]]:
-        """Scan all YAML knowledge items (excluding proposals and READMEs)."""
+        """Scan all YAML knowledge items (excluding proposals and READMEs).
+
+        Only frontmatter is read; bodies load lazily on access to "content".
+        """
         results = []
         if not self.base_path.exists():
             return results
@@ -174,7 +250,7 @@ class KnowledgeService:
                 continue
             if yaml_file.name.lower() == "readme.md":
                 continue
-            data = _parse_knowledge_file(yaml_file)
+            data = _read_knowledge_header(yaml_file)
             if data and "id" in data:
                 results.append((data, yaml_file))
         return results
@@ -189,11 +265,15 @@ class KnowledgeService:
         tags: Optional[list[str]] = None,
         confidence: Optional[str] = None,
         search: Optional[str] = None,
+        include_content: bool = True,
     ) -> list[KnowledgeItem]:
-        """List knowledge items with optional filters."""
+        """List knowledge items with optional filters.
+
+        With include_content=False only frontmatter is read (content is "").
+        """
         items = []
         for data, file_path in self._scan_items():
-            item = _to_knowledge_item(data, file_path)
+            item = _to_knowledge_item(data, file_path, include_content=False)
             if category and item.category != category:
                 continue
             if domain and item.domain != domain:
@@ -213,10 +293,12 @@ class KnowledgeService:
                 q = search.lower()
                 if (
                     q not in item.title.lower()
-                    and q not in item.content.lower()
                     and q not in " ".join(item.tags).lower()
+                    and q not in data.get("content", "").lower()
                 ):
                     continue
+            if include_content:
+                item.content = data.get("content", "")
             items.append(item)
         return items
 
@@ -244,10 +326,10 @@ class KnowledgeService:
         - General knowledge: 0.5
         Sorted by score descending, then confidence level.
         """
-        scored: list[tuple[float, int, KnowledgeItem]] = []
+        scored: list[tuple[float, int, KnowledgeItem, dict[str, Any]]] = []
 
         for data, file_path in self._scan_items():
-            item = _to_knowledge_item(data, file_path)
+            item = _to_knowledge_item(data, file_path, include_content=False)
             score = 0.0
 
             domain_match = item.domain == domain or item.domain == "general"
@@ -270,10 +352,14 @@ class KnowledgeService:
                 score *= 0.5
 
             conf_rank = _CONFIDENCE_RANK.get(item.confidence, 0)
-            scored.append((score, conf_rank, item))
+            scored.append((score, conf_rank, item, data))
 
         scored.sort(key=lambda x: (x[0], x[1]), reverse=True)
-        return [item for _, _, item in scored[:max_items]]
+        results = []
+        for _, _, item, data in scored[:max_items]:
+            item.content = data.get("content", "")
+            results.append(item)
+        return results
 
     def create_item(self, create_data: KnowledgeItemCreate) -> KnowledgeItem:
         """Create a new knowledge item."""
@@ -314,13 +400,16 @@ class KnowledgeService:
         }
 
         _write_knowledge_yaml(target, dict(item_dict))
+        self.proposal_store.reserve_ids([next_id])
         item_dict["content"] = create_data.content
+        self._index_similarity(item_dict, "item")
         return _to_knowledge_item(item_dict, target)
 
     def update_item(self, item_id: str, updates: KnowledgeItemUpdate) -> Optional[KnowledgeItem]:
         """Update an existing knowledge item."""
-        for data, file_path in self._scan_items():
-            if data.get("id") == item_id:
+        for header, file_path in self._scan_items():
+            if header.get("id") == item_id:
+                data = _parse_knowledge_file(file_path)
                 update_dict = updates.model_dump(exclude_none=True)
                 if "source" in update_dict:
                     update_dict["source"] = {
@@ -332,6 +421,7 @@ class KnowledgeService:
                 data["updated"] = date.today().isoformat()
                 _write_knowledge_yaml(file_path, dict(data))
                 data["content"] = data.get("content", "")
+                self._index_similarity(data, "item")
                 return _to_knowledge_item(data, file_path)
         return None
 
@@ -340,13 +430,13 @@ class KnowledgeService:
         for data, file_path in self._scan_items():
             if data.get("id") == item_id:
                 file_path.unlink()
+                self._unindex_similarity(item_id)
                 return True
         return False
 
     def get_stats(self) -> KnowledgeStats:
         """Get summary statistics."""
-        items = self.list_items()
-        proposals = self.list_proposals()
+        items = self.list_items(include_content=False)
 
         by_category = dict(Counter(i.category for i in items))
         by_domain = dict(Counter(i.domain for i in items))
@@ -359,13 +449,12 @@ class KnowledgeService:
             by_domain=by_domain,
             by_confidence=by_confidence,
             by_type=by_type,
-            pending_proposals=len([p for p in proposals if p.proposal_status == "pending"]),
+            pending_proposals=self.proposal_store.count("pending"),
         )
 
     def get_activity(self) -> KnowledgeActivity:
         """Get rich activity analytics for the knowledge dashboard."""
-        items = self.list_items()
-        proposals = self.list_proposals()
+        items = self.list_items(include_content=False)
 
         by_confidence = dict(Counter(i.confidence for i in items))
         by_category = dict(Counter(i.category for i in items))
@@ -384,8 +473,8 @@ class KnowledgeService:
                 "categories": categories,
             })
 
-        pending = len([p for p in proposals if p.proposal_status == "pending"])
-        rejected = len([p for p in proposals if p.proposal_status == "rejected"])
+        pending = self.proposal_store.count("pending")
+        rejected = self.proposal_store.count("rejected")
 
         sorted_items = sorted(items, key=lambda i: i.created, reverse=True)
         recent_items = [
@@ -429,93 +518,224 @@ class KnowledgeService:
 
     # ── Proposals ────────────────────────────────────────────────────────
 
-    def list_proposals(self) -> list[KnowledgeProposal]:
-        """List all proposals."""
+    def list_proposals(self, status: Optional[str] = None) -> list[KnowledgeProposal]:
+        """List all proposals, optionally only those with a given status."""
         proposals = []
-        if not self.proposals_path.exists():
-            return proposals
-        for yaml_file in sorted(self.proposals_path.glob("*.yaml")):
-            data = _parse_knowledge_file(yaml_file)
-            if data and "id" in data:
-                proposals.append(_to_proposal(data, yaml_file))
+        for proposal_id in self.proposal_store.ids(status):
+            proposal = self.get_proposal(proposal_id)
+            if proposal:
+                proposals.append(proposal)
         return proposals
 
     def get_proposal(self, proposal_id: str) -> Optional[KnowledgeProposal]:
         """Get a single proposal by ID."""
-        for yaml_file in self.proposals_path.glob("*.yaml"):
-            data = _parse_knowledge_file(yaml_file)
-            if data and data.get("id") == proposal_id:
-                return _to_proposal(data, yaml_file)
-        return None
+        loaded = self._load_proposal(proposal_id)
+        return _to_proposal(*loaded) if loaded else None
 
     def approve_proposal(self, proposal_id: str, reviewer_notes: str = "") -> Optional[KnowledgeItem]:
         """Approve a proposal: move from .proposals/ to main vault."""
-        for yaml_file in self.proposals_path.glob("*.yaml"):
-            data = _parse_knowledge_file(yaml_file)
-            if data and data.get("id") == proposal_id:
-                data["proposal_status"] = "approved"
-                data["reviewer_notes"] = reviewer_notes
-                data["confidence"] = "reviewed"
-                data["updated"] = date.today().isoformat()
+        result = self.review_proposals([
+            ProposalDecision(proposal_id=proposal_id, action="approve", reviewer_notes=reviewer_notes)
+        ])
+        return result.approved[0] if result.approved else None
 
-                # Determine target path
-                category_dir = _CATEGORY_DIRS.get(data.get("category", "content"), "content")
-                domain = data.get("domain", "general")
-                slug = re.sub(r"[^a-z0-9]+", "_", data.get("title", "untitled").lower()).strip("_")[:60]
-                filename = f"{data['id']}_{slug}.yaml"
+    def reject_proposal(self, proposal_id: str, reason: str = "") -> bool:
+        """Reject a proposal (keep file for audit, mark as rejected)."""
+        result = self.review_proposals([
+            ProposalDecision(proposal_id=proposal_id, action="reject", reviewer_notes=reason)
+        ])
+        return bool(result.rejected)
+
+    def review_proposals(self, decisions: list[ProposalDecision]) -> ProposalReviewResult:
+        """Approve and/or reject many proposals as one batch.
+
+        Every proposal is resolved through the index and parsed before anything
+        is written; if any id is unknown or appears twice, the whole batch is
+        refused and no files change. The updated files are written to temporary
+        files first and renamed into place only once all of them were written,
+        so a failed write leaves the vault unchanged. The proposal index is
+        updated once.
+        """
+        errors = []
+        staged: list[tuple[ProposalDecision, dict[str, Any], Path]] = []
+        seen: set[str] = set()
+        for decision in decisions:
+            if decision.proposal_id in seen:
+                errors.append(f"{decision.proposal_id}: duplicate decision in batch")
+                continue
+            seen.add(decision.proposal_id)
+            loaded = self._load_proposal(decision.proposal_id)
+            if not loaded:
+                errors.append(f"{decision.proposal_id}: proposal not found")
+                continue
+            staged.append((decision, *loaded))
 
-                if data.get("category") == "content":
-                    target = self.base_path / category_dir / domain / filename
-                elif data.get("category") == "operations":
-                    target = self.base_path / category_dir / "engagement-management" / filename
-                else:
-                    target = self.base_path / category_dir / filename
+        if errors:
+            return ProposalReviewResult(status="rejected_batch", errors=errors)
 
-                # Remove proposal-specific fields before writing to main vault
-                clean = {k: v for k, v in data.items() if k not in (
-                    "proposed_by", "proposed_from", "proposal_status", "proposal_date", "reviewer_notes"
-                )}
-                _write_knowledge_yaml(target, dict(clean))
+        today = date.today().isoformat()
+        writes: list[tuple[Path, Path]] = []    # (temporary file, target)
+        promoted: list[tuple[dict[str, Any], Path, Path]] = []
+        rejected: list[str] = []
+        changes: dict[str, Optional[str]] = {}
+        try:
+            for decision, data, yaml_file in staged:
+                if decision.action == "approve":
+                    clean, target = self._promotion(data, decision.reviewer_notes, today)
+                    writes.append((_write_staged(target, clean), target))
+                    promoted.append((clean, target, yaml_file))
+                    changes[decision.proposal_id] = None
+                else:
+                    data["proposal_status"] = "rejected"
+                    data["reviewer_notes"] = decision.reviewer_notes
+                    data["updated"] = today
+                    writes.append((_write_staged(yaml_file, data), yaml_file))
+                    rejected.append(decision.proposal_id)
+                    changes[decision.proposal_id] = "rejected"
+        except OSError as e:
+            for staged_file, _ in writes:
+                staged_file.unlink(missing_ok=True)
+            return ProposalReviewResult(status="rejected_batch", errors=[f"write failed: {e}"])
+
+        for staged_file, target in writes:
+            os.replace(staged_file, target)
+        self.proposal_store.reserve_ids(clean["id"] for clean, _, _ in promoted)
+        approved = []
+        for clean, target, yaml_file in promoted:
+            yaml_file.unlink()
+            self._index_similarity(clean, "item")
+            approved.append(_to_knowledge_item(clean, target))
+        for proposal_id in rejected:
+            self._unindex_similarity(proposal_id)
+
+        self.proposal_store.apply(changes)
+        return ProposalReviewResult(status="applied", approved=approved, rejected=rejected)
+
+    def create_proposal(
+        self, create_data: KnowledgeProposalCreate, allow_duplicates: bool = False
+    ) -> ProposalCreateResult:
+        """Queue a knowledge proposal for human review.
+
+        Items and pending proposals with cosine similarity of at least
+        NEAR_DUPLICATE_THRESHOLD are reported; unless allow_duplicates is set,
+        such a proposal is not written.
+        """
+        data = create_data.model_dump()
+        duplicates = self.find_near_duplicates(_similarity_text(data))
+        if duplicates and not allow_duplicates:
+            return ProposalCreateResult(status="duplicate", near_duplicates=duplicates)
 
-                # Remove proposal file
-                yaml_file.unlink()
+        today = date.today().isoformat()
+        data.update({
+            "id": self._next_id(),
+            "proposal_status": "pending",
+            "proposal_date": today,
+            "created": today,
+            "updated": today,
+        })
+        slug = re.sub(r"[^a-z0-9]+", "_", create_data.title.lower()).strip("_")[:60]
+        target = self.proposals_path / f"{data['id']}_{slug}.yaml"
+        _write_knowledge_yaml(target, dict(data))
+        self.proposal_store.register(data["id"], target)
+        self._index_similarity(data, "proposal")
+
+        return ProposalCreateResult(
+            status="created",
+            proposal=_to_proposal(data, target),
+            near_duplicates=duplicates,
+        )
 
-                clean["content"] = clean.get("content", "")
-                return _to_knowledge_item(clean, target)
-        return None
+    def get_similar_items(self, item_id: str, top_k: int = 5) -> Optional[list[SimilarKnowledge]]:
+        """Items and pending proposals most similar to an indexed item (None if unknown)."""
+        index = self._similarity_index()
+        if item_id not in index:
+            return None
+        return self._to_similar(index.neighbours(item_id, top_k))
 
-    def reject_proposal(self, proposal_id: str, reason: str = "") -> bool:
-        """Reject a proposal (keep file for audit, mark as rejected)."""
-        for yaml_file in self.proposals_path.glob("*.yaml"):
-            data = _parse_knowledge_file(yaml_file)
-            if data and data.get("id") == proposal_id:
-                data["proposal_status"] = "rejected"
-                data["reviewer_notes"] = reason
-                data["updated"] = date.today().isoformat()
-                _write_knowledge_yaml(yaml_file, dict(data))
-                return True
-        return False
+    def find_near_duplicates(
+        self, text: str, threshold: float = NEAR_DUPLICATE_THRESHOLD
+    ) -> list[SimilarKnowledge]:
+        """Items and pending proposals whose content nearly duplicates text."""
+        return self._to_similar(self._similarity_index().near_duplicates(text, threshold))
 
     # ── Helpers ───────────────────────────────────────────────────────────
 
+    def _similarity_index(self) -> KnowledgeSimilarityIndex:
+        """Build the TF-IDF index over items and pending proposals on first use."""
+        if self._similarity is None:
+            documents: dict[str, str] = {}
+            self._similarity_meta = {}
+            for data, _ in self._scan_items():
+                documents[data["id"]] = _similarity_text(data)
+                self._similarity_meta[data["id"]] = (data.get("title", data["id"]), "item")
+            for proposal in self.list_proposals(status="pending"):
+                documents[proposal.id] = _similarity_text(proposal.model_dump())
+                self._similarity_meta[proposal.id] = (proposal.title, "proposal")
+            index = KnowledgeSimilarityIndex()
+            index.build(documents)
+            self._similarity = index
+        return self._similarity
+
+    def _index_similarity(self, data: dict[str, Any], kind: str) -> None:
+        """Incrementally refresh the similarity index if it has been built."""
+        if self._similarity is not None:
+            self._similarity.upsert(data["id"], _similarity_text(data))
+            self._similarity_meta[data["id"]] = (data.get("title", data["id"]), kind)
+
+    def _unindex_similarity(self, item_id: str) -> None:
+        if self._similarity is not None:
+            self._similarity.remove(item_id)
+            self._similarity_meta.pop(item_id, None)
+
+    def _to_similar(self, matches: list[tuple[str, float]]) -> list[SimilarKnowledge]:
+        results = []
+        for doc_id, score in matches:
+            title, kind = self._similarity_meta.get(doc_id, (doc_id, "item"))
+            results.append(SimilarKnowledge(id=doc_id, title=title, score=score, kind=kind))
+        return results
+
+    def _load_proposal(self, proposal_id: str) -> Optional[tuple[dict[str, Any], Path]]:
+        """Resolve a proposal file through the index and parse it."""
+        yaml_file = self.proposal_store.path_for(proposal_id)
+        if yaml_file is None:
+            return None
+        data = _parse_knowledge_file(yaml_file)
+        if not data or data.get("id") != proposal_id:
+            return None
+        return data, yaml_file
+
+    def _promotion(
+        self, data: dict[str, Any], reviewer_notes: str, today: str
+    ) -> tuple[dict[str, Any], Path]:
+        """Vault item and target path for an approved proposal."""
+        data["proposal_status"] = "approved"
+        data["reviewer_notes"] = reviewer_notes
+        data["confidence"] = "reviewed"
+        data["updated"] = today
+
+        # Determine target path
+        category_dir = _CATEGORY_DIRS.get(data.get("category", "content"), "content")
+        domain = data.get("domain", "general")
+        slug = re.sub(r"[^a-z0-9]+", "_", data.get("title", "untitled").lower()).strip("_")[:60]
+        filename = f"{data['id']}_{slug}.yaml"
+
+        if data.get("category") == "content":
+            target = self.base_path / category_dir / domain / filename
+        elif data.get("category") == "operations":
+            target = self.base_path / category_dir / "engagement-management" / filename
+        else:
+            target = self.base_path / category_dir / filename
+
+        # Remove proposal-specific fields before writing to main vault
+        clean = {k: v for k, v in data.items() if k not in (
+            "proposed_by", "proposed_from", "proposal_status", "proposal_date", "reviewer_notes"
+        )}
+        clean["content"] = clean.get("content", "")
+        return clean, target
+
     def _next_id(self) -> str:
-        """Generate next KV_NNN ID."""
-        max_num = 0
-        for data, _ in self._scan_items():
-            item_id = data.get("id", "")
-            match = re.match(r"KV_(\d+)", item_id)
-            if match:
-                max_num = max(max_num, int(match.group(1)))
-        # Also check proposals
-        if self.proposals_path.exists():
-            for yaml_file in self.proposals_path.glob("*.yaml"):
-                data = _parse_knowledge_file(yaml_file)
-                if data:
-                    item_id = data.get("id", "")
-                    match = re.match(r"KV_(\d+)", item_id)
-                    if match:
-                        max_num = max(max_num, int(match.group(1)))
-        return f"KV_{max_num + 1:03d}"
+        """Allocate the next KV_NNN ID from the persisted proposal-store counter."""
+        return self.proposal_store.allocate_id()
 
 
 # Singleton
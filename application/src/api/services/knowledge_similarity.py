@@ -0,0 +1,252 @@
+"""Related-knowledge recommendations via sparse TF-IDF cosine similarity.
+
+Builds an L2-normalised TF-IDF matrix (SciPy CSR) over knowledge text and
+keeps a precomputed top-k neighbour list per document. Documents can be
+added, updated or removed incrementally: only the changed row is
+re-vectorised and only neighbour lists the change can affect are touched.
+Everything runs offline; there is no model download.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Iterable, Optional
+
+import numpy as np
+from scipy import sparse
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9_\-]+")
+
+_STOPWORDS = frozenset("""
+a about above after again all also an and any are as at be because been before being
+between both but by can could did do does doing during each few for from had has have
+having he her here hers him his how i if in into is it its itself just me more most my
+no nor not of off on once only or other our ours out over own same she should so some
+such than that the their theirs them then there these they this those through to too
+under until up very was we were what when where which while who whom why will with
+would you your yours
+""".split())
+
+# Full rebuild once this share of documents changed since the last one (IDF drift)
+_REBUILD_RATIO = 0.2
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords."""
+    return [t for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _rank(entry: tuple[str, float]) -> tuple[float, str]:
+    """Neighbour-list order: higher score first, then id."""
+    return (-entry[1], entry[0])
+
+
+class KnowledgeSimilarityIndex:
+    """TF-IDF vectors with cosine top-k neighbour lists.
+
+    Usage:
+        index = KnowledgeSimilarityIndex(k=5)
+        index.build({"KV_001": "text ...", "KV_002": "text ..."})
+        index.neighbours("KV_001")          # precomputed [(id, score), ...]
+        index.query("free text", top_k=3)   # ad-hoc lookup
+        index.upsert("KV_003", "text ...")  # incremental refresh
+    """
+
+    def __init__(self, k: int = 10):
+        self.k = k
+        self._ids: list[str] = []
+        self._row: dict[str, int] = {}
+        self._counts: dict[str, Counter] = {}
+        self._df: Counter = Counter()
+        self._vocab: dict[str, int] = {}
+        self._idf = np.zeros(0)
+        self._matrix = sparse.csr_matrix((0, 0))
+        self._neighbours: dict[str, list[tuple[str, float]]] = {}
+        self._changes_since_build = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._row
+
+    # ── Building ─────────────────────────────────────────────────────────
+
+    def build(self, documents: dict[str, str]) -> None:
+        """(Re)build vectors and all neighbour lists from scratch."""
+        self._ids = list(documents)
+        self._row = {doc_id: i for i, doc_id in enumerate(self._ids)}
+        self._counts = {doc_id: Counter(tokenize(text)) for doc_id, text in documents.items()}
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Recompute vocabulary, IDF, vectors and neighbour lists from term counts."""
+        self._df = Counter()
+        for counts in self._counts.values():
+            self._df.update(counts.keys())
+        self._vocab = {term: i for i, term in enumerate(sorted(self._df))}
+        self._idf = self._compute_idf()
+        self._matrix = self._vectorize([self._counts[d] for d in self._ids])
+        self._neighbours = self._all_top_k()
+        self._changes_since_build = 0
+
+    def _compute_idf(self) -> np.ndarray:
+        n = len(self._ids)
+        idf = np.zeros(len(self._vocab))
+        for term, col in self._vocab.items():
+            idf[col] = math.log((1 + n) / (1 + self._df[term])) + 1.0
+        return idf
+
+    def _vectorize(self, counts_list: list[Counter]) -> sparse.csr_matrix:
+        """Sublinear-TF x IDF rows, L2-normalised."""
+        rows, cols, vals = [], [], []
+        for r, counts in enumerate(counts_list):
+            for term, tf in counts.items():
+                col = self._vocab.get(term)
+                if col is not None:
+                    rows.append(r)
+                    cols.append(col)
+                    vals.append((1.0 + math.log(tf)) * self._idf[col])
+        matrix = sparse.csr_matrix(
+            (vals, (rows, cols)), shape=(len(counts_list), len(self._vocab))
+        )
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+
+    def _top_k(self, scores: np.ndarray, exclude: Optional[int], top_k: int) -> list[tuple[str, float]]:
+        if top_k <= 0:
+            return []
+        if exclude is not None:
+            scores[exclude] = -1.0
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > top_k:
+            # Keep everything tied (after rounding) with the k-th score; ids break ties
+            kth = np.partition(-scores[candidates], top_k - 1)[top_k - 1]
+            candidates = candidates[-scores[candidates] <= kth + 1e-6]
+        ranked = sorted(candidates, key=lambda i: (-round(float(scores[i]), 6), self._ids[i]))
+        return [(self._ids[i], round(float(scores[i]), 6)) for i in ranked[:top_k]]
+
+    def _all_top_k(self, chunk_size: int = 1024) -> dict[str, list[tuple[str, float]]]:
+        neighbours = {}
+        transposed = self._matrix.T.tocsc()
+        for start in range(0, len(self._ids), chunk_size):
+            block = (self._matrix[start:start + chunk_size] @ transposed).toarray()
+            for offset, scores in enumerate(block):
+                row = start + offset
+                neighbours[self._ids[row]] = self._top_k(scores, row, self.k)
+        return neighbours
+
+    def _scores_for(self, vector: sparse.csr_matrix) -> np.ndarray:
+        if not self._ids:
+            return np.zeros(0)
+        return np.asarray((self._matrix @ vector.T).todense()).ravel()
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def neighbours(self, doc_id: str, top_k: Optional[int] = None) -> list[tuple[str, float]]:
+        """Precomputed most-similar documents for an indexed document."""
+        return self._neighbours.get(doc_id, [])[:top_k or self.k]
+
+    def query(self, text: str, top_k: int = 10) -> list[tuple[str, float]]:
+        """Most similar indexed documents for arbitrary text."""
+        vector = self._vectorize([Counter(tokenize(text))])
+        return self._top_k(self._scores_for(vector), None, top_k)
+
+    def near_duplicates(
+        self, text: str, threshold: float, exclude: Iterable[str] = ()
+    ) -> list[tuple[str, float]]:
+        """Indexed documents whose cosine similarity to text is >= threshold."""
+        skip = set(exclude)
+        return [
+            (doc_id, score) for doc_id, score in self.query(text, top_k=self.k)
+            if score >= threshold and doc_id not in skip
+        ]
+
+    # ── Incremental maintenance ──────────────────────────────────────────
+
+    def upsert(self, doc_id: str, text: str) -> None:
+        """Add or replace one document, refreshing only affected neighbour lists."""
+        counts = Counter(tokenize(text))
+        old = self._counts.get(doc_id)
+        if old is not None:
+            self._df.subtract(old.keys())
+        self._df.update(counts.keys())
+        self._counts[doc_id] = counts
+
+        new_terms = [t for t in counts if t not in self._vocab]
+        for term in new_terms:
+            self._vocab[term] = len(self._vocab)
+        if new_terms:
+            # Unseen terms get the IDF they would have had in a full build
+            n = len(self._ids) + (old is None)
+            extra = [math.log((1 + n) / (1 + self._df[t])) + 1.0 for t in new_terms]
+            self._idf = np.concatenate([self._idf, extra])
+            self._matrix.resize((self._matrix.shape[0], len(self._vocab)))
+
+        vector = self._vectorize([counts])
+        if old is None:
+            self._row[doc_id] = len(self._ids)
+            self._ids.append(doc_id)
+            self._matrix = sparse.vstack([self._matrix, vector], format="csr")
+        else:
+            row = self._row[doc_id]
+            self._matrix = sparse.vstack(
+                [self._matrix[:row], vector, self._matrix[row + 1:]], format="csr"
+            )
+
+        if self._rebuilt_after_change():
+            return
+        scores = self._scores_for(vector)
+        row = self._row[doc_id]
+        self._neighbours[doc_id] = self._top_k(scores.copy(), row, self.k)
+        for other, other_row in self._row.items():
+            if other != doc_id:
+                self._offer(other, doc_id, float(scores[other_row]))
+
+    def remove(self, doc_id: str) -> None:
+        """Drop a document and repair neighbour lists that referenced it."""
+        if doc_id not in self._row:
+            return
+        self._df.subtract(self._counts.pop(doc_id).keys())
+        row = self._row.pop(doc_id)
+        self._ids.pop(row)
+        self._matrix = sparse.vstack([self._matrix[:row], self._matrix[row + 1:]], format="csr")
+        self._row = {d: i for i, d in enumerate(self._ids)}
+        self._neighbours.pop(doc_id, None)
+
+        if self._rebuilt_after_change():
+            return
+        for other, listed in self._neighbours.items():
+            if any(n == doc_id for n, _ in listed):
+                self._refresh(other)
+
+    def _offer(self, doc_id: str, candidate: str, score: float) -> None:
+        """Update doc_id's neighbour list after candidate's vector changed."""
+        listed = self._neighbours.get(doc_id, [])
+        was_listed = any(n == candidate for n, _ in listed)
+        entry = (candidate, round(score, 6))
+        if was_listed and len(listed) >= self.k and _rank(entry) > _rank(listed[-1]):
+            # Candidate fell below the old k-th entry; unlisted docs may now outrank it
+            self._refresh(doc_id)
+            return
+        kept = [(n, s) for n, s in listed if n != candidate]
+        if score > 0 and (len(kept) < self.k or _rank(entry) < _rank(kept[-1])):
+            kept.append(entry)
+            kept.sort(key=_rank)
+            self._neighbours[doc_id] = kept[:self.k]
+        elif was_listed:
+            self._neighbours[doc_id] = kept
+
+    def _refresh(self, doc_id: str) -> None:
+        row = self._row[doc_id]
+        scores = self._scores_for(self._matrix[row])
+        self._neighbours[doc_id] = self._top_k(scores, row, self.k)
+
+    def _rebuilt_after_change(self) -> bool:
+        """Fall back to a full rebuild once IDF weights have drifted too far."""
+        self._changes_since_build += 1
+        if self._changes_since_build > max(10, _REBUILD_RATIO * len(self._ids)):
+            self._rebuild()
+            return True
+        return False
@@ -0,0 +1,233 @@
+"""Indexed store for Knowledge Vault proposals.
+
+Keeps an id index (proposal id -> file name + status), a status index
+(pending/approved/rejected -> ids) and a monotonic KV_NNN id allocator.
+The index is persisted as JSON next to the proposals directory so lookups,
+approvals and rejections never have to glob and parse the whole queue.
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+_INDEX_FILE = ".proposals_index.json"
+_INDEX_VERSION = 1
+_ID_PATTERN = re.compile(r"KV_(\d+)")
+
+PROPOSAL_STATUSES = ("pending", "approved", "rejected")
+
+
+def _id_number(item_id: str) -> int:
+    match = _ID_PATTERN.match(item_id or "")
+    return int(match.group(1)) if match else 0
+
+
+class ProposalStore:
+    """Id/status index over `.proposals/*.yaml` with a persisted id allocator.
+
+    The index is reconciled against the proposals directory whenever the
+    directory's mtime changes (e.g. an agent dropped a new proposal file),
+    parsing only the files that are not indexed yet. The allocator is
+    advanced past the vault item ids (seed_ids) when the index is loaded or
+    built and when such an outside change is reconciled; allocations in
+    between touch only the index.
+    """
+
+    def __init__(
+        self,
+        proposals_path: Path,
+        parse_file: Callable[[Path], Optional[dict[str, Any]]],
+        seed_ids: Callable[[], Iterable[str]],
+    ):
+        """
+        Args:
+            proposals_path: Directory holding proposal YAML files
+            parse_file: Parser returning the proposal dict for a file (or None)
+            seed_ids: Ids already used by vault items, read on load and reconciliation
+        """
+        self.proposals_path = proposals_path
+        # Kept outside the proposals directory so index writes don't bump its mtime
+        self.index_path = proposals_path.parent / _INDEX_FILE
+        self._parse_file = parse_file
+        self._seed_ids = seed_ids
+        self._lock = threading.RLock()
+        self._entries: dict[str, dict[str, str]] = {}
+        self._by_status: dict[str, set[str]] = {s: set() for s in PROPOSAL_STATUSES}
+        self._next_id = 1
+        self._dir_mtime_ns = -1
+        self._loaded = False
+
+    # ── Lookups ──────────────────────────────────────────────────────────
+
+    def path_for(self, proposal_id: str) -> Optional[Path]:
+        """Return the proposal file path for an id, or None if unknown."""
+        with self._lock:
+            self._ensure_fresh()
+            entry = self._entries.get(proposal_id)
+            return self.proposals_path / entry["file"] if entry else None
+
+    def status_of(self, proposal_id: str) -> Optional[str]:
+        with self._lock:
+            self._ensure_fresh()
+            entry = self._entries.get(proposal_id)
+            return entry["status"] if entry else None
+
+    def ids(self, status: Optional[str] = None) -> list[str]:
+        """Return proposal ids (optionally filtered by status), sorted by file name."""
+        with self._lock:
+            self._ensure_fresh()
+            ids = self._by_status.get(status, set()) if status else self._entries.keys()
+            return sorted(ids, key=lambda i: self._entries[i]["file"])
+
+    def count(self, status: str) -> int:
+        with self._lock:
+            self._ensure_fresh()
+            return len(self._by_status.get(status, ()))
+
+    # ── Mutations ────────────────────────────────────────────────────────
+
+    def allocate_id(self) -> str:
+        """Reserve and return the next KV_NNN id (never reused)."""
+        with self._lock:
+            self._ensure_loaded()
+            item_id = f"KV_{self._next_id:03d}"
+            self._next_id += 1
+            self._save()
+            return item_id
+
+    def register(self, proposal_id: str, path: Path, status: str = "pending") -> None:
+        """Index a proposal file written by the caller."""
+        with self._lock:
+            self._ensure_loaded()
+            self._set(proposal_id, path.name, status)
+            self._commit()
+
+    def apply(self, changes: dict[str, Optional[str]]) -> None:
+        """Apply many status changes with a single index write.
+
+        Args:
+            changes: proposal id -> new status, or None to drop the entry
+                (the proposal file was removed, e.g. after approval)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            for proposal_id, status in changes.items():
+                if status is None:
+                    self._drop(proposal_id)
+                elif proposal_id in self._entries:
+                    self._set(proposal_id, self._entries[proposal_id]["file"], status)
+            self._commit()
+
+    def reserve_ids(self, item_ids: Iterable[str]) -> None:
+        """Advance the allocator past ids created outside of it."""
+        with self._lock:
+            self._ensure_loaded()
+            if self._reserve(item_ids):
+                self._save()
+
+    def rebuild(self) -> None:
+        """Drop the persisted index and rebuild it from the proposal files."""
+        with self._lock:
+            self._entries = {}
+            self._by_status = {s: set() for s in PROPOSAL_STATUSES}
+            self._next_id = max((_id_number(i) for i in self._seed_ids()), default=0) + 1
+            self._reconcile()
+            self._loaded = True
+            self._save()
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _set(self, proposal_id: str, file_name: str, status: str) -> None:
+        previous = self._entries.get(proposal_id)
+        if previous:
+            self._by_status.get(previous["status"], set()).discard(proposal_id)
+        self._entries[proposal_id] = {"file": file_name, "status": status}
+        self._by_status.setdefault(status, set()).add(proposal_id)
+        self._next_id = max(self._next_id, _id_number(proposal_id) + 1)
+
+    def _reserve(self, item_ids: Iterable[str]) -> bool:
+        """Advance the allocator past item_ids; True if it moved."""
+        highest = max((_id_number(i) for i in item_ids), default=0)
+        if highest < self._next_id:
+            return False
+        self._next_id = highest + 1
+        return True
+
+    def _drop(self, proposal_id: str) -> None:
+        entry = self._entries.pop(proposal_id, None)
+        if entry:
+            self._by_status.get(entry["status"], set()).discard(proposal_id)
+
+    def _current_mtime_ns(self) -> int:
+        try:
+            return self.proposals_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            if self._load():
+                self._loaded = True
+                # Items may have been added to the vault since the index was saved
+                if self._reserve(self._seed_ids()):
+                    self._save()
+            else:
+                self.rebuild()
+
+    def _ensure_fresh(self) -> None:
+        self._ensure_loaded()
+        if self._current_mtime_ns() != self._dir_mtime_ns:
+            # Changed outside this store; vault items may have been added too
+            self._reserve(self._seed_ids())
+            self._commit()
+
+    def _commit(self) -> None:
+        """Pick up files added or removed since the last sync, then persist once."""
+        self._reconcile()
+        self._save()
+
+    def _reconcile(self) -> None:
+        """Sync the index with the directory, parsing only unindexed files."""
+        on_disk = (
+            {p.name for p in self.proposals_path.glob("*.yaml")}
+            if self.proposals_path.exists() else set()
+        )
+        for proposal_id in [i for i, e in self._entries.items() if e["file"] not in on_disk]:
+            self._drop(proposal_id)
+        indexed = {e["file"] for e in self._entries.values()}
+        for file_name in sorted(on_disk - indexed):
+            data = self._parse_file(self.proposals_path / file_name)
+            if data and "id" in data:
+                self._set(data["id"], file_name, data.get("proposal_status", "pending"))
+        self._dir_mtime_ns = self._current_mtime_ns()
+
+    def _load(self) -> bool:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return False
+        if raw.get("version") != _INDEX_VERSION:
+            return False
+        self._entries = {}
+        self._by_status = {s: set() for s in PROPOSAL_STATUSES}
+        for proposal_id, entry in raw.get("proposals", {}).items():
+            self._set(proposal_id, entry["file"], entry["status"])
+        self._next_id = max(self._next_id, int(raw.get("next_id", 1)))
+        self._dir_mtime_ns = int(raw.get("dir_mtime_ns", -1))
+        return True
+
+    def _save(self) -> None:
+        """Persist the index atomically (write temp file, then rename)."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": _INDEX_VERSION,
+            "next_id": self._next_id,
+            "dir_mtime_ns": self._dir_mtime_ns,
+            "proposals": self._entries,
+        }
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.index_path)
@@ -0,0 +1,54 @@
+"""Run history service: queries over the playbook engine's run catalog"""
+
+from pathlib import Path
+from typing import Any, Optional
+
+from ..config import get_settings
+
+try:
+    from ...core.playbook_engine.run_catalog import DEFAULT_PAGE_SIZE, RunCatalog
+except ImportError:
+    # application/src on sys.path: core is a sibling top-level package
+    from core.playbook_engine.run_catalog import DEFAULT_PAGE_SIZE, RunCatalog
+
+
+class RunHistoryService:
+    """Read-only access to indexed playbook run metadata.
+
+    Queries never open run directories; an absent catalog reads as empty.
+    """
+
+    def __init__(self, catalog_path: Optional[Path] = None):
+        self.catalog_path = Path(catalog_path or get_settings().run_catalog_path)
+        self._catalog: Optional[RunCatalog] = None
+
+    def _get_catalog(self) -> Optional[RunCatalog]:
+        if self._catalog is None and self.catalog_path.exists():
+            self._catalog = RunCatalog(self.catalog_path)
+        return self._catalog
+
+    def list_runs(self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0, **filters) -> dict[str, Any]:
+        """One page of runs matching the filters (see RunCatalog.query)"""
+        catalog = self._get_catalog()
+        if catalog is None:
+            return {"items": [], "total": 0, "limit": limit, "offset": offset}
+        return catalog.query(limit=limit, offset=offset, **filters)
+
+    def get_run(self, run_id: str) -> Optional[dict[str, Any]]:
+        catalog = self._get_catalog()
+        return catalog.get(run_id) if catalog else None
+
+    def rule_fire_rates(self, **filters) -> list[dict[str, Any]]:
+        catalog = self._get_catalog()
+        return catalog.rule_fire_rates(**filters) if catalog else []
+
+    def duration_percentiles(self, **filters) -> list[dict[str, Any]]:
+        catalog = self._get_catalog()
+        return catalog.duration_percentiles(**filters) if catalog else []
+
+
+run_history_service = RunHistoryService()
+
+
+def get_run_history_service() -> RunHistoryService:
+    return run_history_service
@@ -30,6 +30,8 @@ EXAMPLE_REALM = VAULT_ROOT / "ACME_CORP"
 # Output paths - where agents write to
 AGENT_OUTPUT = DATA_ROOT / "agent_outputs"
 RUNS_OUTPUT = DATA_ROOT / "runs"
+RUNS_DB = DATA_ROOT / "runs.db"
+RUN_CATALOG = DATA_ROOT / "run_catalog.db"
 
 # Core directories within application
 CORE_DIR = APPLICATION_ROOT / "src" / "core"
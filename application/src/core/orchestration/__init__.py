@@ -8,26 +8,40 @@ Components:
 - OrchestrationAgent: Main orchestrator
 - ProcessParser: Free-form text to structured process
 - ConflictDetector: Identifies process conflicts
+- ProcessIndex: Blocking index used to pair processes for conflict checks
+- ProcessSimilarity: MinHash/LSH near-duplicate detection
+- DependencyGraph: Trigger graph with incremental cycle detection
+- ProcessRegistry: In-memory, indexed view of the current process definitions
 - AgentFactory: Creates new agents from processes
 - PlaybookGenerator: Generates playbooks from process steps
 - VersionController: Manages versioning and rollback
 - AuditLogger: Immutable audit trail
+- AuditWriter: Shared buffered, group-committing audit log writer
 """
 
 from .orchestration_agent import OrchestrationAgent
 from .process_parser import ProcessParser
-from .conflict_detector import ConflictDetector
+from .conflict_detector import ConflictDetector, ProcessIndex
+from .process_similarity import ProcessSimilarity
+from .dependency_graph import DependencyGraph
+from .process_registry import ProcessRegistry
 from .agent_factory import AgentFactory
 from .playbook_generator import PlaybookGenerator
 from .version_controller import VersionController
 from .audit_logger import AuditLogger
+from .audit_writer import AuditWriter
 
 __all__ = [
     'OrchestrationAgent',
     'ProcessParser',
     'ConflictDetector',
+    'ProcessIndex',
+    'ProcessSimilarity',
+    'DependencyGraph',
+    'ProcessRegistry',
     'AgentFactory',
     'PlaybookGenerator',
     'VersionController',
     'AuditLogger',
+    'AuditWriter',
 ]
@@ -3,14 +3,69 @@ Audit Logger
 
 Immutable audit trail for all orchestration activities.
 Logs events in append-only JSONL format for compliance and debugging.
+
+Sidecar indexes:
+    Each daily log YYYY-MM-DD.jsonl has a sidecar YYYY-MM-DD.idx, appended
+    with one row per event at write time:
+
+        [byte offset, line length, event_type, actor, entity]
+
+    Queries load the rows into posting lists (field value -> rows), walk the
+    rows matching the rarest filter newest-first and seek straight to the
+    matching lines, stopping at `limit`; only returned events are parsed.
+    Loaded indexes are cached: past days once, today's by reading the rows
+    appended since. A missing or lagging sidecar (older logs, a crash
+    between the two appends) is rebuilt from the log on first use.
+
+Writing:
+    Events and index rows are appended through an AuditWriter (by default
+    the process-wide per_event writer). With a buffered writer, index rows
+    are written once the events' offsets are known, and queries flush the
+    writer first so they see every event logged before them.
+
+Hash chain:
+    Every event carries `prev_hash`, the `hash` of the event logged before
+    it (across days; GENESIS_HASH for the first), and its own `hash`: the
+    SHA-256 of its canonical JSON without the hash. Editing, removing or
+    reordering events breaks the chain at that point, and a missing day
+    breaks the link from the day before it to the day after. The chain head
+    is shared by the loggers of a directory within a process; loggers in
+    other processes must not append to the same directory.
+
+Checkpoints:
+    Every `checkpoint_every` events, and after a clean verification, a row
+
+        {"events": n, "offset": bytes, "head": hash, "signature": hmac}
+
+    is appended to the day's YYYY-MM-DD.chk sidecar, signed with HMAC-SHA256
+    under the checkpoint key (argument or AUDIT_CHECKPOINT_KEY; unsigned
+    without one). Verification starts at the latest checkpoint with a valid
+    signature after re-hashing the event it ends at, so re-verifying
+    unchanged days reads one event each. full=True re-verifies everything,
+    which is still needed to catch in-place edits made before a checkpoint
+    whose chain was recomputed up to it. Days are verified in parallel
+    worker processes.
 """
 
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 import json
 import hashlib
+import hmac
+import os
+import threading
+
+from .audit_writer import AuditWriter, shared_writer
+
+# Index row fields, after offset and length
+INDEXED_FIELDS = ("event_type", "actor", "entity")
+
+GENESIS_HASH = "0" * 64
+CHECKPOINT_EVERY = 1000
+CHECKPOINT_KEY_ENV = "AUDIT_CHECKPOINT_KEY"
 
 
 @dataclass
@@ -25,6 +80,8 @@ class AuditEvent:
     conflicts_detected: List[Dict]
     resolution: Optional[str]
     checksum: str = ""
+    prev_hash: Optional[str] = None
+    hash: Optional[str] = None
 
     def __post_init__(self):
         if not self.checksum:
@@ -36,6 +93,55 @@ class AuditEvent:
         return hashlib.sha256(data.encode()).hexdigest()[:16]
 
 
+def event_hash(event: Dict) -> str:
+    """Chain hash of an event: SHA-256 of its canonical JSON, without `hash`."""
+    body = {name: value for name, value in event.items() if name != "hash"}
+    return hashlib.sha256(json.dumps(body, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+def sign_checkpoint(key: Optional[bytes], day: str, events: int, offset: int, head: str) -> Optional[str]:
+    """HMAC-SHA256 signature of a checkpoint (None without a key)."""
+    if not key:
+        return None
+    return hmac.new(key, f"{day}|{events}|{offset}|{head}".encode(), hashlib.sha256).hexdigest()
+
+
+@dataclass
+class _Chain:
+    """Head of a directory's hash chain, shared by its loggers in this process."""
+    head: str = GENESIS_HASH
+    day: Optional[str] = None       # day of the last event
+    events: int = 0                 # events in that day's log
+    offset: int = 0                 # bytes in that day's log
+    checkpointed: int = 0           # events covered by its last checkpoint
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_chains: Dict[str, _Chain] = {}
+_chains_lock = threading.Lock()
+
+
+@dataclass
+class _DayIndex:
+    """In-memory sidecar index of one daily log."""
+    rows: List[Tuple] = field(default_factory=list)
+    postings: Dict[Tuple[str, Any], List[int]] = field(default_factory=dict)
+    offsets: Set[int] = field(default_factory=set)
+    sidecar_position: int = 0       # sidecar bytes consumed
+    log_position: int = 0           # log bytes indexed
+    sealed: bool = False            # past day: no further appends expected
+
+    def add(self, row: Tuple):
+        if row[0] in self.offsets:
+            return      # event already indexed (duplicate sidecar row)
+        self.offsets.add(row[0])
+        number = len(self.rows)
+        self.rows.append(row)
+        for name, value in zip(INDEXED_FIELDS, row[2:]):
+            self.postings.setdefault((name, value), []).append(number)
+        self.log_position = max(self.log_position, row[0] + row[1])
+
+
 class AuditLogger:
     """
     Immutable audit trail for orchestration events.
@@ -67,15 +173,32 @@ class AuditLogger:
         "suggestion_generated": "System generated improvement suggestion",
     }
 
-    def __init__(self, audit_path: Path):
+    def __init__(
+        self,
+        audit_path: Path,
+        writer: Optional[AuditWriter] = None,
+        checkpoint_key: Optional[bytes] = None,
+        checkpoint_every: int = CHECKPOINT_EVERY
+    ):
         """
         Initialize the Audit Logger.
 
         Args:
             audit_path: Path to audit log directory
+            writer: Writer for log and sidecar appends (default: shared per_event writer)
+            checkpoint_key: HMAC key signing checkpoints (default: AUDIT_CHECKPOINT_KEY)
+            checkpoint_every: Events between checkpoints written while logging
         """
         self.audit_path = audit_path
+        self.writer = writer or shared_writer()
+        if checkpoint_key is None and os.environ.get(CHECKPOINT_KEY_ENV):
+            checkpoint_key = os.environ[CHECKPOINT_KEY_ENV].encode()
+        self.checkpoint_key = checkpoint_key
+        self.checkpoint_every = checkpoint_every
         self.audit_path.mkdir(parents=True, exist_ok=True)
+        self._indexes: Dict[str, _DayIndex] = {}
+        self._days: List[str] = []
+        self._days_stamp: Optional[int] = None
 
     def log_event(
         self,
@@ -116,11 +239,28 @@ class AuditLogger:
         )
 
         # Get today's log file
-        log_file = self._get_log_file()
-
-        # Append to log (JSONL format)
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(asdict(event)) + "\n")
+        day = timestamp[:10]
+        log_file = self._get_log_file(day)
+
+        # Chain to the previous event and append to log (JSONL format) in
+        # chain order; index rows follow once written
+        chain = self._chain()
+        with chain.lock:
+            if chain.day != day:
+                self._start_day(chain, day)
+            event.prev_hash = chain.head
+            record = vars(event)    # shallow: serialized as-is, unlike asdict's deep copy
+            event.hash = event_hash(record)
+            line = (json.dumps(record) + "\n").encode()
+            fields = tuple(record.get(name) for name in INDEXED_FIELDS)
+            self.writer.append(log_file, line, on_write=self._on_log_written, meta=fields)
+
+            chain.head = event.hash
+            chain.events += 1
+            chain.offset += len(line)
+            if chain.events - chain.checkpointed >= self.checkpoint_every:
+                self._append_checkpoint(log_file, chain.events, chain.offset, chain.head)
+                chain.checkpointed = chain.events
 
         return f"{timestamp}#{event.checksum}"
 
@@ -131,10 +271,11 @@ class AuditLogger:
         entity: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        newest_first: bool = True
     ) -> List[Dict]:
         """
-        Query audit events with filters.
+        Query audit events with filters, using the sidecar indexes.
 
         Args:
             event_type: Filter by event type
@@ -143,41 +284,15 @@ class AuditLogger:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             limit: Maximum results
+            newest_first: Most recent events first (False: chronological)
 
         Returns:
             List of matching events
         """
-        results = []
-
-        # Determine which log files to search
-        log_files = self._get_log_files_in_range(start_date, end_date)
-
-        for log_file in log_files:
-            if not log_file.exists():
-                continue
-
-            with open(log_file, 'r') as f:
-                for line in f:
-                    try:
-                        event = json.loads(line.strip())
-
-                        # Apply filters
-                        if event_type and event.get("event_type") != event_type:
-                            continue
-                        if actor and event.get("actor") != actor:
-                            continue
-                        if entity and event.get("entity") != entity:
-                            continue
-
-                        results.append(event)
-
-                        if len(results) >= limit:
-                            return results
-
-                    except json.JSONDecodeError:
-                        continue
-
-        return results
+        self.writer.flush()
+        filters = {"event_type": event_type, "actor": actor, "entity": entity}
+        filters = {name: value for name, value in filters.items() if value}
+        return list(self._iter_events(filters, start_date, end_date, limit, newest_first))
 
     def get_entity_history(
         self,
@@ -194,7 +309,10 @@ class AuditLogger:
         Returns:
             List of events affecting this entity
         """
-        return self.query_events(entity=entity, limit=1000)
+        events = self.query_events(entity=entity, limit=1000)
+        if entity_type:
+            events = [e for e in events if e.get("entity_type") == entity_type]
+        return events
 
     def get_actor_activity(
         self,
@@ -268,61 +386,77 @@ class AuditLogger:
 
         return report
 
-    def verify_integrity(self, log_file: Optional[Path] = None) -> Dict:
+    def verify_integrity(self, log_file: Optional[Path] = None, full: bool = False) -> Dict:
         """
-        Verify integrity of audit log.
+        Verify checksums and the hash chain of a daily log.
 
         Args:
             log_file: Specific file to verify (or today's log)
+            full: Verify from the start instead of the latest checkpoint
 
         Returns:
-            Verification results
+            Verification results (see verify_log)
         """
         if log_file is None:
             log_file = self._get_log_file()
+        self.writer.flush()
+        results = verify_log(log_file, self.checkpoint_key, full)
+        self._record_verified(log_file, results)
+        return results
 
-        results = {
-            "file": str(log_file),
-            "total_events": 0,
-            "valid_events": 0,
-            "invalid_events": 0,
-            "errors": []
-        }
+    def verify_range(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        full: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Dict:
+        """
+        Verify the daily logs in a date range and the chain links between them.
 
-        if not log_file.exists():
-            results["errors"].append("Log file not found")
-            return results
+        Days are verified in parallel worker processes, each from its
+        latest checkpoint unless full.
 
-        with open(log_file, 'r') as f:
-            for i, line in enumerate(f, 1):
-                results["total_events"] += 1
-                try:
-                    event = json.loads(line.strip())
-
-                    # Verify checksum
-                    stored_checksum = event.get("checksum", "")
-                    audit_event = AuditEvent(
-                        timestamp=event.get("timestamp", ""),
-                        event_type=event.get("event_type", ""),
-                        actor=event.get("actor", ""),
-                        entity=event.get("entity"),
-                        entity_type=event.get("entity_type"),
-                        details=event.get("details", {}),
-                        conflicts_detected=event.get("conflicts_detected", []),
-                        resolution=event.get("resolution")
-                    )
-
-                    if audit_event.checksum == stored_checksum:
-                        results["valid_events"] += 1
-                    else:
-                        results["invalid_events"] += 1
-                        results["errors"].append(f"Line {i}: Checksum mismatch")
-
-                except json.JSONDecodeError as e:
-                    results["invalid_events"] += 1
-                    results["errors"].append(f"Line {i}: JSON parse error - {str(e)}")
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            full: Verify every event instead of resuming from checkpoints
+            max_workers: Worker processes (1 verifies in this process)
 
-        return results
+        Returns:
+            {"valid", "total_events", "checked_events", "errors", "days": {day: results}}
+        """
+        self.writer.flush()
+        days = [
+            day for day in self._list_days()
+            if not (start_date and day < start_date) and not (end_date and day > end_date)
+        ]
+        log_files = [self._get_log_file(day) for day in days]
+        keys = [self.checkpoint_key] * len(days)
+        fulls = [full] * len(days)
+        if len(days) > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                day_results = list(pool.map(verify_log, log_files, keys, fulls, chunksize=8))
+        else:
+            day_results = list(map(verify_log, log_files, keys, fulls))
+
+        errors = []
+        previous_day, previous = None, None
+        for day, log_file, results in zip(days, log_files, day_results):
+            self._record_verified(log_file, results)
+            errors.extend(f"{day} {error}" for error in results["errors"])
+            if (previous and previous["head"] and results["first_prev_hash"]
+                    and results["first_prev_hash"] != previous["head"]):
+                errors.append(f"{day}: does not continue the chain of {previous_day} (events or days missing)")
+            previous_day, previous = day, results
+
+        return {
+            "valid": not errors,
+            "total_events": sum(r["total_events"] for r in day_results),
+            "checked_events": sum(r["total_events"] - r["resumed_from"] for r in day_results),
+            "errors": errors,
+            "days": dict(zip(days, day_results)),
+        }
 
     def export_for_compliance(
         self,
@@ -341,7 +475,8 @@ class AuditLogger:
         events = self.query_events(
             start_date=start_date,
             end_date=end_date,
-            limit=10000
+            limit=10000,
+            newest_first=False
         )
 
         export = {
@@ -354,35 +489,377 @@ class AuditLogger:
         with open(output_path, 'w') as f:
             json.dump(export, f, indent=2)
 
+    # ── Hash chain ───────────────────────────────────────────────────────
+
+    def _chain(self) -> _Chain:
+        key = str(self.audit_path.resolve())
+        with _chains_lock:
+            if key not in _chains:
+                _chains[key] = _Chain()
+            return _chains[key]
+
+    def _start_day(self, chain: _Chain, day: str):
+        """Continue the chain in a day's log (called with the chain locked)."""
+        self.writer.flush()
+        log_file = self._get_log_file(day)
+        if log_file.exists():
+            events, offset, head, checkpointed = self._log_tail(log_file)
+            chain.head = head or GENESIS_HASH
+        else:
+            events = offset = checkpointed = 0
+            if chain.day is None:
+                # First event in this process: continue from the latest earlier log
+                earlier = [d for d in self._list_days() if d < day]
+                head = self._log_tail(self._get_log_file(earlier[-1]))[2] if earlier else None
+                chain.head = head or GENESIS_HASH
+        chain.day, chain.events, chain.offset, chain.checkpointed = day, events, offset, checkpointed
+
+    def _log_tail(self, log_file: Path) -> Tuple[int, int, Optional[str], int]:
+        """(events, size, last hash, events checkpointed) of a log, read from its latest checkpoint."""
+        checkpoints = _read_checkpoints(self._checkpoint_file(log_file), log_file.stem, self.checkpoint_key, [])
+        size = log_file.stat().st_size
+        checkpoints = [cp for cp in checkpoints if cp["offset"] <= size]
+        latest = max(checkpoints, key=lambda cp: cp["offset"], default=None)
+        start, events, head = (latest["offset"], latest["events"], latest["head"]) if latest else (0, 0, None)
+
+        with open(log_file, 'rb') as f:
+            f.seek(start)
+            data = f.read()
+        end = data.rfind(b"\n")
+        if end >= 0:
+            last = data[data.rfind(b"\n", 0, end) + 1:end]
+            try:
+                head = json.loads(last).get("hash")
+            except (ValueError, AttributeError):
+                head = None
+        # A partial last line is joined by the next append, which counts it
+        return events + data.count(b"\n"), start + len(data), head, events
+
+    def _append_checkpoint(self, log_file: Path, events: int, offset: int, head: str):
+        row = {
+            "events": events,
+            "offset": offset,
+            "head": head,
+            "signature": sign_checkpoint(self.checkpoint_key, log_file.stem, events, offset, head),
+        }
+        self.writer.append(self._checkpoint_file(log_file), (json.dumps(row) + "\n").encode())
+
+    def _record_verified(self, log_file: Path, results: Dict):
+        """Checkpoint the end of a cleanly verified log so the next check resumes there."""
+        if not results["errors"] and results["head"] and results["offset"] > results["checkpoint_offset"]:
+            self._append_checkpoint(log_file, results["total_events"], results["offset"], results["head"])
+
+    @staticmethod
+    def _checkpoint_file(log_file: Path) -> Path:
+        return log_file.with_suffix(".chk")
+
+    # ── Sidecar indexes ──────────────────────────────────────────────────
+
+    @staticmethod
+    def _index_row(offset: int, length: int, event: Dict) -> Tuple:
+        return (offset, length) + tuple(event.get(name) for name in INDEXED_FIELDS)
+
+    @staticmethod
+    def _sidecar(log_file: Path) -> Path:
+        return log_file.with_suffix(".idx")
+
+    def _on_log_written(self, log_file: Path, records: List[Tuple[int, int, Tuple]]):
+        """AuditWriter callback: index the events of a written batch."""
+        self._append_rows(log_file, [(offset, length) + fields for offset, length, fields in records])
+
+    def _append_rows(self, log_file: Path, rows: List[Tuple]):
+        """Append index rows to a log's sidecar."""
+        data = b"".join(json.dumps(list(row)).encode() + b"\n" for row in rows)
+        self.writer.write(self._sidecar(log_file), data)
+
+    def _iter_events(
+        self,
+        filters: Dict[str, str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        limit: int,
+        newest_first: bool
+    ) -> Iterator[Dict]:
+        """Matching events, read by seeking to the offsets the indexes give."""
+        if limit <= 0:
+            return
+        found = 0
+        days = self._list_days()
+        for day in (reversed(days) if newest_first else days):
+            if (start_date and day < start_date) or (end_date and day > end_date):
+                continue
+            index = self._indexes.get(day)
+            if index is None or not index.sealed:
+                index = self._day_index(self.audit_path / f"{day}.jsonl")
+            if filters:
+                lists = [index.postings.get(item, []) for item in filters.items()]
+                numbers = min(lists, key=len)
+            else:
+                numbers = range(len(index.rows))
+            if not numbers:
+                continue
+
+            with open(self.audit_path / f"{day}.jsonl", 'rb') as f:
+                for number in (reversed(numbers) if newest_first else numbers):
+                    row = index.rows[number]
+                    if any(row[2 + INDEXED_FIELDS.index(name)] != value for name, value in filters.items()):
+                        continue
+                    f.seek(row[0])
+                    try:
+                        event = json.loads(f.read(row[1]))
+                    except ValueError:
+                        continue
+                    yield event
+                    found += 1
+                    if found >= limit:
+                        return
+
+    def _list_days(self) -> List[str]:
+        """Dates of the daily logs, oldest first (re-listed when the directory changes)."""
+        stamp = os.stat(self.audit_path).st_mtime_ns
+        if stamp != self._days_stamp:
+            self._days = sorted(p.stem for p in self.audit_path.glob("*.jsonl"))
+            self._days_stamp = stamp
+        return self._days
+
+    def _day_index(self, log_file: Path) -> _DayIndex:
+        """Cached index of a daily log, brought up to date with the sidecar and the log."""
+        day = log_file.stem
+        index = self._indexes.get(day)
+        if index is not None and index.sealed:
+            return index
+        # No event of this process is then written without its index row
+        with self.writer.write_lock:
+            return self._update_day_index(log_file)
+
+    def _update_day_index(self, log_file: Path) -> _DayIndex:
+        day = log_file.stem
+        index = self._indexes.get(day)
+        if index is None:
+            index = self._indexes[day] = _DayIndex()
+
+        sidecar = self._sidecar(log_file)
+        try:
+            with open(sidecar, 'rb') as f:
+                f.seek(index.sidecar_position)
+                tail = f.read()
+        except FileNotFoundError:
+            tail = b""
+        end = tail.rfind(b"\n") + 1      # a partial last row is read once complete
+        try:
+            for line in tail[:end].splitlines():
+                index.add(tuple(json.loads(line)))
+        except (ValueError, TypeError, IndexError):
+            return self._rebuild_index(log_file)
+        index.sidecar_position += end
+
+        log_size = log_file.stat().st_size
+        if log_size < index.log_position:
+            return self._rebuild_index(log_file)
+        if log_size > index.log_position:
+            self._index_log_tail(log_file, index)
+        index.sealed = day < datetime.utcnow().strftime("%Y-%m-%d")
+        return index
+
+    def _index_log_tail(self, log_file: Path, index: _DayIndex):
+        """Index log lines the sidecar does not cover yet, appending their rows."""
+        rows = []
+        with open(log_file, 'rb') as f:
+            f.seek(index.log_position)
+            offset = index.log_position
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break   # partial line still being written
+                try:
+                    rows.append(self._index_row(offset, len(line), json.loads(line)))
+                except (ValueError, AttributeError):
+                    pass
+                offset += len(line)
+        for row in rows:
+            index.add(row)
+        index.log_position = offset
+        if rows:
+            # Rows other processes append meanwhile stay unread until the
+            # next update, which skips these again by offset
+            self._append_rows(log_file, rows)
+
+    def _rebuild_index(self, log_file: Path) -> _DayIndex:
+        """Discard a damaged or stale sidecar and index the whole log."""
+        self._sidecar(log_file).unlink(missing_ok=True)
+        index = self._indexes[log_file.stem] = _DayIndex()
+        self._index_log_tail(log_file, index)
+        index.sealed = log_file.stem < datetime.utcnow().strftime("%Y-%m-%d")
+        return index
+
     def _get_log_file(self, date: Optional[str] = None) -> Path:
         """Get log file path for a date"""
         if date is None:
             date = datetime.utcnow().strftime("%Y-%m-%d")
         return self.audit_path / f"{date}.jsonl"
 
-    def _get_log_files_in_range(
-        self,
-        start_date: Optional[str],
-        end_date: Optional[str]
-    ) -> List[Path]:
-        """Get all log files in date range"""
-        if start_date is None and end_date is None:
-            # Return all log files
-            return sorted(self.audit_path.glob("*.jsonl"), reverse=True)
-
-        # Parse dates and get files in range
-        files = []
-        for log_file in self.audit_path.glob("*.jsonl"):
-            file_date = log_file.stem  # YYYY-MM-DD
-
-            if start_date and file_date < start_date:
-                continue
-            if end_date and file_date > end_date:
-                continue
 
-            files.append(log_file)
+def verify_log(log_file: Path, checkpoint_key: Optional[bytes] = None, full: bool = False) -> Dict:
+    """
+    Verify checksums and the hash chain of a daily log (runs in worker processes).
+
+    Args:
+        log_file: Daily log to verify
+        checkpoint_key: HMAC key of the checkpoints
+        full: Verify from the start instead of the latest checkpoint
+
+    Returns:
+        Verification results: event counts and errors, with the events
+        covered by the checkpoint verification resumed from, the first
+        event's prev_hash and the head (to check links between days), and
+        the offset verified up to
+    """
+    results = {
+        "file": str(log_file),
+        "total_events": 0,
+        "valid_events": 0,
+        "invalid_events": 0,
+        "errors": [],
+        "resumed_from": 0,
+        "first_prev_hash": None,
+        "head": None,
+        "offset": 0,
+        "checkpoint_offset": 0,
+    }
+    errors = results["errors"]
+
+    if not log_file.exists():
+        errors.append("Log file not found")
+        return results
 
-        return sorted(files, reverse=True)
+    checkpoints = _read_checkpoints(log_file.with_suffix(".chk"), log_file.stem, checkpoint_key, errors)
+    results["checkpoint_offset"] = max((cp["offset"] for cp in checkpoints), default=0)
+
+    with open(log_file, 'rb') as f:
+        try:
+            results["first_prev_hash"] = json.loads(f.readline()).get("prev_hash")
+        except (ValueError, AttributeError):
+            pass
+        size = os.fstat(f.fileno()).st_size
+
+        # Resume after the latest checkpoint whose last event still hashes to its head
+        offset, events, previous = 0, 0, None
+        if not full:
+            for cp in sorted(checkpoints, key=lambda cp: cp["offset"], reverse=True):
+                if cp["offset"] > size:
+                    continue
+                last = _line_ending_at(f, cp["offset"])
+                try:
+                    event = json.loads(last) if last else None
+                except ValueError:
+                    event = None
+                if isinstance(event, dict) and event.get("hash") == cp["head"] == event_hash(event):
+                    offset, events, previous = cp["offset"], cp["events"], cp["head"]
+                    break
+        results["resumed_from"] = results["total_events"] = results["valid_events"] = events
+        pending = {cp["offset"]: cp for cp in checkpoints if cp["offset"] > offset}
+
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break       # partial line still being written
+            events += 1
+            offset += len(line)
+            results["total_events"] += 1
+            problems = []
+            try:
+                event = json.loads(line)
+            except ValueError as e:
+                results["invalid_events"] += 1
+                errors.append(f"Line {events}: JSON parse error - {str(e)}")
+                previous = None
+                continue
+
+            audit_event = AuditEvent(
+                timestamp=event.get("timestamp", ""),
+                event_type=event.get("event_type", ""),
+                actor=event.get("actor", ""),
+                entity=event.get("entity"),
+                entity_type=event.get("entity_type"),
+                details=event.get("details", {}),
+                conflicts_detected=event.get("conflicts_detected", []),
+                resolution=event.get("resolution")
+            )
+            if audit_event.checksum != event.get("checksum", ""):
+                problems.append("Checksum mismatch")
+
+            if event.get("hash") is None:
+                if previous is not None:
+                    problems.append("Unchained event inside the hash chain")
+            else:
+                if event_hash(event) != event["hash"]:
+                    problems.append("Hash mismatch")
+                if previous is not None and event.get("prev_hash") != previous:
+                    problems.append("Chain broken (events missing, inserted or reordered before this one)")
+                previous = event["hash"]
+
+            cp = pending.pop(offset, None)
+            if cp and (cp["events"] != events or cp["head"] != previous):
+                problems.append(f"Does not match the checkpoint at event {cp['events']}")
+
+            if problems:
+                results["invalid_events"] += 1
+                errors.extend(f"Line {events}: {problem}" for problem in problems)
+            else:
+                results["valid_events"] += 1
+
+    for cp in pending.values():
+        errors.append(f"Checkpoint at event {cp['events']}: no matching event in the log (truncated?)")
+    results["head"] = previous
+    results["offset"] = offset
+    return results
+
+
+def _read_checkpoints(checkpoint_file: Path, day: str, key: Optional[bytes], errors: List[str]) -> List[Dict]:
+    """Checkpoints that can be trusted: correctly signed, or unsigned when there is no key."""
+    try:
+        with open(checkpoint_file, 'rb') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
+    checkpoints = []
+    for i, line in enumerate(lines, 1):
+        try:
+            row = json.loads(line)
+            events, offset, head = int(row["events"]), int(row["offset"]), str(row["head"])
+            signature = row.get("signature")
+        except (ValueError, KeyError, TypeError, AttributeError):
+            errors.append(f"Checkpoint {i}: unreadable")
+            continue
+        if key:
+            if not signature:
+                continue    # written without a key: not trusted
+            if not hmac.compare_digest(str(signature), sign_checkpoint(key, day, events, offset, head)):
+                errors.append(f"Checkpoint {i}: invalid signature")
+                continue
+        elif signature:
+            continue        # cannot be checked without the key
+        checkpoints.append({"events": events, "offset": offset, "head": head})
+    return checkpoints
+
+
+def _line_ending_at(f, offset: int) -> Optional[bytes]:
+    """The line whose newline is the last byte before offset, or None."""
+    if offset <= 0:
+        return None
+    f.seek(offset - 1)
+    if f.read(1) != b"\n":
+        return None
+    data, start = b"", offset - 1
+    while True:
+        chunk_start = max(0, start - 8192)
+        f.seek(chunk_start)
+        data = f.read(start - chunk_start) + data
+        start = chunk_start
+        newline = data.rfind(b"\n")
+        if newline >= 0:
+            return data[newline + 1:]
+        if start == 0:
+            return data
 
 
 # Convenience function for quick logging
@@ -0,0 +1,371 @@
+"""
+Audit Writer
+
+Shared append-only writer for audit logs (AuditLogger's daily logs and
+sidecars, GovernanceOrchestrator's per-execution logs).
+
+File handles:
+    Log files stay open between writes (O_APPEND, least recently used
+    handles closed beyond max_open_files) instead of being opened and
+    closed per event. Each write checks that the path still names the open
+    file, so logs rotated, deleted or recreated by others are reopened.
+
+Durability policies:
+    per_event   Every append is written before append() returns (default;
+                readers see events immediately, as with per-event opens).
+    interval    Appends are queued and a background thread writes them
+                every interval_ms, or as soon as max_batch are pending.
+                Queued events of the same file are written in one system
+                call (group commit); flush() writes them immediately.
+
+    With fsync=True every batch (a single event under per_event) is
+    fsynced before its callbacks run.
+
+    When a batch write fails, only the appends of files that were not
+    written are requeued; lines already written, even if their fsync
+    failed, are never written again. flush() raises the error.
+
+Callbacks:
+    A failing on_write callback does not undo or repeat the write it
+    reports: its error is kept in .error and the callback is retried with
+    the same records after the next write or on flush(), which raises the
+    error if it fails again. append() itself only raises if the data was
+    not written.
+
+Offsets:
+    Each write learns where its bytes landed from the O_APPEND file
+    position, so appends from other processes never skew the offsets
+    passed to on_write callbacks.
+
+Shutdown:
+    close() - and, for writers that are still open, interpreter exit -
+    stops the flush thread after draining the queue.
+"""
+
+import atexit
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DURABILITY_POLICIES = ("per_event", "interval")
+
+# on_write(path, [(offset, length, meta), ...]) for the appends of one batch
+WriteCallback = Callable[[Path, List[Tuple[int, int, Any]]], None]
+
+_open_writers: "weakref.WeakSet[AuditWriter]" = weakref.WeakSet()
+_shared_writer: Optional["AuditWriter"] = None
+_shared_lock = threading.Lock()
+
+
+class AuditWriter:
+    """
+    Buffered, group-committing appender for audit log files.
+
+    Usage:
+        writer = AuditWriter(policy="interval", interval_ms=50, fsync=True)
+        writer.append(log_file, line, on_write=callback, meta=row)
+        writer.flush()      # write everything queued
+        writer.close()      # drain and stop the flush thread
+    """
+
+    def __init__(
+        self,
+        policy: str = "per_event",
+        interval_ms: float = 50,
+        fsync: bool = False,
+        max_batch: int = 1000,
+        max_open_files: int = 64
+    ):
+        """
+        Args:
+            policy: Durability policy ("per_event" or "interval")
+            interval_ms: Flush interval of the "interval" policy
+            fsync: fsync each batch before running its callbacks
+            max_batch: Pending appends that trigger an early flush
+            max_open_files: Open file handles kept
+        """
+        if policy not in DURABILITY_POLICIES:
+            raise ValueError(f"Unknown durability policy: {policy}")
+        self.policy = policy
+        self.interval = interval_ms / 1000
+        self.fsync = fsync
+        self.max_batch = max_batch
+        self.max_open_files = max_open_files
+
+        self._lock = threading.RLock()                  # files and writes
+        self._pending_lock = threading.Condition()      # queue and thread state
+        self._pending: List[Tuple[Path, bytes, Optional[WriteCallback], Any]] = []
+        self._failed: List[Tuple[WriteCallback, Path, List[Tuple[int, int, Any]]]] = []
+        self._files: "OrderedDict[str, Tuple[int, Tuple[int, int]]]" = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self._closed = False
+        self.error: Optional[BaseException] = None      # last background write or callback failure
+        self.batches = 0
+        _open_writers.add(self)
+
+    # ── Appends ──────────────────────────────────────────────────────────
+
+    def append(
+        self,
+        path: Path,
+        data: bytes,
+        on_write: Optional[WriteCallback] = None,
+        meta: Any = None
+    ):
+        """
+        Append bytes to a file under the durability policy.
+
+        Appends to the same file are written in the order they were made.
+
+        Args:
+            path: File to append to (created if missing)
+            data: Bytes to append (normally complete lines)
+            on_write: Called with the file and the (offset, length, meta) of
+                this batch's appends that share the callback, once written
+            meta: Passed back to on_write
+        """
+        if self._closed:
+            raise ValueError("AuditWriter is closed")
+        self._check_fork()
+        if self.policy == "per_event":
+            with self._lock:
+                offset = self.write(path, data)
+                self.batches += 1
+                if on_write is not None or self._failed:
+                    try:
+                        self._run_callbacks([(on_write, path, [(offset, len(data), meta)])] if on_write else [])
+                    except Exception as e:
+                        self.error = e      # written; flush() retries the callback
+            return
+
+        with self._pending_lock:
+            self._pending.append((path, data, on_write, meta))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._thread.start()
+            if len(self._pending) >= self.max_batch:
+                self._pending_lock.notify()
+
+    def write(self, path: Path, data: bytes) -> int:
+        """
+        Append bytes immediately, bypassing the queue (e.g. from an on_write callback).
+
+        Returns:
+            Offset the bytes were written at
+        """
+        with self._lock:
+            fd = self._fd(path)
+            offset = self._write_fd(fd, data)
+            if self.fsync:
+                os.fsync(fd)
+            return offset
+
+    def flush(self):
+        """Write all queued appends now (in the calling thread) and retry failed callbacks."""
+        self._check_fork()
+        self._drain()
+
+    def close(self):
+        """Drain the queue, stop the flush thread and close the files."""
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending_lock.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                for fd, _ in self._files.values():
+                    os.close(fd)
+                self._files.clear()
+            _open_writers.discard(self)
+
+    def __enter__(self) -> "AuditWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def write_lock(self) -> threading.RLock:
+        """
+        Held while appends are written and their on_write callbacks run.
+
+        Holding it, a reader sees every written append together with the
+        writes its callback makes.
+        """
+        return self._lock
+
+    # ── Flush thread ─────────────────────────────────────────────────────
+
+    def _run(self):
+        while True:
+            with self._pending_lock:
+                if not self._closed and len(self._pending) < self.max_batch:
+                    self._pending_lock.wait(self.interval)
+                closed = self._closed
+            try:
+                self._drain()
+                self.error = None
+            except Exception as e:
+                self.error = e      # unwritten events stay queued for the next attempt
+                if closed:
+                    return          # close() retries in the caller, raising the error
+            if closed:
+                return
+
+    def _drain(self):
+        """Write the queue; holding the write lock keeps batches in order."""
+        with self._lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            calls, error = [], None
+            if batch:
+                calls, unwritten, error = self._write_batch(batch)
+                if unwritten:
+                    with self._pending_lock:
+                        self._pending[:0] = unwritten
+            try:
+                self._run_callbacks(calls)
+            except Exception:
+                if error is None:
+                    raise
+            if error is not None:
+                raise error
+
+    def _check_fork(self):
+        """A forked child has none of the parent's thread; drop its inherited state."""
+        if os.getpid() == self._pid:
+            return
+        # Locks may have been held by parent threads at the fork
+        self._lock = threading.RLock()
+        self._pending_lock = threading.Condition()
+        self._pid = os.getpid()
+        self._pending = []      # the parent writes these
+        self._failed = []
+        self._thread = None
+        for fd, _ in self._files.values():
+            os.close(fd)
+        self._files = OrderedDict()
+
+    # ── Writing ──────────────────────────────────────────────────────────
+
+    def _write_batch(
+        self,
+        batch: List[Tuple[Path, bytes, Optional[WriteCallback], Any]]
+    ) -> Tuple[List[Tuple[WriteCallback, Path, List[Tuple[int, int, Any]]]],
+               List[Tuple[Path, bytes, Optional[WriteCallback], Any]],
+               Optional[OSError]]:
+        """
+        Write queued appends: one write per file, each followed by its fsync.
+
+        A file that fails does not stop the others. Its appends are returned
+        to be requeued; appends of files that were written are not, even if
+        their fsync failed, so no line is ever written twice.
+
+        Returns:
+            (callbacks to run for the written files, unwritten appends,
+            first error or None)
+        """
+        by_path: Dict[str, Tuple[Path, List[Tuple[bytes, Optional[WriteCallback], Any]]]] = {}
+        for path, data, on_write, meta in batch:
+            by_path.setdefault(os.fspath(path), (path, []))[1].append((data, on_write, meta))
+
+        calls = []
+        failed = set()
+        error = None
+        with self._lock:
+            for key, (path, appends) in by_path.items():
+                try:
+                    fd = self._fd(path)
+                    offset = self._write_fd(fd, b"".join(data for data, _, _ in appends))
+                except OSError as e:
+                    failed.add(key)
+                    error = error or e
+                    continue
+                if self.fsync:
+                    try:
+                        os.fsync(fd)
+                    except OSError as e:
+                        error = error or e      # written; rewriting would duplicate it
+                records: Dict[WriteCallback, List[Tuple[int, int, Any]]] = {}
+                for data, on_write, meta in appends:
+                    if on_write is not None:
+                        records.setdefault(on_write, []).append((offset, len(data), meta))
+                    offset += len(data)
+                calls.extend((on_write, path, callback_records) for on_write, callback_records in records.items())
+            self.batches += 1
+
+        unwritten = [entry for entry in batch if os.fspath(entry[0]) in failed]
+        return calls, unwritten, error
+
+    def _run_callbacks(self, calls: List[Tuple[WriteCallback, Path, List[Tuple[int, int, Any]]]]):
+        """Run earlier failed callbacks, then these; raise the first error once all ran."""
+        if self._failed:
+            calls = self._failed + calls
+            self._failed = []
+        error = None
+        for on_write, path, records in calls:
+            try:
+                on_write(path, records)
+            except Exception as e:
+                self._failed.append((on_write, path, records))
+                error = error or e
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def _write_fd(fd: int, data: bytes) -> int:
+        """Append data, returning the offset it starts at."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        # O_APPEND leaves this descriptor's position at the end of our write
+        return os.lseek(fd, 0, os.SEEK_CUR) - len(data)
+
+    def _fd(self, path: Path) -> int:
+        """Open descriptor for path, reopened if the file was replaced or removed."""
+        path = os.fspath(path)
+        entry = self._files.get(path)
+        try:
+            stat = os.stat(path)
+            identity = (stat.st_dev, stat.st_ino)
+        except FileNotFoundError:
+            identity = None
+        if entry is not None:
+            if entry[1] == identity:
+                self._files.move_to_end(path)
+                return entry[0]
+            os.close(entry[0])
+            del self._files[path]
+
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        stat = os.fstat(fd)
+        self._files[path] = (fd, (stat.st_dev, stat.st_ino))
+        while len(self._files) > self.max_open_files:
+            _, (old_fd, _) = self._files.popitem(last=False)
+            os.close(old_fd)
+        return fd
+
+
+def shared_writer() -> AuditWriter:
+    """Process-wide per_event writer used when no writer is given."""
+    global _shared_writer
+    with _shared_lock:
+        if _shared_writer is None or _shared_writer._closed:
+            _shared_writer = AuditWriter()
+        return _shared_writer
+
+
+@atexit.register
+def _close_open_writers():
+    for writer in list(_open_writers):
+        writer.close()
@@ -3,11 +3,36 @@ Conflict Detector
 
 Analyzes processes to identify contradictions, overlaps, gaps, and
 potential issues before they cause runtime problems.
+
+Blocking:
+    Pairwise checks only fire for processes that share a key, so instead
+    of comparing all n^2 pairs, processes are hashed into a ProcessIndex by
+    the key each check needs and only pairs sharing a bucket are compared:
+
+        trigger collision     (trigger event, output artifact)
+        output contradiction  artifact of an output with a value
+        ownership overlap     primary output artifact
+        redundancy            LSH band of the MinHash signature (see
+                              process_similarity); near-duplicates share a
+                              band with high probability
+        resource contention   (resource type, resource id)
+
+    Candidate pairs are compared in the original pair order and only with
+    the checks whose key they share, so findings (and conflict IDs) are
+    identical to the all-pairs comparison (for redundancy, up to the LSH
+    recall of ProcessSimilarity, 0.99 at the threshold). Processes with
+    unhashable key values are compared with every other process for that
+    check.
+    Benchmark: application/scripts/bench_conflict_detector.py
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .dependency_graph import DependencyGraph, trigger_targets
+from .process_similarity import ProcessSimilarity
 
 
 class ConflictSeverity(Enum):
@@ -85,6 +110,98 @@ class ConflictReport:
         }
 
 
+# Pairwise checks in the order they run for each pair
+PAIRWISE_CHECKS = ("trigger", "output", "ownership", "redundancy", "resource")
+
+
+class ProcessIndex:
+    """Hash indexes of processes by the keys each pairwise check compares."""
+
+    def __init__(
+        self,
+        key_function: Callable[[Dict], Dict[str, Optional[Set]]],
+        processes: Iterable[Dict] = ()
+    ):
+        """
+        Args:
+            key_function: process -> {check: set of keys, or None when the
+                process must be compared with everything for that check}
+            processes: Initial processes, indexed in order
+        """
+        self.key_function = key_function
+        self.processes: List[Optional[Dict]] = []     # None where removed
+        self._keys: List[Dict[str, Optional[Set]]] = []
+        self._removed = 0
+        self._buckets: Dict[str, Dict[Any, List[int]]] = {c: defaultdict(list) for c in PAIRWISE_CHECKS}
+        self._wildcards: Dict[str, List[int]] = {c: [] for c in PAIRWISE_CHECKS}
+        for process in processes:
+            self.add(process)
+
+    def __len__(self) -> int:
+        return len(self.processes) - self._removed
+
+    def add(self, process: Dict) -> int:
+        """Index a process; returns its position."""
+        position = len(self.processes)
+        keys = self.key_function(process)
+        self.processes.append(process)
+        self._keys.append(keys)
+        for check in PAIRWISE_CHECKS:
+            if keys[check] is None:
+                self._wildcards[check].append(position)
+            else:
+                for key in keys[check]:
+                    self._buckets[check][key].append(position)
+        return position
+
+    def remove(self, position: int) -> None:
+        """Drop the process at position from the index (positions stay stable)."""
+        if self.processes[position] is None:
+            return
+        keys = self._keys[position]
+        for check in PAIRWISE_CHECKS:
+            if keys[check] is None:
+                self._wildcards[check].remove(position)
+                continue
+            for key in keys[check]:
+                members = self._buckets[check][key]
+                members.remove(position)
+                if not members:
+                    del self._buckets[check][key]
+        self.processes[position] = None
+        self._keys[position] = {}
+        self._removed += 1
+
+    def candidates(self, process: Dict, checks: Iterable[str] = PAIRWISE_CHECKS) -> Dict[int, Set[str]]:
+        """Positions of indexed processes sharing a key with process, with the checks shared."""
+        keys = self.key_function(process)
+        matches: Dict[int, Set[str]] = defaultdict(set)
+        for check in checks:
+            if keys[check] is None:
+                positions: Iterable[int] = (p for p, proc in enumerate(self.processes) if proc is not None)
+            else:
+                positions = [p for key in keys[check] for p in self._buckets[check].get(key, ())]
+                positions += self._wildcards[check]
+            for position in positions:
+                matches[position].add(check)
+        return matches
+
+    def candidate_pairs(self, checks: Iterable[str] = PAIRWISE_CHECKS) -> List[Tuple[int, int, Set[str]]]:
+        """Pairs (i < j) of indexed processes sharing a key, in pair order, with the checks shared."""
+        pairs: Dict[Tuple[int, int], Set[str]] = defaultdict(set)
+        total = len(self.processes)
+        for check in checks:
+            for members in self._buckets[check].values():
+                for offset, i in enumerate(members):
+                    for j in members[offset + 1:]:
+                        pairs[(i, j)].add(check)
+            for i in self._wildcards[check]:
+                for j in range(total):
+                    if j != i and self.processes[j] is not None:
+                        pairs[(min(i, j), max(i, j))].add(check)
+        return [(i, j, pairs[(i, j)]) for i, j in sorted(pairs)]
+
+
 class ConflictDetector:
     """
     Detects conflicts between processes.
@@ -113,14 +230,76 @@ class ConflictDetector:
         "partner_referral",
     ]
 
-    def __init__(self, orchestrator: Any = None):
+    def __init__(
+        self,
+        orchestrator: Any = None,
+        use_index: bool = True,
+        redundancy_threshold: float = 0.8,
+        similarity: Optional[ProcessSimilarity] = None
+    ):
+        """
+        Args:
+            orchestrator: Owning OrchestrationAgent, if any
+            use_index: Compare only processes sharing a blocking key
+                (False compares every pair; same findings, O(n^2))
+            redundancy_threshold: Feature similarity at which two processes
+                are reported as redundant
+            similarity: MinHash/LSH configuration (overrides redundancy_threshold)
+        """
         self.orchestrator = orchestrator
+        self.use_index = use_index
+        self.similarity = similarity or ProcessSimilarity(threshold=redundancy_threshold)
         self.conflict_counter = 0
+        self._pair_checks = {
+            "trigger": self._check_trigger_collision,
+            "output": self._check_output_contradiction,
+            "ownership": self._check_ownership_overlap,
+            "redundancy": self._check_redundancy,
+            "resource": self._check_resource_contention,
+        }
+
+    def build_index(self, processes: Iterable[Dict] = ()) -> ProcessIndex:
+        """Blocking index over processes, reusable across analyze() calls."""
+        return ProcessIndex(self._blocking_keys, processes)
+
+    def near_duplicates(
+        self,
+        process: Dict,
+        index: ProcessIndex,
+        threshold: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Indexed processes similar to process, most similar first.
+
+        Only the LSH buckets of the process's bands are read. Thresholds
+        below the one the LSH bands were tuned for lose recall.
+
+        Args:
+            process: Process definition to look up
+            index: Index built with build_index
+            threshold: Minimum similarity (defaults to the redundancy threshold)
+
+        Returns:
+            List of (process_id, similarity)
+        """
+        if threshold is None:
+            threshold = self.similarity.threshold
+        matches = []
+        for position in index.candidates(process, ("redundancy",)):
+            other = index.processes[position]
+            if other.get("process_id") == process.get("process_id"):
+                continue
+            score = self.similarity.jaccard(process, other)
+            if score >= threshold:
+                matches.append((other.get("process_id"), score))
+        return sorted(matches, key=lambda match: (-match[1], str(match[0])))
 
     def analyze(
         self,
         new_process: Dict,
-        existing_processes: List[Dict]
+        existing_processes: List[Dict],
+        index: Optional[ProcessIndex] = None,
+        graph: Optional[DependencyGraph] = None
     ) -> ConflictReport:
         """
         Analyze a new process against existing processes.
@@ -128,26 +307,38 @@ class ConflictDetector:
         Args:
             new_process: The new process definition to check
             existing_processes: List of existing process definitions
+            index: Prebuilt index over existing_processes (build_index);
+                built on the fly when omitted
+            graph: Persistent trigger graph of existing_processes
+                (OrchestrationAgent.get_dependency_graph); only the region
+                the new process's triggers can reach is searched
 
         Returns:
             ConflictReport with all detected issues
         """
         report = ConflictReport()
+        checks = PAIRWISE_CHECKS[:4]    # no resource contention for new processes
+
+        if self.use_index:
+            if index is None:
+                index = self.build_index(existing_processes)
+            matches = index.candidates(new_process, checks)
+            pairs = [(index.processes[p], matches[p]) for p in sorted(matches)]
+        else:
+            pairs = [(existing, checks) for existing in existing_processes]
 
-        for existing in existing_processes:
+        for existing, shared in pairs:
             # Skip comparing to self
             if existing.get("process_id") == new_process.get("process_id"):
                 continue
 
             # Check each conflict type
-            self._check_trigger_collision(new_process, existing, report)
-            self._check_output_contradiction(new_process, existing, report)
-            self._check_ownership_overlap(new_process, existing, report)
-            self._check_redundancy(new_process, existing, report)
+            for check in checks:
+                if check in shared:
+                    self._pair_checks[check](new_process, existing, report)
 
-        # Check for circular dependencies with all processes
-        all_processes = existing_processes + [new_process]
-        self._check_circular_dependencies(all_processes, report)
+        # Check for circular dependencies the new process would close
+        self._check_new_cycle(new_process, existing_processes, report, graph)
 
         # Check deadline feasibility
         self._check_deadline_feasibility(new_process, report)
@@ -167,13 +358,19 @@ class ConflictDetector:
         report = ConflictReport()
 
         # Pairwise comparisons
-        for i, proc_a in enumerate(processes):
-            for proc_b in processes[i+1:]:
-                self._check_trigger_collision(proc_a, proc_b, report)
-                self._check_output_contradiction(proc_a, proc_b, report)
-                self._check_ownership_overlap(proc_a, proc_b, report)
-                self._check_redundancy(proc_a, proc_b, report)
-                self._check_resource_contention(proc_a, proc_b, report)
+        if self.use_index:
+            for i, j, shared in self.build_index(processes).candidate_pairs():
+                for check in PAIRWISE_CHECKS:
+                    if check in shared:
+                        self._pair_checks[check](processes[i], processes[j], report)
+        else:
+            for i, proc_a in enumerate(processes):
+                for proc_b in processes[i+1:]:
+                    self._check_trigger_collision(proc_a, proc_b, report)
+                    self._check_output_contradiction(proc_a, proc_b, report)
+                    self._check_ownership_overlap(proc_a, proc_b, report)
+                    self._check_redundancy(proc_a, proc_b, report)
+                    self._check_resource_contention(proc_a, proc_b, report)
 
         # Graph-based checks
         self._check_circular_dependencies(processes, report)
@@ -311,43 +508,48 @@ class ConflictDetector:
         processes: List[Dict],
         report: ConflictReport
     ):
-        """Check for circular dependency chains"""
-        # Build dependency graph
-        graph = {}
-        for proc in processes:
-            proc_id = proc.get("process_id")
-            graph[proc_id] = []
-
-            # Add triggered processes
-            triggers = proc.get("outputs", {}).get("triggers", [])
-            if proc.get("relationships"):
-                triggers.extend(proc.get("relationships", {}).get("triggers", []))
-
-            for trigger in triggers:
-                if isinstance(trigger, dict):
-                    target = trigger.get("process")
-                else:
-                    target = trigger
-                if target:
-                    graph[proc_id].append(target)
-
-        # Detect cycles using DFS
-        cycles = self._find_cycles(graph)
-
-        for cycle in cycles:
-            report.conflicts.append(Conflict(
-                conflict_id=self._generate_conflict_id(),
-                conflict_type=ConflictType.CIRCULAR_DEPENDENCY,
-                severity=ConflictSeverity.CRITICAL,
-                processes=cycle,
-                description=f"Circular dependency: {' -> '.join(cycle)}",
-                blocking=True,
-                suggested_resolutions=[
-                    {"option": "termination", "description": "Add termination condition"},
-                    {"option": "merge", "description": "Combine circular processes"},
-                    {"option": "break", "description": "Remove one trigger link"}
-                ]
-            ))
+        """Check for circular dependency chains (one per strongly connected component)"""
+        for cycle, component in DependencyGraph.from_processes(processes).cycles():
+            self._report_cycle(cycle, report, component)
+
+    def _check_new_cycle(
+        self,
+        new_process: Dict,
+        existing_processes: List[Dict],
+        report: ConflictReport,
+        graph: Optional[DependencyGraph] = None
+    ):
+        """Check whether the new process's triggers close a dependency cycle"""
+        process_id = new_process.get("process_id")
+        if graph is None:
+            graph = DependencyGraph.from_processes(
+                p for p in existing_processes if p.get("process_id") != process_id
+            )
+        cycle = graph.find_cycle(process_id, trigger_targets(new_process))
+        if cycle:
+            self._report_cycle(cycle, report)
+
+    def _report_cycle(
+        self,
+        cycle: List[str],
+        report: ConflictReport,
+        component: Optional[List[str]] = None
+    ):
+        """Record a circular dependency conflict"""
+        report.conflicts.append(Conflict(
+            conflict_id=self._generate_conflict_id(),
+            conflict_type=ConflictType.CIRCULAR_DEPENDENCY,
+            severity=ConflictSeverity.CRITICAL,
+            processes=cycle,
+            description=f"Circular dependency: {' -> '.join(cycle)}",
+            details={"component": component} if component else {},
+            blocking=True,
+            suggested_resolutions=[
+                {"option": "termination", "description": "Add termination condition"},
+                {"option": "merge", "description": "Combine circular processes"},
+                {"option": "break", "description": "Remove one trigger link"}
+            ]
+        ))
 
     def _check_resource_contention(
         self,
@@ -441,9 +643,9 @@ class ConflictDetector:
         report: ConflictReport
     ):
         """Check for redundant/duplicate processes"""
-        similarity = self._calculate_similarity(proc_a, proc_b)
+        similarity = self.similarity.jaccard(proc_a, proc_b)
 
-        if similarity > 0.8:
+        if similarity >= self.similarity.threshold:
             report.conflicts.append(Conflict(
                 conflict_id=self._generate_conflict_id(),
                 conflict_type=ConflictType.REDUNDANT_PROCESS,
@@ -459,6 +661,27 @@ class ConflictDetector:
 
     # Helper methods
 
+    def _blocking_keys(self, process: Dict) -> Dict[str, Optional[Set]]:
+        """Keys two processes must share for each pairwise check to fire (see module docstring)."""
+        event = process.get("trigger", {}).get("event")
+        primary = process.get("outputs", {}).get("primary", {}).get("artifact")
+        outputs = self._get_outputs(process)
+        key_builders = {
+            "trigger": lambda: {(event, o.get("artifact")) for o in outputs},
+            "output": lambda: {o.get("artifact") for o in outputs if o.get("value") is not None},
+            "ownership": lambda: {primary} if primary else set(),
+            "redundancy": lambda: self.similarity.band_keys(process),
+            "resource": lambda: {(r.get("type"), r.get("id")) for r in self._extract_resources(process)},
+        }
+        keys = {}
+        for check, build in key_builders.items():
+            try:
+                keys[check] = build()
+            except TypeError:
+                # Unhashable values: compare with every process for this check
+                keys[check] = None
+        return keys
+
     def _conditions_overlap(self, cond_a: List, cond_b: List) -> bool:
         """Check if conditions overlap (both could be true)"""
         if not cond_a or not cond_b:
@@ -519,38 +742,6 @@ class ConflictDetector:
 
         return False
 
-    def _find_cycles(self, graph: Dict[str, List[str]]) -> List[List[str]]:
-        """Find all cycles in dependency graph"""
-        cycles = []
-        visited = set()
-        stack = set()
-
-        def dfs(node: str, path: List[str]):
-            if node in stack:
-                # Found cycle
-                cycle_start = path.index(node)
-                cycles.append(path[cycle_start:] + [node])
-                return
-
-            if node in visited:
-                return
-
-            visited.add(node)
-            stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor in graph:  # Only visit known nodes
-                    dfs(neighbor, path.copy())
-
-            stack.remove(node)
-
-        for node in graph:
-            if node not in visited:
-                dfs(node, [])
-
-        return cycles
-
     def _extract_resources(self, process: Dict) -> List[Dict]:
         """Extract resource requirements from process"""
         resources = []
@@ -588,33 +779,3 @@ class ConflictDetector:
                 return value * 40
 
         return 0
-
-    def _calculate_similarity(self, proc_a: Dict, proc_b: Dict) -> float:
-        """Calculate similarity score between two processes (0-1)"""
-        scores = []
-
-        # Trigger similarity
-        if proc_a.get("trigger", {}).get("event") == proc_b.get("trigger", {}).get("event"):
-            scores.append(1.0)
-        else:
-            scores.append(0.0)
-
-        # Owner similarity
-        owner_a = proc_a.get("ownership", {}).get("primary_owner", {}).get("agent")
-        owner_b = proc_b.get("ownership", {}).get("primary_owner", {}).get("agent")
-        if owner_a == owner_b:
-            scores.append(1.0)
-        else:
-            scores.append(0.0)
-
-        # Output similarity
-        outputs_a = {o.get("artifact") for o in self._get_outputs(proc_a)}
-        outputs_b = {o.get("artifact") for o in self._get_outputs(proc_b)}
-        if outputs_a and outputs_b:
-            intersection = len(outputs_a & outputs_b)
-            union = len(outputs_a | outputs_b)
-            scores.append(intersection / union if union > 0 else 0)
-        else:
-            scores.append(0.5)
-
-        return sum(scores) / len(scores) if scores else 0
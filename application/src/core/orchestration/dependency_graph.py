@@ -0,0 +1,333 @@
+"""
+Dependency Graph
+
+Process trigger graph with incremental cycle detection.
+
+Online topological order:
+    Edges that keep the graph acyclic are kept in a topological order
+    (Pearce-Kelly). Inserting an edge x -> y that already agrees with the
+    order costs O(1); otherwise only the affected region - nodes ordered
+    between y and x that are reachable from y or reach x - is searched and
+    reordered. An insertion that would close a cycle is still recorded but
+    kept out of the order (see `cyclic_edges`) and the cycle is returned;
+    while such edges exist, cycle searches are no longer bounded by the order.
+    Checking a new process before it is added searches the same bounded
+    region and does not change the graph.
+
+Full reports:
+    strongly_connected_components() is an iterative Tarjan (no recursion
+    limit) over all edges; cycles() returns one cycle per component.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def trigger_targets(process: Dict) -> List[str]:
+    """Processes a process triggers (outputs.triggers and relationships.triggers)."""
+    triggers = list(process.get("outputs", {}).get("triggers", []))
+    if process.get("relationships"):
+        triggers.extend(process.get("relationships", {}).get("triggers", []))
+
+    targets = []
+    for trigger in triggers:
+        target = trigger.get("process") if isinstance(trigger, dict) else trigger
+        if target and isinstance(target, str) and target not in targets:
+            targets.append(target)
+    return targets
+
+
+class DependencyGraph:
+    """
+    Directed trigger graph (process -> triggered process).
+
+    Usage:
+        graph = DependencyGraph.from_processes(processes)
+        graph.find_cycle("PROC_NEW", ["PROC_A"])    # would adding it close a cycle?
+        graph.set_edges("PROC_NEW", ["PROC_A"])     # returns cycles it closed
+        graph.cycles()                              # one cycle per SCC
+    """
+
+    def __init__(self):
+        self._successors: Dict[str, Dict[str, None]] = {}   # insertion-ordered sets
+        self._predecessors: Dict[str, Set[str]] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self.cyclic_edges: Set[Tuple[str, str]] = set()
+
+    @classmethod
+    def from_processes(cls, processes: Iterable[Dict]) -> "DependencyGraph":
+        """Graph of the trigger edges of processes."""
+        graph = cls()
+        for process in processes:
+            process_id = process.get("process_id")
+            if process_id:
+                graph.set_edges(process_id, trigger_targets(process))
+        return graph
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._order)
+
+    def successors(self, node: str) -> List[str]:
+        return list(self._successors.get(node, ()))
+
+    def add_node(self, node: str) -> None:
+        if node not in self._order:
+            self._order[node] = self._next_order
+            self._next_order += 1
+            self._successors[node] = {}
+            self._predecessors[node] = set()
+
+    # ── Updates ──────────────────────────────────────────────────────────
+
+    def set_edges(self, node: str, targets: Iterable[str]) -> List[List[str]]:
+        """
+        Replace the out-edges of node.
+
+        Returns:
+            Cycles closed by the new edges, as [node, ..., node] paths
+        """
+        self.add_node(node)
+        targets = list(dict.fromkeys(targets))
+        removed = [t for t in self._successors[node] if t not in targets]
+        for target in removed:
+            self._remove_edge(node, target)
+
+        cycles = []
+        for target in targets:
+            if target not in self._successors[node]:
+                cycle = self.add_edge(node, target)
+                if cycle:
+                    cycles.append(cycle)
+        if removed:
+            self._retry_cyclic_edges()
+        return cycles
+
+    def remove_node(self, node: str) -> None:
+        """Remove a node and its edges."""
+        if node not in self._order:
+            return
+        for target in list(self._successors[node]):
+            self._remove_edge(node, target)
+        for source in list(self._predecessors[node]):
+            self._remove_edge(source, node)
+        del self._successors[node], self._predecessors[node], self._order[node]
+        self._retry_cyclic_edges()
+
+    def add_edge(self, source: str, target: str) -> Optional[List[str]]:
+        """
+        Insert an edge, maintaining the topological order.
+
+        Returns:
+            The cycle the edge closes ([source, target, ..., source]), or None
+        """
+        self.add_node(source)
+        self.add_node(target)
+        if target in self._successors[source]:
+            return None
+        self._successors[source][target] = None
+        self._predecessors[target].add(source)
+
+        cycle = self._reorder(source, target)
+        if cycle:
+            self.cyclic_edges.add((source, target))
+        elif self.cyclic_edges:
+            # Cycles through edges kept out of the order are not bounded by it
+            cycle = self._path_back(source, target, None)
+        return cycle
+
+    def _remove_edge(self, source: str, target: str) -> None:
+        # Removing an edge never invalidates a topological order
+        self._successors[source].pop(target, None)
+        self._predecessors[target].discard(source)
+        self.cyclic_edges.discard((source, target))
+
+    def _retry_cyclic_edges(self) -> None:
+        """Edges kept out of the order may fit it once other edges are gone."""
+        for source, target in list(self.cyclic_edges):
+            self.cyclic_edges.discard((source, target))
+            if self._reorder(source, target):
+                self.cyclic_edges.add((source, target))
+
+    def _reorder(self, source: str, target: str) -> Optional[List[str]]:
+        """Pearce-Kelly: restore the order after inserting source -> target."""
+        if source == target:
+            return [source, source]
+        lower, upper = self._order[target], self._order[source]
+        if lower > upper:
+            return None
+
+        # Forward from target within the affected region
+        parents: Dict[str, Optional[str]] = {target: None}
+        stack = [target]
+        while stack:
+            node = stack.pop()
+            for succ in self._successors[node]:
+                if (node, succ) in self.cyclic_edges:
+                    continue
+                if succ == source:
+                    return self._cycle_path(source, node, parents)
+                if succ not in parents and self._order[succ] < upper:
+                    parents[succ] = node
+                    stack.append(succ)
+        forward = list(parents)
+
+        # Backward from source within the affected region
+        backward = {source}
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            for pred in self._predecessors[node]:
+                if (pred, node) in self.cyclic_edges:
+                    continue
+                if pred not in backward and self._order[pred] > lower:
+                    backward.add(pred)
+                    stack.append(pred)
+
+        # Reassign the region's order slots: backward nodes first, then forward
+        key = self._order.__getitem__
+        affected = sorted(backward, key=key) + sorted(forward, key=key)
+        slots = sorted(self._order[node] for node in affected)
+        for node, slot in zip(affected, slots):
+            self._order[node] = slot
+        return None
+
+    @staticmethod
+    def _cycle_path(source: str, last: str, parents: Dict[str, Optional[str]]) -> List[str]:
+        path = [last]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        return [source] + path[::-1] + [source]
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def find_cycle(self, node: str, targets: Iterable[str]) -> Optional[List[str]]:
+        """
+        Cycle that giving node these out-edges would close, without changing the graph.
+
+        While the graph is acyclic only targets ordered before node are
+        searched, and only within the region up to node.
+
+        Returns:
+            [node, target, ..., node], or None
+        """
+        targets = list(dict.fromkeys(targets))
+        if node in targets:
+            return [node, node]
+        if node not in self._order:
+            return None     # nothing can reach a node the graph has never seen
+        upper = None if self.cyclic_edges else self._order[node]
+        for target in targets:
+            if target not in self._order:
+                continue
+            if upper is not None and self._order[target] > upper:
+                continue
+            cycle = self._path_back(node, target, upper)
+            if cycle:
+                return cycle
+        return None
+
+    def _path_back(self, node: str, target: str, upper: Optional[int]) -> Optional[List[str]]:
+        """[node, target, ..., node] if target reaches node (through nodes ordered below upper)."""
+        parents: Dict[str, Optional[str]] = {target: None}
+        stack = [target]
+        while stack:
+            current = stack.pop()
+            for succ in self._successors[current]:
+                if succ == node:
+                    return self._cycle_path(node, current, parents)
+                if succ not in parents and (upper is None or self._order[succ] < upper):
+                    parents[succ] = current
+                    stack.append(succ)
+        return None
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Iterative Tarjan SCC, components in reverse topological order."""
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        counter = 0
+
+        for root in self._order:
+            if root in index:
+                continue
+            work = [(root, iter(self._successors[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for succ in successors:
+                    if succ not in index:
+                        index[succ] = lowlink[succ] = counter
+                        counter += 1
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(self._successors[succ])))
+                        advanced = True
+                        break
+                    if succ in on_stack:
+                        lowlink[node] = min(lowlink[node], index[succ])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def cycles(self) -> List[Tuple[List[str], List[str]]]:
+        """
+        One cycle per cyclic strongly connected component.
+
+        Returns:
+            List of (cycle path [start, ..., start], component members),
+            starting at the earliest-added member, in insertion order
+        """
+        position = {node: i for i, node in enumerate(self._order)}
+        results = []
+        for component in self.strongly_connected_components():
+            members = set(component)
+            start = min(component, key=position.__getitem__)
+            if len(component) == 1 and start not in self._successors[start]:
+                continue
+            results.append((self._cycle_within(start, members), sorted(component, key=position.__getitem__)))
+        return sorted(results, key=lambda result: position[result[0][0]])
+
+    def _cycle_within(self, start: str, members: Set[str]) -> List[str]:
+        parents: Dict[str, Optional[str]] = {}
+        stack = []
+        for succ in self._successors[start]:
+            if succ == start:
+                return [start, start]
+            if succ in members and succ not in parents:
+                parents[succ] = None
+                stack.append(succ)
+        while stack:
+            node = stack.pop()
+            for succ in self._successors[node]:
+                if succ == start:
+                    return self._cycle_path(start, node, parents)
+                if succ in members and succ not in parents:
+                    parents[succ] = node
+                    stack.append(succ)
+        return [start, start]
@@ -11,19 +11,22 @@ Usage:
     )
 """
 
+import copy
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-import yaml
 
 from .process_parser import ProcessParser
 from .conflict_detector import ConflictDetector
+from .dependency_graph import DependencyGraph
 from .agent_factory import AgentFactory
 from .playbook_generator import PlaybookGenerator
 from .version_controller import VersionController
+from .process_registry import ProcessRegistry
 from .audit_logger import AuditLogger
+from .audit_writer import AuditWriter
 
 
 class ProcessStatus(Enum):
@@ -62,12 +65,15 @@ class OrchestrationAgent:
     - Manage versions and audit trail
     """
 
-    def __init__(self, registry_path: Optional[Path] = None):
+    def __init__(self, registry_path: Optional[Path] = None, audit_writer: Optional[AuditWriter] = None):
         """
         Initialize the Orchestration Agent.
 
         Args:
             registry_path: Path to process registry. Defaults to project root.
+            audit_writer: Writer (and with it the durability policy) of the
+                audit log, e.g. AuditWriter(policy="interval"). Defaults to
+                the shared per_event writer.
         """
         if registry_path is None:
             registry_path = Path(__file__).parent.parent.parent / "process_registry"
@@ -77,8 +83,10 @@ class OrchestrationAgent:
         self.conflict_detector = ConflictDetector(self)
         self.agent_factory = AgentFactory()
         self.playbook_generator = PlaybookGenerator()
-        self.version_controller = VersionController(registry_path)
-        self.audit_logger = AuditLogger(registry_path / "audit")
+        self.version_controller = VersionController(registry_path, self.conflict_detector.similarity)
+        self.audit_logger = AuditLogger(registry_path / "audit", writer=audit_writer)
+        self.registry = ProcessRegistry(registry_path, self.conflict_detector)
+        self.version_controller.subscribe(self.registry.on_saved)
 
     def process_input(
         self,
@@ -116,9 +124,14 @@ class OrchestrationAgent:
                             "Specify who owns the process"]
             )
 
-        # Step 2: Check for conflicts
-        existing_processes = self.get_all_processes()
-        conflict_report = self.conflict_detector.analyze(process_def, existing_processes)
+        # Step 2: Check for conflicts (against process files added or removed since the last check)
+        self.registry.refresh_if_modified()
+        conflict_report = self.conflict_detector.analyze(
+            process_def,
+            self.registry.processes(),
+            index=self.registry.conflict_index,
+            graph=self.registry.dependency_graph
+        )
 
         # Step 3: Check for blocking conflicts
         if conflict_report.has_critical():
@@ -225,30 +238,16 @@ class OrchestrationAgent:
 
     def get_all_processes(self, status: Optional[ProcessStatus] = None) -> List[Dict]:
         """Get all processes from registry, optionally filtered by status"""
-        processes = []
-        process_dir = self.registry_path / "processes"
-
-        if not process_dir.exists():
-            return processes
-
-        for yaml_file in process_dir.glob("*.yaml"):
-            try:
-                with open(yaml_file, 'r') as f:
-                    proc = yaml.safe_load(f)
-                    if status is None or proc.get("status") == status.value:
-                        processes.append(proc)
-            except Exception:
-                continue
+        processes = self.registry.processes(status.value if status else None)
+        return [copy.deepcopy(proc) for proc in processes]
 
-        return processes
+    def get_dependency_graph(self) -> DependencyGraph:
+        """Trigger graph of all registry processes, kept current by the registry"""
+        return self.registry.dependency_graph
 
     def get_process(self, process_id: str) -> Optional[Dict]:
         """Get a specific process by ID"""
-        process_file = self.registry_path / "processes" / f"{process_id}.yaml"
-        if process_file.exists():
-            with open(process_file, 'r') as f:
-                return yaml.safe_load(f)
-        return None
+        return self.registry.get(process_id)
 
     def rollback_process(
         self,
@@ -257,7 +256,7 @@ class OrchestrationAgent:
         actor: str = "human:ceo"
     ) -> ProcessResult:
         """Rollback a process to a previous version"""
-        result = self.version_controller.rollback(process_id, version)
+        result = self.version_controller.rollback("process", process_id, version, actor)
 
         self.audit_logger.log_event(
             event_type="process_rollback",
@@ -0,0 +1,304 @@
+"""
+Process Registry
+
+In-memory index of the current process definitions in
+process_registry/processes/*.yaml, with their status and the indexes the
+conflict checks run against (ProcessIndex, DependencyGraph).
+
+Loading:
+    Nothing is read until the registry is first used. The definitions are
+    then read from a compact index file (process_registry/index.json.gz,
+    gzip-compressed JSON) and validated against the mtime and size of each
+    YAML file; only new or changed files are parsed, and the index file is
+    rewritten if anything was re-read.
+
+Invalidation:
+    The registry subscribes to VersionController, so every save or rollback
+    updates the definition, the conflict indexes and the index file at
+    once. Edits made to the YAML files outside VersionController are picked
+    up on the next load or by refresh(). refresh_if_modified() only stats
+    the processes directory, so it notices files that were added, removed or
+    replaced (renamed into place) but not files rewritten in place.
+
+Duplicates:
+    When several files declare the same process_id, the file named after it
+    (PROC_001.yaml) wins, then the first file name. The others are logged
+    once and remembered with their mtime and size, so refreshes neither
+    re-parse them nor switch between them.
+"""
+
+import copy
+import gzip
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from .conflict_detector import ConflictDetector, ProcessIndex
+from .dependency_graph import DependencyGraph, trigger_targets
+
+INDEX_FILE = "index.json.gz"
+INDEX_FORMAT = 1
+
+# Directory mtimes this recent may not yet reflect every change (timestamp granularity)
+_RACY_MTIME_NS = 1_000_000_000
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessRegistry:
+    """
+    Current process definitions, kept in memory and indexed for conflict checks.
+
+    Usage:
+        registry = ProcessRegistry(registry_path, detector)
+        version_controller.subscribe(registry.on_saved)
+        registry.get("PROC_001")
+        registry.processes(status="active")
+        detector.analyze(new, registry.processes(), index=registry.conflict_index,
+                         graph=registry.dependency_graph)
+    """
+
+    def __init__(self, registry_path: Path, detector: Optional[ConflictDetector] = None):
+        """
+        Args:
+            registry_path: Path to process registry
+            detector: Conflict detector whose blocking keys the index uses
+        """
+        self.registry_path = registry_path
+        self.processes_dir = registry_path / "processes"
+        self.index_path = registry_path / INDEX_FILE
+        self.detector = detector or ConflictDetector()
+        self._loaded = False
+        self._entries: Dict[str, Dict] = {}     # process_id -> {file, stamp, definition}
+        self._shadowed: Dict[str, Tuple[str, Optional[Tuple[int, int]]]] = {}  # file -> (process_id, stamp)
+        self._dir_mtime: Optional[int] = None
+        self._positions: Dict[str, int] = {}
+        self._index: Optional[ProcessIndex] = None
+        self._graph: Optional[DependencyGraph] = None
+
+    # ── Access ───────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._entries)
+
+    def __contains__(self, process_id: str) -> bool:
+        self._ensure_loaded()
+        return process_id in self._entries
+
+    def get(self, process_id: str) -> Optional[Dict]:
+        """Copy of a process definition, or None."""
+        self._ensure_loaded()
+        entry = self._entries.get(process_id)
+        return copy.deepcopy(entry["definition"]) if entry else None
+
+    def processes(self, status: Optional[str] = None) -> List[Dict]:
+        """
+        Current definitions (shared with the registry; do not modify).
+
+        Args:
+            status: Only processes with this status
+        """
+        self._ensure_loaded()
+        return [
+            entry["definition"] for entry in self._entries.values()
+            if status is None or entry["definition"].get("status") == status
+        ]
+
+    @property
+    def conflict_index(self) -> ProcessIndex:
+        """Blocking index over all current processes."""
+        self._ensure_loaded()
+        return self._index
+
+    @property
+    def dependency_graph(self) -> DependencyGraph:
+        """Trigger graph of all current processes."""
+        self._ensure_loaded()
+        return self._graph
+
+    # ── Updates ──────────────────────────────────────────────────────────
+
+    def on_saved(self, entity_type: str, entity_id: str, data: Dict, path: Path):
+        """VersionController listener: a current entity file was written."""
+        if entity_type != "process" or not self._loaded:
+            return      # an unloaded registry reads the file when first used
+        self._put(entity_id, copy.deepcopy(data), path.name, self._stat(path))
+        self._write_index()
+
+    def refresh(self) -> bool:
+        """
+        Re-validate all entries against the YAML files.
+
+        Returns:
+            True if any process was added, changed or removed
+        """
+        if not self._loaded:
+            self._ensure_loaded()
+            return True
+        changed = self._sync()
+        if changed:
+            self._write_index()
+        return changed
+
+    def refresh_if_modified(self) -> bool:
+        """
+        refresh() if the processes directory changed since the last sync.
+
+        Costs one stat() when nothing was added, removed or renamed (and the
+        directory was last modified more than a second before that sync).
+
+        Returns:
+            True if any process was added, changed or removed
+        """
+        if self._loaded and self._dir_stamp() == self._dir_mtime:
+            return False
+        return self.refresh()
+
+    def _put(self, process_id: str, definition: Dict, file_name: str, stamp: Optional[Tuple[int, int]]):
+        self._entries[process_id] = {"file": file_name, "stamp": stamp, "definition": definition}
+        if process_id in self._positions:
+            self._index.remove(self._positions[process_id])
+        self._positions[process_id] = self._index.add(definition)
+        self._graph.set_edges(process_id, trigger_targets(definition))
+
+    def _drop(self, process_id: str):
+        del self._entries[process_id]
+        self._index.remove(self._positions.pop(process_id))
+        self._graph.set_edges(process_id, [])
+
+    # ── Loading ──────────────────────────────────────────────────────────
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._entries = self._read_index()
+        self._index = self.detector.build_index()
+        self._graph = DependencyGraph()
+        self._positions = {}
+        for process_id, entry in sorted(self._entries.items()):
+            self._positions[process_id] = self._index.add(entry["definition"])
+            self._graph.set_edges(process_id, trigger_targets(entry["definition"]))
+        self._loaded = True
+        if self._sync():
+            self._write_index()
+
+    def _sync(self) -> bool:
+        """Parse new or changed YAML files and drop entries whose file is gone."""
+        dir_mtime = self._dir_stamp()
+        racy = dir_mtime is not None and dir_mtime > time.time_ns() - _RACY_MTIME_NS
+        self._dir_mtime = None if racy else dir_mtime
+        stamps = {}
+        if self.processes_dir.exists():
+            for path in sorted(self.processes_dir.glob("*.yaml")):
+                stamps[path.name] = self._stat(path)
+
+        # process_id claimed by each file, parsing only new or changed ones
+        known = dict(self._shadowed)
+        known.update((entry["file"], (process_id, entry["stamp"])) for process_id, entry in self._entries.items())
+        claims: Dict[str, List[str]] = {}
+        parsed: Dict[str, Dict] = {}
+        for file_name, stamp in stamps.items():
+            claim = known.get(file_name)
+            if claim is None or claim[1] != stamp:
+                definition = self._parse(file_name)
+                if definition is not None:
+                    parsed[file_name] = definition
+                    claim = (definition["process_id"], stamp)
+            if claim is not None:   # unreadable files keep their last good claim
+                claims.setdefault(claim[0], []).append(file_name)
+
+        changed = False
+        shadowed = {}
+        for process_id, files in claims.items():
+            winner, *others = sorted(files, key=lambda name: (Path(name).stem != process_id, name))
+            for file_name in others:
+                shadowed[file_name] = (process_id, stamps[file_name])
+            if others and any(file_name in parsed for file_name in files):
+                logger.warning(
+                    "Duplicate process_id %s in %s: using %s", process_id, ", ".join(files), winner
+                )
+            entry = self._entries.get(process_id)
+            if entry is not None and entry["file"] == winner and (
+                entry["stamp"] == stamps[winner] or winner not in parsed
+            ):
+                continue
+            definition = parsed.get(winner) or self._parse(winner)
+            if definition is None or definition["process_id"] != process_id:
+                continue
+            self._put(process_id, definition, winner, stamps[winner])
+            changed = True
+        self._shadowed = shadowed
+
+        for process_id in list(self._entries):
+            if process_id not in claims:
+                self._drop(process_id)
+                changed = True
+        return changed
+
+    def _parse(self, file_name: str) -> Optional[Dict]:
+        """Process definition in a YAML file, or None if unreadable or without process_id."""
+        try:
+            with open(self.processes_dir / file_name, 'r') as f:
+                definition = yaml.safe_load(f)
+        except Exception:
+            return None
+        if not isinstance(definition, dict) or not definition.get("process_id"):
+            return None
+        return definition
+
+    def _read_index(self) -> Dict[str, Dict]:
+        try:
+            with gzip.open(self.index_path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT:
+            return {}
+        entries = {}
+        for process_id, entry in data.get("processes", {}).items():
+            stamp = entry.get("stamp")
+            entries[process_id] = {
+                "file": entry.get("file"),
+                "stamp": tuple(stamp) if stamp else None,
+                "definition": entry.get("definition") or {},
+            }
+        return entries
+
+    def _write_index(self):
+        """Atomically rewrite the index file."""
+        self.registry_path.mkdir(parents=True, exist_ok=True)
+        data = {
+            "format": INDEX_FORMAT,
+            "processes": {
+                process_id: {
+                    "file": entry["file"],
+                    "stamp": list(entry["stamp"]) if entry["stamp"] else None,
+                    "definition": entry["definition"],
+                }
+                for process_id, entry in self._entries.items()
+            },
+        }
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'), default=str)
+        os.replace(tmp_path, self.index_path)
+
+    def _dir_stamp(self) -> Optional[int]:
+        try:
+            return os.stat(self.processes_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
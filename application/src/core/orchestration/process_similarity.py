@@ -0,0 +1,193 @@
+"""
+Process Similarity
+
+Near-duplicate detection for process registries with MinHash signatures
+and locality-sensitive hashing (LSH).
+
+Features:
+    Each process is reduced to a set of string features:
+
+        trigger:<event>          owner:<agent>
+        action:<step action>     output:<artifact>
+        text:<w1 w2 w3>          word 3-shingles of the description and
+                                 step names (stopwords removed)
+
+    Similarity of two processes is the Jaccard index of their feature sets.
+
+Signatures and bands:
+    A MinHash signature (num_perm minimum hash values) estimates Jaccard
+    similarity. The signature is cut into bands of `rows` values; processes
+    sharing any whole band are candidates. Bands and rows are chosen from the
+    threshold so a pair at the threshold collides with probability >= recall
+    while dissimilar pairs rarely do. Band keys are plain hashable tuples, so
+    any hash index (ConflictDetector's ProcessIndex) serves as the LSH table
+    and lookups touch only the buckets of the query's bands.
+
+Stored signatures:
+    VersionController stores each version's signature under `_minhash`
+    together with the parameters and a digest of the features it was built
+    from. A stored signature is reused only when all three still match, so
+    hand-edited process files are re-signed.
+"""
+
+import hashlib
+import random
+import re
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+# Hash permutations (a * x + b) mod p over 32-bit feature hashes, with the
+# product wrapping in uint64 as in common MinHash implementations
+_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = (1 << 32) - 1
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9_\-]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our should "
+    "that the their then this to was we when where which will with within".split()
+)
+
+SHINGLE_SIZE = 3
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=4).digest(), "little")
+
+
+def _choose_bands(num_perm: int, threshold: float, recall: float) -> Tuple[int, int]:
+    """Widest bands (fewest false candidates) that still reach recall at threshold."""
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            return bands, rows
+    return num_perm, 1
+
+
+class ProcessSimilarity:
+    """
+    MinHash signatures and LSH band keys for process definitions.
+
+    Usage:
+        similarity = ProcessSimilarity(threshold=0.8)
+        keys = similarity.band_keys(process)      # index these
+        similarity.jaccard(process_a, process_b)  # exact verification
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        seed: int = 1,
+        recall: float = 0.99
+    ):
+        """
+        Args:
+            threshold: Jaccard similarity at which processes are redundant
+            num_perm: Signature length
+            seed: Seed of the hash permutations (part of stored signatures)
+            recall: Target probability that a pair at the threshold shares a band
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.seed = seed
+        self.bands, self.rows = _choose_bands(num_perm, threshold, recall)
+        rng = random.Random(seed)
+        prime = int(_PRIME)
+        self._a = np.array([rng.randrange(1, prime) for _ in range(num_perm)], dtype=np.uint64)[:, None]
+        self._b = np.array([rng.randrange(0, prime) for _ in range(num_perm)], dtype=np.uint64)[:, None]
+
+    # ── Features ─────────────────────────────────────────────────────────
+
+    def features(self, process: Dict) -> Set[str]:
+        """Feature set of a process (see module docstring)."""
+        features = set()
+        event = process.get("trigger", {}).get("event")
+        if event is not None:
+            features.add(f"trigger:{event}")
+        owner = process.get("ownership", {}).get("primary_owner", {}).get("agent")
+        if owner is not None:
+            features.add(f"owner:{owner}")
+
+        primary = process.get("outputs", {}).get("primary")
+        if primary:
+            features.add(f"output:{primary.get('artifact')}")
+        text = [str(process.get("description") or "")]
+        for step in process.get("steps", []):
+            if step.get("action"):
+                features.add(f"action:{step['action']}")
+            for output in step.get("outputs", []):
+                features.add(f"output:{output.get('artifact')}")
+            text.append(str(step.get("name") or ""))
+
+        tokens = [t for t in _TOKEN.findall(" ".join(text).lower()) if t not in _STOPWORDS]
+        if 0 < len(tokens) < SHINGLE_SIZE:
+            features.add("text:" + " ".join(tokens))
+        for i in range(len(tokens) - SHINGLE_SIZE + 1):
+            features.add("text:" + " ".join(tokens[i:i + SHINGLE_SIZE]))
+        return features
+
+    @staticmethod
+    def digest(features: Iterable[str]) -> str:
+        """Stable digest of a feature set (detects stale stored signatures)."""
+        return hashlib.blake2b("\n".join(sorted(features)).encode(), digest_size=8).hexdigest()
+
+    # ── Signatures ───────────────────────────────────────────────────────
+
+    def signature(self, process: Dict) -> Tuple[int, ...]:
+        """MinHash signature, reusing the stored one when it is still valid."""
+        features = self.features(process)
+        stored = process.get("_minhash")
+        if (isinstance(stored, dict)
+                and stored.get("num_perm") == self.num_perm
+                and stored.get("seed") == self.seed
+                and stored.get("digest") == self.digest(features)):
+            return tuple(stored["signature"])
+        return self.signature_of(features)
+
+    def signature_of(self, features: Iterable[str]) -> Tuple[int, ...]:
+        """MinHash signature of a feature set."""
+        hashes = np.fromiter((_feature_hash(f) for f in features), dtype=np.uint64)
+        if not len(hashes):
+            return (_MAX_HASH,) * self.num_perm
+        permuted = (self._a * hashes + self._b) % _PRIME
+        return tuple((permuted.min(axis=1) & np.uint64(_MAX_HASH)).tolist())
+
+    def stored_signature(self, process: Dict) -> Dict:
+        """`_minhash` entry to store with a process version."""
+        features = self.features(process)
+        return {
+            "num_perm": self.num_perm,
+            "seed": self.seed,
+            "digest": self.digest(features),
+            "signature": list(self.signature_of(features)),
+        }
+
+    def band_keys(self, process: Dict, signature: Optional[Tuple[int, ...]] = None) -> Set[Tuple]:
+        """LSH bucket keys: (band number, band values) for each band."""
+        if signature is None:
+            signature = self.signature(process)
+        rows = self.rows
+        return {(band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands)}
+
+    # ── Similarity ───────────────────────────────────────────────────────
+
+    def jaccard(self, proc_a: Dict, proc_b: Dict) -> float:
+        """Exact Jaccard similarity of two processes' feature sets."""
+        features_a = self.features(proc_a)
+        features_b = self.features(proc_b)
+        union = len(features_a | features_b)
+        return len(features_a & features_b) / union if union else 0.0
+
+    @staticmethod
+    def estimate(signature_a: Tuple[int, ...], signature_b: Tuple[int, ...]) -> float:
+        """Jaccard similarity estimated from two signatures."""
+        return sum(a == b for a, b in zip(signature_a, signature_b)) / len(signature_a)
+
+
+def collision_probability(similarity: float, bands: int, rows: int) -> float:
+    """Probability that a pair with this Jaccard similarity shares a band."""
+    return 1 - (1 - similarity ** rows) ** bands
+
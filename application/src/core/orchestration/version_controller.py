@@ -2,18 +2,22 @@
 Version Controller
 
 Manages versioning, snapshots, and rollback for processes, agents, and playbooks.
-Maintains full history with diff tracking.
+Maintains full history with diff tracking. Process versions carry their
+MinHash signature (`_minhash`, see process_similarity) so redundancy checks
+over the registry do not re-sign unchanged processes.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import json
 import shutil
 import yaml
 
+from .process_similarity import ProcessSimilarity
+
 
 class ChangeType(Enum):
     CREATE = "create"
@@ -48,17 +52,27 @@ class VersionController:
     - Audit-ready change logging
     """
 
-    def __init__(self, registry_path: Path):
+    def __init__(self, registry_path: Path, similarity: Optional[ProcessSimilarity] = None):
         """
         Initialize the Version Controller.
 
         Args:
             registry_path: Path to process registry
+            similarity: Signs saved process versions (ConflictDetector.similarity)
         """
         self.registry_path = registry_path
+        self.similarity = similarity or ProcessSimilarity()
+        self._listeners: List[Callable[[str, str, Dict, Path], None]] = []
         self.versions_path = registry_path / "versions"
         self.versions_path.mkdir(parents=True, exist_ok=True)
 
+    def subscribe(self, listener: Callable[[str, str, Dict, Path], None]):
+        """
+        Call listener(entity_type, entity_id, data, path) whenever an
+        entity's current file is written (saves and rollbacks).
+        """
+        self._listeners.append(listener)
+
     def save_process(
         self,
         process_def: Dict,
@@ -99,6 +113,7 @@ class VersionController:
         process_def["version"] = new_version
         process_def["updated_at"] = datetime.utcnow().isoformat() + "Z"
         process_def["updated_by"] = actor
+        process_def["_minhash"] = self.similarity.stored_signature(process_def)
 
         # Create version record
         record = VersionRecord(
@@ -326,6 +341,9 @@ class VersionController:
         with open(current_file, 'w') as f:
             yaml.dump(data, f, default_flow_style=False, sort_keys=False)
 
+        for listener in self._listeners:
+            listener(entity_type, entity_id, data, current_file)
+
     def _calculate_diff(self, old: Dict, new: Dict) -> Dict:
         """Calculate diff between two snapshots"""
         diff = {
@@ -3,25 +3,49 @@ Playbook Execution Engine - Minimal Vertical Slice
 
 Implements:
 - Playbook loading and schema validation
+- Playbook registry indexed by ID with hot reload
 - Decision Logic Language (DLL) evaluation
 - Threshold management
 - Evidence validation
+- Per-context JSONPath memoization across rules and playbooks
+- Process-pool batch execution across nodes
+- Run storage as directories, a compact SQLite store or in memory; dry runs
+- Run catalog with paginated queries and aggregates
+- Incremental re-execution reusing results of rules with unchanged inputs
+- Lazy node contexts parsing only the documents rules read
 
 Version: 0.1.0 (vertical slice with SWOT playbook)
 """
 
 from .playbook_loader import PlaybookLoader
+from .playbook_registry import PlaybookRegistry
 from .dll_evaluator import DLLEvaluator
 from .threshold_manager import ThresholdManager
 from .evidence_validator import EvidenceValidator
+from .evaluation_session import EvaluationSession
 from .playbook_executor import PlaybookExecutor
+from .batch_executor import BatchExecutor, BatchJob
+from .run_store import DirectoryRunStore, MemoryRunStore, SQLiteRunStore
+from .run_catalog import RunCatalog
+from .rule_cache import RuleResultCache
+from .lazy_context import LazyNodeContext
 
 __all__ = [
     'PlaybookLoader',
+    'PlaybookRegistry',
     'DLLEvaluator',
     'ThresholdManager',
     'EvidenceValidator',
+    'EvaluationSession',
     'PlaybookExecutor',
+    'BatchExecutor',
+    'BatchJob',
+    'DirectoryRunStore',
+    'SQLiteRunStore',
+    'MemoryRunStore',
+    'RunCatalog',
+    'RuleResultCache',
+    'LazyNodeContext',
 ]
 
 __version__ = '0.1.0'
@@ -0,0 +1,272 @@
+"""
+Batch Executor - Run playbooks for many nodes on a process pool
+
+Takes (playbook_id, realm_id, node_id) jobs and schedules them on worker
+processes. Each worker builds one PlaybookExecutor at start-up, so the
+playbook registry, compiled rules and thresholds stay warm across every
+job it runs.
+
+Scheduling:
+    - Results are yielded in completion order
+    - At most max_per_node jobs for the same node are in flight at once,
+      so runs for one node never contend for its files
+    - Jobs for one node start in submission order; different nodes
+      interleave round-robin
+
+Reporting:
+    BatchReport gives throughput (runs/sec over wall time) and per-stage
+    timings aggregated from the execution traces.
+
+Usage:
+    batch = BatchExecutor(playbooks_dir, thresholds_config, runs_dir, max_workers=4)
+    report = batch.run([BatchJob('PB_201', 'ACME_CORP', 'SECURITY_CONSOLIDATION'), ...])
+    report.throughput, report.stage_stats()
+"""
+
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from .lazy_context import LazyNodeContext
+from .node_context import document_fingerprints, load_node_context
+from .playbook_executor import PlaybookExecutor
+from .run_catalog import RunCatalog
+from .rule_cache import RuleResultCache
+from .run_store import RunStore
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One playbook run for one node."""
+
+    playbook_id: str
+    realm_id: str
+    node_id: str
+
+    @property
+    def node_key(self) -> str:
+        return f"{self.realm_id}/{self.node_id}"
+
+
+@dataclass
+class JobResult:
+    """Outcome of one BatchJob as reported by its worker."""
+
+    job: BatchJob
+    status: str                                 # 'completed' | 'failed'
+    run_id: Optional[str] = None
+    fired_rule_ids: List[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    worker_pid: Optional[int] = None
+    started_at: float = 0.0
+    finished_at: float = 0.0
+
+
+@dataclass
+class BatchReport:
+    """All job results of a batch, in completion order."""
+
+    results: List[JobResult]
+    wall_seconds: float
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for r in self.results if r.status == 'completed')
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if r.status != 'completed')
+
+    @property
+    def throughput(self) -> float:
+        """Runs per second of wall time."""
+        return len(self.results) / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def stage_stats(self) -> Dict[str, Dict[str, float]]:
+        """count/total/mean/p50/p95 seconds per pipeline stage across runs."""
+        by_stage: Dict[str, List[float]] = {}
+        for result in self.results:
+            for stage, seconds in result.stage_seconds.items():
+                by_stage.setdefault(stage, []).append(seconds)
+        stats = {}
+        for stage, values in by_stage.items():
+            array = np.asarray(values)
+            stats[stage] = {
+                'count': len(values),
+                'total': float(array.sum()),
+                'mean': float(array.mean()),
+                'p50': float(np.percentile(array, 50)),
+                'p95': float(np.percentile(array, 95)),
+            }
+        return stats
+
+
+def stage_durations(trace: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Seconds per stage from the started/finished step pairs of a trace.
+
+    Uses the perf_counter_ns duration of finished steps when recorded,
+    otherwise the difference of the wall-clock timestamps.
+    """
+    started = {}
+    durations = {}
+    for step in trace.get('execution_steps', []):
+        timestamp = datetime.fromisoformat(step['timestamp'].rstrip('Z'))
+        if step['status'] == 'started':
+            started[step['step']] = timestamp
+        elif step['step'] in started:
+            opened = started.pop(step['step'])
+            if 'duration_ns' in step:
+                durations[step['step']] = step['duration_ns'] / 1e9
+            else:
+                durations[step['step']] = (timestamp - opened).total_seconds()
+    return durations
+
+
+# Context loaders that read the standard vault layout
+_VAULT_LOADERS = (load_node_context, LazyNodeContext)
+
+
+# ── Worker process state ────────────────────────────────────────────────
+
+_WORKER_EXECUTOR: Optional[PlaybookExecutor] = None
+_WORKER_CONTEXT_LOADER: Optional[Callable[..., Dict[str, Any]]] = None
+_WORKER_VAULT_ROOT: Optional[Path] = None
+_WORKER_DRY_RUN = False
+
+
+def _init_worker(playbooks_dir, thresholds_config, runs_dir, vault_root, context_loader,
+                 run_store, run_catalog, rule_cache, profile_memory, dry_run):
+    """Build the worker's executor once; its registry stays warm for all jobs."""
+    global _WORKER_EXECUTOR, _WORKER_CONTEXT_LOADER, _WORKER_VAULT_ROOT, _WORKER_DRY_RUN
+    _WORKER_EXECUTOR = PlaybookExecutor(
+        playbooks_dir, thresholds_config, runs_dir, run_store, run_catalog, rule_cache,
+        profile_memory=profile_memory
+    )
+    _WORKER_CONTEXT_LOADER = context_loader
+    _WORKER_VAULT_ROOT = vault_root
+    _WORKER_DRY_RUN = dry_run
+
+
+def _run_job(job: BatchJob) -> JobResult:
+    result = JobResult(job=job, status='failed', worker_pid=os.getpid(), started_at=time.time())
+    try:
+        context = _WORKER_CONTEXT_LOADER(job.realm_id, job.node_id, _WORKER_VAULT_ROOT)
+        fingerprints = None
+        if _WORKER_EXECUTOR.rule_cache is not None and _WORKER_CONTEXT_LOADER in _VAULT_LOADERS:
+            # Rule inputs fingerprinted from the vault files the context came from
+            fingerprints = document_fingerprints(job.realm_id, job.node_id, _WORKER_VAULT_ROOT)
+        outcome = _WORKER_EXECUTOR.execute(
+            job.playbook_id, context, client_id=f"{job.realm_id}_{job.node_id}",
+            input_fingerprints=fingerprints, dry_run=_WORKER_DRY_RUN
+        )
+        result.status = outcome['status']
+        result.run_id = outcome['run_id']
+        result.fired_rule_ids = [r['rule_id'] for r in outcome['fired_rules']]
+        result.duration_seconds = outcome['duration_seconds']
+        result.stage_seconds = stage_durations(outcome['trace'])
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.finished_at = time.time()
+    return result
+
+
+class BatchExecutor:
+    """Schedule BatchJobs on a process pool with a per-node concurrency cap."""
+
+    def __init__(
+        self,
+        playbooks_dir: Path,
+        thresholds_config: Path,
+        runs_dir: Path,
+        vault_root: Path = None,
+        max_workers: int = None,
+        max_per_node: int = 1,
+        context_loader: Callable[..., Dict[str, Any]] = load_node_context,
+        run_store: Optional[RunStore] = None,
+        run_catalog: Optional[RunCatalog] = None,
+        rule_cache: Optional[RuleResultCache] = None,
+        profile_memory: bool = False,
+        dry_run: bool = False
+    ):
+        """
+        Args:
+            playbooks_dir: Directory containing playbook YAML files
+            thresholds_config: Path to playbook_thresholds.yaml
+            runs_dir: Directory where run outputs are written
+            vault_root: Vault root passed to context_loader
+            max_workers: Worker processes (defaults to CPU count)
+            max_per_node: Concurrent jobs allowed per realm/node
+            context_loader: Module-level function or class (realm_id, node_id,
+                vault_root) -> context dict; must be picklable. LazyNodeContext
+                parses only the documents each playbook reads
+            run_store: Run persistence backend shared by all workers
+                (defaults to directories under runs_dir)
+            run_catalog: Index that all workers record run metadata in
+            rule_cache: Rule result cache for incremental re-runs (use a
+                SQLite-backed one to share results between workers)
+            profile_memory: Record memory deltas per stage in run traces
+            dry_run: Evaluate without persisting runs (see
+                PlaybookExecutor.execute)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_per_node = max(1, max_per_node)
+        self._initargs = (
+            playbooks_dir, thresholds_config, runs_dir, vault_root, context_loader,
+            run_store, run_catalog, rule_cache, profile_memory, dry_run
+        )
+
+    def run(self, jobs: Iterable[BatchJob]) -> BatchReport:
+        """Run all jobs and collect results in completion order."""
+        start = time.perf_counter()
+        results = list(self.iter_results(jobs))
+        return BatchReport(results=results, wall_seconds=time.perf_counter() - start)
+
+    def iter_results(self, jobs: Iterable[BatchJob]) -> Iterator[JobResult]:
+        """Yield JobResults as jobs complete."""
+        queues: Dict[str, deque] = {}
+        for job in jobs:
+            queues.setdefault(job.node_key, deque()).append(job)
+        ready = deque(queues)
+        queued = set(ready)
+        in_flight = Counter()
+        futures = {}
+        # Keep every worker busy without queueing the whole batch up front
+        capacity = self.max_workers * 2
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker, initargs=self._initargs
+        ) as pool:
+            while ready or futures:
+                while ready and len(futures) < capacity:
+                    key = ready.popleft()
+                    queued.discard(key)
+                    job = queues[key].popleft()
+                    in_flight[key] += 1
+                    futures[pool.submit(_run_job, job)] = job
+                    if queues[key] and in_flight[key] < self.max_per_node:
+                        ready.append(key)
+                        queued.add(key)
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = futures.pop(future)
+                    key = job.node_key
+                    in_flight[key] -= 1
+                    if queues[key] and key not in queued and in_flight[key] < self.max_per_node:
+                        ready.append(key)
+                        queued.add(key)
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        # Worker died (e.g. BrokenProcessPool); report the job as failed
+                        yield JobResult(job=job, status='failed', error=f"{type(e).__name__}: {e}")
@@ -0,0 +1,351 @@
+"""
+Bulk Evaluator - Columnar DLL evaluation across many node contexts
+
+Answers "which of our nodes trigger rule X today" without running the
+executor once per node. Every JSONPath referenced by a condition is
+extracted once for all nodes into a column (NumPy array plus null mask),
+and the compiled condition tree is then evaluated as vectorized boolean
+operations over those columns.
+
+Exactness:
+    Results agree with DLLEvaluator.evaluate node by node, including
+    errors. Number-vs-number and string-vs-string comparisons run
+    vectorized; any other type mix falls back to the Python operator per
+    node, so TypeErrors (e.g. 'abc' > 5) surface for exactly the nodes the
+    scalar evaluator would raise on. AND/OR honour short-circuit order, so
+    an error in an operand the scalar evaluator would skip is not reported.
+
+Usage:
+    frame = ContextFrame({'node_a': context_a, 'node_b': context_b})
+    bulk = BulkEvaluator()
+    result = bulk.evaluate("$.account_overview.arr >= 500000", frame)
+    result.firing    # ['node_a']
+    bulk.evaluate_playbook(playbook, frame, 'PB_201')   # {rule_id: BulkResult}
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .dll_evaluator import (
+    CompiledBoolean,
+    CompiledComparison,
+    CompiledCondition,
+    CompiledConstant,
+    CompiledExists,
+    CompiledLiteral,
+    CompiledNot,
+    CompiledPath,
+    DLLEvaluator,
+)
+from .threshold_manager import ThresholdManager
+
+# Plain dotted paths can be read by dict lookups instead of jsonpath_ng
+_SIMPLE_PATH = re.compile(r"^\$(\.[A-Za-z_]\w*)+$")
+
+# Integers beyond this lose precision as float64
+_MAX_EXACT_INT = 2 ** 53
+
+_VECTOR_OPS = {
+    '>': np.greater,
+    '<': np.less,
+    '>=': np.greater_equal,
+    '<=': np.less_equal,
+    '==': np.equal,
+    '!=': np.not_equal,
+}
+
+
+class Column:
+    """
+    One operand's values for every node.
+
+    kind is 'num' (float64 array), 'str' (unicode array) or 'obj' (Python
+    objects, compared per node). present is False where the value is None.
+    axis says which result axis the values run along: 'node' (one per
+    node), 'const' (a single literal, broadcast) or 'sweep' (one per
+    threshold value, shaped (V, 1) to broadcast against nodes).
+    """
+
+    __slots__ = ('raw', 'values', 'present', 'kind', 'axis')
+
+    def __init__(self, values: List[Any], axis: str = 'node'):
+        self.raw = values
+        self.axis = axis
+        self.present = np.fromiter((v is not None for v in values), dtype=bool, count=len(values))
+        self.kind = _column_kind(values)
+        if self.kind == 'num':
+            self.values = np.array([0.0 if v is None else v for v in values], dtype=np.float64)
+        elif self.kind == 'str':
+            self.values = np.array(['' if v is None else v for v in values], dtype=str)
+        else:
+            # Compared per node through the raw values
+            self.values = None
+        if axis == 'sweep':
+            self.present = self.present.reshape(-1, 1)
+            if self.values is not None:
+                self.values = self.values.reshape(-1, 1)
+
+    def item(self, index: Tuple[int, ...]) -> Any:
+        """Raw value at a result index."""
+        if self.axis == 'const':
+            return self.raw[0]
+        if self.axis == 'sweep':
+            return self.raw[index[0]]
+        return self.raw[index[-1]]
+
+
+def _column_kind(values: List[Any]) -> str:
+    kind = None
+    for v in values:
+        if v is None:
+            continue
+        if isinstance(v, (int, float)) and not (isinstance(v, int) and abs(v) > _MAX_EXACT_INT):
+            current = 'num'
+        elif isinstance(v, str) and not v.endswith('\x00'):
+            # NumPy unicode arrays drop trailing NULs
+            current = 'str'
+        else:
+            return 'obj'
+        if kind is None:
+            kind = current
+        elif kind != current:
+            return 'obj'
+    return kind or 'obj'
+
+
+class ContextFrame:
+    """Node contexts plus a cache of extracted operand columns."""
+
+    def __init__(self, contexts: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            contexts: node_id -> InfoHub context dict
+        """
+        self.node_ids = list(contexts)
+        self.contexts = [contexts[node_id] for node_id in self.node_ids]
+        self._columns: Dict[str, Column] = {}
+        self._raw: Dict[str, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of result arrays: one entry per node."""
+        return (len(self.node_ids),)
+
+    def raw(self, path: CompiledPath) -> List[Any]:
+        """Resolved values of path for every node (same shape as CompiledPath.resolve)."""
+        values = self._raw.get(path.expr)
+        if values is None:
+            values = self._extract(path)
+            self._raw[path.expr] = values
+        return values
+
+    def column(self, path: CompiledPath) -> Column:
+        column = self._columns.get(path.expr)
+        if column is None:
+            column = Column(self.raw(path))
+            self._columns[path.expr] = column
+        return column
+
+    def _extract(self, path: CompiledPath) -> List[Any]:
+        if not _SIMPLE_PATH.match(path.base_expr):
+            return [path.resolve(context) for context in self.contexts]
+        keys = path.base_expr[2:].split('.')
+        values = []
+        for context in self.contexts:
+            current = context
+            for key in keys:
+                if not isinstance(current, dict):
+                    # Lists and scalars keep jsonpath_ng semantics
+                    current = path.resolve(context)
+                    break
+                current = current.get(key, _MISSING)
+                if current is _MISSING:
+                    break
+            else:
+                if path.is_length:
+                    current = len(current) if isinstance(current, (list, dict, str)) else 0
+                values.append(current)
+                continue
+            if current is _MISSING:
+                current = 0 if path.is_length else None
+            values.append(current)
+        return values
+
+
+_MISSING = object()
+
+
+@dataclass
+class BulkResult:
+    """Per-node outcome of one condition over a ContextFrame."""
+
+    condition: str
+    firing: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    mask: Optional[np.ndarray] = None
+
+
+class BulkEvaluator:
+    """Evaluate compiled DLL conditions over a ContextFrame with NumPy."""
+
+    def __init__(self, evaluator: DLLEvaluator = None, threshold_manager: ThresholdManager = None):
+        self.evaluator = evaluator or DLLEvaluator()
+        self.threshold_manager = threshold_manager
+
+    def evaluate(self, condition: str, frame: ContextFrame) -> BulkResult:
+        """
+        Evaluate one condition for every node in frame.
+
+        Raises:
+            ValueError: If condition syntax is invalid (as DLLEvaluator.compile)
+        """
+        values, (error_mask, messages) = self.evaluate_masks(condition, frame)
+        fires = values & ~error_mask
+        return BulkResult(
+            condition=condition,
+            firing=[frame.node_ids[i] for i in np.flatnonzero(fires)],
+            errors={
+                frame.node_ids[i]: messages.get((i,), 'evaluation error')
+                for i in np.flatnonzero(error_mask)
+            },
+            mask=fires
+        )
+
+    def evaluate_masks(
+        self,
+        condition: str,
+        frame: ContextFrame
+    ) -> Tuple[np.ndarray, Tuple[np.ndarray, Dict[Tuple[int, ...], str]]]:
+        """
+        Raw result arrays of shape frame.shape.
+
+        Returns:
+            (values, (error_mask, {index: message})); values is meaningful
+            only where error_mask is False
+        """
+        compiled = self.evaluator.compile(condition)
+        values, errors = self._eval(compiled, frame, np.ones(frame.shape, dtype=bool))
+        return np.broadcast_to(values, frame.shape), errors
+
+    def evaluate_playbook(
+        self,
+        playbook: Dict[str, Any],
+        frame: ContextFrame,
+        playbook_id: str
+    ) -> Dict[str, BulkResult]:
+        """
+        Evaluate every decision rule of a playbook across the frame.
+
+        Threshold placeholders are substituted first when a ThresholdManager
+        was given. Rules with invalid syntax report every node as an error.
+        """
+        results = {}
+        for rule in playbook.get('decision_logic', {}).get('rules', []):
+            rule_id = rule.get('id', 'unknown')
+            condition = rule.get('condition', '')
+            if self.threshold_manager is not None:
+                condition = self.threshold_manager.substitute_condition(condition, playbook_id)
+            try:
+                results[rule_id] = self.evaluate(condition, frame)
+            except ValueError as e:
+                results[rule_id] = BulkResult(
+                    condition=condition,
+                    errors={node_id: str(e) for node_id in frame.node_ids}
+                )
+        return results
+
+    # ── Vectorized evaluation ───────────────────────────────────────────
+    #
+    # Each node returns (values, (error_mask, {index: message})) shaped like
+    # frame.shape. active marks entries for which the scalar evaluator would
+    # reach this node; errors outside it are suppressed to match
+    # short-circuiting.
+
+    def _eval(
+        self,
+        node: CompiledCondition,
+        frame: ContextFrame,
+        active: np.ndarray
+    ) -> Tuple[np.ndarray, Tuple[np.ndarray, Dict[Tuple[int, ...], str]]]:
+        shape = frame.shape
+        if isinstance(node, CompiledConstant):
+            return np.full(shape, node.value, dtype=bool), _no_errors(shape)
+        if isinstance(node, CompiledNot):
+            values, errors = self._eval(node.operand, frame, active)
+            return ~values, errors
+        if isinstance(node, CompiledBoolean):
+            return self._eval_boolean(node, frame, active)
+        try:
+            if isinstance(node, CompiledExists):
+                exists = self._eval_exists(node, frame)
+                return np.broadcast_to(exists, shape), _no_errors(shape)
+            if isinstance(node, CompiledComparison):
+                return self._eval_comparison(node, frame, active)
+        except ValueError as e:
+            # Invalid JSONPath: fails every node that reaches this operand
+            error_mask = active.copy()
+            messages = {index: str(e) for index in map(tuple, np.argwhere(error_mask))}
+            return np.zeros(shape, dtype=bool), (error_mask, messages)
+        raise ValueError(f"Unsupported condition node: {type(node).__name__}")
+
+    def _eval_exists(self, node: CompiledExists, frame: ContextFrame) -> np.ndarray:
+        raw = frame.raw(node.path)
+        exists = np.fromiter(
+            (v is not None and (not isinstance(v, list) or len(v) > 0) for v in raw),
+            dtype=bool, count=len(raw)
+        )
+        return ~exists if node.negate else exists
+
+    def _eval_boolean(self, node: CompiledBoolean, frame: ContextFrame, active: np.ndarray):
+        is_and = node.operator == 'AND'
+        pending = active.copy()
+        result = np.full(frame.shape, is_and, dtype=bool)
+        error_mask, messages = _no_errors(frame.shape)
+        for part in node.parts:
+            if not pending.any():
+                break
+            values, (part_errors, part_messages) = self._eval(part, frame, pending)
+            failed = pending & part_errors
+            error_mask |= failed
+            for index in map(tuple, np.argwhere(failed)):
+                messages[index] = part_messages.get(index, 'evaluation error')
+            # AND stops at the first False operand, OR at the first True one
+            decided = pending & ~part_errors & (values != is_and)
+            result[decided] = not is_and
+            pending &= ~(failed | decided)
+        return result, (error_mask, messages)
+
+    def _eval_comparison(self, node: CompiledComparison, frame: ContextFrame, active: np.ndarray):
+        left = self._column(node.left, frame)
+        right = self._column(node.right, frame)
+        # Scalar evaluator returns False when either side resolves to None
+        valid = np.broadcast_to(left.present & right.present, frame.shape)
+        error_mask, messages = _no_errors(frame.shape)
+
+        if left.kind == right.kind and left.kind in ('num', 'str'):
+            values = _VECTOR_OPS[node.operator](left.values, right.values) & valid
+            return values, (error_mask, messages)
+
+        values = np.zeros(frame.shape, dtype=bool)
+        for index in map(tuple, np.argwhere(valid & active)):
+            try:
+                values[index] = bool(node.op_func(left.item(index), right.item(index)))
+            except Exception as e:
+                error_mask[index] = True
+                messages[index] = str(e)
+        return values, (error_mask, messages)
+
+    def _column(self, operand: Any, frame: ContextFrame) -> Column:
+        if isinstance(operand, CompiledLiteral):
+            return Column([operand.value], axis='const')
+        return frame.column(operand)
+
+
+def _no_errors(shape: Tuple[int, ...]) -> Tuple[np.ndarray, Dict[Tuple[int, ...], str]]:
+    return np.zeros(shape, dtype=bool), {}
@@ -7,18 +7,41 @@ This is the "brain" that determines which playbook rules fire.
 Supported Syntax:
     - JSONPath expressions for data access: $.risks[?(@.severity=='HIGH')]
     - Comparison operators: >, <, >=, <=, ==, !=
-    - Boolean operators: AND, OR (NOT planned)
+    - Boolean operators: NOT, AND, OR (in that precedence order)
+    - Parentheses for grouping: (A OR B) AND C
     - Existence checks: EXISTS, NOT EXISTS
     - Pseudo-properties: .length for array/object/string length
 
+Grammar:
+    condition  := or_expr
+    or_expr    := and_expr ('OR' and_expr)*
+    and_expr   := not_expr ('AND' not_expr)*
+    not_expr   := 'NOT' not_expr | primary
+    primary    := '(' or_expr ')' | predicate
+    predicate  := operand (COMPARE operand | COMPARE WORD+ | 'EXISTS' | 'NOT' 'EXISTS')
+    operand    := JSONPATH | NUMBER | STRING | true | false | null | WORD
+
+    Unquoted words after a comparison operator form one string literal
+    ("$.stage == In Progress"), up to the next keyword, operator or parenthesis.
+
 Examples:
     "$.risks[?(@.severity=='HIGH')].length > 0"     # Has high-severity risks
     "$.horizon_1.arr_percentage > 0.80"             # H1 over 80% of ARR
     "$.swot.strengths EXISTS"                       # SWOT has strengths
     "$.account.arr >= 500000 AND $.account.days > 90"  # Strategic account
+    "NOT ($.a.count == 0 OR $.b.count == 0)"        # Grouping and negation
 
 Design Notes:
     - Uses jsonpath_ng library for JSONPath parsing
+    - Conditions are tokenized and parsed into an AST once (JSONPath
+      operands, operator, typed literals) and kept in a bounded per-process
+      cache keyed by condition text; each JSONPath is parsed when it is
+      first resolved, so an invalid one only fails conditions that reach it
+    - Constant subexpressions are folded at compile time, so after
+      ThresholdManager substitution "500000 > 0 AND $.x EXISTS" compiles to
+      just the EXISTS check
+    - AND/OR operands are reordered by estimated cost (literal comparisons
+      before filters) and evaluation short-circuits
     - Threshold placeholders (${thresholds.xxx}) are substituted BEFORE evaluation
       by ThresholdManager.substitute_condition()
     - Returns boolean (True/False) - no partial matches
@@ -26,11 +49,477 @@ Design Notes:
 """
 
 import re
-from typing import Any, Dict
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
 from jsonpath_ng.ext import parse as jsonpath_parse
 from jsonpath_ng.exceptions import JsonPathParserError, JsonPathLexerError
 
 
+# Upper bound on distinct condition strings kept compiled per process
+COMPILE_CACHE_SIZE = 2048
+
+# Relative evaluation cost estimates used to order AND/OR operands
+_COST_LITERAL = 0
+_COST_PATH = 1
+_COST_FILTER = 4
+_COST_DESCENT = 8
+
+_ROOT_KEY = re.compile(r"^\$\.([A-Za-z_][\w\-]*)")
+
+_KEYWORDS = frozenset({'AND', 'OR', 'NOT', 'EXISTS'})
+_COMPARE_TOKENS = ('>=', '<=', '==', '!=', '>', '<')
+_ATOM_STOP = frozenset(' \t\r\n()<>=!')
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _parse_jsonpath(expr: str):
+    """Parse a JSONPath expression once; jsonpath_ng's PLY parser is slow."""
+    return jsonpath_parse(expr)
+
+
+class CompiledPath:
+    """
+    A JSONPath operand with its .length flag resolved.
+
+    The expression is parsed on first resolution, so an invalid path in a
+    branch that short-circuiting never reaches does not fail the condition.
+    """
+
+    __slots__ = ('expr', 'base_expr', 'root', 'is_length', 'cost', '_jsonpath')
+
+    def __init__(self, expr: str):
+        self.expr = expr
+        # Handle .length pseudo-property (not native to JSONPath)
+        self.is_length = expr.endswith('.length')
+        base_expr = expr[:-7] if self.is_length else expr
+        self.base_expr = base_expr
+        # Top-level context key the path reads from (None = any key)
+        root = _ROOT_KEY.match(base_expr)
+        self.root = root.group(1) if root else None
+        self._jsonpath = None
+        if '..' in base_expr or '*' in base_expr:
+            self.cost = _COST_DESCENT
+        elif '[?' in base_expr:
+            self.cost = _COST_FILTER
+        else:
+            self.cost = _COST_PATH
+
+    def find_values(self, context: Dict[str, Any]) -> List[Any]:
+        """Values of all matches of the base expression (without .length)."""
+        if self._jsonpath is None:
+            try:
+                self._jsonpath = _parse_jsonpath(self.base_expr)
+            except (JsonPathParserError, JsonPathLexerError) as e:
+                raise ValueError(f"Invalid JSONPath: {self.expr} - {e}")
+        return [match.value for match in self._jsonpath.find(context)]
+
+    def resolve(self, context: Dict[str, Any]) -> Any:
+        """
+        Same result shape as DLLEvaluator._execute_jsonpath.
+
+        context may also be an EvaluationSession, which memoizes the
+        matched values per base expression.
+        """
+        if isinstance(context, dict):
+            values = self.find_values(context)
+        else:
+            values = context.find_values(self)
+        if self.is_length:
+            if not values:
+                return 0
+            # Return length of first match (assuming it's a list)
+            value = values[0]
+            return len(value) if isinstance(value, (list, dict, str)) else 0
+        if not values:
+            return None
+        if len(values) == 1:
+            return values[0]
+        return values
+
+
+class CompiledLiteral:
+    """A typed literal operand (number, string, boolean, null)."""
+
+    __slots__ = ('value',)
+    cost = _COST_LITERAL
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def resolve(self, context: Dict[str, Any]) -> Any:
+        return self.value
+
+
+class CompiledCondition(ABC):
+    """A node of a compiled DLL condition AST."""
+
+    __slots__ = ('source', 'cost')
+
+    @abstractmethod
+    def evaluate(self, context: Dict[str, Any]) -> bool:
+        """Evaluate this node against context data."""
+
+
+class CompiledConstant(CompiledCondition):
+    """Subexpression folded to a constant at compile time."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, source: str, value: bool):
+        self.source = source
+        self.value = value
+        self.cost = _COST_LITERAL
+
+    def evaluate(self, context: Dict[str, Any]) -> bool:
+        return self.value
+
+
+class CompiledBoolean(CompiledCondition):
+    """AND / OR over compiled operands, cheapest first, short-circuiting."""
+
+    __slots__ = ('operator', 'parts')
+
+    def __init__(self, source: str, operator: str, parts: List[CompiledCondition]):
+        self.source = source
+        self.operator = operator
+        self.parts = sorted(parts, key=lambda p: p.cost)
+        self.cost = sum(p.cost for p in parts)
+
+    def evaluate(self, context: Dict[str, Any]) -> bool:
+        if self.operator == 'AND':
+            for part in self.parts:
+                if not part.evaluate(context):
+                    return False
+            return True
+        for part in self.parts:
+            if part.evaluate(context):
+                return True
+        return False
+
+
+class CompiledNot(CompiledCondition):
+    """Logical negation."""
+
+    __slots__ = ('operand',)
+
+    def __init__(self, source: str, operand: CompiledCondition):
+        self.source = source
+        self.operand = operand
+        self.cost = operand.cost
+
+    def evaluate(self, context: Dict[str, Any]) -> bool:
+        return not self.operand.evaluate(context)
+
+
+class CompiledExists(CompiledCondition):
+    """EXISTS / NOT EXISTS check on a compiled path."""
+
+    __slots__ = ('path', 'negate')
+
+    def __init__(self, source: str, path: CompiledPath, negate: bool):
+        self.source = source
+        self.path = path
+        self.negate = negate
+        self.cost = path.cost
+
+    def evaluate(self, context: Dict[str, Any]) -> bool:
+        result = self.path.resolve(context)
+        # EXISTS = result is not None and not empty
+        exists = result is not None and (not isinstance(result, list) or len(result) > 0)
+        return not exists if self.negate else exists
+
+
+class CompiledComparison(CompiledCondition):
+    """Comparison between two operands (paths or typed literals)."""
+
+    __slots__ = ('left', 'operator', 'op_func', 'right')
+
+    def __init__(
+        self,
+        source: str,
+        left: Any,
+        operator: str,
+        op_func: Callable[[Any, Any], bool],
+        right: Any
+    ):
+        self.source = source
+        self.left = left
+        self.operator = operator
+        self.op_func = op_func
+        self.right = right
+        self.cost = left.cost + right.cost
+
+    def evaluate(self, context: Dict[str, Any]) -> bool:
+        left_value = self.left.resolve(context)
+        if left_value is None:
+            return False
+        right_value = self.right.resolve(context)
+        if right_value is None:
+            return False
+        return self.op_func(left_value, right_value)
+
+
+class _Token(NamedTuple):
+    kind: str       # 'LPAREN' | 'RPAREN' | 'COMPARE' | 'KEYWORD' | 'STRING' | 'ATOM'
+    text: str
+    position: int
+
+
+def _tokenize(condition: str) -> List[_Token]:
+    """
+    Split a condition into tokens.
+
+    JSONPath atoms are scanned bracket- and quote-aware, so filters such as
+    [?(@.a=='x' || @.b > 1)] stay one token and quoted strings may contain
+    keywords like " AND ".
+    """
+    tokens = []
+    i, n = 0, len(condition)
+    while i < n:
+        ch = condition[i]
+        if ch.isspace():
+            i += 1
+        elif ch == '(':
+            tokens.append(_Token('LPAREN', ch, i))
+            i += 1
+        elif ch == ')':
+            tokens.append(_Token('RPAREN', ch, i))
+            i += 1
+        elif condition.startswith(_COMPARE_TOKENS, i):
+            op = next(op for op in _COMPARE_TOKENS if condition.startswith(op, i))
+            tokens.append(_Token('COMPARE', op, i))
+            i += len(op)
+        elif ch in ('"', "'"):
+            end = i + 1
+            while end < n and condition[end] != ch:
+                end += 2 if condition[end] == '\\' else 1
+            if end >= n:
+                raise ValueError(f"Unterminated string at position {i}: {condition}")
+            raw = condition[i + 1:end]
+            tokens.append(_Token('STRING', raw.replace('\\' + ch, ch), i))
+            i = end + 1
+        else:
+            start, depth, quote = i, 0, None
+            while i < n:
+                c = condition[i]
+                if quote:
+                    if c == quote:
+                        quote = None
+                elif c in ('"', "'") and depth:
+                    quote = c
+                elif c in '[(' and (depth or c == '['):
+                    depth += 1
+                elif c in '])' and depth:
+                    depth -= 1
+                elif depth == 0 and c in _ATOM_STOP:
+                    break
+                i += 1
+            if i == start:
+                raise ValueError(f"Unexpected character {condition[i]!r} at position {i}: {condition}")
+            text = condition[start:i]
+            tokens.append(_Token('KEYWORD' if text in _KEYWORDS else 'ATOM', text, start))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing folded CompiledCondition trees."""
+
+    def __init__(self, evaluator: 'DLLEvaluator', condition: str):
+        self.evaluator = evaluator
+        self.condition = condition
+        self.tokens = _tokenize(condition)
+        self.pos = 0
+
+    def parse(self) -> CompiledCondition:
+        if not self.tokens:
+            raise ValueError("Unrecognized condition syntax: empty condition")
+        node = self._or_expr()
+        if self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            raise ValueError(
+                f"Unrecognized condition syntax: unexpected {token.text!r} "
+                f"at position {token.position}: {self.condition}"
+            )
+        return node
+
+    # ── Token helpers ────────────────────────────────────────────────────
+
+    def _peek(self, offset: int = 0) -> Optional[_Token]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _accept(self, kind: str, text: str = None) -> Optional[_Token]:
+        token = self._peek()
+        if token and token.kind == kind and (text is None or token.text == text):
+            self.pos += 1
+            return token
+        return None
+
+    def _source(self, start: int) -> str:
+        first = self.tokens[start].position
+        last = self.tokens[self.pos - 1]
+        end = len(self.condition) if self.pos >= len(self.tokens) else self.tokens[self.pos].position
+        return self.condition[first:max(end, last.position + len(last.text))].strip()
+
+    # ── Grammar ──────────────────────────────────────────────────────────
+
+    def _or_expr(self) -> CompiledCondition:
+        start = self.pos
+        parts = [self._and_expr()]
+        while self._accept('KEYWORD', 'OR'):
+            parts.append(self._and_expr())
+        return parts[0] if len(parts) == 1 else _fold_boolean(self._source(start), 'OR', parts)
+
+    def _and_expr(self) -> CompiledCondition:
+        start = self.pos
+        parts = [self._not_expr()]
+        while self._accept('KEYWORD', 'AND'):
+            parts.append(self._not_expr())
+        return parts[0] if len(parts) == 1 else _fold_boolean(self._source(start), 'AND', parts)
+
+    def _not_expr(self) -> CompiledCondition:
+        start = self.pos
+        if self._accept('KEYWORD', 'NOT'):
+            operand = self._not_expr()
+            source = self._source(start)
+            if isinstance(operand, CompiledConstant):
+                return CompiledConstant(source, not operand.value)
+            return CompiledNot(source, operand)
+        return self._primary()
+
+    def _primary(self) -> CompiledCondition:
+        if self._accept('LPAREN'):
+            node = self._or_expr()
+            if not self._accept('RPAREN'):
+                raise ValueError(f"Unrecognized condition syntax: missing ')' in {self.condition}")
+            return node
+        return self._predicate()
+
+    def _predicate(self) -> CompiledCondition:
+        start = self.pos
+        subject = self._peek()
+        if subject is None or subject.kind not in ('ATOM', 'STRING'):
+            found = repr(subject.text) if subject else 'end of condition'
+            raise ValueError(f"Unrecognized condition syntax: expected operand, found {found}: {self.condition}")
+        self.pos += 1
+
+        if self._accept('KEYWORD', 'EXISTS'):
+            return CompiledExists(self._source(start), self._path_operand(subject), negate=False)
+        if self._peek() and self._peek().text == 'NOT' and self._peek(1) and self._peek(1).text == 'EXISTS':
+            self.pos += 2
+            return CompiledExists(self._source(start), self._path_operand(subject), negate=True)
+
+        op_token = self._accept('COMPARE')
+        if op_token is None:
+            raise ValueError(f"Unrecognized condition syntax: {self.condition}")
+        right_token = self._peek()
+        if right_token is None or right_token.kind not in ('ATOM', 'STRING'):
+            raise ValueError(f"Invalid comparison: {self.condition}")
+        self.pos += 1
+        if right_token.kind == 'ATOM' and not right_token.text.startswith('$'):
+            right_token = self._bare_words(right_token)
+
+        left = self._left_operand(subject)
+        right = self._right_operand(right_token)
+        operator = op_token.text
+        op_func = self.evaluator.COMPARISON_OPS[operator]
+        source = self._source(start)
+
+        if isinstance(left, CompiledLiteral) and isinstance(right, CompiledLiteral):
+            if left.value is None or right.value is None:
+                return CompiledConstant(source, False)
+            try:
+                return CompiledConstant(source, bool(op_func(left.value, right.value)))
+            except TypeError:
+                pass  # Leave incomparable literals to fail at evaluation like before
+        return CompiledComparison(source, left, operator, op_func, right)
+
+    # ── Operands ─────────────────────────────────────────────────────────
+
+    def _bare_words(self, first: _Token) -> _Token:
+        """Unquoted multi-word literal ("== In Progress"), ending at a keyword, operator or paren."""
+        last = first
+        while True:
+            token = self._peek()
+            if token is None or token.kind != 'ATOM' or token.text.startswith('$'):
+                break
+            last = token
+            self.pos += 1
+        if last is first:
+            return first
+        return _Token('ATOM', self.condition[first.position:last.position + len(last.text)], first.position)
+
+    def _path_operand(self, token: _Token) -> CompiledPath:
+        if token.kind == 'STRING':
+            raise ValueError(f"Expected JSONPath, found string {token.text!r}: {self.condition}")
+        return CompiledPath(token.text)
+
+    def _left_operand(self, token: _Token):
+        """Left side: JSONPath unless it is an explicit literal."""
+        if token.kind == 'STRING':
+            return CompiledLiteral(token.text)
+        if token.text.startswith('$') or not _is_literal_atom(token.text):
+            return CompiledPath(token.text)
+        return CompiledLiteral(self.evaluator._parse_literal(token.text))
+
+    def _right_operand(self, token: _Token):
+        """Right side: JSONPath if it starts with $, otherwise a literal."""
+        if token.kind == 'STRING':
+            return CompiledLiteral(token.text)
+        if token.text.startswith('$'):
+            return CompiledPath(token.text)
+        return CompiledLiteral(self.evaluator._parse_literal(token.text))
+
+
+def _is_literal_atom(text: str) -> bool:
+    if text in ('true', 'false', 'null'):
+        return True
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+def _fold_boolean(source: str, operator: str, parts: List[CompiledCondition]) -> CompiledCondition:
+    """Flatten nested AND/AND (OR/OR) and fold constant operands."""
+    absorbing = operator == 'OR'   # True absorbs OR, False absorbs AND
+    flat: List[CompiledCondition] = []
+    for part in parts:
+        if isinstance(part, CompiledConstant):
+            if part.value == absorbing:
+                return CompiledConstant(source, absorbing)
+            continue  # Identity element: drop
+        if isinstance(part, CompiledBoolean) and part.operator == operator:
+            flat.extend(part.parts)
+        else:
+            flat.append(part)
+    if not flat:
+        return CompiledConstant(source, not absorbing)
+    if len(flat) == 1:
+        return flat[0]
+    return CompiledBoolean(source, operator, flat)
+
+
+def condition_paths(node: CompiledCondition) -> List[CompiledPath]:
+    """All JSONPath operands of a compiled condition, in tree order."""
+    if isinstance(node, CompiledBoolean):
+        return [path for part in node.parts for path in condition_paths(part)]
+    if isinstance(node, CompiledNot):
+        return condition_paths(node.operand)
+    if isinstance(node, CompiledExists):
+        return [node.path]
+    if isinstance(node, CompiledComparison):
+        return [operand for operand in (node.left, node.right) if isinstance(operand, CompiledPath)]
+    return []
+
+
+def condition_roots(node: CompiledCondition) -> Set[Optional[str]]:
+    """Top-level context keys a compiled condition reads (None = any key)."""
+    return {path.root for path in condition_paths(node)}
+
+
 class DLLEvaluator:
     """
     Evaluate Decision Logic Language conditions.
@@ -42,7 +531,6 @@ class DLLEvaluator:
     """
 
     # Supported comparison operators mapped to Python lambdas
-    # Order matters in evaluate(): check >= before > to avoid partial matches
     COMPARISON_OPS = {
         '>': lambda a, b: a > b,
         '<': lambda a, b: a < b,
@@ -75,81 +563,35 @@ class DLLEvaluator:
         Raises:
             ValueError: If condition syntax is invalid
         """
-        condition = condition.strip()
-
-        # Handle boolean operators FIRST (before other checks)
-        # This ensures compound conditions are split correctly
-        if ' AND ' in condition:
-            return self._evaluate_boolean(condition, context, 'AND')
-        if ' OR ' in condition:
-            return self._evaluate_boolean(condition, context, 'OR')
-
-        # Handle NOT EXISTS before EXISTS (order matters!)
-        if ' NOT EXISTS' in condition:
-            return self._evaluate_exists(condition, context, negate=True)
-        if ' EXISTS' in condition:
-            return self._evaluate_exists(condition, context, negate=False)
-
-        # Handle comparison operators
-        for op_str in ['>=', '<=', '>', '<', '==', '!=']:
-            if f' {op_str} ' in condition:
-                return self._evaluate_comparison(condition, context, op_str)
-
-        raise ValueError(f"Unrecognized condition syntax: {condition}")
-
-    def _evaluate_exists(self, condition: str, context: Dict[str, Any], negate: bool) -> bool:
-        """Evaluate EXISTS or NOT EXISTS check."""
-        # Extract JSONPath (everything before EXISTS)
-        if negate:
-            jsonpath_expr = condition.replace(' NOT EXISTS', '').strip()
-        else:
-            jsonpath_expr = condition.replace(' EXISTS', '').strip()
-
-        # Execute JSONPath
-        result = self._execute_jsonpath(jsonpath_expr, context)
+        return self.compile(condition).evaluate(context)
 
-        # EXISTS = result is not None and not empty
-        exists = result is not None and (not isinstance(result, list) or len(result) > 0)
-
-        return not exists if negate else exists
-
-    def _evaluate_comparison(self, condition: str, context: Dict[str, Any], operator: str) -> bool:
-        """Evaluate comparison expression."""
-        # Split on operator
-        parts = condition.split(f' {operator} ')
-        if len(parts) != 2:
-            raise ValueError(f"Invalid comparison: {condition}")
+    def compile(self, condition: str) -> CompiledCondition:
+        """
+        Compile a condition into a reusable CompiledCondition.
 
-        left_expr, right_expr = parts[0].strip(), parts[1].strip()
+        Results are kept in a bounded per-process cache keyed by the condition
+        text, so each distinct (threshold-substituted) rule condition is
+        tokenized and its JSONPath expressions parsed only once.
 
-        # Evaluate left side (JSONPath)
-        left_value = self._execute_jsonpath(left_expr, context)
+        Raises:
+            ValueError: If condition syntax is invalid
+        """
+        return _compile_cached(condition.strip())
 
-        # Evaluate right side (literal or JSONPath)
-        if right_expr.startswith('$'):
-            right_value = self._execute_jsonpath(right_expr, context)
-        else:
-            # Parse as literal (number, string, boolean)
-            right_value = self._parse_literal(right_expr)
+    @staticmethod
+    def cache_info():
+        """Hit/miss statistics of the condition compile cache."""
+        return _compile_cached.cache_info()
 
-        # Apply operator
-        if left_value is None or right_value is None:
-            return False
+    @staticmethod
+    def clear_cache():
+        """Drop all compiled conditions and parsed JSONPath expressions."""
+        _compile_cached.cache_clear()
+        _parse_jsonpath.cache_clear()
 
-        op_func = self.COMPARISON_OPS[operator]
-        return op_func(left_value, right_value)
-
-    def _evaluate_boolean(self, condition: str, context: Dict[str, Any], operator: str) -> bool:
-        """Evaluate boolean expression (AND, OR) - simplified."""
-        # For vertical slice, only support simple AND/OR (no parentheses)
-        if operator == 'AND':
-            parts = condition.split(' AND ')
-            return all(self.evaluate(part.strip(), context) for part in parts)
-        elif operator == 'OR':
-            parts = condition.split(' OR ')
-            return any(self.evaluate(part.strip(), context) for part in parts)
-        else:
-            raise ValueError(f"Unsupported boolean operator: {operator}")
+    def _compile(self, condition: str) -> CompiledCondition:
+        """Tokenize and parse a stripped condition (uncached)."""
+        return _Parser(self, condition).parse()
 
     def _execute_jsonpath(self, expr: str, context: Dict[str, Any]) -> Any:
         """
@@ -166,34 +608,7 @@ class DLLEvaluator:
             JSONPath doesn't natively support .length, so we handle it specially.
             This allows conditions like "$.risks.length > 0" to count array items.
         """
-        try:
-            # Handle .length pseudo-property (not native to JSONPath)
-            if expr.endswith('.length'):
-                base_expr = expr[:-7]  # Remove '.length'
-                jsonpath = jsonpath_parse(base_expr)
-                matches = jsonpath.find(context)
-                if not matches:
-                    return 0
-                # Return length of first match (assuming it's a list)
-                value = matches[0].value
-                return len(value) if isinstance(value, (list, dict, str)) else 0
-
-            # Standard JSONPath evaluation
-            jsonpath = jsonpath_parse(expr)
-            matches = jsonpath.find(context)
-
-            if not matches:
-                return None
-
-            # If single match, return value
-            if len(matches) == 1:
-                return matches[0].value
-
-            # Multiple matches, return list of values
-            return [match.value for match in matches]
-
-        except (JsonPathParserError, JsonPathLexerError) as e:
-            raise ValueError(f"Invalid JSONPath: {expr} - {e}")
+        return CompiledPath(expr).resolve(context)
 
     def _parse_literal(self, value_str: str) -> Any:
         """Parse literal value from string."""
@@ -227,3 +642,12 @@ class DLLEvaluator:
 
         # Return as-is (string without quotes)
         return value_str
+
+
+# Compilation is stateless, so one shared compiler backs the process-wide cache
+_COMPILER = DLLEvaluator()
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile_cached(condition: str) -> CompiledCondition:
+    return _COMPILER._compile(condition)
@@ -0,0 +1,127 @@
+"""
+Evaluation Session - Memoize JSONPath results across rules and playbooks
+
+A playbook's rules, and several playbooks run for the same node, query the
+same JSONPath expressions (e.g. $.risks[?(@.severity=='HIGH')]) against the
+same InfoHub context. An EvaluationSession wraps one context and caches the
+matched values per base expression, so each distinct path is evaluated once
+for as long as the context is unchanged.
+
+Usage:
+    session = EvaluationSession(context)
+    session.evaluate("$.risks[?(@.severity=='HIGH')].length > 0")
+    session.evaluate("$.risks[?(@.severity=='HIGH')] EXISTS")   # memo hit
+    session.stats()   # {'lookups': 2, 'evaluations': 1, 'saved': 1, ...}
+
+Invalidation:
+    - Reassigning a top-level key (context['x'] = ...) is detected before the
+      next evaluation and drops only memo entries reading from that key
+      (plus wildcard/recursive-descent paths, which may read any key)
+    - In-place changes below the top level must be announced with
+      session.invalidate('x') or made through session.set('x', value)
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from .dll_evaluator import CompiledCondition, CompiledPath, DLLEvaluator
+
+
+class EvaluationSession:
+    """Per-context JSONPath memo shared by every rule evaluated against it."""
+
+    def __init__(self, context: Dict[str, Any], evaluator: Optional[DLLEvaluator] = None):
+        """
+        Initialize session over a context.
+
+        Args:
+            context: InfoHub data context (dict); may be mutated by callers
+            evaluator: DLLEvaluator used to compile condition strings
+        """
+        self.context = context
+        self.evaluator = evaluator or DLLEvaluator()
+        self._memo: Dict[str, List[Any]] = {}
+        self._by_root: Dict[Optional[str], set] = {}
+        self._snapshot = self._take_snapshot()
+        self.lookups = 0
+        self.evaluations = 0
+        self.invalidations = 0
+        # Time spent resolving JSONPaths (perf_counter_ns), for rule profiles
+        self.resolve_ns = 0
+
+    # ── Evaluation ───────────────────────────────────────────────────────
+
+    def evaluate(self, condition: Union[str, CompiledCondition]) -> bool:
+        """Evaluate a condition string or compiled condition against the context."""
+        if isinstance(condition, str):
+            condition = self.evaluator.compile(condition)
+        self._check_mutation()
+        return condition.evaluate(self)
+
+    def find_values(self, path: CompiledPath) -> List[Any]:
+        """Matched values for path, evaluated at most once per context state."""
+        self.lookups += 1
+        values = self._memo.get(path.base_expr)
+        if values is None:
+            started_ns = time.perf_counter_ns()
+            values = path.find_values(self.context)
+            self.resolve_ns += time.perf_counter_ns() - started_ns
+            self.evaluations += 1
+            self._memo[path.base_expr] = values
+            self._by_root.setdefault(path.root, set()).add(path.base_expr)
+        return values
+
+    # ── Mutation ─────────────────────────────────────────────────────────
+
+    def set(self, key: str, value: Any) -> None:
+        """Assign a top-level context key and drop memo entries that read it."""
+        self.context[key] = value
+        self.invalidate(key)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop memoized results.
+
+        Args:
+            key: Top-level context key that changed; None clears everything
+        """
+        self.invalidations += 1
+        if key is None:
+            self._memo.clear()
+            self._by_root.clear()
+        else:
+            for root in (key, None):
+                for expr in self._by_root.pop(root, ()):
+                    self._memo.pop(expr, None)
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[str, Any]:
+        # Lazy contexts report identities without loading pending keys
+        snapshot_ids = getattr(self.context, 'snapshot_ids', None)
+        if snapshot_ids is not None:
+            return snapshot_ids()
+        return {key: id(value) for key, value in self.context.items()}
+
+    def _check_mutation(self) -> None:
+        """Invalidate top-level keys that were added, removed or reassigned."""
+        snapshot = self._take_snapshot()
+        if snapshot == self._snapshot:
+            return
+        changed = {
+            key for key in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(key) != self._snapshot.get(key)
+        }
+        for key in changed:
+            self.invalidate(key)
+
+    # ── Reporting ────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, int]:
+        """Lookup counts: evaluations performed vs. saved by the memo."""
+        return {
+            'lookups': self.lookups,
+            'evaluations': self.evaluations,
+            'saved': self.lookups - self.evaluations,
+            'invalidations': self.invalidations,
+            'memoized_paths': len(self._memo),
+        }
@@ -28,9 +28,19 @@ Validation Rules:
     3. Each evidence object must have: source_artifact, date, excerpt
     4. Date must be YYYY-MM-DD format
     5. Confidence (if present) must be HIGH/MEDIUM/LOW
+
+Compiled Checks:
+    The rules above are compiled once, at construction, into predicate
+    closures (evidence object -> item -> field) that only answer valid or
+    not. Error messages are built only for the items that fail, by the
+    generic walk. Modes:
+        validate(output)                 full report for one output
+        first_error(output) / is_valid   fail-fast (stop at first failure)
+        validate_many(outputs, fail_fast) batch over all outputs of a run
+    Benchmark: application/scripts/bench_evidence_validator.py
 """
 
-from typing import Dict, Any, List
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 
 class EvidenceValidator:
@@ -44,9 +54,19 @@ class EvidenceValidator:
         'gaps',  # Validation outputs
     ]
 
+    # Fields every evidence object must have (non-empty)
+    REQUIRED_EVIDENCE_KEYS = ('source_artifact', 'date', 'excerpt')
+
+    VALID_CONFIDENCES = ('HIGH', 'MEDIUM', 'LOW')
+
     def __init__(self):
-        """Initialize validator."""
-        pass
+        """Initialize validator and compile its checks."""
+        # Listed fields once each, in order
+        self.fields = tuple(dict.fromkeys(self.EVIDENCE_REQUIRED_FIELDS))
+        self._evidence_ok = _compile_evidence_check(self.REQUIRED_EVIDENCE_KEYS, self.VALID_CONFIDENCES)
+        self._item_ok = _compile_item_check(self._evidence_ok)
+
+    # ── Modes ────────────────────────────────────────────────────────────
 
     def validate(self, output: Dict[str, Any]) -> List[str]:
         """
@@ -61,14 +81,62 @@ class EvidenceValidator:
         errors = []
 
         # Check each evidence-required field
-        for field in self.EVIDENCE_REQUIRED_FIELDS:
-            if field in output and output[field]:
-                # Field exists and is non-empty, check evidence
-                field_errors = self._validate_field(field, output[field])
-                errors.extend(field_errors)
+        for field in self.fields:
+            value = output.get(field)
+            if value and not self._field_ok(value):
+                # Field exists, is non-empty and has a failing item
+                errors.extend(self._validate_field(field, value))
+
+        return errors
+
+    def first_error(self, output: Dict[str, Any]) -> Optional[str]:
+        """First validation error of an output, or None if valid (fail-fast)."""
+        for field in self.fields:
+            value = output.get(field)
+            if value and not self._field_ok(value):
+                return self._validate_field(field, value)[0]
+        return None
+
+    def is_valid(self, output: Dict[str, Any]) -> bool:
+        """True if every claim has valid evidence (no messages are built)."""
+        for field in self.fields:
+            value = output.get(field)
+            if value and not self._field_ok(value):
+                return False
+        return True
+
+    def validate_many(self, outputs: Iterable[Dict[str, Any]], fail_fast: bool = False) -> List[str]:
+        """
+        Validate all outputs of a run.
 
+        Args:
+            outputs: Output dicts (e.g. each output's content)
+            fail_fast: Stop at the first error (at most one is returned)
+
+        Returns:
+            Validation errors of all outputs, in order
+        """
+        errors = []
+        for output in outputs:
+            if fail_fast:
+                error = self.first_error(output)
+                if error is not None:
+                    return [error]
+            else:
+                errors.extend(self.validate(output))
         return errors
 
+    def _field_ok(self, field_value: Any) -> bool:
+        if not isinstance(field_value, list):
+            return False
+        item_ok = self._item_ok
+        for item in field_value:
+            if not item_ok(item):
+                return False
+        return True
+
+    # ── Error reporting (failing fields only) ────────────────────────────
+
     def _validate_field(self, field_name: str, field_value: Any) -> List[str]:
         """
         Validate a specific field has evidence.
@@ -87,8 +155,11 @@ class EvidenceValidator:
             errors.append(f"{field_name}: Expected list of objects, got {type(field_value)}")
             return errors
 
-        # Check each item in list
+        # Check each failing item in list
         for idx, item in enumerate(field_value):
+            if self._item_ok(item):
+                continue
+
             if not isinstance(item, dict):
                 errors.append(f"{field_name}[{idx}]: Expected dict, got {type(item)}")
                 continue
@@ -113,10 +184,11 @@ class EvidenceValidator:
                 errors.append(f"{field_name}: '{item_desc}' evidence must be a list")
                 continue
 
-            # Validate each evidence object
+            # Validate each failing evidence object
             for ev_idx, ev_obj in enumerate(evidence):
-                ev_errors = self._validate_evidence_object(ev_obj, f"{field_name}[{idx}].evidence[{ev_idx}]")
-                errors.extend(ev_errors)
+                if not self._evidence_ok(ev_obj):
+                    ev_errors = self._validate_evidence_object(ev_obj, f"{field_name}[{idx}].evidence[{ev_idx}]")
+                    errors.extend(ev_errors)
 
         return errors
 
@@ -139,8 +211,7 @@ class EvidenceValidator:
             return errors
 
         # Required fields
-        required_fields = ['source_artifact', 'date', 'excerpt']
-        for field in required_fields:
+        for field in self.REQUIRED_EVIDENCE_KEYS:
             if field not in evidence:
                 errors.append(f"{path}: Missing required field '{field}'")
             elif not evidence[field]:
@@ -148,14 +219,13 @@ class EvidenceValidator:
 
         # Optional but recommended: confidence
         if 'confidence' in evidence:
-            valid_confidences = ['HIGH', 'MEDIUM', 'LOW']
-            if evidence['confidence'] not in valid_confidences:
+            if evidence['confidence'] not in self.VALID_CONFIDENCES:
                 errors.append(f"{path}: Invalid confidence '{evidence['confidence']}' (must be HIGH|MEDIUM|LOW)")
 
         # Validate date format (basic check)
         if 'date' in evidence and evidence['date']:
             date_str = evidence['date']
-            if not isinstance(date_str, str) or len(date_str) != 10 or date_str.count('-') != 2:
+            if not _is_date(date_str):
                 errors.append(f"{path}: Invalid date format '{date_str}' (must be YYYY-MM-DD)")
 
         return errors
@@ -175,3 +245,52 @@ class EvidenceValidator:
             error_msg = "Evidence validation failed:\n"
             error_msg += "\n".join(f"  - {e}" for e in errors)
             raise ValueError(error_msg)
+
+
+# ── Compiled checks ──────────────────────────────────────────────────────
+
+_MISSING = object()
+
+
+def _is_date(value: Any) -> bool:
+    """Basic YYYY-MM-DD shape check."""
+    return isinstance(value, str) and len(value) == 10 and value.count('-') == 2
+
+
+def _compile_evidence_check(required_keys, confidences) -> Callable[[Any], bool]:
+    """Predicate for one evidence object under the given rules (no message formatting)."""
+    required_keys = tuple(required_keys)
+    confidences = frozenset(confidences)
+
+    def evidence_ok(evidence: Any) -> bool:
+        if evidence.__class__ is not dict and not isinstance(evidence, dict):
+            return False
+        get = evidence.get
+        for key in required_keys:
+            if not get(key):
+                return False
+        confidence = get('confidence', _MISSING)
+        if confidence is not _MISSING and not (isinstance(confidence, str) and confidence in confidences):
+            return False
+        date = get('date')
+        # Format is checked whenever a date is given
+        return not date or (isinstance(date, str) and len(date) == 10 and date.count('-') == 2)
+
+    return evidence_ok
+
+
+def _compile_item_check(evidence_ok: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Predicate for one claim: a dict with a non-empty list of valid evidence."""
+
+    def item_ok(item: Any) -> bool:
+        if not isinstance(item, dict):
+            return False
+        evidence = item.get('evidence')
+        if not evidence or not isinstance(evidence, list):
+            return False
+        for ev in evidence:
+            if not evidence_ok(ev):
+                return False
+        return True
+
+    return item_ok
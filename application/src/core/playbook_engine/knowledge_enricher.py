@@ -7,8 +7,6 @@ richer inputs without any code changes to their process() methods.
 
 from typing import Any, Dict, List
 
-from ...api.services.knowledge_service import get_knowledge_service
-
 
 def enrich_context_with_knowledge(
     context: Dict[str, Any],
@@ -42,7 +40,7 @@ def enrich_context_with_knowledge(
     agent_role_key = _normalize_role(agent_role)
 
     try:
-        svc = get_knowledge_service()
+        svc = _get_knowledge_service()
         items = svc.get_relevant_knowledge(
             domain=domain,
             archetype=archetype,
@@ -80,6 +78,19 @@ def enrich_context_with_knowledge(
     return context
 
 
+def _get_knowledge_service():
+    """Import the knowledge service lazily.
+
+    With application/src on sys.path (tests, scripts) core and api are
+    sibling top-level packages, so the relative import is not available.
+    """
+    try:
+        from ...api.services.knowledge_service import get_knowledge_service
+    except ImportError:
+        from api.services.knowledge_service import get_knowledge_service
+    return get_knowledge_service()
+
+
 def _mode_to_phase(operating_mode: str) -> str:
     """Map operating_mode values to knowledge phase values."""
     mapping = {
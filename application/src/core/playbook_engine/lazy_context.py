@@ -0,0 +1,264 @@
+"""
+Lazy Context - Node contexts that parse vault documents on first access
+
+load_node_context() parses every InfoHub document of a node, although a
+playbook's rules usually read a handful. LazyNodeContext has the same
+layout (see node_context) but only lists the node's files up front; a
+top-level key, and each document inside a section, is parsed the first
+time it is read, by a rule's JSONPath or any other dict access.
+
+Prefetch:
+    prefetch(conditions) statically analyses compiled conditions and parses
+    exactly the documents their paths name, e.g.
+    $.risks.risk_register.risks[?(@.severity=='HIGH')] loads only
+    internal-infohub/risks/risk_register.yaml. Paths without a fixed root
+    ($..x) load everything.
+
+Behaves as a dict:
+    get/[]/in/len/iteration do not force loading; items(), values(),
+    copy(), JSON encoding, pickling and deepcopy load everything first
+    (pickling and deepcopy yield plain dicts).
+
+Usage:
+    context = LazyNodeContext('ACME_CORP', 'SECURITY_CONSOLIDATION')
+    executor.execute('PB_201', context)      # executor prefetches rule inputs
+    context.files_read                       # [Path(...), ...]
+"""
+
+import re
+from collections.abc import KeysView
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .dll_evaluator import CompiledCondition, condition_paths
+from .node_context import INFOHUB_DIR, _load_yaml, node_path
+
+# Snapshot identity of keys whose value still comes from the vault
+_FROM_VAULT = 'vault'
+
+# Leading plain field names of a JSONPath: $.a.b['c'] -> a, b, c
+_SEGMENT = re.compile(r"\.([A-Za-z_][\w\-]*)|\[['\"]([^'\"]+)['\"]\]")
+
+
+class _LazyDict(dict):
+    """dict whose pending keys are materialized by a thunk on first access."""
+
+    def __init__(self):
+        super().__init__()
+        self._pending: Dict[str, Callable[[], Any]] = {}
+
+    def _materialize(self, key: str) -> bool:
+        thunk = self._pending.pop(key, None)
+        if thunk is None:
+            return dict.__contains__(self, key)
+        value = thunk()
+        if value is None:
+            # Empty documents are left out, as in load_node_context
+            return False
+        dict.__setitem__(self, key, value)
+        return True
+
+    def load_all(self) -> None:
+        """Materialize every pending key (recursively)."""
+        for key in list(self._pending):
+            self._materialize(key)
+        for value in dict.values(self):
+            if isinstance(value, _LazyDict):
+                value.load_all()
+
+    def is_loaded(self, key: str) -> bool:
+        return dict.__contains__(self, key)
+
+    # ── dict protocol ────────────────────────────────────────────────────
+
+    def __missing__(self, key):
+        if key in self._pending and self._materialize(key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key) or (key in self._pending and self._materialize(key)):
+            return dict.__getitem__(self, key)
+        return default
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._pending
+
+    def __iter__(self):
+        return iter(list(dict.keys(self)) + list(self._pending))
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._pending)
+
+    def keys(self):
+        return KeysView(self)
+
+    def items(self):
+        self.load_all()
+        return dict.items(self)
+
+    def values(self):
+        self.load_all()
+        return dict.values(self)
+
+    def __setitem__(self, key, value):
+        self._pending.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        if self._pending.pop(key, None) is None:
+            dict.__delitem__(self, key)
+        elif dict.__contains__(self, key):
+            dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        self._materialize(key)
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, _LazyDict):
+            other.load_all()
+        self.load_all()
+        return dict.__eq__(self, other)
+
+    __hash__ = None
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (list(self.items()),))
+
+    def __repr__(self) -> str:
+        pending = f", pending={sorted(self._pending)}" if self._pending else ""
+        return f"{type(self).__name__}({dict.__repr__(self)}{pending})"
+
+
+class LazySection(_LazyDict):
+    """An InfoHub section directory; documents parse on first access."""
+
+    def __init__(self, directory: Path, files_read: List[Path]):
+        super().__init__()
+        for path in sorted(directory.iterdir()):
+            if path.is_dir():
+                self._pending[path.name] = lambda p=path: LazySection(p, files_read)
+            elif path.suffix in ('.yaml', '.yml'):
+                self._pending[path.stem] = lambda p=path: _read(p, files_read)
+
+
+class LazyNodeContext(_LazyDict):
+    """A node's execution context, parsed from the vault on demand."""
+
+    def __init__(self, realm_id: str, node_id: str, vault_root: Path = None):
+        """
+        List the node's documents without parsing them.
+
+        Raises:
+            FileNotFoundError: If the node directory does not exist
+        """
+        super().__init__()
+        self.root = node_path(realm_id, node_id, vault_root)
+        if not self.root.is_dir():
+            raise FileNotFoundError(f"Node not found: {realm_id}/{node_id}")
+        self.files_read: List[Path] = []
+        dict.update(self, client_id=realm_id, realm_id=realm_id, node_id=node_id)
+
+        for name in ('node_profile', 'blueprint'):
+            path = self.root / f'{name}.yaml'
+            if path.exists():
+                self._pending[name] = lambda p=path: _read(p, self.files_read)
+        if 'node_profile' in self._pending:
+            self._pending['operating_mode'] = self._operating_mode
+        infohub = self.root / INFOHUB_DIR
+        if infohub.is_dir():
+            for section in sorted(p for p in infohub.iterdir() if p.is_dir()):
+                self._pending[section.name] = lambda p=section: LazySection(p, self.files_read)
+
+        # Values as first loaded, so lazy loading is not mistaken for mutation
+        self._origin: Dict[str, int] = {}
+
+    def _operating_mode(self) -> Any:
+        profile = self.get('node_profile')
+        if not isinstance(profile, dict):
+            return None
+        return profile.get('operating_mode') or None
+
+    def _materialize(self, key: str) -> bool:
+        loaded = super()._materialize(key)
+        if loaded and key not in self._origin:
+            self._origin[key] = id(dict.__getitem__(self, key))
+        return loaded
+
+    def snapshot_ids(self) -> Dict[str, Any]:
+        """
+        Identity per top-level key for mutation detection (EvaluationSession).
+
+        Pending keys and values loaded from the vault keep a stable identity,
+        so loading is not reported as a change; reassignments are.
+        """
+        ids = {}
+        for key in dict.keys(self):
+            value_id = id(dict.__getitem__(self, key))
+            ids[key] = _FROM_VAULT if self._origin.get(key) == value_id else value_id
+        for key in self._pending:
+            ids[key] = _FROM_VAULT
+        return ids
+
+    # ── Prefetch ─────────────────────────────────────────────────────────
+
+    def prefetch(self, conditions: Iterable[CompiledCondition]) -> int:
+        """
+        Parse the documents the given compiled conditions read.
+
+        Returns:
+            Number of files parsed by this call
+        """
+        before = len(self.files_read)
+        for segments in required_documents(conditions):
+            if segments is None:
+                self.load_all()
+                break
+            node: Any = self
+            for segment in segments:
+                if not isinstance(node, _LazyDict):
+                    break
+                node = node.get(segment)
+        return len(self.files_read) - before
+
+
+def required_documents(conditions: Iterable[CompiledCondition]) -> List[Optional[Tuple[str, ...]]]:
+    """
+    Leading field names of every JSONPath in the conditions.
+
+    None stands for a path without a fixed root, which may read anything.
+    """
+    required = set()
+    for condition in conditions:
+        for path in condition_paths(condition):
+            if path.root is None:
+                required.add(None)
+                continue
+            segments = []
+            position = 1   # after '$'
+            for match in _SEGMENT.finditer(path.base_expr, 1):
+                if match.start() != position:
+                    break
+                segments.append(match.group(1) or match.group(2))
+                position = match.end()
+            required.add(tuple(segments))
+    return sorted(required, key=lambda s: (s is None, s or ()))
+
+
+def _read(path: Path, files_read: List[Path]) -> Any:
+    files_read.append(path)
+    return _load_yaml(path)
@@ -0,0 +1,133 @@
+"""
+Node Context - Build a playbook execution context from a node's vault files
+
+Layout mapping:
+    vault/{realm}/{node}/node_profile.yaml          -> $.node_profile
+    vault/{realm}/{node}/blueprint.yaml             -> $.blueprint
+    vault/{realm}/{node}/internal-infohub/{dir}/{stem}.yaml
+                                                    -> $.{dir}.{stem}
+
+    e.g. internal-infohub/risks/risk_register.yaml is $.risks.risk_register,
+    so a condition reads $.risks.risk_register.risks[?(@.severity=='HIGH')].
+
+    Nested directories below {dir} nest the same way. client_id, realm_id,
+    node_id and operating_mode (from node_profile) are set at the top level
+    for the executor and knowledge enrichment.
+
+Fingerprints:
+    document_fingerprints() hashes, per top-level key, the raw bytes of the
+    files that feed it, so incremental re-execution can tell which rule
+    inputs changed without parsing anything.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+from ..config.paths import VAULT_ROOT
+
+INFOHUB_DIR = 'internal-infohub'
+
+# libyaml-backed loader when available (same results, several times faster)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def node_path(realm_id: str, node_id: str, vault_root: Path = None) -> Path:
+    """Directory of a node in the vault."""
+    return Path(vault_root or VAULT_ROOT) / realm_id / node_id
+
+
+def load_node_context(realm_id: str, node_id: str, vault_root: Path = None) -> Dict[str, Any]:
+    """
+    Load a node's InfoHub documents into an execution context dict.
+
+    Args:
+        realm_id: Realm directory name (e.g. 'ACME_CORP')
+        node_id: Node directory name (e.g. 'SECURITY_CONSOLIDATION')
+        vault_root: Vault root (defaults to the project vault)
+
+    Returns:
+        Context dict laid out as described in the module docstring
+
+    Raises:
+        FileNotFoundError: If the node directory does not exist
+    """
+    root = node_path(realm_id, node_id, vault_root)
+    if not root.is_dir():
+        raise FileNotFoundError(f"Node not found: {realm_id}/{node_id}")
+
+    context: Dict[str, Any] = {
+        'client_id': realm_id,
+        'realm_id': realm_id,
+        'node_id': node_id,
+    }
+    for name in ('node_profile', 'blueprint'):
+        document = _load_yaml(root / f'{name}.yaml')
+        if document is not None:
+            context[name] = document
+    if isinstance(context.get('node_profile'), dict) and context['node_profile'].get('operating_mode'):
+        context['operating_mode'] = context['node_profile']['operating_mode']
+
+    infohub = root / INFOHUB_DIR
+    if infohub.is_dir():
+        for section in sorted(p for p in infohub.iterdir() if p.is_dir()):
+            context[section.name] = load_section(section)
+    return context
+
+
+def load_section(directory: Path) -> Dict[str, Any]:
+    """Parse every YAML document below directory into {stem: document} (nested by subdirectory)."""
+    section: Dict[str, Any] = {}
+    for path in sorted(directory.iterdir()):
+        if path.is_dir():
+            section[path.name] = load_section(path)
+        elif path.suffix in ('.yaml', '.yml'):
+            document = _load_yaml(path)
+            if document is not None:
+                section[path.stem] = document
+    return section
+
+
+def root_documents(root: Path, key: str) -> List[Path]:
+    """Vault files that feed top-level context key `key` of the node at root."""
+    if key in ('node_profile', 'blueprint'):
+        path = root / f'{key}.yaml'
+        return [path] if path.exists() else []
+    section = root / INFOHUB_DIR / key
+    if not section.is_dir():
+        return []
+    return sorted(p for p in section.rglob('*') if p.suffix in ('.yaml', '.yml') and p.is_file())
+
+
+def document_fingerprints(realm_id: str, node_id: str, vault_root: Path = None) -> Dict[str, str]:
+    """
+    Content fingerprint per top-level context key, from the node's files.
+
+    Covers node_profile, blueprint and every InfoHub section; keys the
+    vault does not feed (client_id, knowledge_context, ...) are absent.
+    """
+    root = node_path(realm_id, node_id, vault_root)
+    keys = ['node_profile', 'blueprint']
+    infohub = root / INFOHUB_DIR
+    if infohub.is_dir():
+        keys.extend(sorted(p.name for p in infohub.iterdir() if p.is_dir()))
+    fingerprints = {}
+    for key in keys:
+        documents = root_documents(root, key)
+        if key in ('node_profile', 'blueprint') and not documents:
+            continue
+        digest = hashlib.blake2b(digest_size=16)
+        for path in documents:
+            digest.update(str(path.relative_to(root)).encode('utf-8') + b'\0')
+            digest.update(path.read_bytes() + b'\0')
+        fingerprints[key] = digest.hexdigest()
+    return fingerprints
+
+
+def _load_yaml(path: Path) -> Any:
+    if not path.exists():
+        return None
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
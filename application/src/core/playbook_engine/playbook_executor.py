@@ -14,27 +14,38 @@ an 8-step execution pipeline:
     8. Write Outputs       - Persist artifacts and execution trace
 
 Integration Points:
-    - Reads from: domain/playbooks/executable/*.yaml, application/settings/playbook_thresholds.yaml
-    - Writes to: data/runs/{run_id}/ (metadata.yaml, trace.json, report.md, outputs/)
+    - Reads from: domain/playbooks/**/*.yaml (via PlaybookRegistry), domain/config/playbook_thresholds.yaml
+    - Writes to: a RunStore - data/runs/{run_id}/ (metadata.yaml, trace.json, report.md,
+      outputs/) by default, one compact SQLite file (SQLiteRunStore) or memory
+      (MemoryRunStore); run metadata optionally indexed in a RunCatalog.
+      Dry runs (execute(..., dry_run=True)) write nothing
     - Used by: Agent implementations, Streamlit UI (app.py)
 
 Design Decisions:
-    - Each run gets a unique directory for full traceability
-    - Execution trace captures every step for debugging
+    - Each run gets a unique run ID for full traceability
+    - Execution trace captures every step for debugging, with
+      perf_counter_ns timings per stage and per rule (see run_profile)
     - Mock outputs used in POC (see _generate_mock_outputs) - replace for production
     - Evidence validation blocks execution if claims lack citations (no hallucinations)
 """
 
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
+import time
 import yaml
 
 from .playbook_loader import PlaybookLoader
 from .dll_evaluator import DLLEvaluator
 from .threshold_manager import ThresholdManager
 from .evidence_validator import EvidenceValidator
+from .evaluation_session import EvaluationSession
+from .playbook_registry import CompiledRule, PlaybookRegistry, compile_rules
+from .run_store import DirectoryRunStore, RunRecord, RunStore
+from .run_catalog import RunCatalog
+from .rule_cache import InputFingerprints, RuleResultCache
+from .run_profile import RunProfile
 from .knowledge_enricher import enrich_context_with_knowledge
 
 
@@ -45,7 +56,11 @@ class PlaybookExecutor:
         self,
         playbooks_dir: Path,
         thresholds_config: Path,
-        runs_dir: Path
+        runs_dir: Path,
+        run_store: Optional[RunStore] = None,
+        run_catalog: Optional[RunCatalog] = None,
+        rule_cache: Optional[RuleResultCache] = None,
+        profile_memory: bool = False
     ):
         """
         Initialize executor with configuration paths.
@@ -54,9 +69,22 @@ class PlaybookExecutor:
             playbooks_dir: Directory containing playbook YAML files
             thresholds_config: Path to playbook_thresholds.yaml
             runs_dir: Directory where run outputs are written
+            run_store: Run persistence backend (defaults to one
+                directory per run under runs_dir)
+            run_catalog: Index that run metadata is recorded in as runs finish
+            rule_cache: Previous rule results by input fingerprint; rules
+                whose inputs are unchanged reuse their last result
+            profile_memory: Also record traced memory deltas per stage
+                (tracemalloc; slows execution)
         """
         self.playbooks_dir = playbooks_dir
         self.runs_dir = runs_dir
+        self.run_store = run_store if run_store is not None else DirectoryRunStore(runs_dir)
+        self.run_catalog = run_catalog
+        self.rule_cache = rule_cache
+        self.profile_memory = profile_memory
+        # Open RunProfile per run ID, read by _log_step
+        self._profiles: Dict[str, RunProfile] = {}
 
         # Initialize the four core components of the playbook engine:
         # - Loader: YAML parsing and schema validation
@@ -68,11 +96,19 @@ class PlaybookExecutor:
         self.threshold_manager = ThresholdManager(thresholds_config)
         self.evidence_validator = EvidenceValidator()
 
+        # Index playbooks once: parsed, validated and rules precompiled
+        self.registry = PlaybookRegistry(
+            playbooks_dir, self.loader, self.dll_evaluator, self.threshold_manager
+        )
+
     def execute(
         self,
         playbook_id: str,
         context: Dict[str, Any],
-        client_id: str = None
+        client_id: str = None,
+        session: Optional[EvaluationSession] = None,
+        input_fingerprints: Optional[Dict[str, str]] = None,
+        dry_run: bool = False
     ) -> Dict[str, Any]:
         """
         Execute playbook against context and generate outputs.
@@ -81,18 +117,33 @@ class PlaybookExecutor:
             playbook_id: Playbook identifier (e.g., 'PB_201')
             context: InfoHub data context
             client_id: Client identifier (extracted from context if not provided)
+            session: Evaluation session over this context, shared across
+                playbooks so JSONPath results are memoized between them
+            input_fingerprints: Content fingerprints of top-level context
+                keys (node_context.document_fingerprints); used by the rule
+                cache instead of hashing those context values
+            dry_run: Run the full pipeline in memory only: the run is not
+                claimed in or written to the run store, not recorded in the
+                run catalog, run files are not rendered and the rule cache
+                is read but not updated. run_dir is None in the result
 
         Returns:
             Execution result with run_id, status, outputs, etc.
         """
+        if session is None:
+            session = EvaluationSession(context, self.dll_evaluator)
+        elif session.context is not context:
+            raise ValueError("Evaluation session belongs to a different context")
+
         # Extract client_id if not provided
         if not client_id:
             client_id = context.get('client_id', 'unknown')
 
-        # Generate run ID
+        # Generate run ID and claim it in the run store
         run_id = self._generate_run_id(playbook_id, client_id)
-        run_dir = self.runs_dir / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
+        if not dry_run:
+            run_id = self.run_store.claim(run_id, playbook_id, client_id)
+        files: Dict[str, str] = {}
 
         # Initialize execution trace
         trace = {
@@ -101,12 +152,15 @@ class PlaybookExecutor:
             'execution_summary': {}
         }
         start_time = datetime.utcnow()
+        profile = RunProfile(playbook_id, track_memory=self.profile_memory)
+        self._profiles[run_id] = profile
 
         try:
             # Step 1: Load playbook
             self._log_step(trace, 'load_playbook', 'started')
-            playbook_path = self._find_playbook(playbook_id)
-            playbook = self.loader.load(playbook_path)
+            entry = self.registry.get(playbook_id)
+            playbook_path = entry.path
+            playbook = entry.playbook
             self._log_step(trace, 'load_playbook', 'success', {
                 'playbook_path': str(playbook_path),
                 'schema_validation': 'passed'
@@ -130,17 +184,33 @@ class PlaybookExecutor:
             # Step 4: Validate inputs (minimal check for POC)
             self._log_step(trace, 'validate_inputs', 'started')
             # TODO: Implement input validation
-            self._log_step(trace, 'validate_inputs', 'success', {
-                'note': 'Input validation not yet implemented'
-            })
+            details = {'note': 'Input validation not yet implemented'}
+            if hasattr(context, 'prefetch'):
+                # Lazy context: parse exactly the documents the rules read
+                details['documents_prefetched'] = context.prefetch(
+                    rule.compiled for rule in entry.rules if rule.compiled is not None
+                )
+            self._log_step(trace, 'validate_inputs', 'success', details)
 
             # Step 4: Evaluate decision logic
             self._log_step(trace, 'evaluate_decision_logic', 'started')
-            fired_rules = self._evaluate_rules(playbook, context, playbook_id, trace)
+            stats_before = session.stats()
+            rule_log = {'reused': [], 'recomputed': []}
+            fired_rules = self._evaluate_rules(
+                playbook, session, playbook_id, trace, entry.rules,
+                client_id=client_id, input_fingerprints=input_fingerprints, rule_log=rule_log,
+                profile=profile, update_cache=not dry_run
+            )
+            stats_after = session.stats()
             self._log_step(trace, 'evaluate_decision_logic', 'success', {
                 'rules_evaluated': len(playbook.get('decision_logic', {}).get('rules', [])),
                 'rules_fired': len(fired_rules),
-                'fired_rule_ids': [r['rule_id'] for r in fired_rules]
+                'fired_rule_ids': [r['rule_id'] for r in fired_rules],
+                'evaluated_rule_ids': [r.rule_id for r in entry.rules],
+                'path_evaluations': stats_after['evaluations'] - stats_before['evaluations'],
+                'path_evaluations_saved': stats_after['saved'] - stats_before['saved'],
+                'reused_rule_ids': rule_log['reused'],
+                'recomputed_rule_ids': rule_log['recomputed']
             })
 
             # Step 5: Generate outputs (mock for POC)
@@ -152,11 +222,10 @@ class PlaybookExecutor:
 
             # Step 6: Validate evidence
             self._log_step(trace, 'validate_evidence', 'started')
-            validation_errors = []
-            for output in outputs:
-                errors = self.evidence_validator.validate(output['content'])
-                if errors:
-                    validation_errors.extend(errors)
+            # Fail fast: the gate only needs to know whether any claim lacks evidence
+            validation_errors = self.evidence_validator.validate_many(
+                (output['content'] for output in outputs), fail_fast=True
+            )
 
             if validation_errors:
                 self._log_step(trace, 'validate_evidence', 'failed', {
@@ -168,16 +237,20 @@ class PlaybookExecutor:
                     'validation_errors': 0
                 })
 
-            # Step 7: Write outputs
-            self._log_step(trace, 'write_outputs', 'started')
-            self._write_outputs(run_dir, outputs)
-            self._log_step(trace, 'write_outputs', 'success', {
-                'files_written': len(outputs)
-            })
+            # Step 7: Write outputs (persisted with the rest of the run below)
+            if dry_run:
+                self._log_step(trace, 'write_outputs', 'skipped', {'dry_run': True})
+            else:
+                self._log_step(trace, 'write_outputs', 'started')
+                files.update(self._render_outputs(outputs))
+                self._log_step(trace, 'write_outputs', 'success', {
+                    'files_written': len(outputs)
+                })
 
             # Finalize execution
             end_time = datetime.utcnow()
             duration = (end_time - start_time).total_seconds()
+            trace['profile'] = self._finish_profile(run_id)
 
             trace['execution_summary'] = {
                 'start_time': start_time.isoformat() + 'Z',
@@ -189,27 +262,32 @@ class PlaybookExecutor:
                 'failed_steps': 0
             }
 
-            # Write metadata
-            metadata = self._generate_metadata(
-                run_id, playbook_id, playbook, client_id,
-                thresholds_used, outputs, trace, 'completed'
-            )
-            self._write_yaml(run_dir / 'metadata.yaml', metadata)
+            if not dry_run:
+                # Write metadata
+                metadata = self._generate_metadata(
+                    run_id, playbook_id, playbook, client_id,
+                    thresholds_used, outputs, trace, 'completed'
+                )
+                files['metadata.yaml'] = self._render_yaml(metadata)
 
-            # Write trace
-            self._write_json(run_dir / 'trace.json', trace)
+                # Write trace
+                files['trace.json'] = self._render_json(trace)
 
-            # Write report
-            report = self._generate_report(run_id, playbook, client_id, fired_rules, outputs, trace)
-            self._write_markdown(run_dir / 'report.md', report)
+                # Write report
+                files['report.md'] = self._generate_report(run_id, playbook, client_id, fired_rules, outputs, trace)
+
+                self.run_store.write(self._run_record(run_id, playbook_id, client_id, trace, files))
+                if self.run_catalog is not None:
+                    self.run_catalog.record(trace, playbook_id, client_id)
 
             return {
                 'run_id': run_id,
                 'status': 'completed',
-                'run_dir': str(run_dir),
+                'run_dir': None if dry_run else self.run_store.location(run_id),
                 'outputs': outputs,
                 'fired_rules': fired_rules,
-                'duration_seconds': duration
+                'duration_seconds': duration,
+                'trace': trace
             }
 
         except Exception as e:
@@ -221,6 +299,8 @@ class PlaybookExecutor:
                 'error_type': type(e).__name__,
                 'error_message': str(e)
             })
+            if 'profile' not in trace:
+                trace['profile'] = self._finish_profile(run_id)
 
             trace['execution_summary'] = {
                 'start_time': start_time.isoformat() + 'Z',
@@ -230,36 +310,96 @@ class PlaybookExecutor:
                 'error': str(e)
             }
 
-            # Write error trace
-            self._write_json(run_dir / 'trace.json', trace)
+            if dry_run:
+                raise
 
-            # Write error log
-            self._write_text(run_dir / 'error.log', str(e))
+            # Write error trace and error log (outputs rendered so far are dropped)
+            self.run_store.write(self._run_record(run_id, playbook_id, client_id, trace, {
+                'trace.json': self._render_json(trace),
+                'error.log': str(e)
+            }))
+            if self.run_catalog is not None:
+                self.run_catalog.record(trace, playbook_id, client_id)
 
             raise
 
+    def execute_many(
+        self,
+        playbook_ids: List[str],
+        context: Dict[str, Any],
+        client_id: str = None,
+        input_fingerprints: Optional[Dict[str, str]] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute several playbooks against one node's context.
+
+        All playbooks share one EvaluationSession, so each distinct JSONPath
+        expression is evaluated once for the node. A failing playbook is
+        recorded and does not stop the others.
+
+        Returns:
+            Dict with per-playbook 'results', 'errors' and session 'evaluation_stats'
+        """
+        session = EvaluationSession(context, self.dll_evaluator)
+        results = []
+        errors = {}
+        for playbook_id in playbook_ids:
+            try:
+                results.append(self.execute(
+                    playbook_id, context, client_id,
+                    session=session, input_fingerprints=input_fingerprints, dry_run=dry_run
+                ))
+            except Exception as e:
+                errors[playbook_id] = str(e)
+
+        return {
+            'results': results,
+            'errors': errors,
+            'evaluation_stats': session.stats()
+        }
+
     def _generate_run_id(self, playbook_id: str, client_id: str) -> str:
         """Generate deterministic run ID."""
         timestamp = datetime.utcnow().strftime('%Y-%m-%d_%H%M%S')
         return f"{timestamp}_{playbook_id}_{client_id}"
 
-    def _find_playbook(self, playbook_id: str) -> Path:
-        """Find playbook file by ID."""
-        # Search in executable/ and validation/ subdirectories
-        for subdir in ['executable', 'validation']:
-            pattern = f"*{playbook_id}*.yaml"
-            matches = list((self.playbooks_dir / subdir).glob(pattern))
-            if matches:
-                return matches[0]
+    def _run_record(
+        self,
+        run_id: str,
+        playbook_id: str,
+        client_id: str,
+        trace: Dict[str, Any],
+        files: Dict[str, str]
+    ) -> RunRecord:
+        """Bundle a run's rendered files with its index fields."""
+        summary = trace['execution_summary']
+        return RunRecord(
+            run_id=run_id,
+            playbook_id=playbook_id,
+            client_id=client_id,
+            status=summary['status'],
+            started_at=summary['start_time'],
+            duration_seconds=summary['duration_seconds'],
+            files=files
+        )
 
-        raise FileNotFoundError(f"Playbook {playbook_id} not found in {self.playbooks_dir}")
+    def _find_playbook(self, playbook_id: str) -> Path:
+        """Find playbook file by ID (via the registry index)."""
+        return self.registry.find_path(playbook_id)
 
     def _evaluate_rules(
         self,
         playbook: Dict[str, Any],
-        context: Dict[str, Any],
+        session: EvaluationSession,
         playbook_id: str,
-        trace: Dict[str, Any]
+        trace: Dict[str, Any],
+        compiled_rules: Optional[List[CompiledRule]] = None,
+        client_id: str = None,
+        input_fingerprints: Optional[Dict[str, str]] = None,
+        rule_log: Optional[Dict[str, List[str]]] = None,
+        profile: Optional[RunProfile] = None,
+        update_cache: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Evaluate decision logic rules against context.
@@ -268,26 +408,62 @@ class PlaybookExecutor:
         are evaluated against the actual InfoHub data. Each rule's condition is:
         1. Extracted from the playbook YAML
         2. Threshold placeholders substituted (e.g., ${thresholds.min_arr} -> 500000)
-        3. Evaluated against context using JSONPath + comparison operators
+        3. Evaluated against the session's context using JSONPath + comparison
+           operators, reusing path results memoized by earlier rules
+
+        Steps 1-2 normally happen once, when the registry indexes the
+        playbook; compiled_rules carries that result.
+
+        With a rule cache, a rule whose input fingerprint matches its last
+        run reuses that result; rule_log collects reused and recomputed ids.
+        With update_cache False the cache is only read (dry runs).
+        A profile, if given, receives each rule's timings.
 
         Rules that evaluate to TRUE are "fired" and will generate outputs.
         """
         fired_rules = []
-
-        # Extract rules from playbook's decision_logic section
-        rules = playbook.get('decision_logic', {}).get('rules', [])
-        for rule in rules:
-            rule_id = rule.get('id', 'unknown')
-            condition = rule.get('condition', '')
-
-            # Substitute thresholds
-            condition_substituted = self.threshold_manager.substitute_condition(
-                condition, playbook_id
+        if rule_log is None:
+            rule_log = {'reused': [], 'recomputed': []}
+        use_cache = self.rule_cache is not None and client_id is not None
+        fingerprints = InputFingerprints(session.context, input_fingerprints) if use_cache else None
+        cache_updates = {}
+
+        if compiled_rules is None:
+            compiled_rules = compile_rules(
+                playbook, playbook_id, self.dll_evaluator, self.threshold_manager
             )
 
-            # Evaluate condition
+        for compiled_rule in compiled_rules:
+            rule = compiled_rule.rule
+            rule_id = compiled_rule.rule_id
+            condition = compiled_rule.condition
+            condition_substituted = compiled_rule.condition_substituted
+
             try:
-                result = self.dll_evaluator.evaluate(condition_substituted, context)
+                if compiled_rule.error:
+                    raise ValueError(compiled_rule.error)
+                started_ns = time.perf_counter_ns()
+                resolve_before = session.resolve_ns
+                result = None
+                if use_cache:
+                    fingerprint = fingerprints.rule(condition_substituted, compiled_rule.compiled)
+                    result = self.rule_cache.get(playbook_id, client_id, rule_id, fingerprint)
+                reused = result is not None
+                if not reused:
+                    result = session.evaluate(compiled_rule.compiled)
+                    rule_log['recomputed'].append(rule_id)
+                    if use_cache:
+                        cache_updates[rule_id] = (fingerprint, result)
+                else:
+                    rule_log['reused'].append(rule_id)
+                if profile is not None:
+                    profile.rule(
+                        rule_id,
+                        total_ns=time.perf_counter_ns() - started_ns,
+                        resolution_ns=session.resolve_ns - resolve_before,
+                        substitution_ns=compiled_rule.substitution_ns,
+                        reused=reused
+                    )
 
                 if result:
                     fired_rules.append({
@@ -312,6 +488,8 @@ class PlaybookExecutor:
                     }
                 })
 
+        if use_cache and update_cache:
+            self.rule_cache.put_many(playbook_id, client_id, cache_updates)
         return fired_rules
 
     def _generate_mock_outputs(
@@ -498,36 +676,25 @@ class PlaybookExecutor:
 
         return '\n'.join(lines)
 
-    def _write_outputs(self, run_dir: Path, outputs: List[Dict[str, Any]]):
-        """Write output files to disk."""
+    def _render_outputs(self, outputs: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Render output files (relative path -> content)."""
+        files = {}
         for output in outputs:
-            output_path = run_dir / output['path']
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Mock content for now (would be real markdown in production)
             content = f"# {output['type'].capitalize()} Output\n\n"
             content += f"Mock output for integration test\n\n"
             content += f"Content: {output['content']}\n"
 
-            output_path.write_text(content)
-
-    def _write_yaml(self, path: Path, data: Dict[str, Any]):
-        """Write YAML file."""
-        with open(path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-
-    def _write_json(self, path: Path, data: Dict[str, Any]):
-        """Write JSON file."""
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
+            files[output['path']] = content
+        return files
 
-    def _write_markdown(self, path: Path, content: str):
-        """Write markdown file."""
-        path.write_text(content)
+    def _render_yaml(self, data: Dict[str, Any]) -> str:
+        """Render YAML file content."""
+        return yaml.dump(data, default_flow_style=False, sort_keys=False)
 
-    def _write_text(self, path: Path, content: str):
-        """Write text file."""
-        path.write_text(content)
+    def _render_json(self, data: Dict[str, Any]) -> str:
+        """Render JSON file content."""
+        return json.dumps(data, indent=2)
 
     def _log_step(
         self,
@@ -536,10 +703,21 @@ class PlaybookExecutor:
         status: str,
         details: Dict[str, Any] = None
     ):
-        """Log execution step to trace."""
-        trace['execution_steps'].append({
+        """Log execution step to trace; finished steps carry their duration_ns."""
+        entry = {
             'timestamp': datetime.utcnow().isoformat() + 'Z',
             'step': step,
             'status': status,
             'details': details or {}
-        })
+        }
+        profile = self._profiles.get(trace.get('run_id'))
+        if profile is not None:
+            if status == 'started':
+                profile.stage_started(step)
+            else:
+                entry.update(profile.stage_finished(step))
+        trace['execution_steps'].append(entry)
+
+    def _finish_profile(self, run_id: str) -> Dict[str, Any]:
+        """Close a run's profile and return it for the trace."""
+        return self._profiles.pop(run_id).finish()
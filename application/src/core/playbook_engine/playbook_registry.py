@@ -0,0 +1,315 @@
+"""
+Playbook Registry - Index playbooks by ID with cached, validated contents
+
+Replaces the per-execution glob + YAML parse + schema validation with an
+index built once: every playbook under the playbooks directory (any
+subdirectory depth) is parsed, validated and has its rule conditions
+threshold-substituted and compiled at index time, so load errors surface
+up front and execution setup is a dict lookup plus one stat().
+
+Hot Reload:
+    - get() stats the playbook's file and re-indexes just that file if its
+      mtime or size changed (or it was deleted)
+    - refresh() re-lists only directories whose mtime changed, picking up
+      added and removed files
+    - Unknown IDs trigger a refresh() before FileNotFoundError is raised
+
+Identification:
+    A file is a playbook when its name starts with an ID such as PB_201,
+    PB_ACI_001 or OP_ACT_002. steckbrief.playbook_id (or a top-level
+    playbook_id) takes precedence over the file name.
+
+    When several files declare the same ID, a file whose name carries that
+    ID wins over one that only declares it, then the lower path; the others
+    are logged and take over if the winning file is removed.
+
+Thresholds:
+    Compiled rules are bound to the threshold generation they were
+    substituted with. get() lets the ThresholdManager reload a changed
+    config; entries of an older generation recompile their rules (the
+    playbook itself is not re-parsed), so compiled rules are effectively
+    cached per (playbook_id, rule_id, thresholds generation).
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .dll_evaluator import CompiledCondition, DLLEvaluator
+from .playbook_loader import PlaybookLoader
+from .threshold_manager import ThresholdManager
+
+_PLAYBOOK_ID = re.compile(r"^([A-Z]{2}(?:_[A-Z]+)?_\d+)")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CompiledRule:
+    """A decision rule with its threshold-substituted, compiled condition."""
+
+    rule_id: str
+    rule: Dict[str, Any]
+    condition: str
+    condition_substituted: str
+    compiled: Optional[CompiledCondition] = None
+    error: Optional[str] = None
+    substitution_ns: int = 0
+
+
+@dataclass
+class RegisteredPlaybook:
+    """Index entry for one playbook file."""
+
+    playbook_id: str
+    path: Path
+    mtime_ns: int
+    size: int
+    playbook: Optional[Dict[str, Any]] = None
+    rules: List[CompiledRule] = field(default_factory=list)
+    error: Optional[str] = None
+    thresholds_generation: int = 0
+
+
+def compile_rules(
+    playbook: Dict[str, Any],
+    playbook_id: str,
+    evaluator: DLLEvaluator,
+    threshold_manager: Optional[ThresholdManager] = None
+) -> List[CompiledRule]:
+    """
+    Substitute thresholds into and compile every decision rule condition.
+
+    Rules that fail to compile keep their error instead of raising, so one
+    bad condition does not hide the others.
+    """
+    compiled_rules = []
+    for rule in playbook.get('decision_logic', {}).get('rules', []) or []:
+        condition = rule.get('condition', '')
+        substituted = condition
+        started_ns = time.perf_counter_ns()
+        if threshold_manager is not None:
+            substituted = threshold_manager.substitute_condition(condition, playbook_id)
+        entry = CompiledRule(
+            rule_id=rule.get('id', 'unknown'),
+            rule=rule,
+            condition=condition,
+            condition_substituted=substituted,
+            substitution_ns=time.perf_counter_ns() - started_ns
+        )
+        try:
+            entry.compiled = evaluator.compile(substituted)
+        except Exception as e:
+            entry.error = str(e)
+        compiled_rules.append(entry)
+    return compiled_rules
+
+
+def playbook_id_from_filename(path: Path) -> Optional[str]:
+    """Playbook ID prefix of a file name (PB_201_swot.yaml -> PB_201)."""
+    match = _PLAYBOOK_ID.match(path.name)
+    return match.group(1) if match else None
+
+
+class PlaybookRegistry:
+    """In-memory index of playbooks by ID with stat-based hot reload."""
+
+    def __init__(
+        self,
+        playbooks_dir: Path,
+        loader: Optional[PlaybookLoader] = None,
+        evaluator: Optional[DLLEvaluator] = None,
+        threshold_manager: Optional[ThresholdManager] = None
+    ):
+        """
+        Build the index.
+
+        Args:
+            playbooks_dir: Root directory searched recursively for *.yaml
+            loader: Loader used for parsing and schema validation
+            evaluator: DLL evaluator used to precompile rule conditions
+            threshold_manager: Substitutes thresholds before compiling
+        """
+        self.playbooks_dir = Path(playbooks_dir)
+        self.loader = loader or PlaybookLoader(self.playbooks_dir)
+        self.evaluator = evaluator or DLLEvaluator()
+        self.threshold_manager = threshold_manager
+        self._entries: Dict[str, RegisteredPlaybook] = {}
+        self._by_path: Dict[Path, str] = {}
+        self._dir_mtimes: Dict[Path, int] = {}
+        self._lock = threading.RLock()
+        self.refresh()
+
+    # ── Lookup ───────────────────────────────────────────────────────────
+
+    def get(self, playbook_id: str) -> RegisteredPlaybook:
+        """
+        Current entry for a playbook, reloading it if its file changed.
+
+        Raises:
+            FileNotFoundError: If no playbook has this ID
+            ValueError: If the playbook failed to load or validate
+        """
+        entry = self._current(playbook_id)
+        if entry is None:
+            self.refresh()
+            entry = self._current(playbook_id)
+        if entry is None:
+            raise FileNotFoundError(f"Playbook {playbook_id} not found in {self.playbooks_dir}")
+        if entry.error:
+            raise ValueError(entry.error)
+        return entry
+
+    def find_path(self, playbook_id: str) -> Path:
+        """
+        Path of a playbook file, whether or not it validated.
+
+        Raises:
+            FileNotFoundError: If no playbook has this ID
+        """
+        entry = self._current(playbook_id)
+        if entry is None:
+            self.refresh()
+            entry = self._current(playbook_id)
+        if entry is None:
+            raise FileNotFoundError(f"Playbook {playbook_id} not found in {self.playbooks_dir}")
+        return entry.path
+
+    def ids(self) -> List[str]:
+        """All indexed playbook IDs, including ones that failed validation."""
+        return sorted(self._entries)
+
+    def errors(self) -> Dict[str, str]:
+        """Load/validation errors by playbook ID, as found at index time."""
+        return {pid: e.error for pid, e in sorted(self._entries.items()) if e.error}
+
+    def __contains__(self, playbook_id: str) -> bool:
+        return playbook_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ── Indexing ─────────────────────────────────────────────────────────
+
+    def refresh(self) -> None:
+        """Re-list directories whose mtime changed and re-index changed files."""
+        with self._lock:
+            if not self.playbooks_dir.exists():
+                return
+            seen_dirs = set()
+            for dirpath, dirnames, filenames in os.walk(self.playbooks_dir):
+                directory = Path(dirpath)
+                seen_dirs.add(directory)
+                mtime = os.stat(directory).st_mtime_ns
+                if self._dir_mtimes.get(directory) == mtime:
+                    continue
+                self._dir_mtimes[directory] = mtime
+                present = set()
+                for name in filenames:
+                    path = directory / name
+                    if name.endswith('.yaml') and playbook_id_from_filename(path):
+                        present.add(path)
+                        if path not in self._by_path:
+                            self._index_file(path)
+                for path in [p for p in self._by_path if p.parent == directory and p not in present]:
+                    self._drop(path)
+            for directory in set(self._dir_mtimes) - seen_dirs:
+                del self._dir_mtimes[directory]
+                for path in [p for p in self._by_path if p.parent == directory]:
+                    self._drop(path)
+
+    def _current(self, playbook_id: str) -> Optional[RegisteredPlaybook]:
+        entry = self._entries.get(playbook_id)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(entry.path)
+        except FileNotFoundError:
+            with self._lock:
+                self._drop(entry.path)
+            return None
+        if stat.st_mtime_ns != entry.mtime_ns or stat.st_size != entry.size:
+            with self._lock:
+                self._drop(entry.path)
+                self._index_file(entry.path)
+            entry = self._entries.get(playbook_id)
+        elif entry.playbook is not None and self._thresholds_generation() != entry.thresholds_generation:
+            with self._lock:
+                self._compile(entry)
+        return entry
+
+    def _thresholds_generation(self) -> int:
+        if self.threshold_manager is None:
+            return 0
+        self.threshold_manager.refresh()
+        return self.threshold_manager.generation
+
+    def _compile(self, entry: RegisteredPlaybook) -> None:
+        """(Re)compile an entry's rules against the current thresholds."""
+        generation = self.threshold_manager.generation if self.threshold_manager is not None else 0
+        if entry.rules and entry.thresholds_generation == generation:
+            return
+        entry.rules = compile_rules(entry.playbook, entry.playbook_id, self.evaluator, self.threshold_manager)
+        entry.thresholds_generation = generation
+
+    def _index_file(self, path: Path) -> None:
+        stat = os.stat(path)
+        entry = RegisteredPlaybook(
+            playbook_id=playbook_id_from_filename(path),
+            path=path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size
+        )
+        try:
+            playbook = self.loader.load(path)
+            declared = _declared_id(playbook)
+            if declared:
+                entry.playbook_id = declared
+            entry.playbook = playbook
+            self._compile(entry)
+        except Exception as e:
+            entry.error = str(e)
+        self._by_path[path] = entry.playbook_id
+        current = self._entries.get(entry.playbook_id)
+        if current is not None and current.path != path:
+            winner, ignored = sorted([current, entry], key=_precedence)
+            logger.warning(
+                "Duplicate playbook ID %s: using %s, ignoring %s",
+                entry.playbook_id, winner.path, ignored.path
+            )
+            if winner is current:
+                return
+        self._entries[entry.playbook_id] = entry
+
+    def _drop(self, path: Path) -> None:
+        playbook_id = self._by_path.pop(path, None)
+        entry = self._entries.get(playbook_id)
+        if entry is not None and entry.path == path:
+            del self._entries[playbook_id]
+            # Files the dropped one shadowed compete for the ID again
+            for other in sorted(p for p, pid in self._by_path.items() if pid == playbook_id):
+                if other.exists():
+                    self._index_file(other)
+                else:
+                    del self._by_path[other]
+
+
+def _precedence(entry: RegisteredPlaybook) -> tuple:
+    """Sort key among files declaring the same ID: named after it first, then by path."""
+    return (playbook_id_from_filename(entry.path) != entry.playbook_id, str(entry.path))
+
+
+def _declared_id(playbook: Any) -> Optional[str]:
+    if not isinstance(playbook, dict):
+        return None
+    steckbrief = playbook.get('steckbrief')
+    if isinstance(steckbrief, dict) and steckbrief.get('playbook_id'):
+        return str(steckbrief['playbook_id'])
+    if playbook.get('playbook_id'):
+        return str(playbook['playbook_id'])
+    return None
@@ -0,0 +1,182 @@
+"""
+Rule Result Cache - Reuse rule results whose inputs are unchanged
+
+Scheduled re-runs evaluate the same rules against mostly unchanged InfoHub
+data. Each rule gets an input fingerprint; when a rule's fingerprint
+matches the one stored for the same (playbook, client, rule) on the last
+run, its previous firing result is reused instead of re-evaluated.
+
+Fingerprint of a rule:
+    hash(threshold-substituted condition,
+         fingerprint of every top-level context key the condition reads)
+
+    The keys come from the compiled condition's JSONPath roots; a path with
+    no single root ($..x, $[*]) depends on the whole context. Per-key
+    fingerprints come from the vault documents that feed the key when the
+    caller supplies them (node_context.document_fingerprints), otherwise
+    from the canonical JSON of the context value.
+
+Only results of rules that evaluated without error are cached. A stored
+result is valid whenever its fingerprint matches, so caches shared by
+several processes never return stale results, they only miss.
+"""
+
+import hashlib
+import json
+import sqlite3
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .dll_evaluator import condition_roots
+
+_ABSENT = 'absent'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rule_results (
+    playbook_id TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    rule_id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    fired INTEGER NOT NULL,
+    PRIMARY KEY (playbook_id, client_id, rule_id)
+);
+"""
+
+
+def fingerprint_value(value: Any) -> str:
+    """Content hash of a JSON-like value (key order independent)."""
+    encoded = json.dumps(value, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class InputFingerprints:
+    """Per-key content fingerprints of one context, computed on first use."""
+
+    def __init__(self, context: Dict[str, Any], sources: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            context: Execution context
+            sources: Precomputed fingerprints by top-level key (e.g. from
+                the vault documents the context was loaded from)
+        """
+        self.context = context
+        self._memo: Dict[Optional[str], str] = dict(sources or {})
+
+    def key(self, root: Optional[str]) -> str:
+        """Fingerprint of one top-level key (None = the whole context)."""
+        if root in self._memo:
+            return self._memo[root]
+        if root is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for name in sorted(self.context):
+                digest.update(f"{name}={self.key(name)};".encode('utf-8'))
+            fingerprint = digest.hexdigest()
+        elif root in self.context:
+            fingerprint = fingerprint_value(self.context[root])
+        else:
+            fingerprint = _ABSENT
+        self._memo[root] = fingerprint
+        return fingerprint
+
+    def rule(self, condition_substituted: str, compiled) -> str:
+        """Fingerprint of a compiled rule's inputs."""
+        digest = hashlib.blake2b(condition_substituted.encode('utf-8'), digest_size=16)
+        roots = condition_roots(compiled)
+        for root in sorted(roots, key=lambda r: (r is None, r or '')):
+            digest.update(f";{root}={self.key(root)}".encode('utf-8'))
+        return digest.hexdigest()
+
+
+class RuleResultCache:
+    """Last firing result per (playbook, client, rule) with its input fingerprint."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: SQLite file to persist results across processes and
+                runs; None keeps them in memory only
+        """
+        self.db_path = Path(db_path) if db_path else None
+        self._entries: Dict[Tuple[str, str, str], Tuple[str, bool]] = {}
+        self._loaded = set()
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection for one operation: committed (or rolled back) and closed on exit."""
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn, conn:
+            yield conn
+
+    def __getstate__(self):
+        # Worker processes start with an empty in-memory view
+        state = self.__dict__.copy()
+        state['_entries'] = {}
+        state['_loaded'] = set()
+        return state
+
+    def get(self, playbook_id: str, client_id: str, rule_id: str, fingerprint: str) -> Optional[bool]:
+        """Cached firing result, or None if absent or the fingerprint differs."""
+        self._load(playbook_id, client_id)
+        entry = self._entries.get((playbook_id, client_id, rule_id))
+        if entry is None or entry[0] != fingerprint:
+            return None
+        return entry[1]
+
+    def put_many(self, playbook_id: str, client_id: str, results: Dict[str, Tuple[str, bool]]) -> None:
+        """Store {rule_id: (fingerprint, fired)} for one playbook/client."""
+        if not results:
+            return
+        for rule_id, (fingerprint, fired) in results.items():
+            self._entries[(playbook_id, client_id, rule_id)] = (fingerprint, bool(fired))
+        if self.db_path is not None:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO rule_results "
+                    "(playbook_id, client_id, rule_id, fingerprint, fired) VALUES (?, ?, ?, ?, ?)",
+                    [(playbook_id, client_id, rule_id, fp, int(bool(fired)))
+                     for rule_id, (fp, fired) in results.items()]
+                )
+
+    def clear(self, playbook_id: str = None, client_id: str = None) -> None:
+        """Forget cached results (all, or for one playbook and/or client)."""
+        self._entries = {
+            key: value for key, value in self._entries.items()
+            if not ((playbook_id is None or key[0] == playbook_id)
+                    and (client_id is None or key[1] == client_id))
+        }
+        self._loaded = set()
+        if self.db_path is not None:
+            clauses, params = [], []
+            if playbook_id is not None:
+                clauses.append("playbook_id = ?")
+                params.append(playbook_id)
+            if client_id is not None:
+                clauses.append("client_id = ?")
+                params.append(client_id)
+            where = " WHERE " + " AND ".join(clauses) if clauses else ""
+            with self._connect() as conn:
+                conn.execute(f"DELETE FROM rule_results{where}", params)
+
+    def __len__(self) -> int:
+        if self.db_path is None:
+            return len(self._entries)
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM rule_results").fetchone()[0]
+
+    def _load(self, playbook_id: str, client_id: str) -> None:
+        if self.db_path is None or (playbook_id, client_id) in self._loaded:
+            return
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT rule_id, fingerprint, fired FROM rule_results "
+                "WHERE playbook_id = ? AND client_id = ?",
+                (playbook_id, client_id)
+            ).fetchall()
+        for rule_id, fingerprint, fired in rows:
+            self._entries[(playbook_id, client_id, rule_id)] = (fingerprint, bool(fired))
+        self._loaded.add((playbook_id, client_id))
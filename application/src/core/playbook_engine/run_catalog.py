@@ -0,0 +1,381 @@
+"""
+Run Catalog - Queryable index of playbook run metadata
+
+Indexes each run's metadata (run_id, playbook, client, status, start time,
+duration, output count and per-rule outcomes) in SQLite as the run
+completes, so run history can be listed, filtered and aggregated without
+opening run directories or the run store payloads.
+
+Tables:
+    runs        One row per run; indexed by playbook, client, status and
+                start time
+    run_rules   One row per (run, rule): outcome 'fired', 'not_fired' or
+                'error'; indexed by rule
+
+Aggregates:
+    rule_fire_rates()       Share of runs in which each rule fired
+    duration_percentiles()  p50/p95/mean duration per playbook
+
+Existing runs (directories or a SQLiteRunStore) can be indexed once with
+backfill(), which reads only their trace.json and metadata.yaml.
+"""
+
+import json
+import re
+import sqlite3
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import yaml
+
+from .playbook_registry import playbook_id_from_filename
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    playbook_id TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    duration_seconds REAL NOT NULL DEFAULT 0,
+    rules_evaluated INTEGER NOT NULL DEFAULT 0,
+    rules_fired INTEGER NOT NULL DEFAULT 0,
+    outputs_count INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_catalog_playbook ON runs (playbook_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_catalog_client ON runs (client_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_catalog_status ON runs (status, started_at);
+CREATE INDEX IF NOT EXISTS idx_catalog_started ON runs (started_at);
+CREATE INDEX IF NOT EXISTS idx_catalog_duration ON runs (playbook_id, duration_seconds);
+
+CREATE TABLE IF NOT EXISTS run_rules (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    rule_id TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    PRIMARY KEY (run_id, rule_id)
+);
+CREATE INDEX IF NOT EXISTS idx_catalog_rule ON run_rules (rule_id, outcome);
+"""
+
+_RUN_COLUMNS = (
+    'run_id', 'playbook_id', 'client_id', 'status', 'started_at', 'duration_seconds',
+    'rules_evaluated', 'rules_fired', 'outputs_count', 'error'
+)
+
+# {timestamp}_{playbook_id}_{client_id}[-N]
+_RUN_ID = re.compile(r"^\d{4}-\d{2}-\d{2}_\d{6}_(?P<rest>.+?)(?:-\d+)?$")
+
+
+class RunCatalog:
+    """SQLite index of run metadata with paginated queries and aggregates."""
+
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path: SQLite database file (created with its schema if missing)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection for one operation: committed (or rolled back) and closed on exit."""
+        # Per-operation connections keep the catalog picklable for worker processes
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn, conn:
+            conn.execute('PRAGMA foreign_keys=ON')
+            yield conn
+
+    # ── Indexing ─────────────────────────────────────────────────────────
+
+    def record(self, trace: Dict[str, Any], playbook_id: str, client_id: str) -> None:
+        """Index one run from its execution trace (replacing any earlier entry)."""
+        summary = trace.get('execution_summary', {})
+        fired, evaluated, errored, outputs_count = [], [], [], 0
+        for step in trace.get('execution_steps', []):
+            details = step.get('details') or {}
+            if step['step'] == 'evaluate_decision_logic' and step['status'] == 'success':
+                fired = list(details.get('fired_rule_ids', []))
+                evaluated = list(details.get('evaluated_rule_ids', []))
+            elif step['step'] == 'generate_outputs' and step['status'] == 'success':
+                outputs_count = details.get('outputs_created', 0)
+            elif step['step'].startswith('evaluate_rule_') and step['status'] == 'error':
+                errored.append(step['step'][len('evaluate_rule_'):])
+
+        outcomes = {rule_id: 'not_fired' for rule_id in evaluated}
+        outcomes.update({rule_id: 'error' for rule_id in errored})
+        outcomes.update({rule_id: 'fired' for rule_id in fired})
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM runs WHERE run_id = ?", (trace['run_id'],))
+            conn.execute(
+                f"INSERT INTO runs ({', '.join(_RUN_COLUMNS)}) VALUES ({', '.join('?' * len(_RUN_COLUMNS))})",
+                (
+                    trace['run_id'], playbook_id, client_id,
+                    summary.get('status', 'unknown'), summary.get('start_time', ''),
+                    summary.get('duration_seconds', 0), len(outcomes), len(fired),
+                    outputs_count, summary.get('error')
+                )
+            )
+            conn.executemany(
+                "INSERT INTO run_rules (run_id, rule_id, outcome) VALUES (?, ?, ?)",
+                [(trace['run_id'], rule_id, outcome) for rule_id, outcome in outcomes.items()]
+            )
+
+    def record_files(self, files: Dict[str, str]) -> bool:
+        """
+        Index a persisted run from its trace.json (and metadata.yaml if present).
+
+        Returns:
+            False if the files have no trace or the playbook cannot be determined
+        """
+        if 'trace.json' not in files:
+            return False
+        trace = json.loads(files['trace.json'])
+        metadata = yaml.safe_load(files['metadata.yaml']) if 'metadata.yaml' in files else {}
+        playbook_id = (metadata or {}).get('playbook_id')
+        client_id = (metadata or {}).get('client_id')
+        if not (playbook_id and client_id):
+            playbook_id, client_id = _parse_run_id(trace.get('run_id', ''))
+        if not playbook_id:
+            return False
+        self.record(trace, playbook_id, client_id)
+        return True
+
+    def backfill(self, source: Any) -> int:
+        """
+        Index existing runs from a runs directory or a SQLiteRunStore.
+
+        Returns:
+            Number of runs indexed
+        """
+        indexed = 0
+        if isinstance(source, (str, Path)):
+            for run_dir in sorted(Path(source).iterdir()):
+                files = {
+                    name: (run_dir / name).read_text()
+                    for name in ('trace.json', 'metadata.yaml')
+                    if (run_dir / name).is_file()
+                }
+                indexed += self.record_files(files)
+        else:
+            for summary in source.query():
+                record = source.get(summary['run_id'])
+                if record is not None:
+                    indexed += self.record_files(record.files)
+        return indexed
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Catalog entry for a run, with per-rule outcomes, or None if unknown."""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            rules = conn.execute(
+                "SELECT rule_id, outcome FROM run_rules WHERE run_id = ? ORDER BY rule_id", (run_id,)
+            ).fetchall()
+        entry = dict(zip(_RUN_COLUMNS, row))
+        entry['fired_rule_ids'] = [rule_id for rule_id, outcome in rules if outcome == 'fired']
+        entry['rule_outcomes'] = dict(rules)
+        return entry
+
+    def query(
+        self,
+        playbook_id: str = None,
+        client_id: str = None,
+        status: str = None,
+        fired_rule_id: str = None,
+        run_id: str = None,
+        since: str = None,
+        until: str = None,
+        min_duration: float = None,
+        max_duration: float = None,
+        min_outputs: int = None,
+        max_outputs: int = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        newest_first: bool = True
+    ) -> Dict[str, Any]:
+        """
+        One page of runs matching all given filters.
+
+        Args:
+            fired_rule_id: Only runs in which this rule fired
+            run_id: Run ID prefix
+            since/until: ISO date or timestamp bounds on start time
+                (since inclusive, until exclusive)
+            min_/max_duration: Duration bounds in seconds (inclusive)
+            min_/max_outputs: Output count bounds (inclusive)
+            limit: Page size (capped at MAX_PAGE_SIZE)
+            offset: Number of matching runs to skip
+
+        Returns:
+            {'items': [...], 'total': matching runs, 'limit', 'offset'}
+        """
+        where, params = _filters(
+            playbook_id=playbook_id, client_id=client_id, status=status,
+            fired_rule_id=fired_rule_id, run_id=run_id, since=since, until=until,
+            min_duration=min_duration, max_duration=max_duration,
+            min_outputs=min_outputs, max_outputs=max_outputs
+        )
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        offset = max(0, offset)
+        order = 'DESC' if newest_first else 'ASC'
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs{where} "
+                f"ORDER BY started_at {order}, run_id {order} LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+            items = [dict(zip(_RUN_COLUMNS, row)) for row in rows]
+            fired = _fired_rule_ids(conn, [item['run_id'] for item in items])
+        for item in items:
+            item['fired_rule_ids'] = fired.get(item['run_id'], [])
+        return {'items': items, 'total': total, 'limit': limit, 'offset': offset}
+
+    def rule_fire_rates(
+        self,
+        playbook_id: str = None,
+        client_id: str = None,
+        since: str = None,
+        until: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Per (playbook, rule): runs evaluated, fired, errored and fire rate.
+
+        Only completed runs count; rows are ordered by playbook, then fire
+        rate descending.
+        """
+        where, params = _filters(
+            playbook_id=playbook_id, client_id=client_id, status='completed', since=since, until=until
+        )
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT r.playbook_id, rr.rule_id, COUNT(*), "
+                "SUM(rr.outcome = 'fired'), SUM(rr.outcome = 'error') "
+                f"FROM run_rules rr JOIN runs r ON r.run_id = rr.run_id{_qualify(where)} "
+                "GROUP BY r.playbook_id, rr.rule_id",
+                params
+            ).fetchall()
+        rates = [
+            {
+                'playbook_id': pb, 'rule_id': rule_id, 'runs': runs,
+                'fired': fired, 'errors': errors, 'fire_rate': fired / runs
+            }
+            for pb, rule_id, runs, fired, errors in rows
+        ]
+        return sorted(rates, key=lambda r: (r['playbook_id'], -r['fire_rate'], r['rule_id']))
+
+    def duration_percentiles(
+        self,
+        playbook_id: str = None,
+        client_id: str = None,
+        status: str = 'completed',
+        since: str = None,
+        until: str = None
+    ) -> List[Dict[str, Any]]:
+        """Per playbook: run count and mean/p50/p95/max duration in seconds."""
+        where, params = _filters(
+            playbook_id=playbook_id, client_id=client_id, status=status, since=since, until=until
+        )
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT playbook_id, duration_seconds FROM runs{where} "
+                "ORDER BY playbook_id, duration_seconds",
+                params
+            ).fetchall()
+        by_playbook: Dict[str, List[float]] = {}
+        for pb, duration in rows:
+            by_playbook.setdefault(pb, []).append(duration)
+        stats = []
+        for pb, durations in by_playbook.items():
+            array = np.asarray(durations)
+            stats.append({
+                'playbook_id': pb,
+                'runs': len(durations),
+                'mean': float(array.mean()),
+                'p50': float(np.percentile(array, 50)),
+                'p95': float(np.percentile(array, 95)),
+                'max': float(array.max()),
+            })
+        return stats
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+def _filters(
+    playbook_id=None, client_id=None, status=None, fired_rule_id=None, run_id=None,
+    since=None, until=None, min_duration=None, max_duration=None,
+    min_outputs=None, max_outputs=None
+):
+    clauses, params = [], []
+    for clause, value in (
+        ("playbook_id = ?", playbook_id),
+        ("client_id = ?", client_id),
+        ("status = ?", status),
+        ("started_at >= ?", since),
+        ("started_at < ?", until),
+        ("duration_seconds >= ?", min_duration),
+        ("duration_seconds <= ?", max_duration),
+        ("outputs_count >= ?", min_outputs),
+        ("outputs_count <= ?", max_outputs),
+    ):
+        if value is not None:
+            clauses.append(clause)
+            params.append(value)
+    if run_id is not None:
+        clauses.append("run_id LIKE ? ESCAPE '\\'")
+        params.append(re.sub(r"([%_\\])", r"\\\1", run_id) + '%')
+    if fired_rule_id is not None:
+        clauses.append(
+            "run_id IN (SELECT run_id FROM run_rules WHERE rule_id = ? AND outcome = 'fired')"
+        )
+        params.append(fired_rule_id)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _qualify(where: str) -> str:
+    """Prefix run columns with the runs alias for joined queries."""
+    return re.sub(r"\b(playbook_id|client_id|status|started_at)\b", r"r.\1", where)
+
+
+def _fired_rule_ids(conn: sqlite3.Connection, run_ids: Iterable[str]) -> Dict[str, List[str]]:
+    run_ids = list(run_ids)
+    if not run_ids:
+        return {}
+    rows = conn.execute(
+        f"SELECT run_id, rule_id FROM run_rules WHERE outcome = 'fired' "
+        f"AND run_id IN ({', '.join('?' * len(run_ids))}) ORDER BY rule_id",
+        run_ids
+    ).fetchall()
+    fired: Dict[str, List[str]] = {}
+    for run_id, rule_id in rows:
+        fired.setdefault(run_id, []).append(rule_id)
+    return fired
+
+
+def _parse_run_id(run_id: str):
+    """(playbook_id, client_id) from a run ID, or (None, None)."""
+    match = _RUN_ID.match(run_id)
+    if not match:
+        return None, None
+    rest = match.group('rest')
+    playbook_id = playbook_id_from_filename(Path(rest))
+    if not playbook_id:
+        return None, None
+    return playbook_id, rest[len(playbook_id) + 1:] or 'unknown'
@@ -0,0 +1,213 @@
+"""
+Run Profile - High-resolution stage and rule timings for execution traces
+
+The executor's step log has wall-clock timestamps only. A RunProfile times
+every pipeline stage and every rule evaluation with time.perf_counter_ns
+and is written into trace.json:
+
+    trace['execution_steps'][i]['duration_ns']   finished stages
+    trace['profile'] = {
+        'playbook_id': 'PB_201',
+        'clock': 'perf_counter_ns',
+        'total_ns': ...,
+        'stages': {'load_playbook': ns, ...},
+        'rules': {rule_id: {'substitution_ns', 'resolution_ns',
+                            'comparison_ns', 'total_ns', 'reused'}},
+        'memory_peak_bytes': ...            # only with track_memory
+    }
+
+Per rule:
+    substitution_ns  threshold substitution, done once when the registry
+                     indexes the playbook (not repeated per run)
+    resolution_ns    JSONPath resolution through the EvaluationSession
+                     (memo hits cost close to nothing)
+    comparison_ns    the rest of the evaluation: operators, literals,
+                     boolean short-circuiting
+    Rules answered by the rule cache are marked reused.
+
+Memory deltas (optional, tracemalloc) add memory_delta_bytes to finished
+stages; tracing slows execution noticeably, so it is off by default.
+
+profile_report() aggregates the profiles of recent runs (load_traces) into
+the slowest rules and playbooks; see scripts/profile_runs.py.
+"""
+
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+CLOCK = 'perf_counter_ns'
+
+
+class RunProfile:
+    """Stage and rule timings of one execution run."""
+
+    def __init__(self, playbook_id: str, track_memory: bool = False):
+        """
+        Args:
+            playbook_id: Playbook being executed
+            track_memory: Record traced memory deltas per stage (tracemalloc)
+        """
+        self.playbook_id = playbook_id
+        self.track_memory = track_memory
+        self.stages: Dict[str, int] = {}
+        self.rules: Dict[str, Dict[str, Any]] = {}
+        self._open: Dict[str, tuple] = {}
+        self._started_tracing = False
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if track_memory:
+            tracemalloc.reset_peak()
+        self._start_ns = time.perf_counter_ns()
+
+    def stage_started(self, step: str) -> None:
+        memory = tracemalloc.get_traced_memory()[0] if self.track_memory else None
+        self._open[step] = (time.perf_counter_ns(), memory)
+
+    def stage_finished(self, step: str) -> Dict[str, int]:
+        """Timing fields for the finished step's trace entry ({} if never started)."""
+        opened = self._open.pop(step, None)
+        if opened is None:
+            return {}
+        started_ns, memory = opened
+        timing = {'duration_ns': time.perf_counter_ns() - started_ns}
+        self.stages[step] = self.stages.get(step, 0) + timing['duration_ns']
+        if self.track_memory:
+            timing['memory_delta_bytes'] = tracemalloc.get_traced_memory()[0] - memory
+        return timing
+
+    def rule(
+        self,
+        rule_id: str,
+        total_ns: int,
+        resolution_ns: int = 0,
+        substitution_ns: int = 0,
+        reused: bool = False
+    ) -> None:
+        self.rules[rule_id] = {
+            'substitution_ns': substitution_ns,
+            'resolution_ns': resolution_ns,
+            'comparison_ns': max(total_ns - resolution_ns, 0),
+            'total_ns': total_ns,
+            'reused': reused,
+        }
+
+    def finish(self) -> Dict[str, Any]:
+        """The profile as written into trace['profile']."""
+        profile = {
+            'playbook_id': self.playbook_id,
+            'clock': CLOCK,
+            'total_ns': time.perf_counter_ns() - self._start_ns,
+            'stages': dict(self.stages),
+            'rules': dict(self.rules),
+        }
+        if self.track_memory:
+            profile['memory_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        return profile
+
+
+# ── Reporting ────────────────────────────────────────────────────────────
+
+def load_traces(source: Any, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Traces of the most recent runs in a runs directory or a SQLiteRunStore.
+
+    Args:
+        source: Runs directory path or SQLiteRunStore
+        limit: Number of most recent runs (None = all)
+    """
+    texts = []
+    if isinstance(source, (str, Path)):
+        # Run IDs start with their timestamp
+        run_dirs = sorted(Path(source).iterdir(), reverse=True)
+        for run_dir in run_dirs:
+            if limit is not None and len(texts) >= limit:
+                break
+            if (run_dir / 'trace.json').is_file():
+                texts.append((run_dir / 'trace.json').read_text())
+    else:
+        summaries = source.query()
+        for summary in reversed(summaries):
+            if limit is not None and len(texts) >= limit:
+                break
+            record = source.get(summary['run_id'])
+            if record is not None and 'trace.json' in record.files:
+                texts.append(record.files['trace.json'])
+    return [json.loads(text) for text in texts]
+
+
+def profile_report(traces: Iterable[Dict[str, Any]], top: int = 10) -> Dict[str, Any]:
+    """
+    Rank the slowest rules and playbooks across runs.
+
+    Runs without a profile (older traces) are skipped. Reused rules are
+    excluded from rule timings; they did not evaluate.
+
+    Returns:
+        Dict with 'runs' (profiled runs), 'rules' and 'playbooks', each a
+        list of rows sorted by p95 descending, times in milliseconds
+    """
+    rule_samples: Dict[tuple, List[int]] = {}
+    resolution: Dict[tuple, List[int]] = {}
+    playbook_samples: Dict[str, List[int]] = {}
+    stage_samples: Dict[str, Dict[str, List[int]]] = {}
+    runs = 0
+    for trace in traces:
+        profile = trace.get('profile')
+        if not profile:
+            continue
+        runs += 1
+        playbook_id = profile['playbook_id']
+        playbook_samples.setdefault(playbook_id, []).append(profile['total_ns'])
+        for stage, ns in profile['stages'].items():
+            stage_samples.setdefault(playbook_id, {}).setdefault(stage, []).append(ns)
+        for rule_id, timing in profile['rules'].items():
+            if timing.get('reused'):
+                continue
+            key = (playbook_id, rule_id)
+            rule_samples.setdefault(key, []).append(timing['total_ns'])
+            resolution.setdefault(key, []).append(timing['resolution_ns'])
+
+    rules = [
+        {
+            'playbook_id': playbook_id,
+            'rule_id': rule_id,
+            **_summary(samples),
+            'resolution_share': round(sum(resolution[(playbook_id, rule_id)]) / max(sum(samples), 1), 3),
+        }
+        for (playbook_id, rule_id), samples in rule_samples.items()
+    ]
+    playbooks = [
+        {
+            'playbook_id': playbook_id,
+            **_summary(samples),
+            'slowest_stage': max(
+                stage_samples.get(playbook_id, {'-': [0]}).items(), key=lambda item: sum(item[1])
+            )[0],
+        }
+        for playbook_id, samples in playbook_samples.items()
+    ]
+    return {
+        'runs': runs,
+        'rules': sorted(rules, key=lambda row: row['p95_ms'], reverse=True)[:top],
+        'playbooks': sorted(playbooks, key=lambda row: row['p95_ms'], reverse=True)[:top],
+    }
+
+
+def _summary(samples_ns: List[int]) -> Dict[str, Any]:
+    values = np.asarray(samples_ns, dtype=float) / 1e6
+    return {
+        'count': len(samples_ns),
+        'mean_ms': round(float(values.mean()), 4),
+        'p50_ms': round(float(np.percentile(values, 50)), 4),
+        'p95_ms': round(float(np.percentile(values, 95)), 4),
+        'max_ms': round(float(values.max()), 4),
+    }
@@ -0,0 +1,298 @@
+"""
+Run Store - Persistence backends for playbook execution runs
+
+A run is a set of text files (metadata.yaml, trace.json, report.md,
+error.log, outputs/...) plus a few index fields. The executor renders the
+files and hands them to a store as one RunRecord.
+
+Backends:
+    DirectoryRunStore - One directory per run under runs_dir (the original
+                        data/runs/{run_id}/ layout)
+    SQLiteRunStore    - All runs in one SQLite file; files are stored as a
+                        single gzip-compressed JSON payload per run, with
+                        indexes by playbook, client, status and start time.
+                        export() materializes the directory layout on demand.
+    MemoryRunStore    - Records kept in process memory (optionally only the
+                        most recent N); nothing touches disk. For tests,
+                        sweeps and callers that persist runs themselves.
+
+A store is the executor's sink: implement claim/write/location to send
+runs anywhere else. PlaybookExecutor.execute(..., dry_run=True) bypasses
+the store entirely.
+
+Run IDs:
+    claim() reserves a unique run ID before execution starts. Runs of the
+    same playbook and client within one second would collide, so later ones
+    get a -2, -3, ... suffix; claims are atomic across processes (mkdir /
+    primary key insert).
+"""
+
+import gzip
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class RunRecord:
+    """Files and index fields of one execution run."""
+
+    run_id: str
+    playbook_id: str
+    client_id: str
+    status: str                                 # 'completed' | 'failed'
+    started_at: str                             # ISO 8601, UTC
+    duration_seconds: float = 0.0
+    files: Dict[str, str] = field(default_factory=dict)   # relative path -> text
+
+
+class RunStore(ABC):
+    """Where execution runs are persisted."""
+
+    @abstractmethod
+    def claim(self, run_id: str, playbook_id: str, client_id: str) -> str:
+        """Reserve run_id (or a suffixed variant if taken) and return it."""
+
+    @abstractmethod
+    def write(self, record: RunRecord) -> None:
+        """Persist a finished run."""
+
+    @abstractmethod
+    def location(self, run_id: str) -> str:
+        """Human-readable location of a run (reported as run_dir)."""
+
+
+class DirectoryRunStore(RunStore):
+    """One directory per run: runs_dir/{run_id}/..."""
+
+    def __init__(self, runs_dir: Path):
+        self.runs_dir = Path(runs_dir)
+
+    def claim(self, run_id: str, playbook_id: str, client_id: str) -> str:
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        candidate = run_id
+        attempt = 1
+        while True:
+            try:
+                # mkdir without exist_ok makes the claim atomic
+                (self.runs_dir / candidate).mkdir()
+                return candidate
+            except FileExistsError:
+                attempt += 1
+                candidate = f"{run_id}-{attempt}"
+
+    def write(self, record: RunRecord) -> None:
+        run_dir = self.runs_dir / record.run_id
+        for relative, content in record.files.items():
+            path = run_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+    def location(self, run_id: str) -> str:
+        return str(self.runs_dir / run_id)
+
+
+class MemoryRunStore(RunStore):
+    """Runs kept in memory, oldest evicted first beyond max_runs."""
+
+    def __init__(self, max_runs: Optional[int] = None):
+        """
+        Args:
+            max_runs: Keep only the most recent runs (None = all)
+        """
+        self.max_runs = max_runs
+        self.records: "OrderedDict[str, Optional[RunRecord]]" = OrderedDict()
+
+    def claim(self, run_id: str, playbook_id: str, client_id: str) -> str:
+        candidate = run_id
+        attempt = 1
+        while candidate in self.records:
+            attempt += 1
+            candidate = f"{run_id}-{attempt}"
+        self.records[candidate] = None
+        return candidate
+
+    def write(self, record: RunRecord) -> None:
+        self.records[record.run_id] = record
+        self.records.move_to_end(record.run_id)
+        if self.max_runs is not None:
+            while len(self.records) > self.max_runs:
+                self.records.popitem(last=False)
+
+    def location(self, run_id: str) -> str:
+        return f"memory:{run_id}"
+
+    def get(self, run_id: str) -> Optional[RunRecord]:
+        """Record of a run, or None if unknown, evicted or still running."""
+        return self.records.get(run_id)
+
+    def __len__(self) -> int:
+        return sum(1 for record in self.records.values() if record is not None)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    playbook_id TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    duration_seconds REAL,
+    payload BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_runs_playbook ON runs (playbook_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_client ON runs (client_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs (status, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs (started_at);
+"""
+
+_SUMMARY_COLUMNS = ('run_id', 'playbook_id', 'client_id', 'status', 'started_at', 'duration_seconds')
+
+
+class SQLiteRunStore(RunStore):
+    """All runs in one SQLite database with a compressed payload per run."""
+
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path: SQLite database file (created with its schema if missing)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection for one operation: committed (or rolled back) and closed on exit."""
+        # A connection per operation keeps the store picklable for worker
+        # processes; WAL plus a busy timeout lets them write concurrently
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn, conn:
+            yield conn
+
+    # ── RunStore ─────────────────────────────────────────────────────────
+
+    def claim(self, run_id: str, playbook_id: str, client_id: str) -> str:
+        candidate = run_id
+        attempt = 1
+        started_at = datetime.utcnow().isoformat() + 'Z'
+        with self._connect() as conn:
+            while True:
+                try:
+                    conn.execute(
+                        "INSERT INTO runs (run_id, playbook_id, client_id, status, started_at) "
+                        "VALUES (?, ?, ?, 'running', ?)",
+                        (candidate, playbook_id, client_id, started_at)
+                    )
+                    return candidate
+                except sqlite3.IntegrityError:
+                    attempt += 1
+                    candidate = f"{run_id}-{attempt}"
+
+    def write(self, record: RunRecord) -> None:
+        payload = gzip.compress(json.dumps(record.files).encode('utf-8'))
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs "
+                "(run_id, playbook_id, client_id, status, started_at, duration_seconds, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (record.run_id, record.playbook_id, record.client_id, record.status,
+                 record.started_at, record.duration_seconds, payload)
+            )
+
+    def location(self, run_id: str) -> str:
+        return f"{self.db_path}#{run_id}"
+
+    # ── Reading ──────────────────────────────────────────────────────────
+
+    def get(self, run_id: str) -> Optional[RunRecord]:
+        """Full record of a run, or None if unknown or still running."""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(_SUMMARY_COLUMNS)}, payload FROM runs WHERE run_id = ?",
+                (run_id,)
+            ).fetchone()
+        if row is None or row[-1] is None:
+            return None
+        return _record(row)
+
+    def query(
+        self,
+        playbook_id: str = None,
+        client_id: str = None,
+        status: str = None,
+        since: str = None,
+        until: str = None,
+        limit: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run summaries (no payload) matching all given filters, oldest first.
+
+        Args:
+            since/until: ISO date or timestamp bounds on started_at
+                (since inclusive, until exclusive)
+        """
+        where, params = _filters(playbook_id, client_id, status, since, until)
+        sql = f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM runs{where} ORDER BY started_at, run_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [dict(zip(_SUMMARY_COLUMNS, row)) for row in rows]
+
+    def export(self, dest_dir: Path, **filters) -> List[Path]:
+        """
+        Materialize matching runs in the directory layout under dest_dir.
+
+        Accepts the same filters as query(). Runs still in progress are
+        skipped. Returns the run directories written.
+        """
+        where, params = _filters(**filters)
+        target = DirectoryRunStore(dest_dir)
+        written = []
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(_SUMMARY_COLUMNS)}, payload FROM runs{where} "
+                "ORDER BY started_at, run_id",
+                params
+            )
+            for row in rows:
+                if row[-1] is None:
+                    continue
+                record = _record(row)
+                target.write(record)
+                written.append(target.runs_dir / record.run_id)
+        return written
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+def _record(row) -> RunRecord:
+    summary = dict(zip(_SUMMARY_COLUMNS, row[:-1]))
+    files = json.loads(gzip.decompress(row[-1]).decode('utf-8'))
+    return RunRecord(files=files, **summary)
+
+
+def _filters(playbook_id=None, client_id=None, status=None, since=None, until=None):
+    clauses, params = [], []
+    for column, value in (('playbook_id', playbook_id), ('client_id', client_id), ('status', status)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if since is not None:
+        clauses.append("started_at >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("started_at < ?")
+        params.append(until)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
@@ -23,16 +23,34 @@ Usage in Playbook Conditions:
     After:  "$.horizon_1.arr_percentage > 0.80"
 
 Lookup Order:
-    1. Playbook-specific threshold (PB_xxx section)
+    1. Playbook-specific threshold (PB_xxx section; a bare ID such as
+       PB_201 also matches its named section PB_201_swot)
     2. Global threshold (global_thresholds section)
     3. KeyError if not found
+
+Resolved Tables:
+    Lookups are flattened at load time: each playbook gets one table of
+    global values overlaid with its section, so get() is a single dict
+    lookup. Substituted conditions are memoized per (playbook, condition)
+    and placeholders are replaced in one regex pass.
+
+Hot Reload:
+    refresh() re-reads the config when its mtime or size changed and bumps
+    `generation`; tables and memoized substitutions are rebuilt. Consumers
+    that cache substituted or compiled conditions (PlaybookRegistry) key
+    them by generation. A config that fails to parse is not applied; the
+    previous values stay active and the error is kept in reload_error.
 """
 
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import yaml
 import re
 
+# ${thresholds.key} placeholder
+_PLACEHOLDER = re.compile(r'\$\{thresholds\.([a-z_0-9]+)\}')
+
 
 class ThresholdManager:
     """Manage configurable thresholds for playbooks."""
@@ -49,7 +67,10 @@ class ThresholdManager:
             config_path = Path(__file__).parent.parent.parent.parent.parent / 'domain' / 'config' / 'playbook_thresholds.yaml'
 
         self.config_path = config_path
-        self.thresholds = self._load_thresholds()
+        self.generation = 0
+        self.reload_error: Optional[str] = None
+        self._stamp = self._stat()
+        self._apply(self._load_thresholds())
 
     def _load_thresholds(self) -> Dict[str, Any]:
         """Load thresholds from YAML config."""
@@ -59,6 +80,62 @@ class ThresholdManager:
         with open(self.config_path, 'r') as f:
             return yaml.safe_load(f)
 
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.config_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _apply(self, thresholds: Dict[str, Any]) -> None:
+        """Install a config: flatten per-playbook tables, start a new generation."""
+        self.thresholds = thresholds or {}
+        global_thresholds = self.thresholds.get('global_thresholds') or {}
+        self._global = dict(global_thresholds)
+        self._tables: Dict[str, Dict[str, Any]] = {
+            key: {**global_thresholds, **section}
+            for key, section in self.thresholds.items()
+            if key != 'global_thresholds' and isinstance(section, dict)
+        }
+        self._substituted: Dict[Tuple[str, str], str] = {}
+        self.generation += 1
+
+    # ── Hot reload ───────────────────────────────────────────────────────
+
+    def refresh(self) -> bool:
+        """
+        Reload the config if the file changed since it was last read.
+
+        Returns:
+            True if a new generation was applied
+        """
+        stamp = self._stat()
+        if stamp == self._stamp or stamp is None:
+            return False
+        self._stamp = stamp
+        try:
+            thresholds = self._load_thresholds()
+            if thresholds is not None and not isinstance(thresholds, dict):
+                raise ValueError("Threshold config must be a mapping")
+        except (OSError, yaml.YAMLError, ValueError) as e:
+            self.reload_error = str(e)
+            return False
+        self.reload_error = None
+        self._apply(thresholds)
+        return True
+
+    # ── Lookup ───────────────────────────────────────────────────────────
+
+    def table(self, playbook_id: str) -> Dict[str, Any]:
+        """Resolved thresholds of a playbook (global values overlaid with its section)."""
+        table = self._tables.get(playbook_id)
+        if table is None:
+            section = self._section_for(playbook_id)
+            table = self._tables.get(section, self._global)
+            # Memoize bare IDs (PB_201 -> PB_201_swot) and unknown ones alike
+            self._tables[playbook_id] = table
+        return table
+
     def get(self, playbook_id: str, threshold_key: str) -> Any:
         """
         Get threshold value for playbook.
@@ -73,19 +150,33 @@ class ThresholdManager:
         Raises:
             KeyError: If playbook or threshold key not found
         """
-        # Try playbook-specific thresholds
-        if playbook_id in self.thresholds:
-            if threshold_key in self.thresholds[playbook_id]:
-                return self.thresholds[playbook_id][threshold_key]
-
-        # Try global thresholds
-        if 'global_thresholds' in self.thresholds:
-            if threshold_key in self.thresholds['global_thresholds']:
-                return self.thresholds['global_thresholds'][threshold_key]
-
+        table = self.table(playbook_id)
+        if threshold_key in table:
+            return table[threshold_key]
         raise KeyError(f"Threshold not found: {playbook_id}.{threshold_key}")
 
-    def substitute_condition(self, condition: str, playbook_id: str) -> str:
+    def _section_for(self, playbook_id: str):
+        """
+        Config section for a playbook.
+
+        Sections are keyed by ID plus name (PB_201_swot) while the engine
+        passes bare IDs (PB_201), so an exact key wins and otherwise the
+        section whose key starts with "<playbook_id>_" is used.
+        """
+        if playbook_id in self.thresholds:
+            return playbook_id
+        prefix = f"{playbook_id}_"
+        for key in self.thresholds:
+            if key.startswith(prefix) and isinstance(self.thresholds[key], dict):
+                return key
+        return None
+
+    def substitute_condition(
+        self,
+        condition: str,
+        playbook_id: str,
+        overrides: Dict[str, Any] = None
+    ) -> str:
         """
         Substitute ${thresholds.key} placeholders in condition.
 
@@ -94,27 +185,32 @@ class ThresholdManager:
                 Example: "$.horizon_1.arr_percentage > ${thresholds.horizon_1_concentration_max}"
 
             playbook_id: Playbook ID for threshold lookup
+            overrides: Values used instead of the configured ones for these keys
 
         Returns:
             Condition with placeholders replaced by actual values
                 Example: "$.horizon_1.arr_percentage > 0.80"
         """
-        # Find all ${thresholds.xxx} patterns
-        pattern = r'\$\{thresholds\.([a-z_0-9]+)\}'
-        matches = re.findall(pattern, condition)
-
-        # Replace each placeholder
-        result = condition
-        for threshold_key in matches:
-            try:
-                value = self.get(playbook_id, threshold_key)
-                placeholder = f'${{thresholds.{threshold_key}}}'
-                result = result.replace(placeholder, str(value))
-            except KeyError:
-                # Leave placeholder if threshold not found (will fail during evaluation)
-                pass
-
-        return result
+        if not overrides:
+            memo_key = (playbook_id, condition)
+            result = self._substituted.get(memo_key)
+            if result is None:
+                result = self._substitute(condition, self.table(playbook_id))
+                self._substituted[memo_key] = result
+            return result
+        return self._substitute(condition, {**self.table(playbook_id), **overrides})
+
+    @staticmethod
+    def _substitute(condition: str, values: Dict[str, Any]) -> str:
+        if '${' not in condition:
+            return condition
+
+        def replace(match):
+            # Leave placeholder if threshold not found (will fail during evaluation)
+            key = match.group(1)
+            return str(values[key]) if key in values else match.group(0)
+
+        return _PLACEHOLDER.sub(replace, condition)
 
     def inject_into_context(self, context: Dict[str, Any], playbook_id: str) -> Dict[str, Any]:
         """
@@ -130,20 +226,9 @@ class ThresholdManager:
         Returns:
             Context with thresholds injected
         """
-        # Get playbook-specific thresholds
-        playbook_thresholds = {}
-        if playbook_id in self.thresholds:
-            playbook_thresholds = self.thresholds[playbook_id].copy()
-
-        # Merge with global thresholds (playbook-specific takes precedence)
-        if 'global_thresholds' in self.thresholds:
-            for key, value in self.thresholds['global_thresholds'].items():
-                if key not in playbook_thresholds:
-                    playbook_thresholds[key] = value
-
-        # Inject into context
+        # Playbook-specific thresholds take precedence over global ones
         context_with_thresholds = context.copy()
-        context_with_thresholds['thresholds'] = playbook_thresholds
+        context_with_thresholds['thresholds'] = dict(self.table(playbook_id))
 
         return context_with_thresholds
 
@@ -157,14 +242,4 @@ class ThresholdManager:
         Returns:
             Dict of all applicable thresholds
         """
-        all_thresholds = {}
-
-        # Start with global
-        if 'global_thresholds' in self.thresholds:
-            all_thresholds.update(self.thresholds['global_thresholds'])
-
-        # Override with playbook-specific
-        if playbook_id in self.thresholds:
-            all_thresholds.update(self.thresholds[playbook_id])
-
-        return all_thresholds
+        return dict(self.table(playbook_id))
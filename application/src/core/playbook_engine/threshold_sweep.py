@@ -0,0 +1,177 @@
+"""
+Threshold Sweep - What-if analysis for playbook rule thresholds
+
+Business owners tune domain/config/playbook_thresholds.yaml by trial and
+error. A sweep evaluates one rule for a grid of values of one threshold
+across a set of node contexts in a single pass, and returns how many nodes
+fire at each value.
+
+How it works:
+    The swept ${thresholds.key} placeholder is substituted with a reserved
+    JSONPath operand; all other placeholders get their configured values.
+    The condition is compiled once, node fields are extracted into columns
+    once, and the swept operand becomes a (V, 1) column, so every
+    comparison broadcasts to a (values x nodes) boolean matrix.
+
+Usage:
+    sweep = ThresholdSweep(ThresholdManager())
+    result = sweep.sweep_rule(playbook, 'defensive_posture_required',
+                              'PB_201_swot', 'high_threat_count',
+                              values=range(0, 10), contexts=contexts)
+    result.firing_counts     # array([500, 431, ...])
+    result.curve()           # [{'value': 0, 'firing': 500, 'errors': 0}, ...]
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .bulk_evaluator import BulkEvaluator, Column, ContextFrame
+from .dll_evaluator import CompiledPath, DLLEvaluator
+from .threshold_manager import ThresholdManager
+
+# Reserved operand the swept placeholder is replaced with
+SWEEP_PATH = '$.__threshold_sweep__'
+
+
+class SweepFrame(ContextFrame):
+    """ContextFrame whose results gain a leading threshold-value axis."""
+
+    def __init__(self, contexts: Dict[str, Dict[str, Any]], values: List[Any]):
+        super().__init__(contexts)
+        self.sweep_values = values
+        self._sweep_column = Column(values, axis='sweep')
+
+    @classmethod
+    def from_frame(cls, frame: ContextFrame, values: List[Any]) -> 'SweepFrame':
+        """Reuse a frame's extracted columns for a new grid of values."""
+        sweep_frame = cls.__new__(cls)
+        sweep_frame.__dict__.update(frame.__dict__)
+        sweep_frame.sweep_values = values
+        sweep_frame._sweep_column = Column(values, axis='sweep')
+        return sweep_frame
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return (len(self.sweep_values), len(self.node_ids))
+
+    def raw(self, path: CompiledPath) -> List[Any]:
+        if path.base_expr == SWEEP_PATH:
+            raise ValueError("Swept threshold can only be used as a comparison operand")
+        return super().raw(path)
+
+    def column(self, path: CompiledPath) -> Column:
+        if path.expr == SWEEP_PATH:
+            return self._sweep_column
+        return super().column(path)
+
+
+@dataclass
+class SweepResult:
+    """Firing curve of one condition over a grid of threshold values."""
+
+    condition: str
+    threshold_key: str
+    values: List[Any]
+    node_ids: List[str]
+    firing: np.ndarray          # (values x nodes) bool
+    errors: np.ndarray          # (values x nodes) bool
+
+    @property
+    def firing_counts(self) -> np.ndarray:
+        return self.firing.sum(axis=1)
+
+    @property
+    def error_counts(self) -> np.ndarray:
+        return self.errors.sum(axis=1)
+
+    def firing_nodes(self, value: Any) -> List[str]:
+        """Nodes that fire at one swept value."""
+        row = self.values.index(value)
+        return [self.node_ids[i] for i in np.flatnonzero(self.firing[row])]
+
+    def curve(self) -> List[Dict[str, Any]]:
+        """Firing and error counts per value, in grid order."""
+        return [
+            {'value': value, 'firing': int(firing), 'errors': int(errors)}
+            for value, firing, errors in zip(self.values, self.firing_counts, self.error_counts)
+        ]
+
+
+class ThresholdSweep:
+    """Evaluate rules for many threshold values at once."""
+
+    def __init__(self, threshold_manager: ThresholdManager, evaluator: Optional[DLLEvaluator] = None):
+        self.threshold_manager = threshold_manager
+        self.bulk = BulkEvaluator(evaluator, threshold_manager)
+
+    def sweep(
+        self,
+        condition: str,
+        playbook_id: str,
+        threshold_key: str,
+        values: Iterable[Any],
+        contexts: Any
+    ) -> SweepResult:
+        """
+        Sweep one threshold of a condition over a grid of values.
+
+        Args:
+            condition: DLL condition with ${thresholds.xxx} placeholders
+            playbook_id: Threshold section used for the other placeholders
+            threshold_key: Placeholder to sweep
+            values: Grid of values (e.g. range(...) or numpy.linspace(...))
+            contexts: node_id -> context dict, or a ContextFrame to reuse
+                its extracted columns across sweeps
+
+        Raises:
+            ValueError: If the condition does not reference threshold_key,
+                or its syntax is invalid
+        """
+        if f'${{thresholds.{threshold_key}}}' not in condition:
+            raise ValueError(f"Condition does not reference thresholds.{threshold_key}: {condition}")
+
+        grid = [_plain(value) for value in values]
+        substituted = self.threshold_manager.substitute_condition(
+            condition, playbook_id, overrides={threshold_key: SWEEP_PATH}
+        )
+        if isinstance(contexts, ContextFrame):
+            frame = SweepFrame.from_frame(contexts, grid)
+        else:
+            frame = SweepFrame(contexts, grid)
+
+        values_mask, (error_mask, _) = self.bulk.evaluate_masks(substituted, frame)
+        return SweepResult(
+            condition=substituted,
+            threshold_key=threshold_key,
+            values=grid,
+            node_ids=frame.node_ids,
+            firing=values_mask & ~error_mask,
+            errors=error_mask
+        )
+
+    def sweep_rule(
+        self,
+        playbook: Dict[str, Any],
+        rule_id: str,
+        playbook_id: str,
+        threshold_key: str,
+        values: Iterable[Any],
+        contexts: Any
+    ) -> SweepResult:
+        """
+        Sweep a threshold for one decision rule of a loaded playbook.
+
+        Raises:
+            KeyError: If the playbook has no rule with rule_id
+        """
+        for rule in playbook.get('decision_logic', {}).get('rules', []):
+            if rule.get('id') == rule_id:
+                return self.sweep(rule.get('condition', ''), playbook_id, threshold_key, values, contexts)
+        raise KeyError(f"Rule not found: {rule_id}")
+
+
+def _plain(value: Any) -> Any:
+    """Unbox NumPy scalars so per-node fallbacks compare Python values."""
+    return value.item() if isinstance(value, np.generic) else value
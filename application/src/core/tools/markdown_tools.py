@@ -10,10 +10,105 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 
-def parse_markdown_with_frontmatter(file_path: Path) -> Dict[str, Any]:
+# Frontmatter reads stop at the closing delimiter; these bound the work done
+_READ_BUFFER_BYTES = 8192
+_MAX_LINE_BYTES = 8192
+_MAX_FRONTMATTER_BYTES = 64 * 1024
+_LEADING_BLANK_LINES = re.compile(r'\A\s*\n')
+# Same block as the header reader finds, matched against the whole file
+_FRONTMATTER_BLOCK = re.compile(rb'\A---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+
+def _read_frontmatter_block(file_path: Path) -> Optional[tuple]:
+    """
+    Read the raw YAML frontmatter block without touching the body.
+
+    Frontmatter with a line over _MAX_LINE_BYTES, or larger than
+    _MAX_FRONTMATTER_BYTES, is found by reading the whole file instead.
+
+    Returns:
+        (frontmatter_text, body_offset) or None if the file has no frontmatter
+    """
+    with open(file_path, 'rb', buffering=_READ_BUFFER_BYTES) as f:
+        if f.readline(_MAX_LINE_BYTES).rstrip() != b'---':
+            return None
+        lines = []
+        size = 0
+        while True:
+            line = f.readline(_MAX_LINE_BYTES)
+            if not line.endswith(b'\n'):
+                # Over-long line, or EOF before the closing delimiter
+                return _match_frontmatter_block(f)
+            if line.rstrip() == b'---':
+                return b''.join(lines).decode('utf-8'), f.tell()
+            size += len(line)
+            if size > _MAX_FRONTMATTER_BYTES:
+                return _match_frontmatter_block(f)
+            lines.append(line)
+
+
+def _match_frontmatter_block(f) -> Optional[tuple]:
+    """Full-read fallback of _read_frontmatter_block."""
+    f.seek(0)
+    match = _FRONTMATTER_BLOCK.match(f.read())
+    if not match:
+        return None
+    return match.group(1).decode('utf-8'), match.end()
+
+
+def _load_frontmatter(frontmatter_str: str) -> Dict[str, Any]:
+    try:
+        frontmatter = yaml.safe_load(frontmatter_str)
+    except yaml.YAMLError:
+        return {}
+    return frontmatter if isinstance(frontmatter, dict) else {}
+
+
+class LazyMarkdownDocument(dict):
+    """
+    Parsed markdown dict whose 'content' is read from disk on first access.
+
+    Behaves like the dict returned by parse_markdown_with_frontmatter; the
+    body is loaded by doc['content'] or doc.get('content').
+    """
+
+    def __init__(self, data: Dict[str, Any], file_path: Path, body_offset: int):
+        super().__init__(data)
+        self._file_path = file_path
+        self._body_offset = body_offset
+
+    def __missing__(self, key):
+        if key != 'content':
+            raise KeyError(key)
+        with open(self._file_path, 'rb') as f:
+            f.seek(self._body_offset)
+            # Same newline handling as reading in text mode
+            content = f.read().decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        if self._body_offset:
+            # Blank lines right after the closing delimiter are not part of the body
+            content = _LEADING_BLANK_LINES.sub('', '\n' + content)
+        self['content'] = content
+        return content
+
+    def get(self, key, default=None):
+        if key == 'content':
+            return self['content']
+        return super().get(key, default)
+
+    @property
+    def content_loaded(self) -> bool:
+        return dict.__contains__(self, 'content')
+
+
+def parse_markdown_with_frontmatter(file_path: Path, lazy_content: bool = False) -> Dict[str, Any]:
     """
     Parse a markdown file with YAML frontmatter
 
+    Args:
+        file_path: Markdown file to read
+        lazy_content: Only read the frontmatter now; the body is loaded on
+            first access to 'content' (see LazyMarkdownDocument)
+
     Returns:
         {
             'frontmatter': dict of YAML data,
@@ -21,36 +116,30 @@ def parse_markdown_with_frontmatter(file_path: Path) -> Dict[str, Any]:
             'tags': list of tags from frontmatter
         }
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    block = _read_frontmatter_block(file_path)
 
-    # Extract frontmatter
-    frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n(.*)$', content, re.DOTALL)
-
-    if frontmatter_match:
-        frontmatter_str = frontmatter_match.group(1)
-        markdown_content = frontmatter_match.group(2)
-
-        try:
-            frontmatter = yaml.safe_load(frontmatter_str)
-        except yaml.YAMLError:
-            frontmatter = {}
+    if block:
+        frontmatter = _load_frontmatter(block[0])
+        body_offset = block[1]
     else:
         frontmatter = {}
-        markdown_content = content
+        body_offset = 0
 
     # Extract tags
     tags = frontmatter.get('tags', [])
     if isinstance(tags, str):
         tags = [tags]
 
-    return {
+    parsed = LazyMarkdownDocument({
         'frontmatter': frontmatter,
-        'content': markdown_content,
         'tags': tags,
         'file_path': str(file_path),
         'file_name': file_path.name
-    }
+    }, file_path, body_offset)
+
+    if lazy_content:
+        return parsed
+    return {**parsed, 'content': parsed['content']}
 
 
 def extract_date_from_filename(filename: str) -> Optional[str]:
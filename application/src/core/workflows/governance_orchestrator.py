@@ -15,6 +15,8 @@ from datetime import datetime
 from pathlib import Path
 import json
 
+from ..orchestration.audit_writer import AuditWriter, shared_writer
+
 
 class WorkflowStatus(Enum):
     """Workflow execution states."""
@@ -82,14 +84,16 @@ class GovernanceOrchestrator:
     - Maintain audit trail for compliance
     """
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, audit_writer: Optional[AuditWriter] = None):
         """
         Initialize orchestrator.
 
         Args:
             output_dir: Directory for workflow execution logs
+            audit_writer: Writer for audit appends (default: shared per_event writer)
         """
         self.output_dir = output_dir
+        self.audit_writer = audit_writer or shared_writer()
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.active_workflows: Dict[str, GovernanceWorkflow] = {}
         self.step_handlers: Dict[StepType, Callable] = {}
@@ -256,8 +260,7 @@ class GovernanceOrchestrator:
             "event_type": event_type,
             **data
         }
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(event) + '\n')
+        self.audit_writer.append(log_file, (json.dumps(event) + '\n').encode())
 
 
 # Pre-defined governance workflow templates
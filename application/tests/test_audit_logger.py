@@ -0,0 +1,266 @@
+"""
+Tests for the audit logger's sidecar indexes
+
+Validates:
+- Every append writes an index row pointing at the event's bytes
+- Queries filter through the indexes, newest-first, honouring limit and dates
+- Logs without (or with damaged or lagging) sidecars are indexed on first use
+- Appends by another logger instance are seen by cached indexes
+- Concurrent logging and querying index every event exactly once
+- Events are hash-chained across days; edits, removals and missing days are detected
+- Verification resumes from signed checkpoints
+"""
+
+import json
+import threading
+from dataclasses import asdict
+
+import pytest
+
+from core.orchestration import audit_logger as audit_module
+from core.orchestration.audit_logger import AuditEvent, AuditLogger, GENESIS_HASH, event_hash
+
+
+def _write_day(audit_path, date, events):
+    """A past day's log written without a sidecar (as by older versions)."""
+    with open(audit_path / f"{date}.jsonl", 'w') as f:
+        for i, (event_type, actor, entity) in enumerate(events):
+            event = AuditEvent(
+                timestamp=f"{date}T00:00:{i:02d}Z", event_type=event_type, actor=actor,
+                entity=entity, entity_type="process", details={"i": i},
+                conflicts_detected=[], resolution=None,
+            )
+            f.write(json.dumps(asdict(event)) + "\n")
+
+
+def _write_chained_days(audit_path, dates, per_day=3):
+    """Chained logs for past days, as log_event writes them."""
+    head = GENESIS_HASH
+    for date in dates:
+        with open(audit_path / f"{date}.jsonl", 'w') as f:
+            for i in range(per_day):
+                event = AuditEvent(
+                    timestamp=f"{date}T00:00:{i:02d}Z", event_type="process_updated", actor="a",
+                    entity="P1", entity_type="process", details={"i": i},
+                    conflicts_detected=[], resolution=None, prev_hash=head,
+                )
+                event.hash = head = event_hash(vars(event))
+                f.write(json.dumps(vars(event)) + "\n")
+
+
+def _drop_line(log_file, number):
+    lines = log_file.read_bytes().splitlines(keepends=True)
+    log_file.write_bytes(b"".join(lines[:number - 1] + lines[number:]))
+
+
+@pytest.fixture
+def logger(tmp_path):
+    return AuditLogger(tmp_path / "audit")
+
+
+class TestSidecar:
+    """Index rows written at append time."""
+
+    def test_rows_point_at_events(self, logger):
+        logger.log_event("process_created", "human:ceo", entity="PROC_1")
+        logger.log_event("process_updated", "sa_agent", entity="PROC_2")
+        log_file = logger._get_log_file()
+        rows = [json.loads(line) for line in log_file.with_suffix(".idx").read_text().splitlines()]
+        assert [row[2:] for row in rows] == [
+            ["process_created", "human:ceo", "PROC_1"],
+            ["process_updated", "sa_agent", "PROC_2"],
+        ]
+        data = log_file.read_bytes()
+        for offset, length, *_ in rows:
+            assert json.loads(data[offset:offset + length])["checksum"]
+
+
+class TestQueries:
+    """Indexed queries."""
+
+    def test_filters_newest_first(self, logger):
+        for i in range(5):
+            logger.log_event("process_created", "human:ceo", entity=f"PROC_{i % 2}", details={"i": i})
+        logger.log_event("conflict_detected", "orchestration_agent", entity="PROC_0")
+
+        history = logger.get_entity_history("PROC_0")
+        assert [e["details"].get("i") for e in history] == [None, 4, 2, 0]
+        assert len(logger.query_events(event_type="process_created", limit=2)) == 2
+        assert [e["details"]["i"] for e in logger.query_events(event_type="process_created", entity="PROC_1")] == [3, 1]
+        assert logger.query_events(actor="nobody") == []
+        assert [e["details"].get("i") for e in logger.query_events(entity="PROC_0", newest_first=False)] == [0, 2, 4, None]
+
+    def test_days_and_date_range(self, logger):
+        _write_day(logger.audit_path, "2026-01-01", [("process_created", "a", "P1"), ("process_updated", "b", "P1")])
+        _write_day(logger.audit_path, "2026-01-02", [("process_created", "a", "P2"), ("process_updated", "a", "P1")])
+        assert [e["timestamp"] for e in logger.get_entity_history("P1")] == [
+            "2026-01-02T00:00:01Z", "2026-01-01T00:00:01Z", "2026-01-01T00:00:00Z",
+        ]
+        assert len(logger.query_events(actor="a", start_date="2026-01-02", end_date="2026-01-02")) == 2
+        assert logger.query_events(entity="P2", end_date="2026-01-01") == []
+        # Sidecars were built for the older logs
+        assert (logger.audit_path / "2026-01-01.idx").exists()
+
+    def test_entity_type_filter(self, logger):
+        logger.log_event("process_created", "a", entity="X", entity_type="process")
+        logger.log_event("agent_created", "a", entity="X", entity_type="agent")
+        assert [e["event_type"] for e in logger.get_entity_history("X", entity_type="agent")] == ["agent_created"]
+
+
+class TestRepair:
+    """Sidecars that are missing, damaged or behind the log."""
+
+    def test_lagging_sidecar_is_extended(self, logger):
+        logger.log_event("process_created", "a", entity="P1")
+        log_file = logger._get_log_file()
+        with open(log_file, 'a') as f:      # appended without an index row
+            f.write(log_file.read_text())
+        assert len(logger.get_entity_history("P1")) == 2
+        assert len(log_file.with_suffix(".idx").read_text().splitlines()) == 2
+
+    def test_damaged_sidecar_is_rebuilt(self, logger):
+        logger.log_event("process_created", "a", entity="P1")
+        logger._get_log_file().with_suffix(".idx").write_text("garbage\n")
+        assert len(AuditLogger(logger.audit_path).get_entity_history("P1")) == 1
+
+    def test_other_instances_appends_are_seen(self, logger):
+        logger.log_event("process_created", "a", entity="P1")
+        assert len(logger.get_entity_history("P1")) == 1
+        AuditLogger(logger.audit_path).log_event("process_updated", "b", entity="P1")
+        assert [e["event_type"] for e in logger.get_entity_history("P1")] == ["process_updated", "process_created"]
+
+    def test_duplicate_sidecar_rows_are_ignored(self, logger):
+        logger.log_event("process_created", "a", entity="P1")
+        sidecar = logger._get_log_file().with_suffix(".idx")
+        sidecar.write_text(sidecar.read_text() * 2)
+        assert len(AuditLogger(logger.audit_path).get_entity_history("P1")) == 1
+
+    def test_concurrent_log_and_query(self, logger):
+        count = 1000
+        done = threading.Event()
+        errors = []
+
+        def query():
+            while not done.is_set():
+                try:
+                    logger.query_events(limit=5)
+                except Exception as e:      # surfaced below
+                    errors.append(e)
+
+        reader = threading.Thread(target=query)
+        reader.start()
+        try:
+            for i in range(count):
+                logger.log_event("process_updated", "a", entity="P1", details={"i": i})
+        finally:
+            done.set()
+            reader.join()
+
+        assert errors == []
+        events = AuditLogger(logger.audit_path).query_events(limit=count * 2)
+        assert sorted(e["details"]["i"] for e in events) == list(range(count))
+        rows = logger._get_log_file().with_suffix(".idx").read_text().splitlines()
+        assert len(rows) == count
+
+    def test_integrity_still_verifies(self, logger):
+        logger.log_event("process_created", "a", entity="P1", details={"k": 1})
+        result = logger.verify_integrity()
+        assert result["valid_events"] == 1 and result["invalid_events"] == 0
+
+
+class TestHashChain:
+    """Events chained through prev_hash."""
+
+    def test_events_chain(self, logger):
+        for i in range(3):
+            logger.log_event("process_created", "a", entity=f"P{i}")
+        events = logger.query_events(newest_first=False)
+        assert events[0]["prev_hash"] == GENESIS_HASH
+        assert [e["prev_hash"] for e in events[1:]] == [e["hash"] for e in events[:-1]]
+        assert all(event_hash(e) == e["hash"] for e in events)
+        result = logger.verify_integrity()
+        assert result["errors"] == [] and result["valid_events"] == 3
+
+    def test_chain_continues_in_a_new_process(self, logger):
+        logger.log_event("process_created", "a", entity="P1")
+        audit_module._chains.clear()        # as if another process started
+        AuditLogger(logger.audit_path).log_event("process_updated", "a", entity="P1")
+        assert logger.verify_integrity(full=True)["errors"] == []
+
+    def test_edits_and_removals_are_detected(self, logger):
+        for i in range(4):
+            logger.log_event("process_created", "a", entity=f"P{i}", details={"i": i})
+        log_file = logger._get_log_file()
+        _drop_line(log_file, 2)
+        assert "Line 2: Chain broken" in logger.verify_integrity(full=True)["errors"][0]
+
+        log_file.write_text(log_file.read_text().replace('"P3"', '"P9"'))
+        errors = logger.verify_integrity(full=True)["errors"]
+        assert any("Line 3: Hash mismatch" in error for error in errors)
+
+
+class TestCheckpoints:
+    """Signed checkpoints and incremental verification."""
+
+    @pytest.fixture
+    def signed(self, tmp_path):
+        return AuditLogger(tmp_path / "audit", checkpoint_key=b"secret", checkpoint_every=5)
+
+    def test_verification_resumes_from_checkpoints(self, signed):
+        for i in range(12):
+            signed.log_event("process_created", "a", entity=f"P{i}")
+        first = signed.verify_integrity()
+        assert (first["resumed_from"], first["total_events"], first["errors"]) == (10, 12, [])
+        # The clean verification checkpointed the end of the log
+        assert signed.verify_integrity()["resumed_from"] == 12
+        signed.log_event("process_created", "a", entity="P12")
+        result = signed.verify_integrity()
+        assert (result["resumed_from"], result["total_events"], result["errors"]) == (12, 13, [])
+
+    def test_truncation_is_detected(self, signed):
+        for i in range(6):
+            signed.log_event("process_created", "a", entity=f"P{i}")
+        _drop_line(signed._get_log_file(), 6)
+        _drop_line(signed._get_log_file(), 5)
+        errors = signed.verify_integrity()["errors"]
+        assert errors == ["Checkpoint at event 5: no matching event in the log (truncated?)"]
+
+    def test_signatures(self, signed):
+        for i in range(5):
+            signed.log_event("process_created", "a", entity=f"P{i}")
+        checkpoints = signed._checkpoint_file(signed._get_log_file())
+        row = json.loads(checkpoints.read_text())
+
+        # Without the key, signed checkpoints are not trusted
+        unkeyed = AuditLogger(signed.audit_path)
+        assert unkeyed.verify_integrity()["resumed_from"] == 0
+
+        row["events"] = 4
+        checkpoints.write_text(json.dumps(row) + "\n")
+        result = signed.verify_integrity()
+        assert result["errors"] == ["Checkpoint 1: invalid signature"]
+        assert result["resumed_from"] == 0
+
+
+class TestVerifyRange:
+    """Multi-day verification."""
+
+    DATES = ["2026-01-01", "2026-01-02", "2026-01-03", "2026-01-04"]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_days_link(self, logger, max_workers):
+        _write_chained_days(logger.audit_path, self.DATES)
+        result = logger.verify_range(max_workers=max_workers)
+        assert result["valid"] and result["total_events"] == 12 and result["checked_events"] == 12
+        assert logger.verify_range(max_workers=max_workers)["checked_events"] == 0
+
+    def test_missing_day_is_detected(self, logger):
+        _write_chained_days(logger.audit_path, self.DATES)
+        (logger.audit_path / "2026-01-03.jsonl").unlink()
+        result = logger.verify_range(max_workers=1)
+        assert result["errors"] == ["2026-01-04: does not continue the chain of 2026-01-02 (events or days missing)"]
+
+    def test_date_range(self, logger):
+        _write_chained_days(logger.audit_path, self.DATES)
+        result = logger.verify_range(start_date="2026-01-02", end_date="2026-01-03", max_workers=1)
+        assert list(result["days"]) == ["2026-01-02", "2026-01-03"] and result["valid"]
@@ -0,0 +1,195 @@
+"""
+Tests for the shared audit writer
+
+Validates:
+- per_event appends are visible immediately and report their offsets
+- interval appends are group-committed by the flush thread, in order
+- flush() and close() drain the queue
+- A failed batch requeues only the files it did not write
+- Files removed or replaced by others are reopened
+- Failing on_write callbacks are retried, never dropped or re-written
+- AuditLogger indexes events written through a buffered writer
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from core.orchestration import OrchestrationAgent
+from core.orchestration.audit_logger import AuditLogger
+from core.orchestration.audit_writer import AuditWriter
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    return tmp_path / "audit.jsonl"
+
+
+class TestPerEvent:
+    """Default policy: written before append() returns."""
+
+    def test_visible_immediately_with_offsets(self, log_file):
+        written = []
+        with AuditWriter() as writer:
+            writer.append(log_file, b"first\n", on_write=lambda p, r: written.extend(r), meta="a")
+            assert log_file.read_bytes() == b"first\n"
+            writer.append(log_file, b"second\n", on_write=lambda p, r: written.extend(r), meta="b")
+        assert written == [(0, 6, "a"), (6, 7, "b")]
+
+    def test_offsets_account_for_other_appenders(self, log_file):
+        log_file.write_bytes(b"")
+        with AuditWriter() as writer:
+            writer.append(log_file, b"mine\n")
+            with open(log_file, 'ab') as f:
+                f.write(b"theirs\n")
+            assert writer.write(log_file, b"again\n") == 12
+
+    def test_replaced_file_is_reopened(self, log_file):
+        with AuditWriter() as writer:
+            writer.append(log_file, b"old\n")
+            os.unlink(log_file)
+            writer.append(log_file, b"new\n")
+        assert log_file.read_bytes() == b"new\n"
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            AuditWriter(policy="never")
+
+
+class TestInterval:
+    """Buffered policy with group commit."""
+
+    def test_flush_thread_group_commits_in_order(self, log_file):
+        batches = []
+        with AuditWriter(policy="interval", interval_ms=10, fsync=True) as writer:
+            for i in range(50):
+                writer.append(log_file, f"{i}\n".encode(), on_write=lambda p, r: batches.append(r), meta=i)
+            deadline = time.monotonic() + 5
+            while sum(map(len, batches)) < 50 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert writer.batches < 50
+        assert log_file.read_text().split() == [str(i) for i in range(50)]
+        records = [record for batch in batches for record in batch]
+        assert [meta for _, _, meta in records] == list(range(50))
+
+    def test_flush_and_close_drain(self, log_file):
+        writer = AuditWriter(policy="interval", interval_ms=60000)
+        writer.append(log_file, b"a\n")
+        writer.flush()
+        assert log_file.read_bytes() == b"a\n"
+        writer.append(log_file, b"b\n")
+        writer.close()
+        assert log_file.read_bytes() == b"a\nb\n"
+        with pytest.raises(ValueError):
+            writer.append(log_file, b"c\n")
+
+    def test_max_batch_triggers_flush(self, log_file):
+        with AuditWriter(policy="interval", interval_ms=60000, max_batch=5) as writer:
+            for i in range(5):
+                writer.append(log_file, b"x\n")
+            deadline = time.monotonic() + 5
+            while not log_file.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert log_file.read_bytes() == b"x\n" * 5
+
+
+    def test_failed_file_does_not_rewrite_others(self, tmp_path):
+        good = tmp_path / "d" / "a.jsonl"
+        bad = tmp_path / "missing" / "b.jsonl"
+        good.parent.mkdir()
+        seen = []
+        with AuditWriter(policy="interval", interval_ms=60000) as writer:
+            writer.append(good, b"line-a\n", on_write=lambda p, r: seen.append(p), meta="a")
+            writer.append(bad, b"line-b\n", on_write=lambda p, r: seen.append(p), meta="b")
+            for _ in range(3):
+                with pytest.raises(OSError):
+                    writer.flush()
+            bad.parent.mkdir()
+            writer.flush()
+        assert good.read_bytes() == b"line-a\n"
+        assert bad.read_bytes() == b"line-b\n"
+        assert seen == [good, bad]
+
+    def test_failed_fsync_is_not_rewritten(self, log_file, monkeypatch):
+        real_fsync = os.fsync
+        failures = [1]
+
+        def flaky_fsync(fd):
+            if failures:
+                failures.pop()
+                raise OSError("fsync failed")
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", flaky_fsync)
+        with AuditWriter(policy="interval", interval_ms=60000, fsync=True) as writer:
+            writer.append(log_file, b"a\n")
+            with pytest.raises(OSError):
+                writer.flush()
+            writer.append(log_file, b"b\n")
+            writer.flush()
+        assert log_file.read_bytes() == b"a\nb\n"
+
+class TestCallbackFailures:
+    """A raising on_write neither loses its records nor repeats the write."""
+
+    @staticmethod
+    def _flaky(failures):
+        seen = []
+
+        def on_write(path, records):
+            if failures:
+                failures.pop()
+                raise OSError("sidecar unavailable")
+            seen.extend(meta for _, _, meta in records)
+
+        return on_write, seen
+
+    @pytest.mark.parametrize("policy", ["per_event", "interval"])
+    def test_failed_callback_is_retried(self, log_file, policy):
+        on_write, seen = self._flaky([1])
+        with AuditWriter(policy=policy, interval_ms=60000) as writer:
+            writer.append(log_file, b"a\n", on_write=on_write, meta="a")
+            if policy == "interval":
+                with pytest.raises(OSError):
+                    writer.flush()
+            else:
+                assert isinstance(writer.error, OSError)
+            writer.append(log_file, b"b\n", on_write=on_write, meta="b")
+            writer.flush()
+        assert seen == ["a", "b"]
+        assert log_file.read_bytes() == b"a\nb\n"
+
+    def test_flush_raises_while_callback_keeps_failing(self, log_file):
+        on_write, seen = self._flaky([1, 1])
+        writer = AuditWriter()
+        writer.append(log_file, b"a\n", on_write=on_write, meta="a")
+        with pytest.raises(OSError):
+            writer.flush()
+        writer.close()
+        assert seen == ["a"]
+        assert log_file.read_bytes() == b"a\n"
+
+
+class TestAuditLoggerIntegration:
+    """Buffered events are indexed and visible to queries."""
+
+    def test_buffered_events_are_indexed(self, tmp_path):
+        with AuditWriter(policy="interval", interval_ms=60000) as writer:
+            logger = AuditLogger(tmp_path / "audit", writer=writer)
+            for i in range(10):
+                logger.log_event("process_created", "a", entity=f"P{i % 3}", details={"i": i})
+            assert [e["details"]["i"] for e in logger.get_entity_history("P1")] == [7, 4, 1]
+            sidecar = logger._get_log_file().with_suffix(".idx")
+            rows = [json.loads(line) for line in sidecar.read_text().splitlines()]
+            data = logger._get_log_file().read_bytes()
+            assert [json.loads(data[o:o + n])["entity"] for o, n, *_ in rows] == [r[4] for r in rows]
+
+    def test_orchestration_agent_uses_given_writer(self, tmp_path):
+        with AuditWriter(policy="interval", interval_ms=60000) as writer:
+            agent = OrchestrationAgent(tmp_path / "registry", audit_writer=writer)
+            assert agent.audit_logger.writer is writer
+            agent.audit_logger.log_event("process_created", "a", entity="P1")
+            assert not agent.audit_logger._get_log_file().exists()
+            assert len(agent.audit_logger.get_entity_history("P1")) == 1
@@ -0,0 +1,111 @@
+"""
+Tests for BatchExecutor and node context loading
+
+Validates:
+- Node vault files map to the documented context layout
+- Batch runs complete on a process pool with unique run directories
+- At most max_per_node runs for one node overlap
+- Failures are reported per job without stopping the batch
+- Throughput and per-stage timing aggregation
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.playbook_engine import BatchExecutor, BatchJob
+from core.playbook_engine.batch_executor import BatchReport, JobResult, stage_durations
+from core.playbook_engine.node_context import load_node_context
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PLAYBOOKS_DIR = PROJECT_ROOT / 'domain' / 'playbooks'
+THRESHOLDS = PROJECT_ROOT / 'domain' / 'config' / 'playbook_thresholds.yaml'
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Two small nodes in one realm."""
+    root = tmp_path / 'vault'
+    for node, severity in (('NODE_A', 'HIGH'), ('NODE_B', 'LOW')):
+        node_dir = root / 'REALM' / node
+        (node_dir / 'internal-infohub' / 'risks').mkdir(parents=True)
+        (node_dir / 'node_profile.yaml').write_text(f"node_id: {node}\noperating_mode: DELIVERY\n")
+        (node_dir / 'internal-infohub' / 'risks' / 'risk_register.yaml').write_text(
+            f"risks:\n  - id: R1\n    severity: {severity}\n"
+        )
+    return root
+
+
+class TestNodeContext:
+    """Vault layout -> context dict."""
+
+    def test_layout(self, vault):
+        context = load_node_context('REALM', 'NODE_A', vault)
+        assert context['realm_id'] == 'REALM'
+        assert context['node_id'] == 'NODE_A'
+        assert context['operating_mode'] == 'DELIVERY'
+        assert context['risks']['risk_register']['risks'][0]['severity'] == 'HIGH'
+
+    def test_missing_node(self, vault):
+        with pytest.raises(FileNotFoundError):
+            load_node_context('REALM', 'NODE_X', vault)
+
+
+class TestBatchExecutor:
+    """Process-pool batch runs."""
+
+    def test_runs_all_jobs(self, vault, tmp_path):
+        batch = BatchExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs', vault, max_workers=2)
+        jobs = [BatchJob('PB_201', 'REALM', node) for node in ('NODE_A', 'NODE_B') for _ in range(3)]
+        report = batch.run(jobs)
+
+        assert len(report.results) == 6
+        assert report.completed == 6, [r.error for r in report.results]
+        # Same playbook/client within one second still gets distinct run dirs
+        run_ids = [r.run_id for r in report.results]
+        assert len(set(run_ids)) == 6
+        assert all((tmp_path / 'runs' / run_id).is_dir() for run_id in run_ids)
+        assert report.throughput > 0
+        assert report.stage_stats()['evaluate_decision_logic']['count'] == 6
+
+    def test_per_node_cap(self, vault, tmp_path):
+        batch = BatchExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs', vault,
+                              max_workers=2, max_per_node=1)
+        report = batch.run([BatchJob('PB_201', 'REALM', 'NODE_A') for _ in range(4)])
+        intervals = sorted((r.started_at, r.finished_at) for r in report.results)
+        for (_, end), (start, _) in zip(intervals, intervals[1:]):
+            assert start >= end
+
+    def test_failures_are_reported(self, vault, tmp_path):
+        batch = BatchExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs', vault, max_workers=1)
+        report = batch.run([
+            BatchJob('PB_201', 'REALM', 'NODE_A'),
+            BatchJob('PB_201', 'REALM', 'NODE_X'),
+            BatchJob('PB_9999', 'REALM', 'NODE_B'),
+        ])
+        assert report.completed == 1
+        assert report.failed == 2
+        errors = {r.job.node_id: r.error for r in report.results if r.error}
+        assert errors['NODE_X'].startswith('FileNotFoundError')
+        assert 'PB_9999' in errors['NODE_B']
+
+
+class TestReporting:
+    """Timing aggregation."""
+
+    def test_stage_durations(self):
+        trace = {'execution_steps': [
+            {'step': 'load', 'status': 'started', 'timestamp': '2026-01-01T00:00:00.000000Z'},
+            {'step': 'load', 'status': 'success', 'timestamp': '2026-01-01T00:00:00.250000Z'},
+            {'step': 'eval', 'status': 'started', 'timestamp': '2026-01-01T00:00:01.000000Z'},
+        ]}
+        assert stage_durations(trace) == {'load': 0.25}
+
+    def test_stage_stats(self):
+        job = BatchJob('PB_201', 'R', 'N')
+        results = [JobResult(job, 'completed', stage_seconds={'load': float(s)}) for s in range(1, 101)]
+        stats = BatchReport(results, wall_seconds=4.0).stage_stats()['load']
+        assert stats['count'] == 100
+        assert stats['p50'] == pytest.approx(50.5)
+        assert stats['p95'] == pytest.approx(95.05)
+        assert BatchReport(results, wall_seconds=4.0).throughput == 25.0
@@ -0,0 +1,132 @@
+"""
+Tests for columnar bulk DLL evaluation
+
+Validates:
+- Bulk results agree exactly with DLLEvaluator.evaluate (differential corpus)
+- Errors are reported for the same nodes as scalar evaluation
+- Playbook rules resolve thresholds and return firing node sets
+"""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from core.playbook_engine import DLLEvaluator, ThresholdManager
+from core.playbook_engine.bulk_evaluator import BulkEvaluator, ContextFrame
+
+VALUES = [None, 0, 1, 5, 2.5, -3, True, False, 'a', 'HIGH', '', [1, 2], [], {'x': 1}, 10 ** 20]
+PATHS = [
+    '$.a.n', '$.b.s', '$.c.n', '$.a.items', '$.a.items.length',
+    "$.b.items[?(@.severity=='HIGH')].length", '$.c.items[*].v', '$.a', '$..n',
+]
+LITERALS = ['0', '1', '5', '2.5', 'true', 'false', 'null', '"a"', "'HIGH'", 'b']
+OPERATORS = ['>', '<', '>=', '<=', '==', '!=']
+
+
+def _random_context(rng):
+    context = {}
+    for key in 'abc':
+        roll = rng.random()
+        if roll < 0.15:
+            continue
+        if roll < 0.3:
+            context[key] = rng.choice(VALUES)
+            continue
+        context[key] = {
+            'n': rng.choice(VALUES),
+            's': rng.choice(VALUES),
+            'items': [
+                {'severity': rng.choice(['HIGH', 'LOW']), 'v': rng.choice(VALUES)}
+                for _ in range(rng.randint(0, 3))
+            ],
+        }
+    return context
+
+
+def _random_condition(rng, depth=0):
+    roll = rng.random()
+    if depth > 2 or roll < 0.4:
+        if rng.random() < 0.2:
+            return f"{rng.choice(PATHS)} {rng.choice(['EXISTS', 'NOT EXISTS'])}"
+        left = rng.choice(PATHS) if rng.random() < 0.9 else rng.choice(LITERALS[:5])
+        right = rng.choice(PATHS) if rng.random() < 0.25 else rng.choice(LITERALS)
+        return f"{left} {rng.choice(OPERATORS)} {right}"
+    if roll < 0.55:
+        return f"NOT ({_random_condition(rng, depth + 1)})"
+    return (
+        f"({_random_condition(rng, depth + 1)}) {rng.choice(['AND', 'OR'])} "
+        f"{_random_condition(rng, depth + 1)}"
+    )
+
+
+@pytest.fixture
+def context_realistic():
+    with open(Path(__file__).parent / 'fixtures' / 'context_realistic.json') as f:
+        return json.load(f)
+
+
+class TestDifferential:
+    """Bulk evaluation agrees with the scalar evaluator."""
+
+    def test_random_corpus(self):
+        rng = random.Random(7)
+        contexts = {f"node_{i}": _random_context(rng) for i in range(200)}
+        frame = ContextFrame(contexts)
+        bulk = BulkEvaluator()
+        scalar = DLLEvaluator()
+
+        checked = 0
+        for _ in range(300):
+            condition = _random_condition(rng)
+            result = bulk.evaluate(condition, frame)
+            for node_id, context in contexts.items():
+                try:
+                    expected, raised = scalar.evaluate(condition, context), False
+                except Exception:
+                    expected, raised = False, True
+                assert (node_id in result.firing) == expected, (condition, context)
+                assert (node_id in result.errors) == raised, (condition, context)
+                checked += 1
+        assert checked == 60000
+
+    def test_type_errors_reported_per_node(self):
+        frame = ContextFrame({'num': {'a': 5}, 'text': {'a': 'x'}, 'missing': {}})
+        result = BulkEvaluator().evaluate("$.a > 1", frame)
+        assert result.firing == ['num']
+        assert list(result.errors) == ['text']
+
+    def test_short_circuit_suppresses_errors(self):
+        frame = ContextFrame({'x': {'a': 0, 'b': 'x'}, 'y': {'a': 1, 'b': 'x'}})
+        result = BulkEvaluator().evaluate("$.a > 0 AND $.b > 1", frame)
+        assert result.firing == []
+        assert list(result.errors) == ['y']
+
+    def test_invalid_jsonpath_fails_only_nodes_reaching_it(self):
+        frame = ContextFrame({'x': {'a': 1}, 'y': {'a': 0}})
+        result = BulkEvaluator().evaluate("$.a > 0 OR $.r[?(@.k=='x' || @.k=='y')] EXISTS", frame)
+        assert result.firing == ['x']
+        assert list(result.errors) == ['y']
+
+
+class TestPlaybookRules:
+    """Firing node sets per playbook rule."""
+
+    def test_firing_nodes_per_rule(self, context_realistic):
+        small = json.loads(json.dumps(context_realistic))
+        small['account_overview']['arr'] = 1000
+        frame = ContextFrame({'big': context_realistic, 'small': small})
+        playbook = {'decision_logic': {'rules': [
+            {'id': 'R1', 'condition': '$.account_overview.arr >= ${thresholds.minimum_account_arr}'},
+            {'id': 'R2', 'condition': "$.risks[?(@.severity=='HIGH')].length > 0"},
+            {'id': 'R3', 'condition': 'single_use_case AND'},
+        ]}}
+        project_root = Path(__file__).parent.parent.parent
+        bulk = BulkEvaluator(threshold_manager=ThresholdManager(
+            project_root / 'domain' / 'config' / 'playbook_thresholds.yaml'
+        ))
+        results = bulk.evaluate_playbook(playbook, frame, 'PB_201')
+        assert results['R1'].firing == ['big']
+        assert results['R2'].firing == ['big', 'small']
+        assert results['R3'].firing == [] and set(results['R3'].errors) == {'big', 'small'}
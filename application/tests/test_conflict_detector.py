@@ -0,0 +1,211 @@
+"""
+Tests for Conflict Detector
+
+Validates:
+- Pairwise conflicts are detected through the blocking index
+- Indexed and all-pairs analysis report identical findings and IDs
+- Processes with unhashable keys are still compared with everything
+- analyze() accepts a prebuilt index
+- MinHash/LSH redundancy: near-duplicate steps, thresholds, stored signatures
+"""
+
+import random
+
+import pytest
+
+from core.orchestration.conflict_detector import ConflictDetector, ConflictType, ProcessIndex
+from core.orchestration.process_similarity import ProcessSimilarity, collision_probability
+from core.orchestration.version_controller import VersionController
+
+
+def _process(process_id, event="deal_closed", owner="sales_agent", artifact=None, value=None, slot=None):
+    steps = [{"action": "schedule_meeting", "params": {"slot": slot}}] if slot else []
+    outputs = {"primary": {"artifact": artifact, "value": value}} if artifact else {}
+    return {
+        "process_id": process_id,
+        "trigger": {"event": event},
+        "ownership": {"primary_owner": {"agent": owner}},
+        "outputs": outputs,
+        "steps": steps,
+    }
+
+
+def _catalog(count, seed):
+    rng = random.Random(seed)
+    return [
+        _process(
+            f"P{i}",
+            event=rng.choice(["deal_closed", "risk_identified", "e1", "e2"]),
+            owner=rng.choice(["a", "b", "c"]),
+            artifact=rng.choice([None, "x", "y", "z", "w"]),
+            value=rng.choice([None, "approved", "rejected", "open", "closed", True, False]),
+            slot=rng.choice([None, None, "mon", "tue"]),
+        )
+        for i in range(count)
+    ]
+
+
+def _types(report):
+    return [c.conflict_type for c in report.conflicts]
+
+
+class TestPairwiseChecks:
+    """Each pairwise check fires through the index."""
+
+    def test_output_contradiction_and_ownership(self):
+        processes = [
+            _process("A", owner="a", artifact="deal_status", value="approved"),
+            _process("B", event="other", owner="b", artifact="deal_status", value="rejected"),
+            _process("C", event="third", owner="c", artifact="unrelated", value="approved"),
+        ]
+        report = ConflictDetector().full_analysis(processes)
+        assert _types(report) == [ConflictType.OUTPUT_CONTRADICTION, ConflictType.OWNERSHIP_OVERLAP]
+        assert all(c.processes == ["A", "B"] for c in report.conflicts)
+
+    def test_resource_contention(self):
+        processes = [
+            _process("A", event="e1", owner="a", slot="mon_9am"),
+            _process("B", event="e2", owner="b", slot="mon_9am"),
+            _process("C", event="e3", owner="c", slot="tue_9am"),
+        ]
+        report = ConflictDetector().full_analysis(processes)
+        assert _types(report) == [ConflictType.RESOURCE_CONTENTION]
+
+    def test_redundancy_requires_event_and_owner(self):
+        processes = [_process("A"), _process("B"), _process("C", owner="other")]
+        report = ConflictDetector().full_analysis(processes)
+        assert [c.processes for c in report.conflicts] == [["A", "B"]]
+
+
+class TestIndexedMatchesAllPairs:
+    """Blocking never changes the findings."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_full_analysis(self, seed):
+        processes = _catalog(80, seed)
+        indexed = ConflictDetector().full_analysis(processes)
+        pairwise = ConflictDetector(use_index=False).full_analysis(processes)
+        assert indexed.conflicts
+        assert indexed.to_list() == pairwise.to_list()
+        assert indexed.gaps == pairwise.gaps
+
+    @pytest.mark.parametrize("seed", [1, 2])
+    def test_analyze(self, seed):
+        processes = _catalog(60, seed)
+        detector = ConflictDetector()
+        index = detector.build_index(processes)
+        for new in _catalog(10, seed + 100) + processes[:3]:
+            indexed = ConflictDetector().analyze(new, processes)
+            pairwise = ConflictDetector(use_index=False).analyze(new, processes)
+            assert indexed.to_list() == pairwise.to_list()
+            assert ConflictDetector().analyze(new, processes, index=index).to_list() == pairwise.to_list()
+
+    def test_unhashable_keys_compare_with_everything(self):
+        processes = [
+            _process("A", event="e1", owner="a", slot=["mon"]),
+            _process("B", event="e2", owner="b", artifact="x", value="rejected"),
+            _process("C", event="e3", owner="c", slot=["mon"]),
+        ]
+        indexed = ConflictDetector().full_analysis(processes)
+        assert _types(indexed) == [ConflictType.RESOURCE_CONTENTION]
+        assert indexed.to_list() == ConflictDetector(use_index=False).full_analysis(processes).to_list()
+
+        new = _process("D", event=["e2"], owner="d", artifact="x", value="approved")
+        report = ConflictDetector().analyze(new, processes)
+        assert _types(report) == [ConflictType.OUTPUT_CONTRADICTION, ConflictType.OWNERSHIP_OVERLAP]
+        assert report.to_list() == ConflictDetector(use_index=False).analyze(new, processes).to_list()
+
+
+class TestProcessIndex:
+    """Candidate pairs only share a bucket."""
+
+    def test_candidate_pairs_are_blocked(self):
+        detector = ConflictDetector()
+        index = detector.build_index([
+            _process("A", event="e1", owner="a"),
+            _process("B", event="e2", owner="b"),
+            _process("C", event="e1", owner="a"),
+        ])
+        assert isinstance(index, ProcessIndex)
+        assert len(index) == 3
+        assert index.candidate_pairs() == [(0, 2, {"redundancy"})]
+        assert index.candidates(_process("D", event="e2", owner="b")) == {1: {"redundancy"}}
+
+
+def _described(process_id, description, steps=("Review the RFP", "Draft the proposal"), owner="Solution Architect"):
+    return {
+        "process_id": process_id,
+        "description": description,
+        "trigger": {"event": "rfp_received"},
+        "ownership": {"primary_owner": {"agent": owner}},
+        "steps": [{"name": name, "action": "analyze"} for name in steps],
+    }
+
+
+RFP = "When an RFP arrives the solution architect reviews requirements and drafts a technical proposal within five days"
+
+
+class TestNearDuplicates:
+    """Redundancy via MinHash signatures and LSH bands."""
+
+    def test_bands_reach_recall_at_threshold(self):
+        for threshold in (0.5, 0.8, 0.9):
+            similarity = ProcessSimilarity(threshold=threshold)
+            assert similarity.bands * similarity.rows <= similarity.num_perm
+            assert collision_probability(threshold, similarity.bands, similarity.rows) >= 0.99
+
+    def test_signature_estimates_jaccard(self):
+        similarity = ProcessSimilarity(num_perm=256)
+        a = _described("A", RFP)
+        b = _described("B", RFP.replace("five days", "a week"))
+        estimate = similarity.estimate(similarity.signature(a), similarity.signature(b))
+        assert estimate == pytest.approx(similarity.jaccard(a, b), abs=0.1)
+
+    def test_near_duplicate_steps_are_redundant(self):
+        processes = [
+            _described("A", RFP),
+            _described("B", RFP.replace("technical", "detailed")),
+            _described("C", "Quarterly business review with the executive sponsor", steps=("Prepare deck",)),
+        ]
+        report = ConflictDetector(redundancy_threshold=0.6).full_analysis(processes)
+        redundant = [c for c in report.conflicts if c.conflict_type == ConflictType.REDUNDANT_PROCESS]
+        assert [c.processes for c in redundant] == [["A", "B"]]
+        assert 0.6 <= redundant[0].details["similarity"] < 1.0
+        assert not [c for c in ConflictDetector().full_analysis(processes).conflicts
+                    if c.conflict_type == ConflictType.REDUNDANT_PROCESS]
+
+    def test_near_duplicates_lookup(self):
+        detector = ConflictDetector(redundancy_threshold=0.5)
+        index = detector.build_index([
+            _described("A", RFP),
+            _described("B", RFP.replace("five days", "a week")),
+            _described("C", "Quarterly business review with the executive sponsor"),
+        ])
+        query = _described("NEW", RFP)
+        matches = detector.near_duplicates(query, index)
+        assert [m[0] for m in matches] == ["A", "B"]
+        assert matches[0][1] == 1.0
+        assert [m[0] for m in detector.near_duplicates(query, index, threshold=0.95)] == ["A"]
+
+    def test_stored_signature_is_reused_while_valid(self):
+        similarity = ProcessSimilarity()
+        process = _described("A", RFP)
+        stored = similarity.stored_signature(process)
+        assert tuple(stored["signature"]) == similarity.signature(process)
+
+        process["_minhash"] = dict(stored, signature=[7] * similarity.num_perm)
+        assert similarity.signature(process) == (7,) * similarity.num_perm
+        process["description"] = "edited by hand"
+        assert similarity.signature(process) != (7,) * similarity.num_perm
+
+    def test_versions_store_signature(self, tmp_path):
+        controller = VersionController(tmp_path / "registry")
+        process = _described("PROC_1", RFP)
+        controller.save_process(process, actor="tester")
+        assert process["_minhash"]["digest"] == controller.similarity.digest(controller.similarity.features(process))
+
+        process["description"] = RFP + " and loops in the account executive"
+        controller.save_process(process, actor="tester")
+        diff = controller.get_diff("process", "PROC_1", 1, 2)
+        assert "description" in diff["modified"]
+        assert "_minhash" not in diff["modified"]
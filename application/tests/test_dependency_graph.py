@@ -0,0 +1,144 @@
+"""
+Tests for the process dependency graph
+
+Validates:
+- The online topological order holds for every acyclic edge
+- Insertions report exactly the cycles they close
+- Trial checks (find_cycle) do not change the graph
+- Iterative Tarjan handles deep graphs without recursion limits
+- Conflict analysis reports one cycle per strongly connected component
+"""
+
+import random
+import sys
+
+import pytest
+
+from core.orchestration import OrchestrationAgent
+from core.orchestration.conflict_detector import ConflictDetector, ConflictType
+from core.orchestration.dependency_graph import DependencyGraph, trigger_targets
+
+
+def _reaches(graph, start, goal):
+    seen, stack = set(), [start]
+    while stack:
+        node = stack.pop()
+        for succ in graph.successors(node):
+            if succ == goal:
+                return True
+            if succ not in seen:
+                seen.add(succ)
+                stack.append(succ)
+    return False
+
+
+def _process(process_id, triggers=()):
+    return {"process_id": process_id, "outputs": {"triggers": list(triggers)}}
+
+
+class TestOnlineOrder:
+    """Pearce-Kelly insertion."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_order_and_cycles_match_reachability(self, seed):
+        rng = random.Random(seed)
+        graph = DependencyGraph()
+        for _ in range(300):
+            source, target = f"P{rng.randrange(60)}", f"P{rng.randrange(60)}"
+            closes = source == target or _reaches(graph, target, source)
+            already = target in graph.successors(source)
+            cycle = graph.add_edge(source, target)
+            assert (cycle is not None) == (closes and not already)
+            if cycle:
+                assert cycle[0] == cycle[-1] == source and cycle[1] == target
+                assert all(b in graph.successors(a) for a, b in zip(cycle, cycle[1:]))
+            for node in graph.nodes:
+                for succ in graph.successors(node):
+                    if (node, succ) not in graph.cyclic_edges:
+                        assert graph._order[node] < graph._order[succ]
+
+    def test_find_cycle_does_not_change_graph(self):
+        graph = DependencyGraph.from_processes([_process("A", ["B"]), _process("B", ["C"]), _process("C")])
+        assert graph.find_cycle("C", ["A"]) == ["C", "A", "B", "C"]
+        assert graph.find_cycle("A", ["C"]) is None
+        assert graph.find_cycle("NEW", ["A"]) is None
+        assert graph.find_cycle("A", ["A"]) == ["A", "A"]
+        assert graph.successors("C") == [] and not graph.cyclic_edges
+
+    def test_removing_an_edge_reinstates_cyclic_edges(self):
+        graph = DependencyGraph()
+        graph.add_edge("A", "B")
+        assert graph.add_edge("B", "A") == ["B", "A", "B"]
+        assert graph.cyclic_edges == {("B", "A")}
+        assert graph.set_edges("A", []) == []
+        assert graph.cyclic_edges == set()
+        assert graph._order["B"] < graph._order["A"]
+
+    def test_trigger_targets(self):
+        process = {
+            "outputs": {"triggers": ["B", {"process": "C"}, {"event": "x"}]},
+            "relationships": {"triggers": ["B", "D"]},
+        }
+        assert trigger_targets(process) == ["B", "C", "D"]
+        assert process["outputs"]["triggers"] == ["B", {"process": "C"}, {"event": "x"}]
+
+
+class TestComponents:
+    """Iterative Tarjan."""
+
+    def test_deep_chain_and_long_cycle(self):
+        depth = sys.getrecursionlimit() * 3
+        processes = [_process(f"P{i}", [f"P{i + 1}"]) for i in range(depth)]
+        graph = DependencyGraph.from_processes(processes)
+        assert graph.cycles() == []
+        assert graph.set_edges(f"P{depth}", ["P0"])[0][:2] == [f"P{depth}", "P0"]
+        (cycle, component), = graph.cycles()
+        assert len(component) == depth + 1
+        assert cycle[0] == cycle[-1] == "P0" and len(cycle) == depth + 2
+
+    def test_one_cycle_per_component(self):
+        graph = DependencyGraph.from_processes([
+            _process("A", ["B"]), _process("B", ["A", "C"]), _process("C", ["A"]),
+            _process("D", ["D"]), _process("E", ["A"]),
+        ])
+        assert [component for _, component in graph.cycles()] == [["A", "B", "C"], ["D"]]
+        assert [cycle for cycle, _ in graph.cycles()] == [["A", "B", "A"], ["D", "D"]]
+
+
+class TestConflictAnalysis:
+    """Cycle conflicts in analyze() and full_analysis()."""
+
+    def test_full_analysis_reports_components(self):
+        processes = [_process("A", ["B"]), _process("B", ["C"]), _process("C", ["A", "B"])]
+        report = ConflictDetector().full_analysis(processes)
+        cycles = [c for c in report.conflicts if c.conflict_type == ConflictType.CIRCULAR_DEPENDENCY]
+        assert len(cycles) == 1
+        assert cycles[0].details["component"] == ["A", "B", "C"]
+        assert cycles[0].blocking
+        # Relationship triggers are no longer appended to the process's outputs
+        processes[0]["relationships"] = {"triggers": ["C"]}
+        ConflictDetector().full_analysis(processes)
+        assert processes[0]["outputs"]["triggers"] == ["B"]
+
+    def test_analyze_reports_cycle_closed_by_new_process(self):
+        existing = [_process("A", ["B"]), _process("B", ["C"]), _process("C")]
+        graph = DependencyGraph.from_processes(existing)
+        for kwargs in ({}, {"graph": graph}):
+            report = ConflictDetector().analyze(_process("C", ["A"]), existing, **kwargs)
+            assert [c.processes for c in report.conflicts] == [["C", "A", "B", "C"]]
+            assert ConflictDetector().analyze(_process("D", ["A"]), existing, **kwargs).conflicts == []
+
+
+class TestOrchestrationAgent:
+    """The agent keeps its graph current."""
+
+    def test_graph_follows_saves_and_rollbacks(self, tmp_path):
+        agent = OrchestrationAgent(tmp_path / "registry")
+        agent.version_controller.save_process(_process("A", ["B"]), actor="tester")
+        graph = agent.get_dependency_graph()
+        assert graph.successors("A") == ["B"]
+        assert agent.get_dependency_graph() is graph
+
+        agent.version_controller.save_process(_process("A", ["C"]), actor="tester")
+        assert agent.rollback_process("A", 1).success
+        assert graph.successors("A") == ["B"]
@@ -5,7 +5,12 @@ Unit tests for DLL (Decision Logic Language) Evaluator
 import pytest
 import json
 from pathlib import Path
-from core.playbook_engine.dll_evaluator import DLLEvaluator
+from core.playbook_engine.dll_evaluator import (
+    CompiledConstant,
+    CompiledExists,
+    CompiledPath,
+    DLLEvaluator,
+)
 
 
 @pytest.fixture
@@ -167,5 +172,148 @@ class TestDLLEvaluatorEdgeCases:
         # Boolean comparison (if we had boolean fields)
 
 
+class TestDLLCompilation:
+    """Test compile-once condition evaluation."""
+
+    def test_compile_is_cached_by_text(self, evaluator):
+        """Same condition text returns the same compiled object."""
+        first = evaluator.compile("$.swot.strengths.count > 0")
+        second = DLLEvaluator().compile("  $.swot.strengths.count > 0 ")
+        assert first is second
+
+    def test_compiled_matches_evaluate(self, evaluator, context_realistic):
+        """Compiled conditions give the same result as evaluate()."""
+        conditions = [
+            "$.risks[?(@.severity=='HIGH')].length > 0",
+            "$.swot.strengths.count > 10 OR $.swot.weaknesses.count > 0",
+            "$.swot.nonexistent NOT EXISTS",
+            "$.account_overview.arr > 500000.5",
+        ]
+        for condition in conditions:
+            compiled = evaluator.compile(condition)
+            assert compiled.evaluate(context_realistic) == evaluator.evaluate(condition, context_realistic)
+
+    def test_jsonpath_parsed_once(self, evaluator, context_minimal, monkeypatch):
+        """Repeated evaluation does not re-parse JSONPath."""
+        from core.playbook_engine import dll_evaluator as module
+        DLLEvaluator.clear_cache()
+        calls = []
+        original = module.jsonpath_parse
+
+        def counting_parse(expr):
+            calls.append(expr)
+            return original(expr)
+
+        monkeypatch.setattr(module, 'jsonpath_parse', counting_parse)
+        for _ in range(5):
+            evaluator.evaluate("$.swot.strengths.count > 0 AND $.swot.threats.count == 0", context_minimal)
+        assert calls == ['$.swot.strengths.count', '$.swot.threats.count']
+        DLLEvaluator.clear_cache()
+
+    def test_literal_typed_at_compile(self, evaluator):
+        """Literals are parsed to typed values once."""
+        compiled = evaluator.compile("$.account_overview.arr >= 500000")
+        assert compiled.right.value == 500000
+        assert isinstance(compiled.left, CompiledPath)
+
+    def test_invalid_syntax_raises_at_compile(self, evaluator):
+        """Unbalanced filters surface as ValueError when compiling."""
+        with pytest.raises(ValueError):
+            evaluator.compile("$.risks[?(@.severity== > 0")
+
+    def test_invalid_jsonpath_raises_when_reached(self, evaluator):
+        """A JSONPath is parsed on first use; short-circuited branches never fail."""
+        compiled = evaluator.compile(
+            "$.a == 1 OR $.r[?(@.kind=='x' || @.kind=='y')].length > 0"
+        )
+        assert compiled.evaluate({'a': 1}) is True
+        with pytest.raises(ValueError, match="Invalid JSONPath"):
+            compiled.evaluate({'a': 2})
+
+
+class TestDLLGrammar:
+    """Test NOT, parentheses, precedence, folding and short-circuiting."""
+
+    def test_and_binds_tighter_than_or(self, evaluator, context_minimal):
+        """A OR B AND C parses as A OR (B AND C)."""
+        # strengths.count == 2, threats.count == 0
+        assert evaluator.evaluate(
+            "$.swot.strengths.count > 0 OR $.swot.threats.count > 0 AND $.swot.threats.count > 5",
+            context_minimal
+        ) is True
+
+    def test_parentheses_override_precedence(self, evaluator, context_minimal):
+        """(A OR B) AND C evaluates the group first."""
+        assert evaluator.evaluate(
+            "($.swot.strengths.count > 0 OR $.swot.threats.count > 0) AND $.swot.threats.count > 5",
+            context_minimal
+        ) is False
+
+    def test_not_operator(self, evaluator, context_minimal):
+        """NOT negates predicates and groups."""
+        assert evaluator.evaluate("NOT $.swot.threats.count > 0", context_minimal) is True
+        assert evaluator.evaluate(
+            "NOT ($.swot.strengths EXISTS AND $.swot.strengths.count > 0)", context_minimal
+        ) is False
+        assert evaluator.evaluate("NOT NOT $.swot.strengths EXISTS", context_minimal) is True
+
+    def test_not_exists_still_supported(self, evaluator, context_minimal):
+        """Postfix NOT EXISTS keeps its meaning alongside prefix NOT."""
+        assert evaluator.evaluate("$.swot.nonexistent NOT EXISTS", context_minimal) is True
+        assert evaluator.evaluate("NOT $.swot.nonexistent NOT EXISTS", context_minimal) is False
+
+    def test_quoted_string_may_contain_keywords(self, evaluator):
+        """Keywords inside quoted literals are not boolean operators."""
+        context = {'deal': {'stage': 'Legal AND Procurement'}}
+        assert evaluator.evaluate("$.deal.stage == 'Legal AND Procurement'", context) is True
+        assert evaluator.evaluate("$.deal.stage == \"Legal OR Procurement\"", context) is False
+
+    def test_unquoted_multi_word_literal(self, evaluator):
+        """Bare words after the operator are one string literal, as before the parser rewrite."""
+        context = {'deal': {'stage': 'In Progress', 'owner': 'sa'}}
+        assert evaluator.evaluate("$.deal.stage == In Progress", context) is True
+        assert evaluator.evaluate("$.deal.stage != Closed  Won", context) is True
+        assert evaluator.evaluate("$.deal.stage == In Progress AND $.deal.owner == sa", context) is True
+        assert evaluator.evaluate("($.deal.stage == Not Started OR $.deal.owner == sa)", context) is True
+
+    def test_filter_with_keywords_is_one_operand(self, evaluator, context_realistic):
+        """Operators inside JSONPath filters do not split the condition."""
+        assert evaluator.evaluate(
+            "$.risks[?(@.severity=='HIGH')].length > 0 AND NOT $.risks.length == 0",
+            context_realistic
+        ) is True
+
+    def test_constant_comparisons_fold(self, evaluator):
+        """Literal-vs-literal comparisons fold at compile time."""
+        assert isinstance(evaluator.compile("500000 > 0"), CompiledConstant)
+        folded = evaluator.compile("500000 > 0 AND $.swot.strengths EXISTS")
+        assert isinstance(folded, CompiledExists)
+        assert evaluator.compile("1 > 2 AND $.swot.strengths EXISTS").evaluate({}) is False
+        assert evaluator.compile("NOT (1 > 2) OR $.x EXISTS").evaluate({}) is True
+
+    def test_cheap_operands_evaluate_first(self, evaluator, context_realistic, monkeypatch):
+        """AND short-circuits on the cheapest failing operand."""
+        calls = []
+        original = CompiledPath.resolve
+
+        def counting(self, context):
+            calls.append(self.expr)
+            return original(self, context)
+
+        monkeypatch.setattr(CompiledPath, 'resolve', counting)
+        condition = "$.risks[?(@.severity=='HIGH')].length > 0 AND $.account_overview.arr < 0"
+        assert evaluator.evaluate(condition, context_realistic) is False
+        assert calls == ['$.account_overview.arr']
+
+    def test_unbalanced_parentheses_raise(self, evaluator):
+        """Missing or extra parentheses are syntax errors."""
+        with pytest.raises(ValueError):
+            evaluator.compile("($.a EXISTS AND $.b EXISTS")
+        with pytest.raises(ValueError):
+            evaluator.compile("$.a EXISTS)")
+        with pytest.raises(ValueError):
+            evaluator.compile("$.a EXISTS AND")
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
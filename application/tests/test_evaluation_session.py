@@ -0,0 +1,124 @@
+"""
+Tests for EvaluationSession
+
+Validates:
+- JSONPath results are memoized across conditions sharing a path
+- Top-level mutations invalidate only the affected memo entries
+- Evaluating the whole playbook catalog evaluates each distinct path once
+"""
+
+import json
+from collections import Counter
+from pathlib import Path
+
+import pytest
+import yaml
+
+from core.playbook_engine import DLLEvaluator, EvaluationSession, PlaybookExecutor
+from core.playbook_engine.dll_evaluator import CompiledPath
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def context_realistic():
+    """Load realistic context fixture."""
+    with open(Path(__file__).parent / 'fixtures' / 'context_realistic.json') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def path_evaluations(monkeypatch):
+    """Count real JSONPath evaluations per base expression."""
+    counts = Counter()
+    original = CompiledPath.find_values
+
+    def counting(self, context):
+        counts[self.base_expr] += 1
+        return original(self, context)
+
+    monkeypatch.setattr(CompiledPath, 'find_values', counting)
+    return counts
+
+
+class TestMemoization:
+    """Memo hits across conditions."""
+
+    def test_same_results_as_plain_evaluation(self, context_realistic):
+        """Session evaluation agrees with DLLEvaluator.evaluate."""
+        evaluator = DLLEvaluator()
+        session = EvaluationSession(context_realistic)
+        conditions = [
+            "$.risks[?(@.severity=='HIGH')].length > 0",
+            "$.risks[?(@.severity=='HIGH')] EXISTS",
+            "$.account_overview.arr >= 500000 AND $.risks.length > 2",
+            "NOT $.swot.nonexistent EXISTS",
+        ]
+        for condition in conditions:
+            assert session.evaluate(condition) == evaluator.evaluate(condition, context_realistic)
+
+    def test_shared_path_evaluated_once(self, context_realistic, path_evaluations):
+        """.length and plain reads of one path share a memo entry."""
+        session = EvaluationSession(context_realistic)
+        session.evaluate("$.risks[?(@.severity=='HIGH')].length > 0")
+        session.evaluate("$.risks[?(@.severity=='HIGH')] EXISTS")
+        session.evaluate("$.risks[?(@.severity=='HIGH')].length < 100")
+        assert path_evaluations["$.risks[?(@.severity=='HIGH')]"] == 1
+        stats = session.stats()
+        assert stats['evaluations'] == 1
+        assert stats['saved'] == 2
+
+
+class TestInvalidation:
+    """Context mutation drops stale results."""
+
+    def test_reassigned_key_is_detected(self):
+        context = {'a': {'n': 1}, 'b': {'n': 1}}
+        session = EvaluationSession(context)
+        assert session.evaluate("$.a.n == 1 AND $.b.n == 1") is True
+        context['a'] = {'n': 2}
+        assert session.evaluate("$.a.n == 1") is False
+        # b was untouched, so it stays memoized
+        assert session.stats()['memoized_paths'] == 2
+        assert session.evaluate("$.b.n == 1") is True
+        assert session.stats()['evaluations'] == 3
+
+    def test_explicit_invalidate_for_nested_changes(self):
+        context = {'a': {'n': 1}}
+        session = EvaluationSession(context)
+        assert session.evaluate("$.a.n == 1") is True
+        context['a']['n'] = 2
+        session.invalidate('a')
+        assert session.evaluate("$.a.n == 1") is False
+
+    def test_set_invalidates_wildcard_paths(self):
+        session = EvaluationSession({'a': [1], 'b': [2]})
+        assert session.evaluate("$..b EXISTS") is True
+        session.set('b', None)
+        assert session.evaluate("$..b[0] EXISTS") is False
+
+
+class TestPlaybookCatalog:
+    """Shared session across every playbook's rules."""
+
+    def test_catalog_evaluates_each_path_once(self, context_realistic, path_evaluations, tmp_path):
+        executor = PlaybookExecutor(
+            playbooks_dir=PROJECT_ROOT / 'domain' / 'playbooks',
+            thresholds_config=PROJECT_ROOT / 'domain' / 'config' / 'playbook_thresholds.yaml',
+            runs_dir=tmp_path
+        )
+        session = EvaluationSession(context_realistic, executor.dll_evaluator)
+        evaluated = 0
+        for path in sorted((PROJECT_ROOT / 'domain' / 'playbooks').rglob('PB_*.yaml')):
+            with open(path) as f:
+                playbook = yaml.safe_load(f)
+            if not isinstance(playbook, dict) or not playbook.get('decision_logic', {}).get('rules'):
+                continue
+            playbook_id = path.stem[:6]
+            executor._evaluate_rules(playbook, session, playbook_id, {'execution_steps': []})
+            evaluated += 1
+
+        assert evaluated > 10
+        assert path_evaluations
+        assert max(path_evaluations.values()) == 1
+        assert session.stats()['saved'] > 0
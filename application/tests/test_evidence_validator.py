@@ -215,5 +215,52 @@ class TestValidateOrRaise:
         assert "evidence validation failed" in str(exc_info.value).lower()
 
 
+def _claim(description, **evidence):
+    base = {"source_artifact": "a.md", "date": "2025-12-01", "excerpt": "text"}
+    base.update(evidence)
+    return {"description": description, "evidence": [base]}
+
+
+class TestCompiledModes:
+    """Test fail-fast, batch and full-report modes."""
+
+    @pytest.fixture
+    def mixed(self):
+        return {
+            "strengths": [_claim("ok"), _claim("bad confidence", confidence="SURE")],
+            "risks": [_claim("bad date", date="Dec 1"), {"description": "no evidence"}, "not a dict"],
+            "decisions": [_claim("missing excerpt", excerpt="")],
+        }
+
+    def test_full_report_lists_every_failure(self, validator, mixed):
+        """Test that only failing items are reported, with their messages."""
+        errors = validator.validate(mixed)
+        assert errors == [
+            "strengths[1].evidence[0]: Invalid confidence 'SURE' (must be HIGH|MEDIUM|LOW)",
+            "risks[0].evidence[0]: Invalid date format 'Dec 1' (must be YYYY-MM-DD)",
+            "risks: 'no evidence' lacks evidence field",
+            "risks[2]: Expected dict, got <class 'str'>",
+            "decisions[0].evidence[0]: Field 'excerpt' is empty",
+        ]
+
+    def test_fail_fast(self, validator, mixed):
+        """Test that fail-fast mode stops at the first error."""
+        assert validator.first_error(mixed) == validator.validate(mixed)[0]
+        assert not validator.is_valid(mixed)
+        assert validator.is_valid({"strengths": [_claim("ok", confidence="LOW")], "notes": "x"})
+        assert validator.first_error({"strengths": [_claim("ok")]}) is None
+
+    def test_validate_many(self, validator, mixed):
+        """Test batch validation across the outputs of a run."""
+        valid = {"strengths": [_claim("ok")]}
+        assert validator.validate_many([valid, mixed, mixed]) == validator.validate(mixed) * 2
+        assert validator.validate_many([valid, mixed], fail_fast=True) == [validator.first_error(mixed)]
+        assert validator.validate_many([valid, valid]) == []
+
+    def test_field_listed_twice_is_checked_once(self, validator):
+        """Test that opportunities (listed for SWOT and Three Horizons) report once."""
+        assert len(validator.validate({"opportunities": [{"name": "Expansion"}]})) == 1
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
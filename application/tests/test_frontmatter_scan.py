@@ -0,0 +1,138 @@
+"""
+Tests for frontmatter-only scanning
+
+Validates:
+- markdown_tools reads headers without bodies and loads bodies lazily
+- Oversized frontmatter falls back to a full parse instead of being dropped
+- Lazy and eager parsing agree on frontmatter and content
+- Knowledge Vault listing/stats never read item bodies
+"""
+
+import pytest
+
+from api.services import knowledge_service
+from api.services.knowledge_service import KnowledgeService, _write_knowledge_yaml
+from core.tools.markdown_tools import (
+    _MAX_FRONTMATTER_BYTES,
+    _MAX_LINE_BYTES,
+    parse_markdown_with_frontmatter,
+)
+
+
+@pytest.fixture
+def notes_dir(tmp_path):
+    (tmp_path / "2026-01-15-deep-dive.md").write_text(
+        "---\ntitle: Deep dive\ntags: security\n---\n\n# Deep dive\n\nBody text\n"
+    )
+    (tmp_path / "plain.md").write_text("# No frontmatter\n\nJust text\n")
+    (tmp_path / "unterminated.md").write_text("---\ntitle: broken\n\nBody without closing\n")
+    return tmp_path
+
+
+class TestMarkdownFrontmatter:
+    """Header-only reads in markdown_tools."""
+
+    def test_frontmatter(self, notes_dir):
+        def frontmatter(name):
+            return parse_markdown_with_frontmatter(notes_dir / name, lazy_content=True)["frontmatter"]
+
+        assert frontmatter("2026-01-15-deep-dive.md") == {"title": "Deep dive", "tags": "security"}
+        assert frontmatter("plain.md") == {}
+        assert frontmatter("unterminated.md") == {}
+
+    @pytest.mark.parametrize("summary", [
+        "x" * (_MAX_LINE_BYTES * 2),
+        "\n  ".join(["y" * 100] * (_MAX_FRONTMATTER_BYTES // 100 + 10)),
+    ], ids=["long-line", "large-block"])
+    def test_oversized_frontmatter_falls_back_to_full_parse(self, tmp_path, summary):
+        path = tmp_path / "big.md"
+        path.write_text(f"---\ntitle: Big\nsummary: {summary}\n---\n\n# Big\n\nBody\n")
+        for lazy in (False, True):
+            parsed = parse_markdown_with_frontmatter(path, lazy_content=lazy)
+            assert parsed["frontmatter"]["title"] == "Big"
+            assert parsed["frontmatter"]["summary"] == " ".join(summary.split("\n  "))
+            assert parsed["content"] == "# Big\n\nBody\n"
+
+    def test_eager_parse(self, notes_dir):
+        parsed = parse_markdown_with_frontmatter(notes_dir / "2026-01-15-deep-dive.md")
+        assert parsed["frontmatter"]["title"] == "Deep dive"
+        assert parsed["tags"] == ["security"]
+        assert parsed["content"] == "# Deep dive\n\nBody text\n"
+
+    def test_lazy_parse_defers_body(self, notes_dir):
+        parsed = parse_markdown_with_frontmatter(notes_dir / "2026-01-15-deep-dive.md", lazy_content=True)
+        assert parsed.content_loaded is False
+        assert parsed.get("content") == "# Deep dive\n\nBody text\n"
+        assert parsed.content_loaded is True
+
+    def test_lazy_matches_eager(self, notes_dir):
+        for path in notes_dir.iterdir():
+            eager = parse_markdown_with_frontmatter(path)
+            lazy = parse_markdown_with_frontmatter(path, lazy_content=True)
+            assert lazy["frontmatter"] == eager["frontmatter"]
+            assert lazy["content"] == eager["content"]
+
+
+class TestKnowledgeHeaderScan:
+    """Knowledge listing reads frontmatter only."""
+
+    @pytest.fixture
+    def svc(self, tmp_path):
+        base = tmp_path / "knowledge"
+        for i in range(1, 6):
+            _write_knowledge_yaml(base / "content" / "security" / f"KV_00{i}_item.yaml", {
+                "id": f"KV_00{i}", "title": f"Item {i}", "type": "pattern",
+                "category": "content", "domain": "security",
+                "content": f"Body {i} " + "lorem " * 200,
+            })
+        return KnowledgeService(base_path=base)
+
+    @pytest.fixture
+    def body_reads(self, monkeypatch):
+        """Count lazy body loads."""
+        calls = []
+        original = knowledge_service._KnowledgeHeader.__missing__
+
+        def counting(self, key):
+            calls.append(key)
+            return original(self, key)
+
+        monkeypatch.setattr(knowledge_service._KnowledgeHeader, "__missing__", counting)
+        return calls
+
+    def test_stats_do_not_read_bodies(self, svc, body_reads):
+        assert svc.get_stats().total_items == 5
+        assert body_reads == []
+
+    def test_get_item_reads_one_body(self, svc, body_reads):
+        item = svc.get_item("KV_003")
+        assert item.content.startswith("Body 3")
+        assert body_reads == ["content"]
+
+    def test_list_items_content_matches_full_parse(self, svc):
+        for item in svc.list_items():
+            full = knowledge_service._parse_knowledge_file(
+                svc.base_path / "content" / "security" / f"{item.id}_item.yaml"
+            )
+            assert item.content == full["content"]
+
+    def test_relevant_knowledge_loads_only_returned_bodies(self, svc, body_reads):
+        items = svc.get_relevant_knowledge(domain="security", max_items=2)
+        assert len(items) == 2
+        assert len(body_reads) == 2
+
+    def test_update_keeps_body(self, svc):
+        from api.models.knowledge_schemas import KnowledgeItemUpdate
+        svc.update_item("KV_002", KnowledgeItemUpdate(title="Renamed"))
+        item = svc.get_item("KV_002")
+        assert item.title == "Renamed"
+        assert item.content.startswith("Body 2")
+
+    def test_item_with_long_frontmatter_line_is_listed(self, svc):
+        _write_knowledge_yaml(svc.base_path / "content" / "security" / "KV_009_long.yaml", {
+            "id": "KV_009", "title": "Long", "type": "pattern", "category": "content",
+            "domain": "security", "summary": "z" * (_MAX_LINE_BYTES * 2), "content": "Long body",
+        })
+        item = svc.get_item("KV_009")
+        assert item.title == "Long"
+        assert item.content == "Long body"
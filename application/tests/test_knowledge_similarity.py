@@ -0,0 +1,157 @@
+"""
+Tests for TF-IDF knowledge similarity
+
+Validates:
+- Cosine top-k neighbours over sparse TF-IDF vectors
+- Incremental upsert/remove keeps neighbour lists equal to a full rebuild
+- Near-duplicate check on proposal creation
+"""
+
+import random
+
+import pytest
+
+from api.models.knowledge_schemas import KnowledgeProposalCreate
+from api.services.knowledge_service import KnowledgeService, _write_knowledge_yaml
+from api.services.knowledge_similarity import KnowledgeSimilarityIndex
+
+DOCS = {
+    "KV_001": "Zero trust network segmentation for hybrid cloud security",
+    "KV_002": "Network segmentation patterns for zero trust security programs",
+    "KV_003": "Log retention and index lifecycle management for observability",
+    "KV_004": "Observability dashboards for service level objectives",
+    "KV_005": "Executive sponsor alignment during renewal negotiations",
+}
+
+
+@pytest.fixture
+def index():
+    idx = KnowledgeSimilarityIndex(k=3)
+    idx.build(DOCS)
+    return idx
+
+
+def _rebuilt(documents, k=3):
+    idx = KnowledgeSimilarityIndex(k=k)
+    idx.build(documents)
+    return idx
+
+
+class TestSimilarityIndex:
+    """Vectors and neighbour lists."""
+
+    def test_nearest_neighbour(self, index):
+        assert index.neighbours("KV_001")[0][0] == "KV_002"
+        assert index.neighbours("KV_003")[0][0] == "KV_004"
+
+    def test_scores_are_cosine(self, index):
+        for doc_id in DOCS:
+            for _, score in index.neighbours(doc_id):
+                assert 0 < score <= 1.0
+
+    def test_unrelated_docs_have_no_neighbours(self, index):
+        assert index.neighbours("KV_005") == []
+
+    def test_query_free_text(self, index):
+        assert index.query("zero trust segmentation", top_k=2)[0][0] in ("KV_001", "KV_002")
+
+    def test_near_duplicates(self, index):
+        matches = index.near_duplicates(DOCS["KV_003"], threshold=0.99)
+        assert [m[0] for m in matches] == ["KV_003"]
+
+    def test_upsert_matches_full_rebuild(self, index):
+        docs = dict(DOCS)
+        docs["KV_006"] = "Hybrid cloud security review with zero trust"
+        index.upsert("KV_006", docs["KV_006"])
+        rebuilt = _rebuilt(docs)
+        for doc_id in docs:
+            assert [n for n, _ in index.neighbours(doc_id)] == [n for n, _ in rebuilt.neighbours(doc_id)]
+
+    def test_remove_repairs_neighbour_lists(self, index):
+        index.remove("KV_002")
+        assert "KV_002" not in index
+        assert all(n != "KV_002" for n, _ in index.neighbours("KV_001"))
+
+    def test_many_incremental_changes_stay_consistent(self):
+        rng = random.Random(7)
+        vocab = ["risk", "renewal", "security", "cloud", "index", "sponsor", "latency", "budget"]
+        docs = {f"KV_{i:03d}": " ".join(rng.choices(vocab, k=rng.randint(1, 6))) for i in range(30)}
+        idx = _rebuilt(docs, k=4)
+
+        def check():
+            # Neighbour lists equal a full top-k pass over the same vectors ...
+            exact = idx._all_top_k()
+            for doc_id in docs:
+                assert idx.neighbours(doc_id) == exact[doc_id]
+            # ... and their scores stay within the bounded IDF drift of a fresh build
+            fresh = _rebuilt(docs, k=len(docs))
+            for doc_id in docs:
+                fresh_scores = dict(fresh.neighbours(doc_id))
+                for neighbour, score in idx.neighbours(doc_id):
+                    assert score == pytest.approx(fresh_scores.get(neighbour, 0.0), abs=0.1)
+
+        for i in range(30, 45):
+            docs[f"KV_{i:03d}"] = " ".join(rng.choices(vocab, k=rng.randint(1, 6)))
+            idx.upsert(f"KV_{i:03d}", docs[f"KV_{i:03d}"])
+            check()
+        for doc_id in ["KV_031", "KV_002"]:
+            docs[doc_id] = " ".join(rng.choices(vocab, k=rng.randint(1, 6)))
+            idx.upsert(doc_id, docs[doc_id])
+            check()
+        for doc_id in list(docs)[:5]:
+            del docs[doc_id]
+            idx.remove(doc_id)
+            check()
+        assert sorted(idx._ids) == sorted(docs)
+
+        # Rebuilding from the incrementally maintained counts gives the fresh index exactly
+        idx._rebuild()
+        fresh = _rebuilt(docs, k=4)
+        for doc_id in docs:
+            assert idx.neighbours(doc_id) == fresh.neighbours(doc_id)
+
+
+class TestProposalDuplicateCheck:
+    """Near-duplicate detection wired into create_proposal."""
+
+    @pytest.fixture
+    def svc(self, tmp_path):
+        base = tmp_path / "knowledge"
+        _write_knowledge_yaml(base / "content" / "security" / "KV_001_zt.yaml", {
+            "id": "KV_001", "title": "Zero trust segmentation", "type": "pattern",
+            "category": "content", "domain": "security", "tags": ["zero-trust"],
+            "content": DOCS["KV_001"],
+        })
+        return KnowledgeService(base_path=base)
+
+    def _proposal(self, title, content):
+        return KnowledgeProposalCreate(
+            title=title, type="lesson_learned", category="content",
+            domain="security", tags=["zero-trust"], content=content,
+        )
+
+    def test_duplicate_is_refused(self, svc):
+        result = svc.create_proposal(self._proposal("Zero trust segmentation", DOCS["KV_001"]))
+        assert result.status == "duplicate"
+        assert result.near_duplicates[0].id == "KV_001"
+        assert svc.list_proposals() == []
+
+    def test_duplicate_allowed_when_forced(self, svc):
+        result = svc.create_proposal(
+            self._proposal("Zero trust segmentation", DOCS["KV_001"]), allow_duplicates=True
+        )
+        assert result.status == "created"
+        assert result.proposal.id == "KV_002"
+
+    def test_distinct_proposal_is_created_and_indexed(self, svc):
+        result = svc.create_proposal(self._proposal("Renewal sponsor", DOCS["KV_005"]))
+        assert result.status == "created"
+        assert svc.proposal_store.ids("pending") == [result.proposal.id]
+        again = svc.create_proposal(self._proposal("Renewal sponsor", DOCS["KV_005"]))
+        assert again.near_duplicates[0].kind == "proposal"
+
+    def test_similar_items(self, svc):
+        svc.create_item(self._proposal("Segmentation for hybrid cloud", DOCS["KV_002"]))
+        similar = svc.get_similar_items("KV_001")
+        assert similar[0].title == "Segmentation for hybrid cloud"
+        assert svc.get_similar_items("KV_404") is None
@@ -0,0 +1,144 @@
+"""
+Tests for LazyNodeContext
+
+Validates:
+- Documents are listed up front and parsed on first access
+- Prefetch parses exactly the documents rule JSONPaths name
+- Dict behaviour matches the eagerly loaded context
+- Lazy loading is not reported as context mutation by EvaluationSession
+- Playbook results match eager execution
+"""
+
+import copy
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from core.playbook_engine import DLLEvaluator, EvaluationSession, LazyNodeContext, PlaybookExecutor
+from core.playbook_engine.lazy_context import required_documents
+from core.playbook_engine.node_context import load_node_context
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PLAYBOOKS_DIR = PROJECT_ROOT / 'domain' / 'playbooks'
+THRESHOLDS = PROJECT_ROOT / 'domain' / 'config' / 'playbook_thresholds.yaml'
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture
+def vault(tmp_path):
+    with open(FIXTURES / 'context_realistic.json') as f:
+        realistic = json.load(f)
+    node = tmp_path / 'REALM' / 'NODE'
+    infohub = node / 'internal-infohub'
+    for section, stem, data in [
+        ('swot', 'strengths', realistic['swot']['strengths']),
+        ('swot', 'weaknesses', realistic['swot']['weaknesses']),
+        ('swot', 'opportunities', realistic['swot']['opportunities']),
+        ('swot', 'threats', realistic['swot']['threats']),
+        ('risks', 'risk_register', {'risks': realistic['risks']}),
+        ('stakeholders', 'map', {'stakeholders': [{'name': 'CTO'}]}),
+    ]:
+        (infohub / section).mkdir(parents=True, exist_ok=True)
+        (infohub / section / f'{stem}.yaml').write_text(json.dumps(data))
+    (infohub / 'stakeholders' / 'empty.yaml').write_text('')
+    (node / 'node_profile.yaml').write_text('node_id: NODE\noperating_mode: pursuit\n')
+    (node / 'blueprint.yaml').write_text('contract_id: C1\n')
+    return tmp_path
+
+
+def _names(context):
+    return [path.relative_to(context.root).as_posix() for path in context.files_read]
+
+
+class TestLazyLoading:
+    """On-demand parsing."""
+
+    def test_nothing_parsed_up_front(self, vault):
+        context = LazyNodeContext('REALM', 'NODE', vault)
+        assert context.files_read == []
+        assert 'risks' in context and len(context) == 9
+        assert context['risks']['risk_register']['risks']
+        assert _names(context) == ['internal-infohub/risks/risk_register.yaml']
+
+    def test_missing_node(self, vault):
+        with pytest.raises(FileNotFoundError):
+            LazyNodeContext('REALM', 'MISSING', vault)
+
+    def test_prefetch_reads_only_named_documents(self, vault):
+        context = LazyNodeContext('REALM', 'NODE', vault)
+        compiled = DLLEvaluator().compile("$.risks.risk_register.risks[?(@.severity=='HIGH')].length > 0")
+        assert context.prefetch([compiled]) == 1
+        assert _names(context) == ['internal-infohub/risks/risk_register.yaml']
+
+    def test_prefetch_rootless_reads_everything(self, vault):
+        context = LazyNodeContext('REALM', 'NODE', vault)
+        context.prefetch([DLLEvaluator().compile("$..severity EXISTS")])
+        assert len(context.files_read) == 9
+
+    def test_required_documents(self):
+        compile_ = DLLEvaluator().compile
+        assert required_documents([compile_("$.swot.threats.count > 1 AND $.risks.length > 0")]) == [
+            ('risks',), ('swot', 'threats', 'count')]
+        assert required_documents([compile_("$..x EXISTS")]) == [None]
+
+
+class TestDictBehaviour:
+    """Parity with load_node_context."""
+
+    def test_equal_to_eager_context(self, vault):
+        eager = load_node_context('REALM', 'NODE', vault)
+        assert LazyNodeContext('REALM', 'NODE', vault) == eager
+        assert json.loads(json.dumps(LazyNodeContext('REALM', 'NODE', vault))) == eager
+        stakeholders = LazyNodeContext('REALM', 'NODE', vault)['stakeholders']
+        assert stakeholders.get('empty') is None and 'empty' not in stakeholders
+
+    def test_derived_operating_mode(self, vault):
+        context = LazyNodeContext('REALM', 'NODE', vault)
+        assert context.get('operating_mode') == 'pursuit'
+        assert _names(context) == ['node_profile.yaml']
+
+    def test_copies_are_plain_dicts(self, vault):
+        context = LazyNodeContext('REALM', 'NODE', vault)
+        for copied in (copy.deepcopy(context), pickle.loads(pickle.dumps(context)), context.copy()):
+            assert type(copied) is dict
+            assert copied['swot']['threats'] == context['swot']['threats']
+
+    def test_assignment_replaces_pending_value(self, vault):
+        context = LazyNodeContext('REALM', 'NODE', vault)
+        context['risks'] = []
+        assert context.get('risks') == []
+        assert context.files_read == []
+
+
+class TestExecution:
+    """Executor and session integration."""
+
+    def test_lazy_load_is_not_mutation(self, vault):
+        context = LazyNodeContext('REALM', 'NODE', vault)
+        session = EvaluationSession(context)
+        assert session.evaluate("$.swot.threats.count > 1")
+        assert session.evaluate("$.risks.risk_register.risks.length > 0")
+        assert session.evaluate("$.swot.threats.count > 1")
+        assert session.stats()['invalidations'] == 0
+        assert session.stats()['saved'] == 1
+
+        context['swot'] = {'threats': {'count': 0}}
+        assert not session.evaluate("$.swot.threats.count > 1")
+
+    def test_matches_eager_execution(self, tmp_path, vault):
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs')
+        lazy = LazyNodeContext('REALM', 'NODE', vault)
+        lazy_result = executor.execute('PB_201', lazy, client_id='REALM')
+        eager_result = executor.execute('PB_201', load_node_context('REALM', 'NODE', vault), client_id='REALM')
+
+        assert ([r['rule_id'] for r in lazy_result['fired_rules']]
+                == [r['rule_id'] for r in eager_result['fired_rules']])
+        # PB_201 rules read $.swot only; the enricher reads the profile and blueprint
+        assert not any(name.startswith('internal-infohub/risks') for name in _names(lazy))
+        assert not any(name.startswith('internal-infohub/stakeholders') for name in _names(lazy))
+        step = next(s for s in lazy_result['trace']['execution_steps']
+                    if s['step'] == 'validate_inputs' and s['status'] == 'success')
+        swot_read = [name for name in _names(lazy) if name.startswith('internal-infohub/swot/')]
+        assert step['details']['documents_prefetched'] == len(swot_read) > 0
@@ -0,0 +1,136 @@
+"""
+Tests for PlaybookRegistry
+
+Validates:
+- Recursive indexing by playbook ID with cached, validated playbooks
+- Rule conditions are precompiled and errors surface at index time
+- Hot reload on modified, added and removed files
+- Duplicate playbook IDs keep a stable winner and are logged
+- Rules recompile when the threshold config changes
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from core.playbook_engine import PlaybookRegistry, ThresholdManager
+from core.playbook_engine.playbook_registry import playbook_id_from_filename
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PLAYBOOKS_DIR = PROJECT_ROOT / 'domain' / 'playbooks'
+SWOT = PLAYBOOKS_DIR / 'strategy' / 'PB_201_swot_analysis.yaml'
+
+
+@pytest.fixture
+def playbooks_copy(tmp_path):
+    """Small playbook tree: one valid, one invalid playbook, one template."""
+    root = tmp_path / 'playbooks'
+    (root / 'strategy').mkdir(parents=True)
+    (root / 'templates').mkdir()
+    shutil.copy(SWOT, root / 'strategy' / SWOT.name)
+    (root / 'strategy' / 'PB_999_broken.yaml').write_text("framework_name: Broken\n")
+    (root / 'templates' / 'playbook_template.yaml').write_text("framework_name: Template\n")
+    return root
+
+
+def _touch_later(path: Path, text: str):
+    """Rewrite a file and make sure its mtime differs."""
+    before = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+class TestIndexing:
+    """Index contents."""
+
+    def test_filename_ids(self):
+        assert playbook_id_from_filename(Path('PB_201_swot_analysis.yaml')) == 'PB_201'
+        assert playbook_id_from_filename(Path('PB_ACI_001_research.yaml')) == 'PB_ACI_001'
+        assert playbook_id_from_filename(Path('OP_ACT_002_complete.yaml')) == 'OP_ACT_002'
+        assert playbook_id_from_filename(Path('registry.yaml')) is None
+
+    def test_indexes_nested_directories(self):
+        registry = PlaybookRegistry(PLAYBOOKS_DIR, threshold_manager=ThresholdManager())
+        assert 'PB_201' in registry
+        entry = registry.get('PB_201')
+        assert entry.path == SWOT
+        assert entry.playbook['framework_name']
+        rules = {rule.rule_id: rule for rule in entry.rules}
+        # Thresholds come from the PB_201_swot section
+        assert rules['defensive_posture_required'].compiled is not None
+        assert '${thresholds' not in rules['defensive_posture_required'].condition_substituted
+        assert all((rule.compiled is None) == bool(rule.error) for rule in entry.rules)
+
+    def test_get_is_cached(self, playbooks_copy):
+        registry = PlaybookRegistry(playbooks_copy)
+        assert registry.get('PB_201').playbook is registry.get('PB_201').playbook
+
+    def test_errors_surface_at_index_time(self, playbooks_copy):
+        registry = PlaybookRegistry(playbooks_copy)
+        assert registry.ids() == ['PB_201', 'PB_999']
+        assert 'schema validation failed' in registry.errors()['PB_999']
+        with pytest.raises(ValueError):
+            registry.get('PB_999')
+        assert registry.find_path('PB_999').name == 'PB_999_broken.yaml'
+
+    def test_unknown_id(self, playbooks_copy):
+        with pytest.raises(FileNotFoundError):
+            PlaybookRegistry(playbooks_copy).get('PB_404')
+
+    def test_duplicate_id_keeps_named_file(self, playbooks_copy, caplog):
+        (playbooks_copy / 'delivery').mkdir()
+        copy = playbooks_copy / 'delivery' / 'PB_202_copy.yaml'
+        shutil.copy(SWOT, copy)
+        registry = PlaybookRegistry(playbooks_copy)
+        assert registry.get('PB_201').path.name == SWOT.name
+        assert 'Duplicate playbook ID PB_201' in caplog.text
+        # The shadowed file takes over when the winner goes away
+        (playbooks_copy / 'strategy' / SWOT.name).unlink()
+        assert registry.get('PB_201').path == copy
+
+
+class TestHotReload:
+    """Changes on disk are picked up without rebuilding the registry."""
+
+    def test_modified_file_reloads(self, playbooks_copy):
+        registry = PlaybookRegistry(playbooks_copy)
+        path = playbooks_copy / 'strategy' / SWOT.name
+        text = path.read_text().replace('version: "2.0"', 'version: "2.1"', 1)
+        _touch_later(path, text)
+        assert registry.get('PB_201').playbook['steckbrief']['version'] == '2.1'
+
+    def test_fixed_file_clears_error(self, playbooks_copy):
+        registry = PlaybookRegistry(playbooks_copy)
+        fixed = SWOT.read_text().replace('playbook_id: "PB_201"', 'playbook_id: "PB_999"')
+        _touch_later(playbooks_copy / 'strategy' / 'PB_999_broken.yaml', fixed)
+        assert registry.get('PB_999').playbook is not None
+        assert 'PB_999' not in registry.errors()
+
+    def test_added_and_removed_files(self, playbooks_copy):
+        registry = PlaybookRegistry(playbooks_copy)
+        (playbooks_copy / 'delivery').mkdir()
+        shutil.copy(SWOT, playbooks_copy / 'delivery' / 'PB_202_copy.yaml')
+        # Declared steckbrief.playbook_id wins over the file name
+        (playbooks_copy / 'strategy' / SWOT.name).unlink()
+        with pytest.raises(FileNotFoundError):
+            registry.get('PB_202')
+        assert registry.get('PB_201').path.name == 'PB_202_copy.yaml'
+
+    def test_threshold_change_recompiles_rules(self, playbooks_copy, tmp_path):
+        config = tmp_path / 'thresholds.yaml'
+        config.write_text("PB_201_swot:\n  high_threat_count: 2\n  low_strength_count: 1\n")
+        registry = PlaybookRegistry(playbooks_copy, threshold_manager=ThresholdManager(config))
+        playbook = registry.get('PB_201').playbook
+
+        def condition():
+            rules = {rule.rule_id: rule for rule in registry.get('PB_201').rules}
+            return rules['defensive_posture_required'].condition_substituted
+
+        assert 'length >= 2' in condition()
+        _touch_later(config, "PB_201_swot:\n  high_threat_count: 5\n  low_strength_count: 1\n")
+        assert 'length >= 5' in condition()
+        # Only the rules were rebuilt
+        assert registry.get('PB_201').playbook is playbook
+        assert registry.get('PB_201').thresholds_generation == registry.threshold_manager.generation
@@ -0,0 +1,204 @@
+"""
+Tests for the process registry index
+
+Validates:
+- Lazy loading, and reuse of the on-disk index for unchanged files
+- VersionController saves and rollbacks update definitions and conflict indexes
+- Edits made outside VersionController are picked up by refresh()
+- Duplicate process_ids keep one winner without re-parsing on every refresh
+- OrchestrationAgent reads processes through the registry
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+import yaml
+
+from core.orchestration import OrchestrationAgent, ProcessRegistry
+from core.orchestration.conflict_detector import ConflictDetector
+from core.orchestration.version_controller import VersionController
+
+
+def _process(process_id, status="active", triggers=(), owner="sales_agent", artifact=None):
+    process = {
+        "process_id": process_id,
+        "status": status,
+        "trigger": {"event": "deal_closed"},
+        "ownership": {"primary_owner": {"agent": owner}},
+        "outputs": {"triggers": list(triggers)},
+    }
+    if artifact:
+        process["outputs"]["primary"] = {"artifact": artifact}
+    return process
+
+
+@pytest.fixture
+def registry_path(tmp_path):
+    controller = VersionController(tmp_path / "registry")
+    controller.save_process(_process("PROC_A", triggers=["PROC_B"]), actor="tester")
+    controller.save_process(_process("PROC_B", status="draft"), actor="tester")
+    return tmp_path / "registry"
+
+
+def _wired(registry_path):
+    controller = VersionController(registry_path)
+    registry = ProcessRegistry(registry_path)
+    controller.subscribe(registry.on_saved)
+    return controller, registry
+
+
+class TestLoading:
+    """Lazy load and the index file."""
+
+    def test_loads_lazily_and_writes_index(self, registry_path):
+        registry = ProcessRegistry(registry_path)
+        assert not registry.index_path.exists()
+        assert len(registry) == 2
+        assert [p["process_id"] for p in registry.processes(status="active")] == ["PROC_A"]
+        assert registry.dependency_graph.successors("PROC_A") == ["PROC_B"]
+        assert len(registry.conflict_index) == 2
+
+        with gzip.open(registry.index_path, 'rt') as f:
+            stored = json.load(f)
+        assert set(stored["processes"]) == {"PROC_A", "PROC_B"}
+
+    def test_unchanged_files_come_from_the_index(self, registry_path, monkeypatch):
+        ProcessRegistry(registry_path).refresh()
+        parsed = []
+        original = yaml.safe_load
+        monkeypatch.setattr(yaml, "safe_load", lambda f: parsed.append(f.name) or original(f))
+        registry = ProcessRegistry(registry_path)
+        assert registry.get("PROC_B")["status"] == "draft"
+        assert parsed == []
+
+    def test_get_returns_a_copy(self, registry_path):
+        registry = ProcessRegistry(registry_path)
+        registry.get("PROC_A")["status"] = "archived"
+        assert registry.get("PROC_A")["status"] == "active"
+        assert registry.get("PROC_MISSING") is None
+
+    def test_corrupt_index_is_rebuilt(self, registry_path):
+        ProcessRegistry(registry_path).refresh()
+        (registry_path / "index.json.gz").write_bytes(b"not gzip")
+        assert "PROC_A" in ProcessRegistry(registry_path)
+
+
+class TestInvalidation:
+    """Saves, rollbacks and outside edits."""
+
+    def test_saves_update_registry_and_indexes(self, registry_path):
+        controller, registry = _wired(registry_path)
+        assert len(registry) == 2
+        controller.save_process(_process("PROC_C", triggers=["PROC_A"], artifact="deal_status"), actor="tester")
+        controller.save_process(_process("PROC_A", triggers=[], artifact="deal_status", owner="cs_agent"), actor="tester")
+
+        assert registry.get("PROC_A")["version"] == 2
+        assert registry.dependency_graph.successors("PROC_A") == []
+        assert len(registry.conflict_index) == 3
+        report = ConflictDetector().analyze(
+            _process("PROC_NEW", artifact="deal_status", owner="other_agent"),
+            registry.processes(),
+            index=registry.conflict_index,
+        )
+        assert sorted(c.processes[1] for c in report.conflicts if c.conflict_type.value == "ownership_overlap") == ["PROC_A", "PROC_C"]
+
+        # A fresh registry sees the saves through the index file
+        assert ProcessRegistry(registry_path).get("PROC_C")["outputs"]["triggers"] == ["PROC_A"]
+
+    def test_rollback_updates_registry(self, registry_path):
+        controller, registry = _wired(registry_path)
+        controller.save_process(_process("PROC_A", triggers=["PROC_C"]), actor="tester")
+        assert registry.dependency_graph.successors("PROC_A") == ["PROC_C"]
+        assert controller.rollback("process", "PROC_A", 1)
+        assert registry.dependency_graph.successors("PROC_A") == ["PROC_B"]
+
+    def test_refresh_picks_up_outside_edits(self, registry_path):
+        registry = ProcessRegistry(registry_path)
+        assert registry.refresh() is True       # first use loads
+        assert registry.refresh() is False
+
+        (registry_path / "processes" / "PROC_B.yaml").unlink()
+        (registry_path / "processes" / "PROC_D.yaml").write_text(yaml.dump(_process("PROC_D")))
+        assert registry.refresh() is True
+        assert sorted(p["process_id"] for p in registry.processes()) == ["PROC_A", "PROC_D"]
+        assert len(registry.conflict_index) == 2
+
+
+    def test_refresh_if_modified_checks_the_directory(self, registry_path, monkeypatch):
+        processes_dir = registry_path / "processes"
+        past = processes_dir.stat().st_mtime_ns - 10**10
+        os.utime(processes_dir, ns=(past, past))
+        registry = ProcessRegistry(registry_path)
+        assert len(registry) == 2
+        synced = []
+        monkeypatch.setattr(registry, "_sync", lambda: synced.append(1) or False)
+        assert registry.refresh_if_modified() is False
+        assert synced == []
+        monkeypatch.undo()
+
+        (registry_path / "processes" / "PROC_D.yaml").write_text(yaml.dump(_process("PROC_D")))
+        assert registry.refresh_if_modified() is True
+        assert "PROC_D" in registry
+
+
+class TestDuplicates:
+    """Several files declaring one process_id."""
+
+    def test_named_file_wins_and_refresh_is_stable(self, registry_path, monkeypatch, caplog):
+        processes_dir = registry_path / "processes"
+        (processes_dir / "A_copy.yaml").write_text(yaml.dump(_process("PROC_A", status="draft")))
+        registry = ProcessRegistry(registry_path)
+        assert registry.get("PROC_A")["status"] == "active"
+        assert "Duplicate process_id PROC_A" in caplog.text
+        assert registry.refresh() is False
+
+        caplog.clear()
+        parsed = []
+        original = yaml.safe_load
+        monkeypatch.setattr(yaml, "safe_load", lambda f: parsed.append(f.name) or original(f))
+        index_mtime = registry.index_path.stat().st_mtime_ns
+        for _ in range(3):
+            assert registry.refresh() is False
+        assert parsed == []
+        assert caplog.text == ""
+        assert registry.index_path.stat().st_mtime_ns == index_mtime
+
+    def test_first_file_name_wins_and_shadowed_file_takes_over(self, registry_path):
+        processes_dir = registry_path / "processes"
+        (processes_dir / "x_first.yaml").write_text(yaml.dump(_process("PROC_X", owner="first")))
+        (processes_dir / "y_second.yaml").write_text(yaml.dump(_process("PROC_X", owner="second")))
+        registry = ProcessRegistry(registry_path)
+
+        def owner():
+            return registry.get("PROC_X")["ownership"]["primary_owner"]["agent"]
+
+        assert owner() == "first"
+        assert registry.refresh() is False
+        (processes_dir / "x_first.yaml").unlink()
+        assert registry.refresh() is True
+        assert owner() == "second"
+        assert len(registry.conflict_index) == 3
+
+
+class TestOrchestrationAgent:
+    """The agent reads through its registry."""
+
+    def test_agent_uses_registry(self, registry_path):
+        agent = OrchestrationAgent(registry_path)
+        assert agent.get_process("PROC_B")["status"] == "draft"
+        processes = agent.get_all_processes()
+        processes[0]["status"] = "archived"
+        assert {p["status"] for p in agent.get_all_processes()} == {"active", "draft"}
+
+        agent.version_controller.save_process(_process("PROC_E"), actor="tester")
+        assert agent.get_process("PROC_E")["version"] == 1
+        assert agent.get_dependency_graph() is agent.registry.dependency_graph
+
+    def test_process_input_sees_new_process_files(self, registry_path):
+        agent = OrchestrationAgent(registry_path)
+        assert len(agent.registry) == 2
+        (registry_path / "processes" / "PROC_D.yaml").write_text(yaml.dump(_process("PROC_D")))
+        agent.process_input("When a deal closes, the sales agent sends a welcome pack")
+        assert "PROC_D" in agent.registry
@@ -0,0 +1,164 @@
+"""
+Tests for the indexed Knowledge Vault proposal queue
+
+Validates:
+- Id/status index built from proposal files
+- Monotonic id allocation persisted across instances
+- Single and bulk approve/reject through the index
+- Reconciliation when proposal files are added outside the service
+- Ids of vault items added after the index was built are not reallocated
+- Allocating an id reads only the index, not the vault items
+- A bulk review whose writes fail leaves the vault unchanged
+"""
+
+import json
+
+import pytest
+
+from api.models.knowledge_schemas import KnowledgeProposalCreate, ProposalDecision
+from api.services import knowledge_service
+from api.services.knowledge_service import KnowledgeService, _write_knowledge_yaml
+
+
+def _write_proposal(proposals_dir, proposal_id, title="Reusable insight", status="pending"):
+    path = proposals_dir / f"{proposal_id}_{title.lower().replace(' ', '_')}.yaml"
+    _write_knowledge_yaml(path, {
+        "id": proposal_id,
+        "title": title,
+        "type": "lesson_learned",
+        "category": "content",
+        "domain": "security",
+        "confidence": "proposed",
+        "proposed_by": "sa_agent",
+        "proposal_status": status,
+        "content": f"Body of {proposal_id}",
+    })
+    return path
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Knowledge vault with one item and three proposals."""
+    base = tmp_path / "knowledge"
+    _write_knowledge_yaml(base / "content" / "security" / "KV_004_item.yaml", {
+        "id": "KV_004", "title": "Item", "type": "pattern", "category": "content",
+        "domain": "security", "content": "Existing item",
+    })
+    proposals = base / ".proposals"
+    _write_proposal(proposals, "KV_005", "First")
+    _write_proposal(proposals, "KV_006", "Second")
+    _write_proposal(proposals, "KV_007", "Third", status="rejected")
+    return base
+
+
+@pytest.fixture
+def svc(vault):
+    return KnowledgeService(base_path=vault)
+
+
+class TestProposalIndex:
+    """Index and allocator behaviour."""
+
+    def test_status_index(self, svc):
+        assert svc.proposal_store.ids("pending") == ["KV_005", "KV_006"]
+        assert svc.proposal_store.ids("rejected") == ["KV_007"]
+        assert svc.get_stats().pending_proposals == 2
+
+    def test_index_persisted_next_to_proposals(self, svc, vault):
+        svc.proposal_store.ids()
+        index = json.loads((vault / ".proposals_index.json").read_text())
+        assert set(index["proposals"]) == {"KV_005", "KV_006", "KV_007"}
+        assert index["next_id"] == 8
+
+    def test_allocator_is_monotonic_across_instances(self, svc, vault):
+        assert svc._next_id() == "KV_008"
+        assert KnowledgeService(base_path=vault)._next_id() == "KV_009"
+
+    def test_get_proposal_by_id(self, svc):
+        proposal = svc.get_proposal("KV_006")
+        assert proposal.title == "Second"
+        assert svc.get_proposal("KV_999") is None
+
+    def test_external_proposal_file_is_picked_up(self, svc, vault):
+        svc.proposal_store.ids()
+        _write_proposal(vault / ".proposals", "KV_020", "Dropped by agent")
+        assert "KV_020" in svc.proposal_store.ids("pending")
+        assert svc._next_id() == "KV_021"
+
+    def test_item_added_after_index_is_not_reused(self, svc, vault):
+        svc.proposal_store.ids()
+        _write_knowledge_yaml(vault / "content" / "security" / "KV_030_late.yaml", {
+            "id": "KV_030", "title": "Late", "type": "pattern", "category": "content",
+            "domain": "security", "content": "Added outside the service",
+        })
+        # Picked up when the persisted index is next loaded
+        result = KnowledgeService(base_path=vault).create_proposal(KnowledgeProposalCreate(
+            title="Fresh idea", type="lesson_learned", category="content", domain="security",
+            content="Entirely unrelated text about onboarding", proposed_by="sa_agent",
+        ), allow_duplicates=True)
+        assert result.proposal.id == "KV_031"
+
+    def test_allocation_does_not_scan_the_vault(self, svc, monkeypatch):
+        svc.proposal_store.ids()
+        monkeypatch.setattr(svc, "_scan_items", lambda: pytest.fail("vault scanned"))
+        assert [svc._next_id(), svc._next_id()] == ["KV_008", "KV_009"]
+
+class TestProposalReview:
+    """Approve/reject through the index."""
+
+    def test_approve_moves_to_vault(self, svc, vault):
+        item = svc.approve_proposal("KV_005", "looks good")
+        assert item.confidence == "reviewed"
+        assert (vault / "content" / "security" / "KV_005_first.yaml").exists()
+        assert svc.get_proposal("KV_005") is None
+        assert svc.get_item("KV_005") is not None
+
+    def test_reject_marks_file(self, svc):
+        assert svc.reject_proposal("KV_006", "duplicate") is True
+        assert svc.get_proposal("KV_006").proposal_status == "rejected"
+        assert svc.proposal_store.ids("pending") == ["KV_005"]
+
+    def test_unknown_proposal(self, svc):
+        assert svc.approve_proposal("KV_999") is None
+        assert svc.reject_proposal("KV_999") is False
+
+    def test_bulk_review(self, svc):
+        result = svc.review_proposals([
+            ProposalDecision(proposal_id="KV_005", action="approve"),
+            ProposalDecision(proposal_id="KV_006", action="reject", reviewer_notes="no"),
+        ])
+        assert result.status == "applied"
+        assert [i.id for i in result.approved] == ["KV_005"]
+        assert result.rejected == ["KV_006"]
+        assert svc.proposal_store.ids("pending") == []
+        assert svc.proposal_store.ids("rejected") == ["KV_006", "KV_007"]
+
+    def test_bulk_review_is_all_or_nothing(self, svc):
+        result = svc.review_proposals([
+            ProposalDecision(proposal_id="KV_005", action="approve"),
+            ProposalDecision(proposal_id="KV_404", action="reject"),
+        ])
+        assert result.status == "rejected_batch"
+        assert result.errors == ["KV_404: proposal not found"]
+        assert svc.get_proposal("KV_005").proposal_status == "pending"
+
+    def test_failed_write_leaves_vault_unchanged(self, svc, vault, monkeypatch):
+        real_write = knowledge_service._write_knowledge_yaml
+        calls = []
+
+        def failing_write(path, data):
+            calls.append(path)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            real_write(path, data)
+
+        monkeypatch.setattr(knowledge_service, "_write_knowledge_yaml", failing_write)
+        result = svc.review_proposals([
+            ProposalDecision(proposal_id="KV_005", action="approve"),
+            ProposalDecision(proposal_id="KV_006", action="reject"),
+        ])
+        assert result.status == "rejected_batch"
+        assert result.errors == ["write failed: disk full"]
+        assert not (vault / "content" / "security" / "KV_005_first.yaml").exists()
+        assert not list(vault.rglob("*.staged"))
+        assert svc.proposal_store.ids("pending") == ["KV_005", "KV_006"]
@@ -0,0 +1,172 @@
+"""
+Tests for incremental re-execution (RuleResultCache)
+
+Validates:
+- Rule fingerprints depend only on the context keys the condition reads
+- Vault document fingerprints change only for the edited section
+- Re-runs reuse results of rules with unchanged inputs and recompute the
+  rest, and the trace records which is which
+- SQLite-backed caches persist across instances and close their connections
+"""
+
+import copy
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from core.playbook_engine import DLLEvaluator, PlaybookExecutor, RuleResultCache
+from core.playbook_engine.node_context import document_fingerprints
+from core.playbook_engine.rule_cache import InputFingerprints, fingerprint_value
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PLAYBOOKS_DIR = PROJECT_ROOT / 'domain' / 'playbooks'
+THRESHOLDS = PROJECT_ROOT / 'domain' / 'config' / 'playbook_thresholds.yaml'
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+CONDITION = "$.risks.length > 0 AND $.account.arr >= 100"
+
+
+@pytest.fixture
+def context():
+    with open(FIXTURES / 'context_realistic.json') as f:
+        return json.load(f)
+
+
+def _evaluation(result):
+    step = next(s for s in result['trace']['execution_steps']
+                if s['step'] == 'evaluate_decision_logic' and s['status'] == 'success')
+    return step['details']
+
+
+class TestFingerprints:
+    """Input fingerprinting."""
+
+    def test_value_fingerprint_ignores_key_order(self):
+        assert fingerprint_value({'a': 1, 'b': [1, 2]}) == fingerprint_value({'b': [1, 2], 'a': 1})
+        assert fingerprint_value({'a': 1}) != fingerprint_value({'a': 2})
+
+    def test_rule_depends_only_on_read_keys(self):
+        compiled = DLLEvaluator().compile(CONDITION)
+        base = {'risks': [1], 'account': {'arr': 500}, 'other': 1}
+        fingerprint = InputFingerprints(base).rule(CONDITION, compiled)
+
+        assert InputFingerprints({**base, 'other': 2}).rule(CONDITION, compiled) == fingerprint
+        assert InputFingerprints({**base, 'risks': [1, 2]}).rule(CONDITION, compiled) != fingerprint
+        assert InputFingerprints({**base, 'risks': [1]}).rule(CONDITION + ' ', compiled) != fingerprint
+
+    def test_rootless_path_depends_on_everything(self):
+        compiled = DLLEvaluator().compile("$..arr EXISTS")
+        base = {'account': {'arr': 500}, 'other': 1}
+        assert (InputFingerprints(base).rule('c', compiled)
+                != InputFingerprints({**base, 'other': 2}).rule('c', compiled))
+
+    def test_sources_take_precedence(self):
+        compiled = DLLEvaluator().compile(CONDITION)
+        base = {'risks': [1], 'account': {'arr': 500}}
+        sources = {'risks': 'f1', 'account': 'f2'}
+        assert (InputFingerprints(base, sources).rule(CONDITION, compiled)
+                == InputFingerprints({'risks': [9], 'account': {}}, sources).rule(CONDITION, compiled))
+
+    def test_document_fingerprints(self, tmp_path):
+        node = tmp_path / 'REALM' / 'NODE'
+        for section in ('risks', 'stakeholders'):
+            (node / 'internal-infohub' / section).mkdir(parents=True)
+            (node / 'internal-infohub' / section / 'register.yaml').write_text('items: []\n')
+        (node / 'node_profile.yaml').write_text('node_id: NODE\n')
+
+        before = document_fingerprints('REALM', 'NODE', tmp_path)
+        assert set(before) == {'node_profile', 'risks', 'stakeholders'}
+        (node / 'internal-infohub' / 'risks' / 'register.yaml').write_text('items: [1]\n')
+        after = document_fingerprints('REALM', 'NODE', tmp_path)
+        assert after['risks'] != before['risks']
+        assert after['stakeholders'] == before['stakeholders']
+
+
+class TestIncrementalExecution:
+    """Executor reuse of unchanged rule results."""
+
+    @pytest.fixture
+    def executor(self, tmp_path):
+        return PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs', rule_cache=RuleResultCache())
+
+    def test_rerun_reuses_results(self, executor, context):
+        first = executor.execute('PB_201', copy.deepcopy(context), client_id='ACME')
+        second = executor.execute('PB_201', copy.deepcopy(context), client_id='ACME')
+
+        failed = {s['step'][len('evaluate_rule_'):] for s in first['trace']['execution_steps']
+                  if s['step'].startswith('evaluate_rule_') and s['status'] == 'error'}
+        evaluated = [r.rule_id for r in executor.registry.get('PB_201').rules if r.rule_id not in failed]
+        assert _evaluation(first)['recomputed_rule_ids'] == evaluated
+        assert _evaluation(first)['reused_rule_ids'] == []
+        assert _evaluation(second)['reused_rule_ids'] == evaluated
+        assert _evaluation(second)['recomputed_rule_ids'] == []
+        assert [r['rule_id'] for r in second['fired_rules']] == [r['rule_id'] for r in first['fired_rules']]
+
+    def test_changed_input_recomputes(self, executor, context):
+        executor.execute('PB_201', copy.deepcopy(context), client_id='ACME')
+
+        # PB_201 rules read $.swot only
+        unrelated = copy.deepcopy(context)
+        unrelated['risks'].append({'id': 'NEW', 'severity': 'HIGH'})
+        assert _evaluation(executor.execute('PB_201', unrelated, client_id='ACME'))['recomputed_rule_ids'] == []
+
+        changed = copy.deepcopy(context)
+        changed['swot']['threats']['count'] = 99
+        details = _evaluation(executor.execute('PB_201', changed, client_id='ACME'))
+        assert details['reused_rule_ids'] == []
+        assert 'defensive_posture_required' in details['recomputed_rule_ids']
+
+    def test_cache_is_per_client(self, executor, context):
+        executor.execute('PB_201', copy.deepcopy(context), client_id='ACME')
+        other = executor.execute('PB_201', copy.deepcopy(context), client_id='GLOBEX')
+        assert _evaluation(other)['reused_rule_ids'] == []
+
+    def test_without_cache_everything_recomputes(self, tmp_path, context):
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs')
+        executor.execute('PB_201', copy.deepcopy(context), client_id='ACME')
+        details = _evaluation(executor.execute('PB_201', copy.deepcopy(context), client_id='ACME'))
+        assert details['reused_rule_ids'] == []
+        assert details['recomputed_rule_ids']
+
+
+class TestPersistence:
+    """SQLite-backed cache."""
+
+    def test_survives_new_instance(self, tmp_path):
+        cache = RuleResultCache(tmp_path / 'rules.db')
+        cache.put_many('PB_201', 'ACME', {'r1': ('fp1', True), 'r2': ('fp2', False)})
+
+        reopened = RuleResultCache(tmp_path / 'rules.db')
+        assert reopened.get('PB_201', 'ACME', 'r1', 'fp1') is True
+        assert reopened.get('PB_201', 'ACME', 'r2', 'fp2') is False
+        assert reopened.get('PB_201', 'ACME', 'r1', 'other') is None
+        assert len(reopened) == 2
+
+    def test_clear(self, tmp_path):
+        cache = RuleResultCache(tmp_path / 'rules.db')
+        cache.put_many('PB_201', 'ACME', {'r1': ('fp1', True)})
+        cache.put_many('PB_201', 'GLOBEX', {'r1': ('fp1', True)})
+        cache.clear(client_id='ACME')
+        assert cache.get('PB_201', 'ACME', 'r1', 'fp1') is None
+        assert RuleResultCache(tmp_path / 'rules.db').get('PB_201', 'GLOBEX', 'r1', 'fp1') is True
+
+    def test_connections_are_closed(self, tmp_path, monkeypatch):
+        opened = []
+        connect = sqlite3.connect
+
+        def tracking(*args, **kwargs):
+            opened.append(connect(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(sqlite3, 'connect', tracking)
+        cache = RuleResultCache(tmp_path / 'rules.db')
+        cache.put_many('PB_201', 'ACME', {'r1': ('fp1', True)})
+        RuleResultCache(tmp_path / 'rules.db').get('PB_201', 'ACME', 'r1', 'fp1')
+        cache.clear()
+        assert len(cache) == 0
+        assert len(opened) == 6
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute('SELECT 1')
@@ -0,0 +1,212 @@
+"""
+Tests for RunCatalog and the run history API
+
+Validates:
+- Runs are indexed as they complete (including failures)
+- Filtering by every indexed field, with pagination
+- Fire rate per rule and duration percentiles per playbook
+- Backfill from run directories and from a SQLite run store
+- /runs endpoints
+- Every catalog connection is closed after its operation
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.services.run_history_service import RunHistoryService, get_run_history_service
+from core.playbook_engine import PlaybookExecutor, RunCatalog, SQLiteRunStore
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PLAYBOOKS_DIR = PROJECT_ROOT / 'domain' / 'playbooks'
+THRESHOLDS = PROJECT_ROOT / 'domain' / 'config' / 'playbook_thresholds.yaml'
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def _trace(run_id, fired=(), evaluated=(), errored=(), status='completed',
+           start='2026-03-01T10:00:00Z', duration=1.0, outputs=0):
+    steps = [{'step': f'evaluate_rule_{r}', 'status': 'error', 'details': {}} for r in errored]
+    steps += [
+        {'step': 'evaluate_decision_logic', 'status': 'success',
+         'details': {'fired_rule_ids': list(fired), 'evaluated_rule_ids': list(evaluated)}},
+        {'step': 'generate_outputs', 'status': 'success', 'details': {'outputs_created': outputs}},
+    ]
+    return {
+        'run_id': run_id,
+        'execution_steps': steps,
+        'execution_summary': {'status': status, 'start_time': start, 'duration_seconds': duration},
+    }
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = RunCatalog(tmp_path / 'catalog.db')
+    rules = ('r_a', 'r_b', 'r_c')
+    catalog.record(_trace('run1', fired=['r_a'], evaluated=rules, duration=1.0, outputs=1), 'PB_201', 'ACME')
+    catalog.record(_trace('run2', fired=['r_a', 'r_b'], evaluated=rules, start='2026-03-02T10:00:00Z',
+                          duration=2.0, outputs=2), 'PB_201', 'GLOBEX')
+    catalog.record(_trace('run3', evaluated=rules, errored=['r_c'], start='2026-03-03T10:00:00Z',
+                          duration=3.0), 'PB_201', 'ACME')
+    catalog.record(_trace('run4', status='failed', start='2026-03-04T10:00:00Z', duration=0.1),
+                   'PB_202', 'ACME')
+    return catalog
+
+
+def _ids(page):
+    return [run['run_id'] for run in page['items']]
+
+
+class TestQueries:
+    """Filters and pagination."""
+
+    def test_filters(self, catalog):
+        assert _ids(catalog.query()) == ['run4', 'run3', 'run2', 'run1']
+        assert _ids(catalog.query(playbook_id='PB_202')) == ['run4']
+        assert _ids(catalog.query(client_id='GLOBEX')) == ['run2']
+        assert _ids(catalog.query(status='failed')) == ['run4']
+        assert _ids(catalog.query(fired_rule_id='r_b')) == ['run2']
+        assert _ids(catalog.query(run_id='run1')) == ['run1']
+        assert _ids(catalog.query(since='2026-03-02', until='2026-03-04')) == ['run3', 'run2']
+        assert _ids(catalog.query(min_duration=1.5, max_duration=2.5)) == ['run2']
+        assert _ids(catalog.query(min_outputs=1, newest_first=False)) == ['run1', 'run2']
+
+    def test_pagination(self, catalog):
+        page = catalog.query(limit=3, offset=3)
+        assert page['total'] == 4
+        assert _ids(page) == ['run1']
+        assert catalog.query(limit=3)['limit'] == 3
+
+    def test_entry_fields(self, catalog):
+        run = catalog.get('run2')
+        assert run['fired_rule_ids'] == ['r_a', 'r_b']
+        assert run['rules_evaluated'] == 3
+        assert run['outputs_count'] == 2
+        assert catalog.get('run3')['rule_outcomes']['r_c'] == 'error'
+        assert catalog.get('missing') is None
+
+    def test_rerecord_replaces(self, catalog):
+        catalog.record(_trace('run1', evaluated=['r_a']), 'PB_201', 'ACME')
+        assert catalog.get('run1')['fired_rule_ids'] == []
+        assert len(catalog) == 4
+
+
+    def test_connections_are_closed(self, tmp_path, monkeypatch):
+        opened = []
+        connect = sqlite3.connect
+
+        def tracking(*args, **kwargs):
+            opened.append(connect(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(sqlite3, 'connect', tracking)
+        catalog = RunCatalog(tmp_path / 'catalog.db')
+        catalog.record(_trace('run1', fired=['r_a'], evaluated=['r_a']), 'PB_201', 'ACME')
+        catalog.get('run1')
+        catalog.query(fired_rule_id='r_a')
+        catalog.rule_fire_rates()
+        catalog.duration_percentiles()
+        assert len(catalog) == 1
+        assert len(opened) == 7
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute('SELECT 1')
+
+
+class TestAggregates:
+    """Fire rates and duration percentiles."""
+
+    def test_rule_fire_rates(self, catalog):
+        rates = {row['rule_id']: row for row in catalog.rule_fire_rates(playbook_id='PB_201')}
+        assert rates['r_a']['fired'] == 2
+        assert rates['r_a']['fire_rate'] == pytest.approx(2 / 3)
+        assert rates['r_b']['fire_rate'] == pytest.approx(1 / 3)
+        assert rates['r_c']['errors'] == 1
+        assert rates['r_c']['fire_rate'] == 0
+        assert [r['fired'] for r in catalog.rule_fire_rates(client_id='ACME') if r['rule_id'] == 'r_a'] == [1]
+
+    def test_duration_percentiles(self, catalog):
+        stats = {row['playbook_id']: row for row in catalog.duration_percentiles()}
+        assert set(stats) == {'PB_201'}
+        assert stats['PB_201']['runs'] == 3
+        assert stats['PB_201']['p50'] == pytest.approx(2.0)
+        assert stats['PB_201']['p95'] == pytest.approx(2.9)
+        assert catalog.duration_percentiles(status='failed')[0]['playbook_id'] == 'PB_202'
+
+
+class TestIndexingRuns:
+    """Executor integration and backfill."""
+
+    @pytest.fixture
+    def context(self):
+        with open(FIXTURES / 'context_realistic.json') as f:
+            return json.load(f)
+
+    def test_executor_records_runs(self, tmp_path, context):
+        catalog = RunCatalog(tmp_path / 'catalog.db')
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs', run_catalog=catalog)
+        result = executor.execute('PB_201', context, client_id='ACME')
+        with pytest.raises(FileNotFoundError):
+            executor.execute('PB_9999', context, client_id='ACME')
+
+        run = catalog.get(result['run_id'])
+        assert run['status'] == 'completed'
+        assert run['fired_rule_ids'] == sorted(r['rule_id'] for r in result['fired_rules'])
+        assert run['rules_evaluated'] == len(executor.registry.get('PB_201').rules)
+        assert run['outputs_count'] == len(result['outputs'])
+        failed = catalog.query(status='failed')['items']
+        assert [run['playbook_id'] for run in failed] == ['PB_9999']
+
+    def test_backfill(self, tmp_path, context):
+        store = SQLiteRunStore(tmp_path / 'runs.db')
+        PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs').execute('PB_201', context, client_id='ACME')
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'unused', run_store=store)
+        executor.execute('PB_201', context, client_id='GLOBEX')
+        with pytest.raises(FileNotFoundError):
+            executor.execute('PB_9999', context, client_id='GLOBEX')
+
+        from_dirs = RunCatalog(tmp_path / 'a.db')
+        assert from_dirs.backfill(tmp_path / 'runs') == 1
+        assert from_dirs.query()['items'][0]['client_id'] == 'ACME'
+
+        from_store = RunCatalog(tmp_path / 'b.db')
+        assert from_store.backfill(store) == 2
+        # Failed runs have no metadata.yaml; IDs come from the run ID
+        failed = from_store.query(status='failed')['items'][0]
+        assert (failed['playbook_id'], failed['client_id']) == ('PB_9999', 'GLOBEX')
+
+
+class TestRunsAPI:
+    """/runs endpoints."""
+
+    @pytest.fixture
+    def client(self, catalog):
+        app.dependency_overrides[get_run_history_service] = lambda: RunHistoryService(catalog.db_path)
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_list_runs(self, client):
+        r = client.get("/api/v1/runs", params={"playbook_id": "PB_201", "limit": 2, "offset": 1})
+        assert r.status_code == 200
+        data = r.json()
+        assert data["total"] == 3
+        assert [run["run_id"] for run in data["items"]] == ["run2", "run1"]
+
+    def test_stats(self, client):
+        rules = client.get("/api/v1/runs/stats/rules").json()
+        assert {row["rule_id"] for row in rules} == {"r_a", "r_b", "r_c"}
+        durations = client.get("/api/v1/runs/stats/durations").json()
+        assert durations[0]["playbook_id"] == "PB_201"
+
+    def test_get_run(self, client):
+        assert client.get("/api/v1/runs/run2").json()["fired_rule_ids"] == ["r_a", "r_b"]
+        assert client.get("/api/v1/runs/missing").status_code == 404
+
+    def test_missing_catalog_reads_empty(self, tmp_path):
+        svc = RunHistoryService(tmp_path / 'absent.db')
+        assert svc.list_runs()["total"] == 0
+        assert svc.rule_fire_rates() == []
+        assert not (tmp_path / 'absent.db').exists()
@@ -0,0 +1,132 @@
+"""
+Tests for run profiling (RunProfile, profile_report)
+
+Validates:
+- Traces carry perf_counter_ns durations per stage and per rule
+- Rule time splits into JSONPath resolution and comparison
+- Memory deltas are recorded only when enabled
+- Failed runs keep the profile of the stages that ran
+- Reports rank rules and playbooks of recent runs by p95
+"""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from core.playbook_engine import PlaybookExecutor, RuleResultCache, SQLiteRunStore
+from core.playbook_engine.batch_executor import stage_durations
+from core.playbook_engine.run_profile import load_traces, profile_report
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PLAYBOOKS_DIR = PROJECT_ROOT / 'domain' / 'playbooks'
+THRESHOLDS = PROJECT_ROOT / 'domain' / 'config' / 'playbook_thresholds.yaml'
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+STAGES = ['load_playbook', 'load_thresholds', 'enrich_knowledge', 'validate_inputs',
+          'evaluate_decision_logic', 'generate_outputs', 'validate_evidence', 'write_outputs']
+
+
+@pytest.fixture
+def context():
+    with open(FIXTURES / 'context_realistic.json') as f:
+        return json.load(f)
+
+
+def _profile(playbook_id, total_ms, rules):
+    return {'profile': {
+        'playbook_id': playbook_id,
+        'clock': 'perf_counter_ns',
+        'total_ns': int(total_ms * 1e6),
+        'stages': {'evaluate_decision_logic': int(total_ms * 1e6)},
+        'rules': {
+            rule_id: {'total_ns': int(ms * 1e6), 'resolution_ns': int(ms * 5e5),
+                      'comparison_ns': int(ms * 5e5), 'substitution_ns': 0, 'reused': reused}
+            for rule_id, ms, reused in rules
+        },
+    }}
+
+
+class TestTraceProfile:
+    """Timings written by the executor."""
+
+    def test_stage_and_rule_timings(self, tmp_path, context):
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs')
+        result = executor.execute('PB_201', context, client_id='ACME')
+        profile = result['trace']['profile']
+
+        assert profile['playbook_id'] == 'PB_201'
+        assert list(profile['stages']) == STAGES
+        assert sum(profile['stages'].values()) <= profile['total_ns']
+        finished = [s for s in result['trace']['execution_steps'] if s['status'] == 'success']
+        assert all(s['duration_ns'] == profile['stages'][s['step']] for s in finished)
+        assert 'memory_delta_bytes' not in finished[0]
+
+        failed = {s['step'][len('evaluate_rule_'):] for s in result['trace']['execution_steps']
+                  if s['step'].startswith('evaluate_rule_') and s['status'] == 'error'}
+        evaluated = [r.rule_id for r in executor.registry.get('PB_201').rules if r.rule_id not in failed]
+        assert list(profile['rules']) == evaluated
+        for timing in profile['rules'].values():
+            assert timing['resolution_ns'] > 0
+            assert timing['resolution_ns'] + timing['comparison_ns'] == timing['total_ns']
+            assert timing['reused'] is False
+
+        # Written to trace.json as well
+        stored = json.loads((Path(result['run_dir']) / 'trace.json').read_text())
+        assert stored['profile']['rules'].keys() == profile['rules'].keys()
+
+    def test_stage_durations_use_ns_timings(self, tmp_path, context):
+        result = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs').execute('PB_201', context)
+        durations = stage_durations(result['trace'])
+        assert durations['load_playbook'] == result['trace']['profile']['stages']['load_playbook'] / 1e9
+
+    def test_memory_deltas(self, tmp_path, context):
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs', profile_memory=True)
+        result = executor.execute('PB_201', context)
+        finished = [s for s in result['trace']['execution_steps'] if s['status'] == 'success']
+        assert all('memory_delta_bytes' in s for s in finished)
+        assert result['trace']['profile']['memory_peak_bytes'] > 0
+
+    def test_reused_rules_are_marked(self, tmp_path, context):
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs', rule_cache=RuleResultCache())
+        executor.execute('PB_201', copy.deepcopy(context), client_id='ACME')
+        rules = executor.execute('PB_201', copy.deepcopy(context), client_id='ACME')['trace']['profile']['rules']
+        assert all(timing['reused'] and timing['resolution_ns'] == 0 for timing in rules.values())
+
+    def test_failed_run_keeps_profile(self, tmp_path, context):
+        store = SQLiteRunStore(tmp_path / 'runs.db')
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'unused', run_store=store)
+        with pytest.raises(FileNotFoundError):
+            executor.execute('PB_9999', context, client_id='ACME')
+        trace = load_traces(store)[0]
+        assert trace['profile']['playbook_id'] == 'PB_9999'
+        assert trace['profile']['rules'] == {}
+        assert executor._profiles == {}
+
+
+class TestProfileReport:
+    """Aggregation across runs."""
+
+    def test_ranks_by_p95(self):
+        traces = [
+            _profile('PB_201', 5, [('fast', 0.1, False), ('slow', 2.0, False)]),
+            _profile('PB_201', 7, [('fast', 0.1, False), ('slow', 3.0, False)]),
+            _profile('PB_202', 20, [('heavy', 9.0, False), ('cached', 50.0, True)]),
+            {'execution_steps': []},    # trace without profile
+        ]
+        report = profile_report(traces, top=2)
+        assert report['runs'] == 3
+        assert [row['rule_id'] for row in report['rules']] == ['heavy', 'slow']
+        assert report['rules'][1]['count'] == 2
+        assert report['rules'][1]['resolution_share'] == pytest.approx(0.5)
+        assert [row['playbook_id'] for row in report['playbooks']] == ['PB_202', 'PB_201']
+        assert report['playbooks'][1]['max_ms'] == pytest.approx(7.0)
+
+    def test_load_recent_traces(self, tmp_path, context):
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs')
+        for client_id in ('A', 'B', 'C'):
+            executor.execute('PB_201', copy.deepcopy(context), client_id=client_id)
+        traces = load_traces(tmp_path / 'runs', limit=2)
+        assert len(traces) == 2
+        assert profile_report(traces)['playbooks'][0]['count'] == 2
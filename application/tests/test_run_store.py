@@ -0,0 +1,179 @@
+"""
+Tests for run stores
+
+Validates:
+- The executor persists runs through its RunStore
+- SQLiteRunStore keeps runs in one file, indexed by playbook, client,
+  status and start time
+- Export reproduces the directory layout file for file
+- Run ID claims are unique in every backend
+- MemoryRunStore keeps the most recent runs in memory
+- Dry runs return the full result without persisting anything
+- SQLiteRunStore closes every connection it opens
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from core.playbook_engine import (
+    DirectoryRunStore, MemoryRunStore, PlaybookExecutor, RunCatalog, RuleResultCache, SQLiteRunStore
+)
+from core.playbook_engine.run_store import RunRecord
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PLAYBOOKS_DIR = PROJECT_ROOT / 'domain' / 'playbooks'
+THRESHOLDS = PROJECT_ROOT / 'domain' / 'config' / 'playbook_thresholds.yaml'
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture
+def context():
+    with open(FIXTURES / 'context_realistic.json') as f:
+        return json.load(f)
+
+
+def _record(run_id, playbook_id='PB_201', client_id='ACME', status='completed', started_at='2026-03-01T10:00:00Z'):
+    return RunRecord(run_id, playbook_id, client_id, status, started_at, 0.5,
+                     files={'trace.json': '{}', 'outputs/risks/r.md': '# Risk\n'})
+
+
+class TestClaims:
+    """Run ID reservation."""
+
+    @pytest.mark.parametrize('make_store', [
+        lambda tmp: DirectoryRunStore(tmp / 'runs'),
+        lambda tmp: SQLiteRunStore(tmp / 'runs.db'),
+        lambda tmp: MemoryRunStore(),
+    ])
+    def test_collisions_get_suffix(self, tmp_path, make_store):
+        store = make_store(tmp_path)
+        claimed = [store.claim('2026-03-01_100000_PB_201_ACME', 'PB_201', 'ACME') for _ in range(3)]
+        assert claimed == [
+            '2026-03-01_100000_PB_201_ACME',
+            '2026-03-01_100000_PB_201_ACME-2',
+            '2026-03-01_100000_PB_201_ACME-3',
+        ]
+
+
+class TestSQLiteRunStore:
+    """Compact store contents, index queries and export."""
+
+    def test_query_filters(self, tmp_path):
+        store = SQLiteRunStore(tmp_path / 'runs.db')
+        store.write(_record('r1'))
+        store.write(_record('r2', client_id='GLOBEX', started_at='2026-03-02T10:00:00Z'))
+        store.write(_record('r3', playbook_id='PB_202', status='failed', started_at='2026-03-03T10:00:00Z'))
+
+        assert [r['run_id'] for r in store.query()] == ['r1', 'r2', 'r3']
+        assert [r['run_id'] for r in store.query(playbook_id='PB_201')] == ['r1', 'r2']
+        assert [r['run_id'] for r in store.query(client_id='GLOBEX')] == ['r2']
+        assert [r['run_id'] for r in store.query(status='failed')] == ['r3']
+        assert [r['run_id'] for r in store.query(since='2026-03-02', until='2026-03-03')] == ['r2']
+        assert [r['run_id'] for r in store.query(limit=1)] == ['r1']
+
+    def test_get_round_trips_files(self, tmp_path):
+        store = SQLiteRunStore(tmp_path / 'runs.db')
+        store.write(_record('r1'))
+        assert store.get('r1').files == _record('r1').files
+        assert store.get('missing') is None
+
+    def test_claimed_run_is_not_exported(self, tmp_path):
+        store = SQLiteRunStore(tmp_path / 'runs.db')
+        store.claim('r1', 'PB_201', 'ACME')
+        assert store.query()[0]['status'] == 'running'
+        assert store.get('r1') is None
+        assert store.export(tmp_path / 'out') == []
+
+    def test_connections_are_closed(self, tmp_path, monkeypatch):
+        opened = []
+        connect = sqlite3.connect
+
+        def tracking(*args, **kwargs):
+            opened.append(connect(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(sqlite3, 'connect', tracking)
+        store = SQLiteRunStore(tmp_path / 'runs.db')
+        store.claim('r1', 'PB_201', 'ACME')
+        store.write(_record('r2'))
+        store.get('r2')
+        store.query()
+        store.export(tmp_path / 'out')
+        assert len(store) == 2
+        assert len(opened) == 7
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute('SELECT 1')
+
+    def test_executor_export_matches_directory_layout(self, tmp_path, context):
+        store = SQLiteRunStore(tmp_path / 'runs.db')
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'unused', run_store=store)
+        result = executor.execute('PB_201', context, client_id='ACME')
+
+        assert result['run_dir'] == f"{tmp_path / 'runs.db'}#{result['run_id']}"
+        assert not (tmp_path / 'unused').exists()
+        summary = store.query(client_id='ACME')[0]
+        assert summary['status'] == 'completed'
+        assert summary['playbook_id'] == 'PB_201'
+
+        # Same files as the directory backend would write
+        expected = {'metadata.yaml', 'trace.json', 'report.md'} | {o['path'] for o in result['outputs']}
+        exported = store.export(tmp_path / 'export')
+        assert exported == [tmp_path / 'export' / result['run_id']]
+        run_dir = exported[0]
+        assert {str(p.relative_to(run_dir)) for p in run_dir.rglob('*') if p.is_file()} == expected
+        assert json.loads((run_dir / 'trace.json').read_text()) == result['trace']
+
+    def test_failed_run_is_indexed(self, tmp_path, context):
+        store = SQLiteRunStore(tmp_path / 'runs.db')
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'unused', run_store=store)
+        with pytest.raises(FileNotFoundError):
+            executor.execute('PB_9999', context, client_id='ACME')
+        failed = store.query(status='failed')
+        assert [r['playbook_id'] for r in failed] == ['PB_9999']
+        assert 'PB_9999' in store.get(failed[0]['run_id']).files['error.log']
+
+
+class TestInMemoryExecution:
+    """MemoryRunStore and dry runs."""
+
+    def test_memory_store_keeps_recent_runs(self, tmp_path, context):
+        store = MemoryRunStore(max_runs=2)
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs', run_store=store)
+        run_ids = [executor.execute('PB_201', context, client_id=c)['run_id'] for c in ('A', 'B', 'C')]
+
+        assert len(store) == 2
+        assert store.get(run_ids[0]) is None
+        record = store.get(run_ids[2])
+        assert record.status == 'completed'
+        assert 'report.md' in record.files
+        assert not (tmp_path / 'runs').exists()
+
+    def test_dry_run_writes_nothing(self, tmp_path, context):
+        catalog_path = tmp_path / 'catalog.db'
+        cache = RuleResultCache()
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs',
+                                    run_catalog=RunCatalog(catalog_path), rule_cache=cache)
+        persisted = executor.execute('PB_201', context, client_id='ACME')
+        dry = executor.execute('PB_201', context, client_id='GLOBEX', dry_run=True)
+
+        assert dry['status'] == 'completed'
+        assert dry['run_dir'] is None
+        assert [r['rule_id'] for r in dry['fired_rules']] == [r['rule_id'] for r in persisted['fired_rules']]
+        assert [o['type'] for o in dry['outputs']] == [o['type'] for o in persisted['outputs']]
+        assert [p.name for p in (tmp_path / 'runs').iterdir()] == [persisted['run_id']]
+        assert len(RunCatalog(catalog_path)) == 1
+        assert len(cache) == len(executor.registry.get('PB_201').rules) - 1   # only ACME's results
+        steps = {s['step']: s['status'] for s in dry['trace']['execution_steps']}
+        assert steps['validate_evidence'] == 'success'
+        assert steps['write_outputs'] == 'skipped'
+
+    def test_dry_run_failure_is_not_persisted(self, tmp_path, context):
+        store = MemoryRunStore()
+        executor = PlaybookExecutor(PLAYBOOKS_DIR, THRESHOLDS, tmp_path / 'runs', run_store=store)
+        with pytest.raises(FileNotFoundError):
+            executor.execute('PB_9999', context, dry_run=True)
+        assert store.records == {}
@@ -2,6 +2,7 @@
 Unit tests for Threshold Manager
 """
 
+import os
 import pytest
 from pathlib import Path
 from core.playbook_engine.threshold_manager import ThresholdManager
@@ -26,6 +27,11 @@ class TestThresholdManagerBasics:
         value = threshold_manager.get('PB_001_three_horizons', 'horizon_1_concentration_max')
         assert value == 0.80  # From config
 
+    def test_bare_playbook_id_matches_named_section(self, threshold_manager):
+        """Test that PB_201 resolves thresholds from the PB_201_swot section."""
+        assert threshold_manager.get('PB_201', 'high_threat_count') == 2
+        assert threshold_manager.get_all_for_playbook('PB_201')['high_threat_count'] == 2
+
     def test_get_missing_threshold_raises_error(self, threshold_manager):
         """Test that missing threshold raises KeyError."""
         with pytest.raises(KeyError):
@@ -57,6 +63,14 @@ class TestThresholdSubstitution:
         assert "$.value > 100 AND" in result
         assert "${thresholds.minimum_account_arr}" not in result
 
+    def test_substitute_with_overrides(self, threshold_manager):
+        """Test that overrides replace configured values for their keys only."""
+        condition = "$.a > ${thresholds.minimum_account_arr} AND $.b > ${thresholds.renewal_warning_days_high}"
+        result = threshold_manager.substitute_condition(
+            condition, 'PB_any', overrides={'minimum_account_arr': 1000}
+        )
+        assert result == "$.a > 1000 AND $.b > 60"
+
 
 class TestThresholdContextInjection:
     """Test injecting thresholds into context."""
@@ -95,5 +109,65 @@ class TestThresholdContextInjection:
         assert len(thresholds) > 0
 
 
+def _rewrite(path: Path, text: str):
+    """Rewrite the config and make sure its mtime differs."""
+    before = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+class TestResolvedTables:
+    """Flattened per-playbook tables and memoized substitution."""
+
+    def test_table_overlays_section_on_global(self, threshold_manager):
+        table = threshold_manager.table('PB_201')
+        assert table['high_threat_count'] == 2
+        assert table['minimum_account_arr'] == 500000
+        assert threshold_manager.table('PB_201') is table
+        assert threshold_manager.table('PB_unknown')['minimum_account_arr'] == 500000
+
+    def test_substitution_is_memoized(self, threshold_manager):
+        condition = "$.a > ${thresholds.minimum_account_arr}"
+        first = threshold_manager.substitute_condition(condition, 'PB_any')
+        assert threshold_manager.substitute_condition(condition, 'PB_any') is first
+
+    def test_unknown_placeholder_is_left(self, threshold_manager):
+        condition = "$.a > ${thresholds.no_such_key} AND $.b > ${thresholds.minimum_account_arr}"
+        assert (threshold_manager.substitute_condition(condition, 'PB_any')
+                == "$.a > ${thresholds.no_such_key} AND $.b > 500000")
+
+
+class TestHotReload:
+    """Config changes on disk start a new generation."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        path = tmp_path / 'thresholds.yaml'
+        path.write_text("global_thresholds:\n  limit: 10\nPB_201_swot:\n  count: 2\n")
+        return path
+
+    def test_changed_config_bumps_generation(self, config):
+        manager = ThresholdManager(config)
+        condition = "$.a > ${thresholds.limit} AND $.b > ${thresholds.count}"
+        assert manager.substitute_condition(condition, 'PB_201') == "$.a > 10 AND $.b > 2"
+        assert manager.refresh() is False
+
+        generation = manager.generation
+        _rewrite(config, "global_thresholds:\n  limit: 20\nPB_201_swot:\n  count: 3\n")
+        assert manager.refresh() is True
+        assert manager.generation == generation + 1
+        assert manager.substitute_condition(condition, 'PB_201') == "$.a > 20 AND $.b > 3"
+        assert manager.get_all_for_playbook('PB_201') == {'limit': 20, 'count': 3}
+
+    def test_invalid_config_keeps_previous_values(self, config):
+        manager = ThresholdManager(config)
+        generation = manager.generation
+        _rewrite(config, "global_thresholds: [unclosed\n")
+        assert manager.refresh() is False
+        assert manager.reload_error
+        assert manager.generation == generation
+        assert manager.get('PB_any', 'limit') == 10
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,99 @@
+"""
+Tests for threshold what-if sweeps
+
+Validates:
+- Sweep firing curves match per-value substitution + scalar evaluation
+- Other placeholders keep their configured values
+- Frames can be reused across sweeps
+"""
+
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from core.playbook_engine import DLLEvaluator, ThresholdManager
+from core.playbook_engine.bulk_evaluator import ContextFrame
+from core.playbook_engine.threshold_sweep import ThresholdSweep
+
+CONDITION = (
+    "$.account_overview.arr >= ${thresholds.minimum_account_arr} "
+    "AND $.swot.strengths.count <= ${thresholds.low_strength_count}"
+)
+
+
+@pytest.fixture
+def threshold_manager():
+    return ThresholdManager()
+
+
+@pytest.fixture
+def contexts():
+    with open(Path(__file__).parent / 'fixtures' / 'context_realistic.json') as f:
+        base = json.load(f)
+    rng = random.Random(3)
+    nodes = {}
+    for i in range(60):
+        context = json.loads(json.dumps(base))
+        context['account_overview']['arr'] = rng.randint(0, 1_000_000)
+        context['swot']['strengths']['count'] = rng.randint(0, 8)
+        if i % 10 == 0:
+            del context['account_overview']['arr']
+        nodes[f"node_{i:02d}"] = context
+    return nodes
+
+
+class TestThresholdSweep:
+    """Firing curves over a threshold grid."""
+
+    def test_matches_scalar_evaluation(self, threshold_manager, contexts):
+        values = list(np.linspace(0, 1_000_000, 41))
+        result = ThresholdSweep(threshold_manager).sweep(
+            CONDITION, 'PB_201_swot', 'minimum_account_arr', values, contexts
+        )
+        evaluator = DLLEvaluator()
+        for value, count in zip(result.values, result.firing_counts):
+            condition = threshold_manager.substitute_condition(
+                CONDITION, 'PB_201_swot', overrides={'minimum_account_arr': value}
+            )
+            expected = [n for n, c in contexts.items() if evaluator.evaluate(condition, c)]
+            assert result.firing_nodes(value) == expected
+            assert count == len(expected)
+
+    def test_curve_is_monotonic_for_lower_bound(self, threshold_manager, contexts):
+        result = ThresholdSweep(threshold_manager).sweep(
+            CONDITION, 'PB_201_swot', 'minimum_account_arr', range(0, 1_000_001, 50_000), contexts
+        )
+        counts = result.firing_counts
+        assert all(a >= b for a, b in zip(counts, counts[1:]))
+        assert result.curve()[-1] == {'value': 1_000_000, 'firing': 0, 'errors': 0}
+
+    def test_other_placeholder_swept(self, threshold_manager, contexts):
+        result = ThresholdSweep(threshold_manager).sweep(
+            CONDITION, 'PB_201_swot', 'low_strength_count', range(0, 9), contexts
+        )
+        assert '500000' in result.condition
+        assert result.firing_counts[0] <= result.firing_counts[-1]
+
+    def test_frame_reuse(self, threshold_manager, contexts):
+        sweep = ThresholdSweep(threshold_manager)
+        frame = ContextFrame(contexts)
+        first = sweep.sweep(CONDITION, 'PB_201_swot', 'minimum_account_arr', [0, 500_000], frame)
+        second = sweep.sweep(CONDITION, 'PB_201_swot', 'low_strength_count', [0, 8], frame)
+        assert first.firing.shape == second.firing.shape == (2, len(contexts))
+
+    def test_unknown_key_rejected(self, threshold_manager, contexts):
+        with pytest.raises(ValueError):
+            ThresholdSweep(threshold_manager).sweep(
+                CONDITION, 'PB_201_swot', 'not_referenced', [1, 2], contexts
+            )
+
+    def test_sweep_rule_by_id(self, threshold_manager, contexts):
+        playbook = {'decision_logic': {'rules': [{'id': 'R1', 'condition': CONDITION}]}}
+        sweep = ThresholdSweep(threshold_manager)
+        result = sweep.sweep_rule(playbook, 'R1', 'PB_201_swot', 'minimum_account_arr', [0], contexts)
+        assert result.values == [0]
+        with pytest.raises(KeyError):
+            sweep.sweep_rule(playbook, 'R2', 'PB_201_swot', 'minimum_account_arr', [0], contexts)